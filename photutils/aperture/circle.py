@@ -5,6 +5,7 @@ pixel and sky coordinates.
 """
 
 import math
+from functools import partial
 
 from astropy.utils import lazyproperty
 
@@ -12,8 +13,8 @@ from photutils.aperture.attributes import (PixelPositions, PositiveScalar,
                                            PositiveScalarAngle,
                                            SkyCoordPositions)
 from photutils.aperture.core import PixelAperture, SkyAperture
-from photutils.aperture.mask import ApertureMask
-from photutils.geometry import circular_overlap_grid
+from photutils.geometry import (circular_overlap_grid_batch,
+                                circular_overlap_sum_batch)
 
 __all__ = ['CircularMaskMixin', 'CircularAperture', 'CircularAnnulus',
            'SkyCircularAperture', 'SkyCircularAnnulus']
@@ -71,6 +72,9 @@ class CircularMaskMixin:
             otherwise a list of `~photutils.aperture.ApertureMask` is
             returned.
         """
+        return self._unpack_masks(*self._packed_weights(method, subpixels))
+
+    def _packed_weights(self, method, subpixels):
         use_exact, subpixels = self._translate_mask_mode(method, subpixels)
 
         if hasattr(self, 'r'):
@@ -80,25 +84,32 @@ class CircularMaskMixin:
         else:
             raise ValueError('Cannot determine the aperture radius.')
 
-        masks = []
-        for bbox, edges in zip(self._bbox, self._centered_edges):
-            ny, nx = bbox.shape
-            mask = circular_overlap_grid(edges[0], edges[1], edges[2],
-                                         edges[3], nx, ny, radius, use_exact,
-                                         subpixels)
+        edges = self._centered_edges
+        shapes = self._bbox_shapes
+        weights, offsets = circular_overlap_grid_batch(edges, shapes, radius,
+                                                       use_exact, subpixels)
 
-            # subtract the inner circle for an annulus
-            if hasattr(self, 'r_in'):
-                mask -= circular_overlap_grid(edges[0], edges[1], edges[2],
-                                              edges[3], nx, ny, self.r_in,
-                                              use_exact, subpixels)
+        # subtract the inner circle for an annulus
+        if hasattr(self, 'r_in'):
+            weights -= circular_overlap_grid_batch(edges, shapes, self.r_in,
+                                                   use_exact, subpixels)[0]
 
-            masks.append(ApertureMask(mask, bbox))
+        return weights, offsets
 
-        if self.isscalar:
-            return masks[0]
+    def _sum_kernel(self, method, subpixels):
+        use_exact, subpixels = self._translate_mask_mode(method, subpixels)
+
+        if hasattr(self, 'r'):
+            radius = self.r
+            radius_in = 0.0
+        elif hasattr(self, 'r_out'):  # annulus
+            radius = self.r_out
+            radius_in = self.r_in
         else:
-            return masks
+            raise ValueError('Cannot determine the aperture radius.')
+
+        return partial(circular_overlap_sum_batch, r=radius, r_in=radius_in,
+                       use_exact=use_exact, subpixels=subpixels)
 
 
 class CircularAperture(CircularMaskMixin, PixelAperture):
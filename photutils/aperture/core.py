@@ -6,7 +6,9 @@ This module defines the base aperture classes.
 import abc
 import inspect
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from multiprocessing import cpu_count
 
 import astropy.units as u
 import numpy as np
@@ -14,6 +16,7 @@ from astropy.coordinates import SkyCoord
 from astropy.utils import lazyproperty
 
 from photutils.aperture.bounding_box import BoundingBox
+from photutils.aperture.mask import ApertureMask
 from photutils.utils._wcs_helpers import _pixel_scale_angle_at_skycoord
 
 __all__ = ['Aperture', 'SkyAperture', 'PixelAperture']
@@ -225,10 +228,14 @@ class PixelAperture(Aperture):
         return np.atleast_2d(self.positions)
 
     @lazyproperty
-    def _bbox(self):
+    def _bbox_indices(self):
         """
-        The minimal bounding box for the aperture, always as a list of
-        `~photutils.aperture.BoundingBox` instances.
+        The minimal bounding box pixel indices for the aperture, always
+        as a 2D ``(N, 4)`` integer ndarray of ``(ixmin, ixmax, iymin,
+        iymax)`` values.
+
+        The indices are identical to those of
+        `~photutils.aperture.BoundingBox.from_float`.
         """
         x_delta, y_delta = self._xy_extents
         xmin = self._positions[:, 0] - x_delta
@@ -236,8 +243,18 @@ class PixelAperture(Aperture):
         ymin = self._positions[:, 1] - y_delta
         ymax = self._positions[:, 1] + y_delta
 
-        return [BoundingBox.from_float(x0, x1, y0, y1)
-                for x0, x1, y0, y1 in zip(xmin, xmax, ymin, ymax)]
+        return np.transpose((np.floor(xmin + 0.5), np.ceil(xmax + 0.5),
+                             np.floor(ymin + 0.5),
+                             np.ceil(ymax + 0.5))).astype(int)
+
+    @lazyproperty
+    def _bbox(self):
+        """
+        The minimal bounding box for the aperture, always as a list of
+        `~photutils.aperture.BoundingBox` instances.
+        """
+        return [BoundingBox(*indices)
+                for indices in self._bbox_indices.tolist()]
 
     @lazyproperty
     def bbox(self):
@@ -253,25 +270,345 @@ class PixelAperture(Aperture):
         else:
             return self._bbox
 
+    @lazyproperty
+    def _bbox_shapes(self):
+        """
+        The ``(ny, nx)`` shape of the minimal bounding box for each
+        aperture position, always as a 2D ``(N, 2)`` integer ndarray.
+        """
+        ixmin, ixmax, iymin, iymax = self._bbox_indices.T
+        return np.transpose((iymax - iymin, ixmax - ixmin))
+
     @lazyproperty
     def _centered_edges(self):
         """
-        A list of ``(xmin, xmax, ymin, ymax)`` tuples, one for each
-        position, of the pixel edges after recentering the aperture at
+        A 2D ``(N, 4)`` ndarray of the ``(xmin, xmax, ymin, ymax)``
+        pixel edges for each position after recentering the aperture at
         the origin.
 
         These pixel edges are used by the low-level `photutils.geometry`
         functions.
         """
-        edges = []
-        for position, bbox in zip(self._positions, self._bbox):
-            xmin = bbox.ixmin - 0.5 - position[0]
-            xmax = bbox.ixmax - 0.5 - position[0]
-            ymin = bbox.iymin - 0.5 - position[1]
-            ymax = bbox.iymax - 0.5 - position[1]
-            edges.append((xmin, xmax, ymin, ymax))
+        ixmin, ixmax, iymin, iymax = self._bbox_indices.T
+        xpos = self._positions[:, 0]
+        ypos = self._positions[:, 1]
+
+        return np.transpose((ixmin - 0.5 - xpos, ixmax - 0.5 - xpos,
+                             iymin - 0.5 - ypos, iymax - 0.5 - ypos))
+
+    def to_packed_mask(self, method='exact', subpixels=5):
+        """
+        Return the aperture masks for all positions packed into a single
+        1D array.
+
+        Unlike `to_mask`, this method does not create an
+        `~photutils.aperture.ApertureMask` or
+        `~photutils.aperture.BoundingBox` object for each aperture
+        position. It is therefore well suited for apertures with a very
+        large number of positions.
+
+        Parameters
+        ----------
+        method : {'exact', 'center', 'subpixel'}, optional
+            The method used to determine the overlap of the aperture on
+            the pixel grid.  Not all options are available for all
+            aperture types.  Note that the more precise methods are
+            generally slower.  The following methods are available:
+
+                * ``'exact'`` (default):
+                  The the exact fractional overlap of the aperture and
+                  each pixel is calculated. The aperture weights will
+                  contain values between 0 and 1.
+
+                * ``'center'``:
+                  A pixel is considered to be entirely in or out of the
+                  aperture depending on whether its center is in or out
+                  of the aperture. The aperture weights will contain
+                  values only of 0 (out) and 1 (in).
+
+                * ``'subpixel'``:
+                  A pixel is divided into subpixels (see the
+                  ``subpixels`` keyword), each of which are considered
+                  to be entirely in or out of the aperture depending
+                  on whether its center is in or out of the aperture.
+                  If ``subpixels=1``, this method is equivalent to
+                  ``'center'``. The aperture weights will contain values
+                  between 0 and 1.
+
+        subpixels : int, optional
+            For the ``'subpixel'`` method, resample pixels by this
+            factor in each dimension. That is, each pixel is divided
+            into ``subpixels**2`` subpixels. This keyword is ignored
+            unless ``method='subpixel'``.
+
+        Returns
+        -------
+        weights : 1D `~numpy.ndarray`
+            The packed aperture mask weights. The mask for the ``i``-th
+            position is ``weights[offsets[i]:offsets[i + 1]]`` reshaped
+            to the ``(iymax - iymin, ixmax - ixmin)`` shape of its
+            bounding box.
+
+        offsets : 1D `~numpy.ndarray`
+            The ``N + 1`` offsets of each mask in the packed ``weights``
+            array, where ``N`` is the number of aperture positions.
+
+        bbox : 2D `~numpy.ndarray`
+            A ``(N, 4)`` integer array of the ``(ixmin, ixmax, iymin,
+            iymax)`` bounding box indices of each mask (see
+            `~photutils.aperture.BoundingBox`).
+
+        Examples
+        --------
+        >>> from photutils.aperture import CircularAperture
+        >>> aper = CircularAperture([(10.0, 20.0), (30.5, 40.5)], r=3.0)
+        >>> weights, offsets, bbox = aper.to_packed_mask()
+        >>> print(offsets)
+        [ 0 49 85]
+        >>> print(bbox)
+        [[ 7 14 17 24]
+         [28 34 38 44]]
+        >>> mask0 = weights[offsets[0]:offsets[1]].reshape(7, 7)
+        """
+        weights, offsets = self._packed_weights(method, subpixels)
+        return weights, offsets, self._bbox_indices.copy()
+
+    def _packed_weights(self, method, subpixels):
+        """
+        Return the packed ``(weights, offsets)`` aperture mask weights
+        for all positions.
+
+        Subclasses that can compute all masks in a single batched call
+        (e.g., with the ``photutils.geometry`` ``*_overlap_grid_batch``
+        functions) should override this method. This default
+        implementation packs the output of `to_mask`.
+        """
+        apermasks = self.to_mask(method=method, subpixels=subpixels)
+        if self.isscalar:
+            apermasks = (apermasks,)
+
+        offsets = np.zeros(len(apermasks) + 1, dtype=int)
+        offsets[1:] = np.cumsum([apermask.data.size
+                                 for apermask in apermasks])
+        weights = np.concatenate([apermask.data.ravel()
+                                  for apermask in apermasks])
+
+        return weights, offsets
+
+    def _unpack_masks(self, weights, offsets):
+        """
+        Convert packed aperture mask weights into
+        `~photutils.aperture.ApertureMask` objects.
+
+        Each output `~photutils.aperture.ApertureMask` holds its own
+        copy of its weights (i.e., it is not a view into the packed
+        ``weights`` array).
+        """
+        masks = []
+        for bbox, shape, i0, i1 in zip(self._bbox, self._bbox_shapes,
+                                       offsets[:-1], offsets[1:]):
+            masks.append(ApertureMask(weights[i0:i1].reshape(shape).copy(),
+                                      bbox))
+
+        if self.isscalar:
+            return masks[0]
+        else:
+            return masks
+
+    def _overlap_slices(self, shape):
+        """
+        Get the overlap of all aperture bounding boxes with an array of
+        the given shape.
+
+        Parameters
+        ----------
+        shape : 2-tuple of int
+            The shape of the 2D array.
+
+        Returns
+        -------
+        large : 2D ``(N, 4)`` int `~numpy.ndarray`
+            The ``(xmin, xmax, ymin, ymax)`` indices of the overlap
+            region in the large array.
+
+        small : 2D ``(N, 4)`` int `~numpy.ndarray`
+            The ``(xmin, xmax, ymin, ymax)`` indices of the overlap
+            region in the bounding box array.
+
+        overlap : 1D bool `~numpy.ndarray`
+            Whether each bounding box overlaps the large array.
+        """
+        bbox = self._bbox_indices
+        large = np.empty_like(bbox)
+        large[:, 0:2] = np.clip(bbox[:, 0:2], 0, shape[1])
+        large[:, 2:4] = np.clip(bbox[:, 2:4], 0, shape[0])
+        small = large - bbox[:, [0, 0, 2, 2]]
+        overlap = ((large[:, 0] < large[:, 1])
+                   & (large[:, 2] < large[:, 3]))
+
+        return large, small, overlap
+
+    @staticmethod
+    def _validate_photometry_inputs(data, error, mask):
+        """
+        Validate the photometry input arrays and strip the ``data`` and
+        ``error`` units.
+
+        Returns
+        -------
+        data, error, mask : `~numpy.ndarray` or `None`
+            The unitless input arrays.
+
+        unit : `~astropy.units.Unit` or `None`
+            The unit of the input ``data`` and ``error``.
+        """
+        data = np.asanyarray(data)
+        if data.ndim != 2:
+            raise ValueError('data must be a 2D array.')
+
+        if error is not None:
+            error = np.asanyarray(error)
+            if error.shape != data.shape:
+                raise ValueError('error and data must have the same shape.')
+
+        # check Quantity inputs
+        unit = {getattr(arr, 'unit', None) for arr in (data, error)
+                if arr is not None}
+        if len(unit) > 1:
+            raise ValueError('If data or error has units, then they both must '
+                             'have the same units.')
+
+        # strip data and error units for performance
+        unit = unit.pop()
+        if unit is not None:
+            unit = data.unit
+            data = data.value
+
+            if error is not None:
+                error = error.value
+
+        if mask is not None:
+            mask = np.asanyarray(mask)
+            if mask.shape != data.shape:
+                raise ValueError('mask and data must have the same shape')
+
+        return data, error, mask, unit
+
+    def _sum_kernel(self, method, subpixels):
+        """
+        Return a fused ``photutils.geometry`` aperture-sum kernel for
+        the aperture, or `None` if one is not available.
+
+        The returned function must have the signature ``kernel(data,
+        error, mask, edges, bbox)``, where ``edges`` and ``bbox`` are
+        the rows of `_centered_edges` and `_bbox_indices` for a subset
+        of the aperture positions, and return the ``(sums, sum_errs)``
+        arrays for those positions (see, e.g.,
+        `~photutils.geometry.circular_overlap_sum_batch`). The kernel
+        must release the GIL so that it can be run in multiple
+        threads.
+
+        Subclasses that have such a kernel should override this
+        method.
+        """
+        return None
+
+    def _aperture_sums(self, data, error, mask, method, subpixels,
+                       nproc=1):
+        """
+        Compute the weighted sums of the (unitless) ``data`` and the
+        errors of the sums within each aperture.
+
+        If the aperture has a fused aperture-sum kernel (see
+        `_sum_kernel`), the positions are split into contiguous chunks
+        that are processed in ``nproc`` threads. Each aperture sum is
+        computed by a single thread, so the results are identical to
+        the serial ``nproc=1`` results. Otherwise, each aperture is
+        summed separately (serially) using the packed aperture weights.
+
+        The sums and errors are NaN for apertures that do not overlap
+        ``data``. The errors are all NaN if ``error`` is `None`.
+        """
+        kernel = self._sum_kernel(method, subpixels)
+        if kernel is None:
+            return self._packed_aperture_sums(data, error, mask, method,
+                                              subpixels)
+
+        return self._run_sum_kernel(kernel, data, error, mask,
+                                    self._centered_edges, self._bbox_indices,
+                                    nproc)
+
+    @staticmethod
+    def _run_sum_kernel(kernel, data, error, mask, edges, bbox, nproc):
+        """
+        Run a fused ``photutils.geometry`` aperture-sum kernel, splitting
+        the aperture positions into contiguous chunks that are processed
+        in ``nproc`` threads.
+
+        Each aperture is processed by a single thread, so the results
+        are identical to the serial ``nproc=1`` results. The output
+        arrays of the chunks are concatenated along the first axis.
+        """
+        # float64 arrays are passed through without copying (the
+        # kernels read them in place, including non-contiguous views)
+        data = np.asarray(data, dtype=float)
+        if error is not None:
+            error = np.asarray(error, dtype=float)
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool)
 
-        return edges
+        if nproc is None:
+            nproc = cpu_count()  # pragma: no cover
+        nchunks = min(nproc, len(bbox))
+        if nchunks <= 1:
+            return kernel(data, error, mask, edges, bbox)
+
+        def sum_chunk(idx):
+            return kernel(data, error, mask, edges[idx], bbox[idx])
+
+        chunks = np.array_split(np.arange(len(bbox)), nchunks)
+        chunks = [slice(chunk[0], chunk[-1] + 1) for chunk in chunks]
+        with ThreadPoolExecutor(max_workers=nchunks) as executor:
+            results = list(executor.map(sum_chunk, chunks))
+
+        return tuple(np.concatenate(arrays) for arrays in zip(*results))
+
+    def _packed_aperture_sums(self, data, error, mask, method, subpixels):
+        """
+        Compute the weighted sums of the (unitless) ``data`` and the
+        errors of the sums within each aperture by summing each
+        aperture separately using the packed aperture weights.
+        """
+        weights, offsets = self._packed_weights(method, subpixels)
+        large, small, overlap = self._overlap_slices(data.shape)
+
+        napers = len(self._bbox_indices)
+        aperture_sums = np.full(napers, np.nan)
+        aperture_sum_errs = np.full(napers, np.nan)
+        for i in np.flatnonzero(overlap):
+            lx0, lx1, ly0, ly1 = large[i]
+            sx0, sx1, sy0, sy1 = small[i]
+            slc_large = (slice(ly0, ly1), slice(lx0, lx1))
+
+            aper_weights = weights[offsets[i]:offsets[i + 1]]
+            aper_weights = aper_weights.reshape(
+                self._bbox_shapes[i])[sy0:sy1, sx0:sx1]
+            pixel_mask = (aper_weights > 0)  # good pixels
+            if mask is not None:
+                pixel_mask &= ~mask[slc_large]
+
+            with warnings.catch_warnings():
+                # ignore multiplication with non-finite data values
+                warnings.simplefilter('ignore', RuntimeWarning)
+
+                values = (data[slc_large] * aper_weights)[pixel_mask]
+                aperture_sums[i] = values.sum()
+
+                if error is not None:
+                    variance = (error[slc_large]**2 * aper_weights)[pixel_mask]
+                    aperture_sum_errs[i] = np.sqrt(variance.sum())
+
+        return aperture_sums, aperture_sum_errs
 
     @abc.abstractmethod
     def area(self):
@@ -438,7 +775,7 @@ class PixelAperture(Aperture):
         raise NotImplementedError('Needs to be implemented in a subclass.')
 
     def do_photometry(self, data, error=None, mask=None, method='exact',
-                      subpixels=5):
+                      subpixels=5, nproc=1):
         """
         Perform aperture photometry on the input data.
 
@@ -492,6 +829,17 @@ class PixelAperture(Aperture):
             into ``subpixels**2`` subpixels. This keyword is ignored
             unless ``method='subpixel'``.
 
+        nproc : int, optional
+            The number of threads used to compute the aperture sums
+            (if larger than 1). The aperture positions are split
+            between the threads. If set to 1, then a serial
+            implementation is used. If `None`, then the number of
+            threads will be set to the number of CPUs detected on the
+            machine. The results do not depend on ``nproc``. Only the
+            circular, elliptical, and rectangular apertures (and annuli)
+            support multiple threads; other apertures are always
+            processed serially.
+
         Returns
         -------
         aperture_sums : `~numpy.ndarray` or `~astropy.units.Quantity`
@@ -513,61 +861,16 @@ class PixelAperture(Aperture):
         it is recommend to set ``method='subpixel'`` with a larger
         ``subpixels`` size.
         """
-        data = np.asanyarray(data)
-        if data.ndim != 2:
-            raise ValueError('data must be a 2D array.')
-
-        if error is not None:
-            error = np.asanyarray(error)
-            if error.shape != data.shape:
-                raise ValueError('error and data must have the same shape.')
-
-        # check Quantity inputs
-        unit = {getattr(arr, 'unit', None) for arr in (data, error)
-                if arr is not None}
-        if len(unit) > 1:
-            raise ValueError('If data or error has units, then they both must '
-                             'have the same units.')
-
-        # strip data and error units for performance
-        unit = unit.pop()
-        if unit is not None:
-            unit = data.unit
-            data = data.value
-
-            if error is not None:
-                error = error.value
-
-        apermasks = self.to_mask(method=method, subpixels=subpixels)
-        if self.isscalar:
-            apermasks = (apermasks,)
-
-        aperture_sums = []
-        aperture_sum_errs = []
-        for apermask in apermasks:
-            (slc_large,
-             aper_weights,
-             pixel_mask) = apermask._get_overlap_cutouts(data.shape, mask=mask)
-
-            # no overlap of the aperture with the data
-            if slc_large is None:
-                aperture_sums.append(np.nan)
-                aperture_sum_errs.append(np.nan)
-                continue
-
-            with warnings.catch_warnings():
-                # ignore multiplication with non-finite data values
-                warnings.simplefilter('ignore', RuntimeWarning)
-
-                values = (data[slc_large] * aper_weights)[pixel_mask]
-                aperture_sums.append(values.sum())
-
-                if error is not None:
-                    variance = (error[slc_large]**2 * aper_weights)[pixel_mask]
-                    aperture_sum_errs.append(np.sqrt(variance.sum()))
-
-        aperture_sums = np.array(aperture_sums)
-        aperture_sum_errs = np.array(aperture_sum_errs)
+        data, error, mask, unit = self._validate_photometry_inputs(
+            data, error, mask)
+
+        aperture_sums, aperture_sum_errs = self._aperture_sums(
+            data, error, mask, method, subpixels, nproc=nproc)
+        if error is None:
+            # without an input error, the errors contain only the NaN
+            # values for the apertures that do not overlap the data
+            overlap = self._overlap_slices(data.shape)[2]
+            aperture_sum_errs = aperture_sum_errs[~overlap]
 
         # apply units
         if unit is not None:
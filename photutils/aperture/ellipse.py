@@ -5,6 +5,7 @@ pixel and sky coordinates.
 """
 
 import math
+from functools import partial
 
 import astropy.units as u
 import numpy as np
@@ -14,8 +15,8 @@ from photutils.aperture.attributes import (PixelPositions, PositiveScalar,
                                            ScalarAngleOrValue,
                                            SkyCoordPositions)
 from photutils.aperture.core import PixelAperture, SkyAperture
-from photutils.aperture.mask import ApertureMask
-from photutils.geometry import elliptical_overlap_grid
+from photutils.geometry import (elliptical_overlap_grid_batch,
+                                elliptical_overlap_sum_batch)
 
 __all__ = ['EllipticalMaskMixin', 'EllipticalAperture', 'EllipticalAnnulus',
            'SkyEllipticalAperture', 'SkyEllipticalAnnulus']
@@ -73,6 +74,9 @@ class EllipticalMaskMixin:
             otherwise a list of `~photutils.aperture.ApertureMask` is
             returned.
         """
+        return self._unpack_masks(*self._packed_weights(method, subpixels))
+
+    def _packed_weights(self, method, subpixels):
         use_exact, subpixels = self._translate_mask_mode(method, subpixels)
 
         if hasattr(self, 'a'):
@@ -84,27 +88,37 @@ class EllipticalMaskMixin:
         else:
             raise ValueError('Cannot determine the aperture shape.')
 
-        masks = []
-        for bbox, edges in zip(self._bbox, self._centered_edges):
-            ny, nx = bbox.shape
-            mask = elliptical_overlap_grid(edges[0], edges[1], edges[2],
-                                           edges[3], nx, ny, a, b,
-                                           self._theta_radians,
-                                           use_exact, subpixels)
+        edges = self._centered_edges
+        shapes = self._bbox_shapes
+        weights, offsets = elliptical_overlap_grid_batch(
+            edges, shapes, a, b, self._theta_radians, use_exact, subpixels)
 
-            # subtract the inner ellipse for an annulus
-            if hasattr(self, 'a_in'):
-                mask -= elliptical_overlap_grid(edges[0], edges[1], edges[2],
-                                                edges[3], nx, ny, self.a_in,
-                                                self.b_in, self._theta_radians,
-                                                use_exact, subpixels)
+        # subtract the inner ellipse for an annulus
+        if hasattr(self, 'a_in'):
+            weights -= elliptical_overlap_grid_batch(
+                edges, shapes, self.a_in, self.b_in, self._theta_radians,
+                use_exact, subpixels)[0]
 
-            masks.append(ApertureMask(mask, bbox))
+        return weights, offsets
 
-        if self.isscalar:
-            return masks[0]
+    def _sum_kernel(self, method, subpixels):
+        use_exact, subpixels = self._translate_mask_mode(method, subpixels)
+
+        if hasattr(self, 'a'):
+            a = self.a
+            b = self.b
+            a_in = b_in = 0.0
+        elif hasattr(self, 'a_in'):  # annulus
+            a = self.a_out
+            b = self.b_out
+            a_in = self.a_in
+            b_in = self.b_in
         else:
-            return masks
+            raise ValueError('Cannot determine the aperture shape.')
+
+        return partial(elliptical_overlap_sum_batch, rx=a, ry=b,
+                       theta=self._theta_radians, rx_in=a_in, ry_in=b_in,
+                       use_exact=use_exact, subpixels=subpixels)
 
     @staticmethod
     def _calc_extents(semimajor_axis, semiminor_axis, theta):
@@ -4,6 +4,7 @@ This module defines tools to perform aperture photometry.
 """
 
 import warnings
+from functools import partial
 
 import astropy.units as u
 import numpy as np
@@ -11,14 +12,18 @@ from astropy.nddata import NDData, StdDevUncertainty
 from astropy.table import QTable
 from astropy.utils.exceptions import AstropyUserWarning
 
-from photutils.aperture.core import Aperture, SkyAperture
+from photutils.aperture.circle import CircularAperture
+from photutils.aperture.core import Aperture, PixelAperture, SkyAperture
+from photutils.aperture.ellipse import EllipticalAperture
+from photutils.geometry import (circular_overlap_multi_sum_batch,
+                                elliptical_overlap_multi_sum_batch)
 from photutils.utils._misc import _get_meta
 
 __all__ = ['aperture_photometry']
 
 
 def aperture_photometry(data, apertures, error=None, mask=None,
-                        method='exact', subpixels=5, wcs=None):
+                        method='exact', subpixels=5, wcs=None, nproc=1):
     """
     Perform aperture photometry on the input data by summing the flux
     within the given aperture(s).
@@ -96,6 +101,15 @@ def aperture_photometry(data, apertures, error=None, mask=None,
         `astropy.wcs.WCS`, `gwcs.wcs.WCS`). Used only if the input
         ``apertures`` contains a `SkyAperture` object.
 
+    nproc : int, optional
+        The number of threads used to compute the aperture sums (if
+        larger than 1). The aperture positions are split between the
+        threads. If set to 1, then a serial implementation is used. If
+        `None`, then the number of threads will be set to the number
+        of CPUs detected on the machine. The results do not depend on
+        ``nproc``. See `~photutils.aperture.PixelAperture.do_photometry`
+        for details.
+
     Returns
     -------
     table : `~astropy.table.QTable`
@@ -167,7 +181,7 @@ def aperture_photometry(data, apertures, error=None, mask=None,
 
         return aperture_photometry(data, apertures, error=error, mask=mask,
                                    method=method, subpixels=subpixels,
-                                   wcs=wcs)
+                                   wcs=wcs, nproc=nproc)
 
     single_aperture = False
     if isinstance(apertures, Aperture):
@@ -217,12 +231,29 @@ def aperture_photometry(data, apertures, error=None, mask=None,
         else:
             tbl['sky_center'] = skycoord_pos
 
+    # concentric circular or elliptical apertures are measured in a
+    # single pass over the pixels
+    concentric = None
+    if not single_aperture:
+        inputs = PixelAperture._validate_photometry_inputs(data, error, mask)
+        unit = inputs[-1]
+        concentric = _concentric_aperture_sums(apertures, *inputs[:-1],
+                                               method, subpixels,
+                                               nproc=nproc)
+
     sum_key_main = 'aperture_sum'
     sum_err_key_main = 'aperture_sum_err'
     for i, aper in enumerate(apertures):
-        aper_sum, aper_sum_err = aper.do_photometry(data, error=error,
-                                                    mask=mask, method=method,
-                                                    subpixels=subpixels)
+        if concentric is None:
+            aper_sum, aper_sum_err = aper.do_photometry(
+                data, error=error, mask=mask, method=method,
+                subpixels=subpixels, nproc=nproc)
+        else:
+            aper_sum = concentric[0][:, i]
+            aper_sum_err = concentric[1][:, i]
+            if unit is not None:
+                aper_sum <<= unit
+                aper_sum_err <<= unit
 
         sum_key = sum_key_main
         sum_err_key = sum_err_key_main
@@ -235,3 +266,100 @@ def aperture_photometry(data, apertures, error=None, mask=None,
             tbl[sum_err_key] = aper_sum_err
 
     return tbl
+
+
+def _concentric_aperture_sums(apertures, data, error, mask, method,
+                              subpixels, nproc=1):
+    """
+    Compute the aperture sums, errors, and areas of overlap for a list
+    of concentric circular or elliptical apertures in a single pass
+    over the pixels.
+
+    The pixels within the largest aperture at each position are visited
+    only once (see `~photutils.geometry.circular_overlap_multi_sum_batch`
+    and `~photutils.geometry.elliptical_overlap_multi_sum_batch`).
+
+    Parameters
+    ----------
+    apertures : list of `~photutils.aperture.PixelAperture`
+        The apertures. Only lists of `~photutils.aperture.CircularAperture`
+        objects or lists of nested `~photutils.aperture.EllipticalAperture`
+        objects with the same ``theta`` are supported. All apertures
+        must have the same positions.
+
+    data, error, mask : `~numpy.ndarray` or `None`
+        The unitless (validated) input arrays.
+
+    method : {'exact', 'center', 'subpixel'}
+        The aperture mask method.
+
+    subpixels : int
+        The subpixel resampling factor.
+
+    nproc : int or `None`, optional
+        The number of threads.
+
+    Returns
+    -------
+    result : tuple of 2D `~numpy.ndarray` or `None`
+        The ``(sums, sum_errs, areas)`` arrays, each with shape
+        ``(npositions, napertures)``. The values are NaN for apertures
+        that do not overlap the data, and ``sum_errs`` are NaN if
+        ``error`` is `None`. `None` is returned if the apertures are not
+        supported, in which case each aperture must be measured
+        separately.
+    """
+    aper_types = {type(aper) for aper in apertures}
+    if len(aper_types) != 1:
+        return None
+    aper_type = aper_types.pop()
+
+    positions = apertures[0].positions
+    for aper in apertures[1:]:
+        if not np.array_equal(aper.positions, positions):
+            return None
+
+    if aper_type is CircularAperture:
+        radii = np.array([aper.r for aper in apertures], dtype=float)
+        order = np.argsort(radii, kind='stable')
+        kernel = partial(circular_overlap_multi_sum_batch,
+                         radii=radii[order])
+    elif aper_type is EllipticalAperture:
+        theta = apertures[0]._theta_radians
+        if any(aper._theta_radians != theta for aper in apertures[1:]):
+            return None
+        rx = np.array([aper.a for aper in apertures], dtype=float)
+        ry = np.array([aper.b for aper in apertures], dtype=float)
+        order = np.argsort(rx, kind='stable')
+        if np.any(np.diff(ry[order]) < 0):  # ellipses are not nested
+            return None
+        kernel = partial(elliptical_overlap_multi_sum_batch, rx=rx[order],
+                         ry=ry[order], theta=theta)
+    else:
+        return None
+
+    largest = apertures[order[-1]]
+    use_exact, subpixels = largest._translate_mask_mode(method, subpixels)
+    kernel = partial(kernel, use_exact=use_exact, subpixels=subpixels)
+    # the pixel grid of each aperture, with shape (npositions,
+    # napertures, 4), in order of increasing aperture size
+    edges = np.stack([apertures[i]._centered_edges for i in order], axis=1)
+    bbox = np.stack([apertures[i]._bbox_indices for i in order], axis=1)
+    sums, sum_errs, areas = largest._run_sum_kernel(
+        kernel, data, error, mask, edges, bbox, nproc)
+
+    # restore the input aperture order
+    inverse = np.empty_like(order)
+    inverse[order] = np.arange(len(order))
+    sums = sums[:, inverse]
+    sum_errs = sum_errs[:, inverse]
+    areas = areas[:, inverse]
+
+    # smaller apertures may not overlap the data
+    for i, aper in enumerate(apertures):
+        nooverlap = ~aper._overlap_slices(data.shape)[2]
+        sums[nooverlap, i] = np.nan
+        sum_errs[nooverlap, i] = np.nan
+        areas[nooverlap, i] = np.nan
+
+    return sums, sum_errs, areas
@@ -5,6 +5,7 @@ both pixel and sky coordinates.
 """
 
 import math
+from functools import partial
 
 import astropy.units as u
 import numpy as np
@@ -14,8 +15,8 @@ from photutils.aperture.attributes import (PixelPositions, PositiveScalar,
                                            ScalarAngleOrValue,
                                            SkyCoordPositions)
 from photutils.aperture.core import PixelAperture, SkyAperture
-from photutils.aperture.mask import ApertureMask
-from photutils.geometry import rectangular_overlap_grid
+from photutils.geometry import (rectangular_overlap_grid_batch,
+                                rectangular_overlap_sum_batch)
 
 __all__ = ['RectangularMaskMixin', 'RectangularAperture',
            'RectangularAnnulus', 'SkyRectangularAperture',
@@ -74,6 +75,9 @@ class RectangularMaskMixin:
             otherwise a list of `~photutils.aperture.ApertureMask` is
             returned.
         """
+        return self._unpack_masks(*self._packed_weights(method, subpixels))
+
+    def _packed_weights(self, method, subpixels):
         _, subpixels = self._translate_mask_mode(method, subpixels,
                                                  rectangle=True)
 
@@ -86,27 +90,38 @@ class RectangularMaskMixin:
         else:
             raise ValueError('Cannot determine the aperture radius.')
 
-        masks = []
-        for bbox, edges in zip(self._bbox, self._centered_edges):
-            ny, nx = bbox.shape
-            mask = rectangular_overlap_grid(edges[0], edges[1], edges[2],
-                                            edges[3], nx, ny, w, h,
-                                            self._theta_radians, 0, subpixels)
+        edges = self._centered_edges
+        shapes = self._bbox_shapes
+        weights, offsets = rectangular_overlap_grid_batch(
+            edges, shapes, w, h, self._theta_radians, 0, subpixels)
 
-            # subtract the inner circle for an annulus
-            if hasattr(self, 'w_in'):
-                mask -= rectangular_overlap_grid(edges[0], edges[1], edges[2],
-                                                 edges[3], nx, ny, self.w_in,
-                                                 self.h_in,
-                                                 self._theta_radians, 0,
-                                                 subpixels)
+        # subtract the inner rectangle for an annulus
+        if hasattr(self, 'w_in'):
+            weights -= rectangular_overlap_grid_batch(
+                edges, shapes, self.w_in, self.h_in, self._theta_radians, 0,
+                subpixels)[0]
 
-            masks.append(ApertureMask(mask, bbox))
+        return weights, offsets
 
-        if self.isscalar:
-            return masks[0]
+    def _sum_kernel(self, method, subpixels):
+        _, subpixels = self._translate_mask_mode(method, subpixels,
+                                                 rectangle=True)
+
+        if hasattr(self, 'w'):
+            w = self.w
+            h = self.h
+            w_in = h_in = 0.0
+        elif hasattr(self, 'w_out'):  # annulus
+            w = self.w_out
+            h = self.h_out
+            w_in = self.w_in
+            h_in = self.h_in
         else:
-            return masks
+            raise ValueError('Cannot determine the aperture radius.')
+
+        return partial(rectangular_overlap_sum_batch, width=w, height=h,
+                       theta=self._theta_radians, width_in=w_in,
+                       height_in=h_in, use_exact=0, subpixels=subpixels)
 
     @staticmethod
     def _calc_extents(width, height, theta):
@@ -14,6 +14,7 @@ from astropy.wcs import WCS
 from numpy.testing import (assert_allclose, assert_array_equal,
                            assert_array_less)
 
+from photutils.aperture.bounding_box import BoundingBox
 from photutils.aperture.circle import (CircularAnnulus, CircularAperture,
                                        SkyCircularAnnulus, SkyCircularAperture)
 from photutils.aperture.ellipse import (EllipticalAnnulus, EllipticalAperture,
@@ -828,3 +829,151 @@ def test_nddata_input():
         if column == 'sky_center':  # cannot test SkyCoord equality
             continue
         assert_allclose(tbl1[column], tbl2[column])
+
+
+@pytest.mark.parametrize(('aperture_class', 'params'), TEST_APERTURES)
+@pytest.mark.parametrize('method', ['exact', 'center', 'subpixel'])
+def test_packed_masks(aperture_class, params, method):
+    """
+    Test that the batched (packed) aperture masks match the individual
+    masks and mask-based photometry.
+    """
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(51, 51))
+    error = np.abs(rng.normal(size=data.shape))
+    mask = np.zeros(data.shape, dtype=bool)
+    mask[20:24, 18:22] = True
+    xypos = [(25.3, 25.7), (0.2, 0.9), (50.6, 3.2), (-100.0, 10.0),
+             (20.5, 21.5)]
+    aper = aperture_class(xypos, *params)
+
+    weights, offsets, bbox = aper.to_packed_mask(method=method, subpixels=5)
+    apermasks = aper.to_mask(method=method, subpixels=5)
+    assert len(offsets) == len(xypos) + 1
+    assert bbox.shape == (len(xypos), 4)
+    for i, apermask in enumerate(apermasks):
+        ixmin, ixmax, iymin, iymax = bbox[i]
+        assert apermask.bbox == BoundingBox(ixmin, ixmax, iymin, iymax)
+        assert_array_equal(weights[offsets[i]:offsets[i + 1]],
+                           apermask.data.ravel())
+
+    flux, flux_err = aper.do_photometry(data, error=error, mask=mask,
+                                        method=method, subpixels=5)
+    for i, apermask in enumerate(apermasks):
+        if i == 3:
+            assert np.isnan(flux[i])
+            assert np.isnan(flux_err[i])
+            continue
+        assert_allclose(flux[i], np.sum(apermask.get_values(data,
+                                                            mask=mask)))
+        err = np.sqrt(np.sum(apermask.get_values(error**2, mask=mask)))
+        assert_allclose(flux_err[i], err)
+
+    # without an error array, the errors are NaN only for the
+    # apertures that do not overlap the data
+    _, flux_err = aper.do_photometry(data, mask=mask, method=method,
+                                     subpixels=5)
+    assert_array_equal(flux_err, [np.nan])
+    _, flux_err = aper[0].do_photometry(data, method=method, subpixels=5)
+    assert flux_err.shape == (0,)
+
+    # the ApertureMask data arrays are independent copies
+    data1 = apermasks[1].data.copy()
+    apermasks[0].data[:] = -1.0
+    assert_array_equal(apermasks[1].data, data1)
+
+
+@pytest.mark.parametrize(('aperture_class', 'params'), TEST_APERTURES)
+@pytest.mark.parametrize('method', ['exact', 'center', 'subpixel'])
+def test_fused_aperture_sums(aperture_class, params, method):
+    """
+    Test that the fused aperture-sum kernels match the packed-weights
+    photometry, including non-finite and non-contiguous input data.
+    """
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(51, 102))[:, ::2]  # non-contiguous view
+    data[10, 30] = np.nan
+    error = np.abs(rng.normal(size=data.shape))
+    mask = np.zeros(data.shape, dtype=bool)
+    mask[20:24, 18:22] = True
+    xypos = [(25.3, 25.7), (0.2, 0.9), (50.6, 3.2), (-100.0, 10.0),
+             (30.5, 10.2)]
+    aper = aperture_class(xypos, *params)
+
+    for err, msk in ((None, None), (error, mask)):
+        flux, flux_err = aper.do_photometry(data, error=err, mask=msk,
+                                            method=method, subpixels=5)
+        flux2, flux_err2 = aper._packed_aperture_sums(data, err, msk,
+                                                      method, 5)
+        assert_allclose(flux, flux2)
+        if err is not None:
+            assert_allclose(flux_err, flux_err2)
+        assert np.isnan(flux[3])
+
+
+@pytest.mark.parametrize(('aperture_class', 'params'), TEST_APERTURES)
+@pytest.mark.parametrize('nproc', [2, 3, 10])
+def test_photometry_nproc(aperture_class, params, nproc):
+    """
+    Test that multithreaded photometry gives results identical to the
+    serial results.
+    """
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(101, 101))
+    error = np.abs(rng.normal(size=data.shape))
+    mask = rng.uniform(size=data.shape) > 0.95
+    xypos = rng.uniform(-5, 105, size=(7, 2))
+    aper = aperture_class(xypos, *params)
+
+    tbl1 = aperture_photometry(data, aper, error=error, mask=mask)
+    tbl2 = aperture_photometry(data, aper, error=error, mask=mask,
+                               nproc=nproc)
+    assert_array_equal(tbl1['aperture_sum'], tbl2['aperture_sum'])
+    assert_array_equal(tbl1['aperture_sum_err'], tbl2['aperture_sum_err'])
+
+    # scalar aperture
+    flux1, err1 = aper[0].do_photometry(data, error=error)
+    flux2, err2 = aper[0].do_photometry(data, error=error, nproc=nproc)
+    assert_array_equal(flux1, flux2)
+    assert_array_equal(err1, err2)
+
+
+@pytest.mark.parametrize('method', ['exact', 'center', 'subpixel'])
+@pytest.mark.parametrize('shape', ['circle', 'ellipse'])
+def test_concentric_apertures(method, shape):
+    """
+    Test that the single-pass photometry of concentric apertures matches
+    the photometry of each aperture.
+    """
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(61, 71)) * u.Jy
+    error = np.abs(rng.normal(size=data.shape)) * u.Jy
+    mask = rng.uniform(size=data.shape) > 0.9
+    data[5, 6] = np.nan
+    xypos = [(30.3, 20.7), (1.0, 2.0), (70.5, 60.2), (-3.0, 30.0),
+             (5.5, 6.2)]
+
+    radii = [3.0, 0.5, 8.2, 1.0, 5.0, 3.0]  # unsorted with duplicates
+    if shape == 'circle':
+        apertures = [CircularAperture(xypos, r=radius) for radius in radii]
+    else:
+        apertures = [EllipticalAperture(xypos, a=radius, b=0.6 * radius,
+                                        theta=0.7) for radius in radii]
+
+    tbl = aperture_photometry(data, apertures, error=error, mask=mask,
+                              method=method)
+    for i, aper in enumerate(apertures):
+        flux, flux_err = aper.do_photometry(data, error=error, mask=mask,
+                                            method=method)
+        assert_allclose(tbl[f'aperture_sum_{i}'], flux, rtol=1e-12,
+                        atol=1e-12 * u.Jy)
+        assert_allclose(tbl[f'aperture_sum_err_{i}'], flux_err,
+                        rtol=1e-12)
+
+    # non-nested ellipses are measured separately
+    apertures = [EllipticalAperture(xypos, a=5.0, b=4.0),
+                 EllipticalAperture(xypos, a=6.0, b=3.0)]
+    tbl = aperture_photometry(data, apertures, method=method)
+    for i, aper in enumerate(apertures):
+        flux, _ = aper.do_photometry(data, method=method)
+        assert_array_equal(tbl[f'aperture_sum_{i}'], flux)
@@ -4,7 +4,12 @@ This module defines classes to estimate the 2D background and background
 RMS in an image.
 """
 
+import inspect
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from copy import copy
+from multiprocessing import cpu_count
 
 import astropy.units as u
 import numpy as np
@@ -14,13 +19,15 @@ from astropy.utils import lazyproperty
 from astropy.utils.exceptions import AstropyUserWarning
 
 from photutils.aperture import RectangularAperture
-from photutils.background.core import SExtractorBackground, StdBackgroundRMS
+from photutils.background.core import (_SORTED_STATS_FUNCS,
+                                       SExtractorBackground, StdBackgroundRMS,
+                                       _SortedStats)
 from photutils.background.interpolators import BkgZoomInterpolator
 from photutils.utils import ShepardIDWInterpolator
-from photutils.utils._parameters import as_pair
+from photutils.utils._parameters import as_float_dtype, as_pair
 from photutils.utils._stats import nanmedian
 
-__all__ = ['Background2D']
+__all__ = ['Background2D', 'LazyBackgroundImage']
 
 __doctest_requires__ = {('Background2D'): ['scipy']}
 
@@ -166,11 +173,50 @@ class Background2D:
         is an instance of `BkgZoomInterpolator`, which uses the
         `scipy.ndimage.zoom` function.
 
+    tiled : bool, optional
+        If `True`, the box statistics are computed one row of boxes at
+        a time. Only a single row of boxes of the input ``data`` (and
+        masks) is converted to float and held in memory at a time,
+        and only the low-resolution box statistics are kept. In this
+        case, ``data`` can be a `~numpy.memmap` or a FITS image section
+        (e.g., ``hdu.section``) that is larger than the available
+        memory. The low-resolution background and background RMS
+        meshes are identical to those computed with ``tiled=False``.
+        Note that the full-sized `background` and `background_rms`
+        images are still computed in memory if they are accessed.
+
+    dtype : data-type, optional
+        The floating-point data type (e.g., ``np.float32``) used
+        for the internal copy of the data and for the output
+        `background` and `background_rms` images. Using ``np.float32``
+        halves the memory footprint and memory bandwidth for large
+        images. The low-resolution background and background RMS meshes
+        are always float64 arrays. The default is float64.
+
+    nproc : int or `None`, optional
+        The number of threads used to sigma clip the boxes and compute
+        the box statistics. The boxes are split into chunks that are
+        processed independently, thus the results are identical for
+        any ``nproc``. If `None`, then all available CPU cores are
+        used. Note that the ``bkg_estimator`` and ``bkgrms_estimator``
+        are called from multiple threads if ``nproc`` is larger than 1.
+
     Notes
     -----
     Better performance will generally be obtained if you have the
     `bottleneck`_ package installed.
 
+    If ``sigma_clip`` uses the default ``cenfunc='median'`` and
+    ``stdfunc='std'`` (without ``grow``) and the ``bkg_estimator``
+    and ``bkgrms_estimator`` are instances of `MeanBackground`,
+    `MedianBackground`, `ModeEstimatorBackground`, `MMMBackground`,
+    `SExtractorBackground`, `StdBackgroundRMS`, or
+    `MADStdBackgroundRMS` (with ``sigma_clip=None``), then the sigma
+    clipping and the box statistics are computed together from the
+    sorted box data. The
+    results are identical to computing them separately, up to
+    floating-point rounding of the mean and standard deviation.
+
     If there is only one background box element (i.e., ``box_size`` is
     the same size as (or larger than) the ``data``), then the background
     map will simply be a constant image.
@@ -184,7 +230,8 @@ class Background2D:
                  sigma_clip=SigmaClip(sigma=3.0, maxiters=10),
                  bkg_estimator=SExtractorBackground(sigma_clip=None),
                  bkgrms_estimator=StdBackgroundRMS(sigma_clip=None),
-                 interpolator=BkgZoomInterpolator()):
+                 interpolator=BkgZoomInterpolator(), tiled=False,
+                 dtype=float, nproc=1):
 
         if isinstance(data, (u.Quantity, NDData)):  # includes CCDData
             self.unit = data.unit
@@ -192,11 +239,18 @@ class Background2D:
         else:
             self.unit = None
 
+        self.tiled = tiled
+        self.dtype = as_float_dtype(dtype, allow_none=False)
         self.data = self._validate_array(data, 'data', shape=False)
+        # a reference to the input data, which is used to recompute the
+        # box statistics in update() (self.data is replaced by a masked
+        # copy if not tiled)
+        self._input_data = self.data
         self.mask = self._validate_array(mask, 'mask')
         self.coverage_mask = self._validate_array(coverage_mask,
                                                   'coverage_mask')
-        self.total_mask = self._combine_masks()
+        # in tiled mode, the masks are combined for each row of boxes
+        self.total_mask = None if self.tiled else self._combine_masks()
 
         # box_size cannot be larger than the data array size
         self.box_size = as_pair('box_size', box_size, lower_bound=(0, 1),
@@ -217,70 +271,117 @@ class Background2D:
         self.bkg_estimator = bkg_estimator
         self.bkgrms_estimator = bkgrms_estimator
         self.interpolator = interpolator
+        self.nproc = nproc
 
         self.nboxes = None
         self.box_npixels = None
         self.nboxes_tot = None
-        self._box_data = None
         self._box_idx = None
         self._mesh_idx = None
         self._bkg_stats = None
         self._bkgrms_stats = None
+        self._box_nmasked = None
 
         self._prepare_box_data()
+        self._packed_mask = self._pack_mask(self.mask)
 
     def _validate_array(self, array, name, shape=True):
         if name in ('mask', 'coverage_mask') and array is np.ma.nomask:
             array = None
         if array is not None:
-            array = np.asanyarray(array)
-            if array.ndim != 2:
+            # in tiled mode, array-like objects that support slicing
+            # (e.g., a FITS image section) are not loaded into memory
+            if not (self.tiled and hasattr(array, 'shape')):
+                array = np.asanyarray(array)
+            if len(array.shape) != 2:
                 raise ValueError(f'{name} must be a 2D array.')
             if shape and array.shape != self.data.shape:
                 raise ValueError(f'data and {name} must have the same shape.')
         return array
 
-    def _combine_masks(self):
+    def _combine_masks(self, slc=np.s_[:]):
         if self.mask is None and self.coverage_mask is None:
             return None
         if self.mask is None:
-            return self.coverage_mask
+            return self.coverage_mask[slc]
         elif self.coverage_mask is None:
-            return self.mask
+            return self.mask[slc]
         else:
-            return np.logical_or(self.mask, self.coverage_mask)
+            return np.logical_or(self.mask[slc], self.coverage_mask[slc])
 
-    def _prepare_data(self):
+    def _prepare_data(self, data, mask):
         """
         Prepare the data.
 
         This method:
-          * converts the data to float dtype (and makes a copy)
+          * converts the data to ``dtype`` (and makes a copy)
           * automatically masks non-finite values
           * replaces all masked values with NaN
           * converts MaskedArray to ndarray using NaN as masked values
+
+        Returns the prepared data, the updated mask, and whether the
+        data contained non-finite values.
         """
         # float array type is needed to insert nans into the array
-        self.data = self.data.astype(float)  # makes a copy
+        data = data.astype(self.dtype)  # makes a copy
 
         # include non-finite values in the total mask
-        bad_mask = ~np.isfinite(self.data)
-        if np.any(bad_mask):
-            if self.total_mask is None:
-                self.total_mask = bad_mask
+        bad_mask = ~np.isfinite(data)
+        has_nonfinite = np.any(bad_mask)
+        if has_nonfinite:
+            if mask is None:
+                mask = bad_mask
             else:
-                self.total_mask |= bad_mask
-            warnings.warn('Input data contains invalid values (NaNs or '
-                          'infs), which were automatically masked.',
-                          AstropyUserWarning)
+                mask = mask | bad_mask
 
         # replace all masked values with NaN
-        if self.total_mask is not None:
-            self.data[self.total_mask] = np.nan
+        if mask is not None:
+            data[mask] = np.nan
 
         # convert MaskedArray to ndarray using np.nan as masked values
-        if isinstance(self.data, np.ma.MaskedArray):
-            self.data = self.data.filled(np.nan)
+        if isinstance(data, np.ma.MaskedArray):
+            data = data.filled(np.nan)
+
+        return data, mask, has_nonfinite
+
+    @staticmethod
+    def _warn_nonfinite():
+        warnings.warn('Input data contains invalid values (NaNs or '
+                      'infs), which were automatically masked.',
+                      AstropyUserWarning)
+
+    def _pad_or_crop(self, data):
+        """
+        Pad or crop the 2D data array so that there are an integer
+        number of boxes in both dimensions.
+        """
+        extra_size = data.shape % self.box_size
+        if np.sum(extra_size) == 0:
+            return data
+
+        if self.edge_method == 'pad':
+            pad_size = (np.ceil(data.shape / self.box_size).astype(int)
+                        * self.box_size) - data.shape
+            pad_width = ((0, pad_size[0]), (0, pad_size[1]))
+            return np.pad(data, pad_width, mode='constant',
+                          constant_values=np.nan)
+        elif self.edge_method == 'crop':
+            crop_size = (data.shape // self.box_size) * self.box_size
+            crop_slc = np.index_exp[0:crop_size[0], 0:crop_size[1]]
+            return data[crop_slc]
+        else:
+            raise ValueError('edge_method must be "pad" or "crop"')
+
+    def _make_box_data(self, data):
+        """
+        Reshape the (padded or cropped) 2D data array into a different
+        2D array where each row represents the data in a single box.
+        """
+        nboxes = data.shape // self.box_size
+        return np.swapaxes(data.reshape(
+            nboxes[0], self.box_size[0],
+            nboxes[1], self.box_size[1]),
+            1, 2).reshape(np.prod(nboxes), np.prod(self.box_size))
 
     def _reshape_data(self):
         """
@@ -290,36 +391,13 @@ class Background2D:
         Then reshape it into a different 2D array where each row
         represents the data in a single box.
         """
-        self.nboxes = self.data.shape // self.box_size
-        extra_size = self.data.shape % self.box_size
-
-        if np.sum(extra_size) != 0:
-            # pad or crop the data
-            if self.edge_method == 'pad':
-                pad_size = (np.ceil(self.data.shape
-                                    / self.box_size).astype(int)
-                            * self.box_size) - self.data.shape
-                pad_width = ((0, pad_size[0]), (0, pad_size[1]))
-                data = np.pad(self.data, pad_width, mode='constant',
-                              constant_values=np.nan)
-                self.nboxes = data.shape // self.box_size
-            elif self.edge_method == 'crop':
-                crop_size = self.nboxes * self.box_size
-                crop_slc = np.index_exp[0:crop_size[0], 0:crop_size[1]]
-                data = self.data[crop_slc]
-            else:
-                raise ValueError('edge_method must be "pad" or "crop"')
-        else:
-            data = self.data
-
+        data = self._pad_or_crop(self.data)
+        self.nboxes = data.shape // self.box_size
         self.box_npixels = np.prod(self.box_size)
         self.nboxes_tot = np.prod(self.nboxes)
 
         # a reshaped 2D array with box data along the x axis
-        self._box_data = np.swapaxes(data.reshape(
-            self.nboxes[0], self.box_size[0],
-            self.nboxes[1], self.box_size[1]),
-            1, 2).reshape(self.nboxes_tot, self.box_npixels)
+        return self._make_box_data(data)
 
     @lazyproperty
     def _box_npixels_threshold(self):
@@ -337,23 +415,24 @@ class Background2D:
             threshold -= 1
         return threshold
 
-    def _get_box_indices(self):
+    def _get_box_indices(self, box_data):
         """
-        Define the x and y indices of the boxes that will be used to
-        compute background statistics.
+        Define the indices of the boxes that will be used to compute
+        background statistics.
 
-        The box array (self._box_data) is a 2D array where each row
+        The box array (``box_data``) is a 2D array where each row
         represents the data in a single box.
 
         The ``exclude_percentile`` keyword determines which boxes are
         not used for the background interpolation.
         """
         # the number of NaN pixels in each box
-        nmasked = np.count_nonzero(np.isnan(self._box_data), axis=1)
+        nmasked = np.count_nonzero(np.isnan(box_data), axis=1)
 
         # define indices of good (included) boxes
-        box_idx = np.where(nmasked <= self._box_npixels_threshold)[0]
+        return np.where(nmasked <= self._box_npixels_threshold)[0]
 
+    def _check_box_indices(self, box_idx):
         if box_idx.size == 0:
             raise ValueError('All boxes contain > '
                              f'{self._box_npixels_threshold} '
@@ -363,40 +442,324 @@ class Background2D:
                              '"exclude_percentile" to allow more boxes to '
                              'be included.')
 
-        return box_idx
+    @lazyproperty
+    def _nproc(self):
+        if self.nproc is None:
+            return cpu_count()  # pragma: no cover
+        return self.nproc
+
+    def _executor(self):
+        """
+        Return a context manager for the thread pool used to compute
+        the box statistics (or a null context if ``nproc`` is 1).
+        """
+        if self._nproc > 1:
+            return ThreadPoolExecutor(max_workers=self._nproc)
+        return nullcontext()
+
+    @lazyproperty
+    def _use_sorted_stats(self):
+        """
+        Whether the sigma clipping and box statistics can be computed
+        together from the sorted box data (see `_SortedStats`).
+        """
+        sigma_clip = self.sigma_clip
+        if sigma_clip is not None and (type(sigma_clip) is not SigmaClip
+                                       or sigma_clip.cenfunc != 'median'
+                                       or sigma_clip.stdfunc != 'std'
+                                       or sigma_clip.grow):
+            return False
+        return all(type(estimator) in _SORTED_STATS_FUNCS
+                   and estimator.sigma_clip is None
+                   for estimator in (self.bkg_estimator,
+                                     self.bkgrms_estimator))
+
+    def _calc_box_stats(self, box_data):
+        """
+        Select the boxes to be used to compute background statistics,
+        sigma clip the data in each box, and compute the background and
+        background RMS statistics of the selected boxes.
+
+        The box array (``box_data``) is a 2D array where each row
+        represents the data in a single box.
 
-    def _select_initial_boxes(self):
+        Returns the indices of the selected boxes (rows), their
+        background and background RMS statistics, and their number of
+        masked pixels.
+        """
         # perform a first cut on rejecting boxes
-        self._box_idx = self._get_box_indices()
-        if self._box_idx.size != self._box_data.shape[0]:
-            self._box_data = self._box_data[self._box_idx, :]
+        box_idx = self._get_box_indices(box_data)
+        if box_idx.size != box_data.shape[0]:
+            box_data = box_data[box_idx, :]
+        if box_idx.size == 0:
+            return box_idx, np.array([]), np.array([]), box_idx
 
-    def _sigmaclip_boxes(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter('ignore', category=AstropyUserWarning)
+        if self._use_sorted_stats:
+            stats = _SortedStats(box_data)
             if self.sigma_clip is not None:
-                self._box_data = self.sigma_clip(self._box_data, axis=1,
-                                                 masked=False)
+                stats.sigma_clip(self.sigma_clip)
+            box_nmasked = self.box_npixels - stats.npixels
+            bkg_func = _SORTED_STATS_FUNCS[type(self.bkg_estimator)]
+            bkgrms_func = _SORTED_STATS_FUNCS[type(self.bkgrms_estimator)]
+            bkg_stats = bkg_func(self.bkg_estimator, stats)
+            bkgrms_stats = bkgrms_func(self.bkgrms_estimator, stats)
+        else:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', category=AstropyUserWarning)
+                if self.sigma_clip is not None:
+                    # SigmaClip stores the clipping bounds, thus each
+                    # thread needs its own instance
+                    box_data = copy(self.sigma_clip)(box_data, axis=1,
+                                                     masked=False)
+            box_nmasked = np.count_nonzero(np.isnan(box_data), axis=1)
+            bkg_stats = self.bkg_estimator(box_data, axis=1)
+            bkgrms_stats = self.bkgrms_estimator(box_data, axis=1)
 
         # perform box rejection on sigma-clipped data (i.e., for any
         # newly-masked pixels)
-        idx = self._get_box_indices()
-        self._box_idx = self._box_idx[idx]
-        if self._box_idx.size != self._box_data.shape[0]:
-            self._box_data = self._box_data[idx, :]
+        idx = np.where(box_nmasked <= self._box_npixels_threshold)[0]
 
-        # the indices of the good pixels in the low-resolution 2D mesh
-        self._mesh_idx = np.unravel_index(self._box_idx, self.nboxes)
+        return (box_idx[idx], bkg_stats[idx], bkgrms_stats[idx],
+                box_nmasked[idx])
+
+    def _compute_box_stats(self, box_data, executor=None):
+        """
+        Compute the box statistics (see `_calc_box_stats`) in chunks of
+        boxes, which are processed in the threads of the input
+        ``executor``.
+
+        The chunks also limit the size of the temporary arrays.
+        """
+        nboxes = box_data.shape[0]
+        nchunks = max(box_data.size // 2**22, 1)
+        if executor is not None:
+            nchunks = max(nchunks, self._nproc)
+        nchunks = min(nchunks, nboxes)
+        if nchunks <= 1:
+            return self._calc_box_stats(box_data)
+
+        bounds = np.linspace(0, nboxes, nchunks + 1).astype(int)
+        slices = [slice(start, stop)
+                  for start, stop in zip(bounds[:-1], bounds[1:])]
+
+        def calc_chunk(slc):
+            return self._calc_box_stats(box_data[slc])
+
+        if executor is None:
+            results = list(map(calc_chunk, slices))
+        else:
+            results = list(executor.map(calc_chunk, slices))
+
+        box_idx, bkg_stats, bkgrms_stats, box_nmasked = zip(*results)
+        box_idx = [idx + slc.start for idx, slc in zip(box_idx, slices)]
+        return (np.concatenate(box_idx), np.concatenate(bkg_stats),
+                np.concatenate(bkgrms_stats), np.concatenate(box_nmasked))
 
     def _prepare_box_data(self):
         """
         Prepare the box data by reshaping, masking (with NaNs), and
-        sigma clipping the data.
+        sigma clipping the data, and compute the box statistics.
+        """
+        with self._executor() as executor:
+            if self.tiled:
+                box_stats = self._compute_box_stats_tiled(executor)
+            else:
+                self.data, self.total_mask, has_nonfinite = (
+                    self._prepare_data(self.data, self.total_mask))
+                if has_nonfinite:
+                    self._warn_nonfinite()
+                box_stats = self._compute_box_stats(self._reshape_data(),
+                                                    executor)
+
+        (self._box_idx, self._bkg_stats, self._bkgrms_stats,
+         self._box_nmasked) = box_stats
+        self._check_box_indices(self._box_idx)
+
+        # the indices of the good pixels in the low-resolution 2D mesh
+        self._mesh_idx = np.unravel_index(self._box_idx, self.nboxes)
+
+    def _compute_box_stats_tiled(self, executor=None):
         """
-        self._prepare_data()
-        self._reshape_data()
-        self._select_initial_boxes()
-        self._sigmaclip_boxes()
+        Compute the box statistics one row of boxes at a time.
+
+        Only the data (and masks) for a single row of boxes are loaded
+        into memory at a time. The sigma clipping and the statistics
+        are computed independently for each box, thus the box
+        statistics are identical to those computed from the full data
+        array.
+        """
+        shape = np.array(self.data.shape)
+        if (np.sum(shape % self.box_size) != 0
+                and self.edge_method not in ('pad', 'crop')):
+            raise ValueError('edge_method must be "pad" or "crop"')
+
+        self.nboxes = shape // self.box_size
+        if self.edge_method == 'pad':
+            self.nboxes = -(-shape // self.box_size)  # ceil
+        self.box_npixels = np.prod(self.box_size)
+        self.nboxes_tot = np.prod(self.nboxes)
+
+        results = []
+        has_nonfinite = False
+        for row in range(self.nboxes[0]):
+            data, nonfinite = self._prepare_row_data(row)
+            has_nonfinite |= nonfinite
+
+            box_data = self._make_box_data(self._pad_or_crop(data))
+            box_idx, *box_stats = self._compute_box_stats(box_data, executor)
+            results.append((box_idx + row * self.nboxes[1], *box_stats))
+
+        if has_nonfinite:
+            self._warn_nonfinite()
+
+        return tuple(np.concatenate(arrays) for arrays in zip(*results))
+
+    def _row_slice(self, row):
+        """
+        The slice of the data rows in the given row of boxes.
+        """
+        return np.s_[row * self.box_size[0]:(row + 1) * self.box_size[0]]
+
+    def _prepare_row_data(self, row):
+        """
+        Prepare the input data (see `_prepare_data`) in a single row of
+        boxes.
+
+        Returns the prepared data and whether the data contained
+        non-finite values.
+        """
+        slc = self._row_slice(row)
+        mask = self._combine_masks(slc)
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool)
+        data, _, has_nonfinite = self._prepare_data(self._input_data[slc],
+                                                    mask)
+        return data, has_nonfinite
+
+    def _pack_mask(self, mask):
+        """
+        Return a copy of the ``mask`` packed into bits for each row
+        of boxes (or `None` if ``mask`` is `None`).
+
+        The copy is used by `_changed_boxes` to detect the mask changes,
+        including changes made in place to the input mask array.
+        """
+        if mask is None:
+            return None
+
+        return [np.packbits(np.asarray(mask[self._row_slice(row)],
+                                       dtype=bool), axis=1)
+                for row in range(self.nboxes[0])]
+
+    def _changed_boxes(self, mask):
+        """
+        Return a 2D boolean array of the boxes that contain pixels
+        whose ``mask`` value differs from the mask used to compute the
+        current box statistics.
+        """
+        changed = np.zeros(self.nboxes, dtype=bool)
+        if self._packed_mask is None and mask is None:
+            return changed
+
+        col_starts = np.arange(self.nboxes[1]) * self.box_size[1]
+        for row in range(self.nboxes[0]):
+            if self._packed_mask is None:
+                diff = np.asarray(mask[self._row_slice(row)], dtype=bool)
+            else:
+                old_mask = np.unpackbits(self._packed_mask[row], axis=1,
+                                         count=self.data.shape[1])
+                old_mask = old_mask.astype(bool)
+                if mask is None:
+                    diff = old_mask
+                else:
+                    diff = (np.asarray(mask[self._row_slice(row)],
+                                       dtype=bool) != old_mask)
+            if diff.size > 0:
+                changed[row] = np.logical_or.reduceat(diff.any(axis=0),
+                                                      col_starts)
+        return changed
+
+    def update(self, mask=None):
+        """
+        Update the background and background RMS for a new ``mask``.
+
+        Only the boxes that contain pixels whose mask value changed
+        are sigma clipped and have their statistics recomputed. The
+        low-resolution meshes and the full-sized `background` and
+        `background_rms` images are then recomputed when they are next
+        accessed. The results are identical to creating a new
+        `Background2D` instance with the new ``mask``.
+
+        This is useful, for example, when iteratively masking sources
+        where the source mask grows with each iteration. The new
+        ``mask`` can be the same array as the current mask, modified
+        in place.
+
+        The input ``data`` must not have been modified since this
+        `Background2D` instance was created.
+
+        Parameters
+        ----------
+        mask : array_like (bool), optional
+            The new boolean mask, with the same shape as the input
+            ``data``, where a `True` value indicates the corresponding
+            element of ``data`` is masked. It replaces the ``mask``
+            used to create this instance. Masked data are excluded from
+            calculations. If `None`, then no pixels are masked (other
+            than by the ``coverage_mask`` and non-finite values).
+        """
+        mask = self._validate_array(mask, 'mask')
+        changed = self._changed_boxes(mask)
+        self.mask = mask
+        self._packed_mask = self._pack_mask(mask)
+        if not self.tiled:
+            self.data, self.total_mask, _ = self._prepare_data(
+                self._input_data, self._combine_masks())
+
+        results = []
+        with self._executor() as executor:
+            for row in np.nonzero(changed.any(axis=1))[0]:
+                if self.tiled:
+                    data, _ = self._prepare_row_data(row)
+                else:
+                    data = self.data[self._row_slice(row)]
+
+                cols = np.nonzero(changed[row])[0]
+                box_data = self._make_box_data(self._pad_or_crop(data))
+                box_idx, *box_stats = self._compute_box_stats(
+                    box_data[cols], executor)
+                results.append((cols[box_idx] + row * self.nboxes[1],
+                                *box_stats))
+
+        # replace the statistics of the changed boxes
+        keep = ~changed.ravel()[self._box_idx]
+        results.append((self._box_idx[keep], self._bkg_stats[keep],
+                        self._bkgrms_stats[keep], self._box_nmasked[keep]))
+        box_idx, *box_stats = (np.concatenate(arrays)
+                               for arrays in zip(*results))
+        self._check_box_indices(box_idx)
+
+        idx = np.argsort(box_idx)
+        self._box_idx = box_idx[idx]
+        self._bkg_stats, self._bkgrms_stats, self._box_nmasked = (
+            stats[idx] for stats in box_stats)
+        self._mesh_idx = np.unravel_index(self._box_idx, self.nboxes)
+        self._reset_lazyproperties()
+
+    @property
+    def _lazyproperties(self):
+        """
+        A list of all class lazyproperties (even in superclasses).
+        """
+        def islazyproperty(obj):
+            return isinstance(obj, lazyproperty)
+
+        return [i[0] for i in inspect.getmembers(self.__class__,
+                                                 predicate=islazyproperty)]
+
+    def _reset_lazyproperties(self):
+        for key in self._lazyproperties:
+            self.__dict__.pop(key, None)
 
     def _make_2d_array(self, data):
         """
@@ -542,7 +905,6 @@ class Background2D:
         compute which pixels are to be selectively filtered (if
         ``filter_threshold`` is input).
         """
-        self._bkg_stats = self.bkg_estimator(self._box_data, axis=1)
         return self._make_mesh_image(self._bkg_stats)
 
     @lazyproperty
@@ -563,7 +925,6 @@ class Background2D:
         This image is equivalent to the low-resolution "MINIBACKGROUND"
         background rms map in SourceExtractor.
         """
-        self._bkgrms_stats = self.bkgrms_estimator(self._box_data, axis=1)
         mesh_img = self._make_mesh_image(self._bkgrms_stats)
         return self._filter_meshes(mesh_img)
 
@@ -604,8 +965,7 @@ class Background2D:
         A 2D array of the number of masked pixels in each mesh. NaN
         values indicate where meshes were excluded.
         """
-        return self._make_2d_array(
-            np.count_nonzero(np.isnan(self._box_data), axis=1))
+        return self._make_2d_array(self._box_nmasked)
 
     @lazyproperty
     def background_median(self):
@@ -653,6 +1013,199 @@ class Background2D:
             bkg_rms <<= self.unit
         return bkg_rms
 
+    @property
+    def lazy_background(self):
+        """
+        A `LazyBackgroundImage` array-like proxy for the `background`
+        image that computes only the indexed pixels.
+        """
+        return LazyBackgroundImage(self)
+
+    @property
+    def lazy_background_rms(self):
+        """
+        A `LazyBackgroundImage` array-like proxy for the
+        `background_rms` image that computes only the indexed pixels.
+        """
+        return LazyBackgroundImage(self, rms=True)
+
+    def _interpolate_at(self, rms, y, x):
+        """
+        Interpolate the background (or background RMS if ``rms`` is
+        `True`) mesh at the ``y`` and ``x`` pixel positions (1D arrays)
+        of the full-sized image.
+
+        Returns `None` if the interpolator cannot be evaluated at
+        individual positions (i.e., only computes the full-sized
+        image).
+        """
+        interpolate_at = getattr(self.interpolator, '_interpolate_at', None)
+        if interpolate_at is None:
+            return None
+
+        mesh = self.background_rms_mesh if rms else self.background_mesh
+        return interpolate_at(mesh, self, y, x)
+
+    def _add_unit(self, values):
+        if self.unit is not None:
+            values <<= self.unit
+        return values
+
+    def _values_at(self, x, y, rms):
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float),
+                                   np.asarray(y, dtype=float))
+        xi = np.round(x.ravel()).astype(int)
+        yi = np.round(y.ravel()).astype(int)
+        ny, nx = self.data.shape
+        if (np.any(xi < 0) or np.any(xi >= nx) or np.any(yi < 0)
+                or np.any(yi >= ny)):
+            raise ValueError('The input positions must be within the data '
+                             'array.')
+
+        values = self._interpolate_at(rms, y.ravel(), x.ravel())
+        if values is None:
+            # custom interpolators compute only the full-sized image,
+            # which does not define the values between the pixels
+            if np.any(xi != x.ravel()) or np.any(yi != y.ravel()):
+                raise ValueError('The positions must be integers if the '
+                                 'interpolator is a custom callable '
+                                 'object.')
+            # the full-sized image includes the coverage mask and unit
+            image = self.background_rms if rms else self.background
+            values = image[yi, xi]
+        else:
+            if self.coverage_mask is not None:
+                covered = np.asarray(self.coverage_mask[yi, xi], dtype=bool)
+                values[covered] = self.fill_value
+            values = self._add_unit(values)
+
+        if x.ndim == 0:
+            return values[0]
+        return values.reshape(x.shape)
+
+    def _cutout(self, slices, rms):
+        try:
+            if len(slices) != 2:
+                raise TypeError
+            yx_range = [slc.indices(size)
+                        for slc, size in zip(slices, self.data.shape)]
+        except (TypeError, AttributeError) as exc:
+            raise ValueError('slices must be a tuple of two slice '
+                             'objects.') from exc
+        if any(step != 1 for _, _, step in yx_range):
+            raise ValueError('slices must have a step of 1.')
+
+        slices = tuple(slice(start, max(start, stop))
+                       for start, stop, _ in yx_range)
+        shape = tuple(slc.stop - slc.start for slc in slices)
+        y, x = np.mgrid[slices]
+        values = self._interpolate_at(rms, y.ravel(), x.ravel())
+        if values is None:
+            # the full-sized image includes the coverage mask and unit
+            image = self.background_rms if rms else self.background
+            return image[slices]
+
+        values = values.reshape(shape)
+        if self.coverage_mask is not None:
+            values[np.asarray(self.coverage_mask[slices], dtype=bool)] = (
+                self.fill_value)
+        return self._add_unit(values)
+
+    def background_at(self, x, y):
+        """
+        Compute the background image values at the given pixel
+        positions.
+
+        The interpolator is evaluated only at the input positions, thus
+        the full-sized `background` image is not computed (unless the
+        ``interpolator`` is a custom callable object that can only
+        compute the full-sized image).
+
+        Parameters
+        ----------
+        x, y : float or array_like
+            The ``x`` and ``y`` pixel positions. The positions must be
+            within the data array. They can be fractional, unless the
+            ``interpolator`` is a custom callable object.
+
+        Returns
+        -------
+        result : float, `~numpy.ndarray`, or `~astropy.units.Quantity`
+            The background values at the input positions, with the
+            same shape as the (broadcast) ``x`` and ``y`` inputs.
+        """
+        return self._values_at(x, y, rms=False)
+
+    def background_rms_at(self, x, y):
+        """
+        Compute the background RMS image values at the given pixel
+        positions.
+
+        The interpolator is evaluated only at the input positions, thus
+        the full-sized `background_rms` image is not computed (unless
+        the ``interpolator`` is a custom callable object that can only
+        compute the full-sized image).
+
+        Parameters
+        ----------
+        x, y : float or array_like
+            The ``x`` and ``y`` pixel positions. The positions must be
+            within the data array. They can be fractional, unless the
+            ``interpolator`` is a custom callable object.
+
+        Returns
+        -------
+        result : float, `~numpy.ndarray`, or `~astropy.units.Quantity`
+            The background RMS values at the input positions, with the
+            same shape as the (broadcast) ``x`` and ``y`` inputs.
+        """
+        return self._values_at(x, y, rms=True)
+
+    def background_cutout(self, slices):
+        """
+        Compute a cutout of the background image.
+
+        The interpolator is evaluated only for the cutout pixels, thus
+        the full-sized `background` image is not computed (unless the
+        ``interpolator`` is a custom callable object that can only
+        compute the full-sized image).
+
+        Parameters
+        ----------
+        slices : tuple of 2 slice
+            The ``(y, x)`` slices defining the cutout. The slices must
+            have a step of 1.
+
+        Returns
+        -------
+        result : 2D `~numpy.ndarray` or `~astropy.units.Quantity`
+            The background cutout, identical to ``background[slices]``.
+        """
+        return self._cutout(slices, rms=False)
+
+    def background_rms_cutout(self, slices):
+        """
+        Compute a cutout of the background RMS image.
+
+        The interpolator is evaluated only for the cutout pixels, thus
+        the full-sized `background_rms` image is not computed (unless
+        the ``interpolator`` is a custom callable object that can only
+        compute the full-sized image).
+
+        Parameters
+        ----------
+        slices : tuple of 2 slice
+            The ``(y, x)`` slices defining the cutout. The slices must
+            have a step of 1.
+
+        Returns
+        -------
+        result : 2D `~numpy.ndarray` or `~astropy.units.Quantity`
+            The background RMS cutout, identical to
+            ``background_rms[slices]``.
+        """
+        return self._cutout(slices, rms=True)
+
     def plot_meshes(self, *, ax=None, marker='+', markersize=None,
                     color='blue', alpha=None, outlines=False, **kwargs):
         """
@@ -706,3 +1259,164 @@ class Background2D:
             apers = RectangularAperture(xypos, self.box_size[1],
                                         self.box_size[0], 0.0)
             apers.plot(ax=ax, alpha=alpha, **kwargs)
+
+
+class LazyBackgroundImage:
+    """
+    An array-like proxy for the full-sized background (or background
+    RMS) image of a `Background2D` object that computes only the
+    indexed pixels.
+
+    Indexing with slices (e.g., ``image[10:20, 30:50]``) computes only
+    the pixels in the cutout (see `Background2D.background_cutout`).
+    Indexing with two integer arrays (e.g., ``image[yidx, xidx]``)
+    computes only the indexed pixels (see `Background2D.background_at`).
+    Any other indexing, or converting the proxy to an array (e.g.,
+    with `numpy.asarray`), computes the full-sized image.
+
+    This object can be used as the ``background`` input to
+    `~photutils.segmentation.SourceCatalog` or as the
+    ``background`` input to `~photutils.psf.PSFPhotometry`.
+
+    This class should not be instantiated directly. Use the
+    `Background2D.lazy_background` or
+    `Background2D.lazy_background_rms` attributes instead.
+
+    Parameters
+    ----------
+    bkg2d : `Background2D`
+        The `Background2D` object.
+
+    rms : bool, optional
+        Whether the proxy is for the background RMS image instead of the
+        background image.
+    """
+
+    def __init__(self, bkg2d, *, rms=False):
+        self._bkg2d = bkg2d
+        self.rms = rms
+        self._with_unit = True
+
+    def __repr__(self):
+        image = 'background_rms' if self.rms else 'background'
+        return f'<{self.__class__.__name__}({image}, shape={self.shape})>'
+
+    @property
+    def shape(self):
+        """
+        The shape of the image.
+        """
+        return self._bkg2d.data.shape
+
+    @property
+    def ndim(self):
+        """
+        The number of image dimensions.
+        """
+        return 2
+
+    @property
+    def size(self):
+        """
+        The number of pixels in the image.
+        """
+        return int(np.prod(self.shape))
+
+    @property
+    def dtype(self):
+        """
+        The data type of the image.
+        """
+        return np.dtype(self._bkg2d.dtype)
+
+    @property
+    def unit(self):
+        """
+        The unit of the image values, or `None` if the image values do
+        not have units.
+        """
+        return self._bkg2d.unit if self._with_unit else None
+
+    @property
+    def value(self):
+        """
+        A proxy for the image without units.
+        """
+        proxy = self.__class__(self._bkg2d, rms=self.rms)
+        proxy._with_unit = False
+        return proxy
+
+    def __len__(self):
+        return self.shape[0]
+
+    def _strip_unit(self, values):
+        if not self._with_unit and isinstance(values, u.Quantity):
+            return values.value
+        return values
+
+    def at(self, x, y):
+        """
+        Compute the image values at the given pixel positions.
+
+        Parameters
+        ----------
+        x, y : float or array_like
+            The ``x`` and ``y`` pixel positions. The positions must
+            be within the image. They can be fractional, unless the
+            `Background2D` ``interpolator`` is a custom callable object.
+
+        Returns
+        -------
+        result : float, `~numpy.ndarray`, or `~astropy.units.Quantity`
+            The image values at the input positions.
+        """
+        return self._strip_unit(self._bkg2d._values_at(x, y, rms=self.rms))
+
+    def _full_image(self):
+        bkg2d = self._bkg2d
+        return bkg2d.background_rms if self.rms else bkg2d.background
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) == 1:
+            key = (key[0], slice(None))
+
+        if len(key) == 2:
+            if all(isinstance(k, (slice, int, np.integer)) for k in key):
+                slices = []
+                for k, size in zip(key, self.shape):
+                    if isinstance(k, slice):
+                        slices.append(k)
+                        continue
+                    idx = k + size if k < 0 else k
+                    if idx < 0 or idx >= size:
+                        raise IndexError(f'index {k} is out of bounds for '
+                                         f'axis with size {size}')
+                    slices.append(slice(idx, idx + 1))
+
+                if all(slc.step in (None, 1) for slc in slices):
+                    values = self._bkg2d._cutout(tuple(slices),
+                                                 rms=self.rms)
+                    idx = tuple(slice(None) if isinstance(k, slice) else 0
+                                for k in key)
+                    return self._strip_unit(values[idx])
+
+            yidx, xidx = (np.asanyarray(k) for k in key)
+            if yidx.dtype.kind in 'iu' and xidx.dtype.kind in 'iu':
+                yidx, xidx = np.broadcast_arrays(yidx, xidx)
+                yidx = np.where(yidx < 0, yidx + self.shape[0], yidx)
+                xidx = np.where(xidx < 0, xidx + self.shape[1], xidx)
+                if (np.any(yidx < 0) or np.any(yidx >= self.shape[0])
+                        or np.any(xidx < 0) or np.any(xidx >= self.shape[1])):
+                    raise IndexError('index is out of bounds')
+                return self.at(xidx, yidx)
+
+        # any other indexing computes the full-sized image
+        return self._strip_unit(self._full_image()[key])
+
+    def __array__(self, dtype=None, copy=None):
+        image = self._full_image()
+        if isinstance(image, u.Quantity):
+            image = image.value
+        return np.asarray(image, dtype=dtype)
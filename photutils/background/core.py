@@ -412,13 +412,7 @@ class SExtractorBackground(BackgroundBase):
             _median = np.atleast_1d(nanmedian(data, axis=axis))
             _mean = np.atleast_1d(nanmean(data, axis=axis))
             _std = np.atleast_1d(nanstd(data, axis=axis))
-            bkg = np.atleast_1d((2.5 * _median) - (1.5 * _mean))
-
-            bkg = np.where(_std == 0, _mean, bkg)
-
-            idx = np.where(_std != 0)
-            condition = (np.abs(_mean[idx] - _median[idx]) / _std[idx]) < 0.3
-            bkg[idx] = np.where(condition, bkg[idx], _median[idx])
+            bkg = _sextractor_mode(_median, _mean, _std)
             if bkg.size == 1:
                 bkg = bkg[0]
             result = bkg
@@ -682,3 +676,165 @@ class BiweightScaleBackgroundRMS(BackgroundRMSBase):
             result = np.ma.masked_where(np.isnan(result), result)
 
         return result
+
+
+def _sextractor_mode(median, mean, std):
+    """
+    Calculate the SourceExtractor background estimator from 1D arrays
+    of the median, mean, and standard deviation values.
+    """
+    bkg = np.atleast_1d((2.5 * median) - (1.5 * mean))
+
+    bkg = np.where(std == 0, mean, bkg)
+
+    idx = np.where(std != 0)
+    condition = (np.abs(mean[idx] - median[idx]) / std[idx]) < 0.3
+    bkg[idx] = np.where(condition, bkg[idx], median[idx])
+    return bkg
+
+
+class _SortedStats:
+    """
+    Class to calculate (sigma-clipped) statistics along the rows of a
+    2D array from the sorted rows.
+
+    Each row is sorted once. NaN values are treated as masked (they
+    are sorted to the end of each row). Sigma clipping then only
+    narrows the ``[lo, hi)`` window of unclipped values in each sorted
+    row, the median is indexed directly, and the mean and standard
+    deviation are calculated from prefix sums of the values relative
+    to the initial row medians. This avoids replacing the clipped
+    values with NaN and recomputing the NaN-aware statistics over the
+    full array in each sigma-clipping iteration.
+
+    The results are identical to those of `~astropy.stats.SigmaClip`
+    (with the default ``cenfunc='median'`` and ``stdfunc='std'``)
+    followed by the NaN-aware statistics, up to floating-point rounding
+    of the mean and standard deviation.
+
+    Parameters
+    ----------
+    data : 2D `~numpy.ndarray`
+        The 2D array, where NaN values are masked.
+    """
+
+    def __init__(self, data):
+        self.data = np.sort(data, axis=1)
+        self.lo = np.zeros(data.shape[0], dtype=int)
+        self.hi = data.shape[1] - np.count_nonzero(np.isnan(data), axis=1)
+
+        # the prefix sums of the values relative to the initial medians
+        # (with a leading zero); NaN values at the end of the rows are
+        # never included in the window
+        self._shift = self.median
+        values = self.data - np.nan_to_num(self._shift)[:, None]
+        shape = (data.shape[0], data.shape[1] + 1)
+        self._sum1 = np.zeros(shape)
+        self._sum2 = np.zeros(shape)
+        np.cumsum(values, axis=1, out=self._sum1[:, 1:])
+        np.cumsum(values**2, axis=1, out=self._sum2[:, 1:])
+
+    @property
+    def npixels(self):
+        """
+        The number of unmasked and unclipped values in each row.
+        """
+        return self.hi - self.lo
+
+    def _take(self, idx):
+        idx = np.clip(idx, 0, self.data.shape[1] - 1)
+        return np.take_along_axis(self.data, idx[:, None], axis=1)[:, 0]
+
+    def _window_sums(self, sums):
+        rows = np.arange(sums.shape[0])
+        return sums[rows, self.hi] - sums[rows, self.lo]
+
+    @property
+    def median(self):
+        npixels = self.npixels
+        with np.errstate(invalid='ignore'):
+            median = (self._take(self.lo + (npixels - 1) // 2).astype(float)
+                      + self._take(self.lo + npixels // 2)) / 2.0
+        median[npixels == 0] = np.nan
+        return median
+
+    @property
+    def mean(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (self._shift
+                    + self._window_sums(self._sum1) / self.npixels)
+
+    @property
+    def std(self):
+        npixels = self.npixels
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = self._window_sums(self._sum1) / npixels
+            var = self._window_sums(self._sum2) / npixels - mean**2
+        return np.sqrt(np.maximum(var, 0.0))
+
+    @property
+    def mad_std(self):
+        # the deviations of the values outside of the window are masked
+        mask = ((np.arange(self.data.shape[1]) < self.lo[:, None])
+                | (np.arange(self.data.shape[1]) >= self.hi[:, None]))
+        deviation = np.abs(self.data - self.median[:, None])
+        deviation[mask] = np.nan
+        # same normalization as astropy.stats.mad_std
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return nanmedian(deviation, axis=1) * 1.482602218505602
+
+    def sigma_clip(self, sigma_clip):
+        """
+        Sigma clip the values in each row.
+
+        Parameters
+        ----------
+        sigma_clip : `astropy.stats.SigmaClip`
+            The sigma-clipping parameters. The ``cenfunc`` and
+            ``stdfunc`` must be ``'median'`` and ``'std'``,
+            respectively, and ``grow`` must be `False`.
+        """
+        iteration = 0
+        while iteration < sigma_clip.maxiters:
+            iteration += 1
+            median = self.median
+            std = self.std
+            min_value = median - (std * sigma_clip.sigma_lower)
+            max_value = median + (std * sigma_clip.sigma_upper)
+
+            # clipped values are always excluded, even if the bounds
+            # become wider; comparisons with NaN are always False
+            with np.errstate(invalid='ignore'):
+                lo = np.count_nonzero(self.data < min_value[:, None],
+                                      axis=1)
+                hi = np.count_nonzero(self.data <= max_value[:, None],
+                                      axis=1)
+            lo = np.maximum(self.lo, lo)
+            hi = np.maximum(np.minimum(self.hi, hi), lo)
+            empty = self.npixels == 0
+            lo[empty] = self.lo[empty]
+            hi[empty] = self.hi[empty]
+
+            if np.array_equal(lo, self.lo) and np.array_equal(hi, self.hi):
+                break
+            self.lo = lo
+            self.hi = hi
+
+
+# the built-in estimators (exact types) that can be calculated from
+# _SortedStats
+_SORTED_STATS_FUNCS = {
+    MeanBackground: lambda estimator, stats: stats.mean,
+    MedianBackground: lambda estimator, stats: stats.median,
+    ModeEstimatorBackground: lambda estimator, stats: (
+        (estimator.median_factor * stats.median)
+        - (estimator.mean_factor * stats.mean)),
+    MMMBackground: lambda estimator, stats: (
+        (estimator.median_factor * stats.median)
+        - (estimator.mean_factor * stats.mean)),
+    SExtractorBackground: lambda estimator, stats: _sextractor_mode(
+        stats.median, stats.mean, stats.std),
+    StdBackgroundRMS: lambda estimator, stats: stats.std,
+    MADStdBackgroundRMS: lambda estimator, stats: stats.mad_std,
+}
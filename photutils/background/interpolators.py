@@ -3,13 +3,57 @@
 This module defines interpolator classes for Background2D.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import cpu_count
+
 import numpy as np
 
 from photutils.utils import ShepardIDWInterpolator
 
-__all__ = ['BkgZoomInterpolator', 'BkgIDWInterpolator']
+__all__ = ['BkgZoomInterpolator', 'BkgBicubicInterpolator',
+           'BkgIDWInterpolator']
+
+__doctest_requires__ = {('BkgZoomInterpolator'): ['scipy'],
+                        ('BkgBicubicInterpolator'): ['scipy']}
+
+
+def _mesh_coordinates(pixels, axis, mesh_shape, bkg2d_obj, grid_mode):
+    """
+    Calculate the mesh coordinates of the pixel positions along an
+    axis of the full-sized image, as used by `~scipy.ndimage.zoom` in
+    `BkgZoomInterpolator`.
+
+    Parameters
+    ----------
+    pixels : `~numpy.ndarray`
+        The pixel positions along the ``axis`` of the full-sized image.
+
+    axis : int
+        The image axis.
 
-__doctest_requires__ = {('BkgZoomInterpolator'): ['scipy']}
+    mesh_shape : tuple of int
+        The shape of the low-resolution mesh array.
+
+    bkg2d_obj : `Background2D` object
+        The `Background2D` object that prepared the mesh array.
+
+    grid_mode : bool
+        The ``grid_mode`` used for the ``'pad'`` edge method.
+
+    Returns
+    -------
+    coords : `~numpy.ndarray`
+        The mesh coordinates.
+    """
+    nmesh = mesh_shape[axis]
+    if bkg2d_obj.edge_method == 'pad':
+        box_size = bkg2d_obj.box_size[axis]
+        if grid_mode:
+            return (pixels + 0.5) / box_size - 0.5
+        nout = nmesh * box_size
+    else:
+        nout = bkg2d_obj.data.shape[axis]
+    return pixels * ((nmesh - 1) / max(nout - 1, 1))
 
 
 class BkgZoomInterpolator:
@@ -78,7 +122,8 @@ class BkgZoomInterpolator:
         """
         mesh = np.asanyarray(mesh)
         if np.ptp(mesh) == 0:
-            return np.zeros_like(bkg2d_obj.data) + np.min(mesh)
+            return np.full(bkg2d_obj.data.shape, np.min(mesh),
+                           dtype=bkg2d_obj.dtype)
 
         from scipy.ndimage import zoom
 
@@ -87,15 +132,16 @@ class BkgZoomInterpolator:
             # (i.e., zoom_factor should be an integer) and then cropped
             # back to the final data size.
             zoom_factor = bkg2d_obj.box_size
-            result = zoom(mesh, zoom_factor, order=self.order, mode=self.mode,
-                          cval=self.cval, grid_mode=self.grid_mode)
+            result = zoom(mesh, zoom_factor, output=bkg2d_obj.dtype,
+                          order=self.order, mode=self.mode, cval=self.cval,
+                          grid_mode=self.grid_mode)
             result = result[0:bkg2d_obj.data.shape[0],
                             0:bkg2d_obj.data.shape[1]]
         else:
             # The mesh is resized directly to the final data size.
             zoom_factor = np.array(bkg2d_obj.data.shape) / mesh.shape
-            result = zoom(mesh, zoom_factor, order=self.order, mode=self.mode,
-                          cval=self.cval)
+            result = zoom(mesh, zoom_factor, output=bkg2d_obj.dtype,
+                          order=self.order, mode=self.mode, cval=self.cval)
 
         if self.clip:
             minval = np.min(mesh)
@@ -104,6 +150,251 @@ class BkgZoomInterpolator:
 
         return result
 
+    def _interpolate_at(self, mesh, bkg2d_obj, y, x):
+        """
+        Interpolate the 2D mesh array at the given pixel positions of
+        the full-sized image.
+
+        The values are identical (up to floating-point rounding) to
+        those of the full-sized image returned by ``__call__``, but the
+        spline is evaluated only at the input positions.
+
+        Parameters
+        ----------
+        mesh : 2D `~numpy.ndarray`
+            The low-resolution 2D mesh array.
+
+        bkg2d_obj : `Background2D` object
+            The `Background2D` object that prepared the ``mesh`` array.
+
+        y, x : 1D `~numpy.ndarray`
+            The ``y`` and ``x`` pixel positions in the full-sized image.
+
+        Returns
+        -------
+        result : 1D `~numpy.ndarray`
+            The interpolated values.
+        """
+        mesh = np.asanyarray(mesh)
+        if np.ptp(mesh) == 0:
+            return np.full(y.shape, np.min(mesh), dtype=bkg2d_obj.dtype)
+
+        from scipy.ndimage import map_coordinates
+
+        # the mesh coordinates of the output pixels used by zoom
+        yx = [_mesh_coordinates(pixels, axis, mesh.shape, bkg2d_obj,
+                                self.grid_mode)
+              for axis, pixels in enumerate((y, x))]
+
+        result = map_coordinates(mesh, yx, output=bkg2d_obj.dtype,
+                                 order=self.order, mode=self.mode,
+                                 cval=self.cval)
+
+        if self.clip:
+            minval = np.min(mesh)
+            maxval = np.max(mesh)
+            np.clip(result, minval, maxval, out=result)  # clip in place
+
+        return result
+
+
+class BkgBicubicInterpolator:
+    """
+    This class generates full-sized background and background RMS
+    images from lower-resolution mesh images using bicubic spline
+    interpolation.
+
+    The bicubic spline coefficients of the low-resolution mesh are
+    computed once (using `~scipy.ndimage.spline_filter`). The
+    full-sized image is then evaluated in chunks of rows from the
+    separable spline: each mesh row is first interpolated along the x
+    axis and each output row is then a weighted sum of four of these
+    interpolated rows. The chunks of rows can be evaluated in multiple
+    threads. The output image has the data type of the `Background2D`
+    ``dtype`` (e.g., ``np.float32``).
+
+    The result is the same as that of `BkgZoomInterpolator` with
+    ``order=3`` and ``grid_mode=True`` (and the same ``mode`` and
+    ``clip``). The values agree to within a relative tolerance of
+    1e-12 for float64 output and within the float32 precision
+    (relative tolerance of 1e-6) for float32 output.
+
+    This class must be used in concert with the `Background2D` class.
+
+    Parameters
+    ----------
+    mode : {'reflect', 'mirror', 'nearest'}, optional
+        Points outside the boundaries of the input are filled according
+        to the given mode. See `scipy.ndimage.zoom` for the definitions
+        of the modes. Default is 'reflect'.
+
+    clip : bool, optional
+        Whether to clip the output to the range of values in the
+        input image. This is enabled by default, since higher order
+        interpolation may produce values outside the given input range.
+
+    nproc : int or `None`, optional
+        The number of threads used to evaluate the full-sized image. If
+        `None`, then all available CPU cores are used. The results are
+        identical for any ``nproc``.
+    """
+
+    def __init__(self, *, mode='reflect', clip=True, nproc=1):
+        if mode not in ('reflect', 'mirror', 'nearest'):
+            raise ValueError('mode must be "reflect", "mirror", or '
+                             '"nearest"')
+        self.mode = mode
+        self.clip = clip
+        self.nproc = nproc
+
+    def _coefficients(self, mesh):
+        """
+        Calculate the bicubic spline coefficients of the mesh.
+
+        For ``mode='nearest'``, the mesh is first padded with its edge
+        values (as in `scipy.ndimage.zoom`). Returns the coefficients
+        and the size of the padding.
+        """
+        from scipy.ndimage import spline_filter
+
+        npad = 0
+        if self.mode == 'nearest':
+            npad = 12
+            mesh = np.pad(mesh, npad, mode='edge')
+        coeffs = spline_filter(mesh, order=3, output=float, mode=self.mode)
+        return coeffs, npad
+
+    def _weights(self, coords, size):
+        """
+        Calculate the indices and weights of the four spline
+        coefficients that contribute to each coordinate along an axis.
+
+        Returns two arrays of shape ``(4, ncoords)``.
+        """
+        idx0 = np.floor(coords)
+        t = coords - idx0
+        weights = np.array([(1.0 - t)**3,
+                            (3.0 * t - 6.0) * t**2 + 4.0,
+                            ((-3.0 * t + 3.0) * t + 3.0) * t + 1.0,
+                            t**3]) / 6.0
+
+        idx = idx0.astype(int) + np.arange(-1, 3)[:, None]
+        # the boundary conditions of the spline coefficients
+        if self.mode == 'mirror':
+            idx = np.abs(idx)
+            idx = np.where(idx >= size, 2 * size - 2 - idx, idx)
+        elif self.mode == 'reflect':
+            idx = np.where(idx < 0, -idx - 1, idx)
+            idx = np.where(idx >= size, 2 * size - 1 - idx, idx)
+        else:
+            # the mesh was padded by more than the spline support
+            idx = np.clip(idx, 0, size - 1)
+
+        return idx, weights
+
+    def __call__(self, mesh, bkg2d_obj):
+        """
+        Resize the 2D mesh array.
+
+        Parameters
+        ----------
+        mesh : 2D `~numpy.ndarray`
+            The low-resolution 2D mesh array.
+
+        bkg2d_obj : `Background2D` object
+            The `Background2D` object that prepared the ``mesh`` array.
+
+        Returns
+        -------
+        result : 2D `~numpy.ndarray`
+            The resized background or background RMS image.
+        """
+        mesh = np.asanyarray(mesh)
+        shape = bkg2d_obj.data.shape
+        if np.ptp(mesh) == 0:
+            return np.full(shape, np.min(mesh), dtype=bkg2d_obj.dtype)
+
+        coeffs, npad = self._coefficients(mesh)
+        (yidx, yweights), (xidx, xweights) = (
+            self._weights(_mesh_coordinates(np.arange(size), axis,
+                                            mesh.shape, bkg2d_obj, True)
+                          + npad, coeffs.shape[axis])
+            for axis, size in enumerate(shape))
+
+        # interpolate each row of coefficients along the x axis
+        xinterp = np.zeros((coeffs.shape[0], shape[1]))
+        for idx, weights in zip(xidx, xweights):
+            xinterp += coeffs[:, idx] * weights
+        xinterp = xinterp.astype(bkg2d_obj.dtype, copy=False)
+
+        result = np.empty(shape, dtype=bkg2d_obj.dtype)
+        minval = np.min(mesh)
+        maxval = np.max(mesh)
+
+        def interpolate_rows(slc):
+            out = result[slc]
+            np.multiply(xinterp[yidx[0, slc]], yweights[0, slc, None],
+                        out=out, casting='same_kind')
+            for idx, weights in zip(yidx[1:, slc], yweights[1:, slc]):
+                out += xinterp[idx] * weights[:, None]
+            if self.clip:
+                np.clip(out, minval, maxval, out=out)  # clip in place
+
+        nproc = cpu_count() if self.nproc is None else self.nproc
+        nrows = max(2**18 // shape[1], 1)  # rows per chunk
+        slices = [slice(row, row + nrows) for row in range(0, shape[0], nrows)]
+        if nproc > 1 and len(slices) > 1:
+            with ThreadPoolExecutor(max_workers=nproc) as executor:
+                list(executor.map(interpolate_rows, slices))
+        else:
+            for slc in slices:
+                interpolate_rows(slc)
+
+        return result
+
+    def _interpolate_at(self, mesh, bkg2d_obj, y, x):
+        """
+        Interpolate the 2D mesh array at the given pixel positions of
+        the full-sized image.
+
+        Parameters
+        ----------
+        mesh : 2D `~numpy.ndarray`
+            The low-resolution 2D mesh array.
+
+        bkg2d_obj : `Background2D` object
+            The `Background2D` object that prepared the ``mesh`` array.
+
+        y, x : 1D `~numpy.ndarray`
+            The ``y`` and ``x`` pixel positions in the full-sized image.
+
+        Returns
+        -------
+        result : 1D `~numpy.ndarray`
+            The interpolated values.
+        """
+        mesh = np.asanyarray(mesh)
+        if np.ptp(mesh) == 0:
+            return np.full(y.shape, np.min(mesh), dtype=bkg2d_obj.dtype)
+
+        coeffs, npad = self._coefficients(mesh)
+        (yidx, yweights), (xidx, xweights) = (
+            self._weights(_mesh_coordinates(pixels, axis, mesh.shape,
+                                            bkg2d_obj, True)
+                          + npad, coeffs.shape[axis])
+            for axis, pixels in enumerate((y, x)))
+
+        result = np.zeros(y.shape)
+        for iy, wy in zip(yidx, yweights):
+            for ix, wx in zip(xidx, xweights):
+                result += coeffs[iy, ix] * wy * wx
+        result = result.astype(bkg2d_obj.dtype, copy=False)
+
+        if self.clip:
+            np.clip(result, np.min(mesh), np.max(mesh), out=result)
+
+        return result
+
 
 class BkgIDWInterpolator:
     """
@@ -158,7 +449,8 @@ class BkgIDWInterpolator:
         """
         mesh = np.asanyarray(mesh)
         if np.ptp(mesh) == 0:
-            return np.zeros_like(bkg2d_obj.data) + np.min(mesh)
+            return np.full(bkg2d_obj.data.shape, np.min(mesh),
+                           dtype=bkg2d_obj.dtype)
 
         yxpos = np.column_stack(bkg2d_obj._mesh_yxpos)
         mesh1d = mesh[bkg2d_obj._mesh_idx]
@@ -173,4 +465,40 @@ class BkgIDWInterpolator:
                            n_neighbors=self.n_neighbors, power=self.power,
                            reg=self.reg)
 
-        return data.reshape(bkg2d_obj.data.shape)
+        return data.reshape(bkg2d_obj.data.shape).astype(bkg2d_obj.dtype,
+                                                         copy=False)
+
+    def _interpolate_at(self, mesh, bkg2d_obj, y, x):
+        """
+        Interpolate the 2D mesh array at the given pixel positions of
+        the full-sized image.
+
+        Parameters
+        ----------
+        mesh : 2D `~numpy.ndarray`
+            The low-resolution 2D mesh array.
+
+        bkg2d_obj : `Background2D` object
+            The `Background2D` object that prepared the ``mesh`` array.
+
+        y, x : 1D `~numpy.ndarray`
+            The ``y`` and ``x`` pixel positions in the full-sized image.
+
+        Returns
+        -------
+        result : 1D `~numpy.ndarray`
+            The interpolated values.
+        """
+        mesh = np.asanyarray(mesh)
+        if np.ptp(mesh) == 0:
+            return np.full(y.shape, np.min(mesh), dtype=bkg2d_obj.dtype)
+
+        yxpos = np.column_stack(bkg2d_obj._mesh_yxpos)
+        mesh1d = mesh[bkg2d_obj._mesh_idx]
+        interp_func = ShepardIDWInterpolator(yxpos, mesh1d,
+                                             leafsize=self.leafsize)
+        data = interp_func(np.column_stack((y, x)),
+                           n_neighbors=self.n_neighbors, power=self.power,
+                           reg=self.reg)
+
+        return np.atleast_1d(data).astype(bkg2d_obj.dtype, copy=False)
@@ -8,13 +8,18 @@ import itertools
 import astropy.units as u
 import numpy as np
 import pytest
+from astropy.io import fits
 from astropy.nddata import CCDData, NDData
+from astropy.stats import SigmaClip
 from astropy.utils.exceptions import AstropyUserWarning
 from numpy.testing import assert_allclose, assert_equal
 
 from photutils.background.background_2d import Background2D
-from photutils.background.core import MeanBackground
-from photutils.background.interpolators import (BkgIDWInterpolator,
+from photutils.background.core import (MADStdBackgroundRMS, MeanBackground,
+                                       MedianBackground, SExtractorBackground,
+                                       StdBackgroundRMS)
+from photutils.background.interpolators import (BkgBicubicInterpolator,
+                                                BkgIDWInterpolator,
                                                 BkgZoomInterpolator)
 from photutils.utils._optional_deps import HAS_MATPLOTLIB, HAS_SCIPY
 
@@ -25,7 +30,8 @@ BKG_RMS_MESH = np.zeros((4, 4))
 PADBKG_MESH = np.ones((5, 5))
 PADBKG_RMS_MESH = np.zeros((5, 5))
 FILTER_SIZES = [(1, 1), (3, 3)]
-INTERPOLATORS = [BkgZoomInterpolator(), BkgIDWInterpolator()]
+INTERPOLATORS = [BkgZoomInterpolator(), BkgBicubicInterpolator(),
+                 BkgIDWInterpolator()]
 
 DATA1 = DATA << u.ct
 DATA2 = NDData(DATA, unit=None)
@@ -346,6 +352,296 @@ class TestBackground2D:
         assert_allclose(bkg.background_rms_median, 0.0)
         assert_allclose(bkg.background_mesh.shape, (4, 5))
 
+    @pytest.mark.parametrize(('box_size', 'edge_method'),
+                             [((25, 25), 'pad'), ((23, 17), 'pad'),
+                              ((23, 17), 'crop')])
+    def test_tiled(self, tmp_path, box_size, edge_method):
+        rng = np.random.default_rng(0)
+        data = rng.normal(10.0, 2.0, size=(101, 97))
+        data[40:45, 30:60] += 100.0
+        data[3, 5] = np.nan
+        mask = np.zeros(data.shape, dtype=bool)
+        mask[60:80, 10:20] = True
+        coverage_mask = np.zeros(data.shape, dtype=bool)
+        coverage_mask[:, 90:] = True
+
+        kwargs = {'mask': mask, 'coverage_mask': coverage_mask,
+                  'edge_method': edge_method}
+        match = 'Input data contains invalid values'
+        with pytest.warns(AstropyUserWarning, match=match):
+            bkg1 = Background2D(data, box_size, **kwargs)
+
+        filename = tmp_path / 'data.dat'
+        data_mmap = np.memmap(filename, dtype=np.float32, mode='w+',
+                              shape=data.shape)
+        data_mmap[:] = data
+        filename = tmp_path / 'data.fits'
+        fits.writeto(filename, data)
+
+        with fits.open(filename) as hdulist:
+            for data2 in (data, data_mmap, hdulist[0].section):
+                with pytest.warns(AstropyUserWarning, match=match):
+                    bkg2 = Background2D(data2, box_size, tiled=True,
+                                        **kwargs)
+                assert_equal(bkg2._box_idx, bkg1._box_idx)
+                if data2 is data_mmap:
+                    rtol = 1.0e-6
+                else:
+                    rtol = 0.0
+                assert_allclose(bkg2.background_mesh, bkg1.background_mesh,
+                                rtol=rtol)
+                assert_allclose(bkg2.background_rms_mesh,
+                                bkg1.background_rms_mesh, rtol=rtol)
+                assert_equal(bkg2.mesh_nmasked, bkg1.mesh_nmasked)
+                assert_allclose(bkg2.background, bkg1.background, rtol=rtol)
+
+        # the input data are not copied
+        with pytest.warns(AstropyUserWarning, match=match):
+            bkg2 = Background2D(data_mmap, box_size, tiled=True, **kwargs)
+        assert bkg2.data is data_mmap
+
+    def test_tiled_completely_masked(self):
+        mask = np.ones(DATA.shape, dtype=bool)
+        with pytest.raises(ValueError):
+            Background2D(DATA, (25, 25), mask=mask, tiled=True)
+
+        with pytest.raises(ValueError):
+            Background2D(DATA, (23, 22), filter_size=(1, 1),
+                         edge_method='not_valid', tiled=True)
+
+    @pytest.mark.parametrize('interpolator', INTERPOLATORS)
+    @pytest.mark.parametrize('tiled', [False, True])
+    def test_dtype(self, interpolator, tiled):
+        rng = np.random.default_rng(0)
+        data = rng.normal(10.0, 2.0, size=(101, 97))
+        data32 = data.astype(np.float32)
+        bkg1 = Background2D(data, (25, 25), interpolator=interpolator)
+        bkg2 = Background2D(data32, (25, 25), interpolator=interpolator,
+                            tiled=tiled, dtype=np.float32)
+        assert bkg2.background_mesh.dtype == np.float64
+        assert bkg2.background_rms_mesh.dtype == np.float64
+        assert bkg2.background.dtype == np.float32
+        assert bkg2.background_rms.dtype == np.float32
+        if not tiled:
+            assert bkg2.data.dtype == np.float32
+        assert_allclose(bkg2.background_mesh, bkg1.background_mesh,
+                        rtol=1e-5)
+        assert_allclose(bkg2.background_rms_mesh, bkg1.background_rms_mesh,
+                        rtol=1e-4)
+        assert_allclose(bkg2.background, bkg1.background, rtol=1e-5)
+
+        bkg3 = Background2D(np.ones((100, 100), dtype=np.float32), 25,
+                            interpolator=interpolator, dtype=np.float32)
+        assert bkg3.background.dtype == np.float32
+
+        with pytest.raises(ValueError):
+            Background2D(data, (25, 25), dtype=int)
+
+    @pytest.mark.parametrize('tiled', [False, True])
+    def test_nproc(self, tiled):
+        rng = np.random.default_rng(0)
+        data = rng.normal(10.0, 2.0, size=(205, 199))
+        mask = rng.random(data.shape) < 0.05
+        bkg1 = Background2D(data, (10, 10), mask=mask)
+        for nproc in (2, 3):
+            bkg2 = Background2D(data, (10, 10), mask=mask, tiled=tiled,
+                                nproc=nproc)
+            assert_equal(bkg2.background_mesh, bkg1.background_mesh)
+            assert_equal(bkg2.background_rms_mesh,
+                         bkg1.background_rms_mesh)
+            assert_equal(bkg2.mesh_nmasked, bkg1.mesh_nmasked)
+            assert_equal(bkg2.background, bkg1.background)
+
+    @pytest.mark.parametrize(('bkg_estimator', 'bkgrms_estimator'),
+                             [(MeanBackground, StdBackgroundRMS),
+                              (MedianBackground, MADStdBackgroundRMS),
+                              (SExtractorBackground, StdBackgroundRMS)])
+    def test_sorted_stats(self, bkg_estimator, bkgrms_estimator):
+        """
+        Test that the box statistics computed from the sorted box data
+        match those computed from the sigma-clipped data.
+        """
+        # subclasses are not computed from the sorted box data
+        class BkgEstimator(bkg_estimator):
+            pass
+
+        class BkgRMSEstimator(bkgrms_estimator):
+            pass
+
+        rng = np.random.default_rng(0)
+        data = rng.normal(10.0, 2.0, size=(200, 200))
+        data[rng.random(data.shape) < 0.01] = 1000.0
+        mask = rng.random(data.shape) < 0.05
+        bkg1 = Background2D(data, (20, 20), mask=mask,
+                            bkg_estimator=bkg_estimator(sigma_clip=None),
+                            bkgrms_estimator=bkgrms_estimator(
+                                sigma_clip=None))
+        bkg2 = Background2D(data, (20, 20), mask=mask,
+                            bkg_estimator=BkgEstimator(sigma_clip=None),
+                            bkgrms_estimator=BkgRMSEstimator(
+                                sigma_clip=None))
+        assert bkg1._use_sorted_stats
+        assert not bkg2._use_sorted_stats
+        assert_equal(bkg1.mesh_nmasked, bkg2.mesh_nmasked)
+        assert_allclose(bkg1.background_mesh, bkg2.background_mesh,
+                        rtol=1e-10)
+        assert_allclose(bkg1.background_rms_mesh, bkg2.background_rms_mesh,
+                        rtol=1e-10)
+
+        bkg3 = Background2D(data, (20, 20), mask=mask,
+                            sigma_clip=SigmaClip(cenfunc='mean'),
+                            bkg_estimator=bkg_estimator(sigma_clip=None))
+        assert not bkg3._use_sorted_stats
+
+    @pytest.mark.parametrize('tiled', [False, True])
+    @pytest.mark.parametrize('edge_method', ['pad', 'crop'])
+    def test_update(self, tiled, edge_method):
+        rng = np.random.default_rng(0)
+        data = rng.normal(10.0, 2.0, size=(205, 199))
+        data[100:110, 50:60] += 100.0
+        mask1 = np.zeros(data.shape, dtype=bool)
+        mask1[20:40, 30:35] = True
+        mask2 = mask1.copy()
+        mask2[95:115, 45:65] = True
+        mask2[200:, 190:] = True
+        mask3 = mask2.copy()
+        mask3[20:40, 30:35] = False
+        kwargs = {'edge_method': edge_method, 'filter_size': 3}
+
+        bkg = Background2D(data, (20, 20), mask=mask1, tiled=tiled,
+                           **kwargs)
+        _ = bkg.background
+        for mask in (mask2, mask3, None, mask1):
+            bkg.update(mask=mask)
+            bkg2 = Background2D(data, (20, 20), mask=mask, **kwargs)
+            assert bkg.mask is mask
+            assert_equal(bkg._box_idx, bkg2._box_idx)
+            assert_equal(bkg.mesh_nmasked, bkg2.mesh_nmasked)
+            assert_allclose(bkg.background_mesh, bkg2.background_mesh)
+            assert_allclose(bkg.background_rms_mesh,
+                            bkg2.background_rms_mesh)
+            assert_allclose(bkg.background, bkg2.background)
+            if not tiled:
+                assert_equal(bkg.data, bkg2.data)
+
+        with pytest.raises(ValueError):
+            bkg.update(mask=np.ones(data.shape, dtype=bool))
+        with pytest.raises(ValueError):
+            bkg.update(mask=np.zeros((10, 10), dtype=bool))
+
+    @pytest.mark.parametrize('tiled', [False, True])
+    def test_update_inplace(self, tiled):
+        rng = np.random.default_rng(0)
+        data = rng.normal(10.0, 2.0, size=(205, 199))
+        data[50:70, 50:70] += 100.0
+        mask = np.zeros(data.shape, dtype=bool)
+        mask[20:40, 30:35] = True
+        bkg = Background2D(data, (20, 20), mask=mask, filter_size=3,
+                           tiled=tiled)
+        _ = bkg.background
+
+        for slc in (np.s_[50:70, 50:70], np.s_[20:40, 30:35]):
+            mask[slc] = ~mask[slc]
+            bkg.update(mask=mask)
+            bkg2 = Background2D(data, (20, 20), mask=mask.copy(),
+                                filter_size=3)
+            assert_equal(bkg._box_idx, bkg2._box_idx)
+            assert_equal(bkg.mesh_nmasked, bkg2.mesh_nmasked)
+            assert_allclose(bkg.background_mesh, bkg2.background_mesh)
+            assert_allclose(bkg.background, bkg2.background)
+
+    @pytest.mark.parametrize('tiled', [False, True])
+    def test_update_no_mask(self, tiled):
+        rng = np.random.default_rng(0)
+        data = rng.normal(10.0, 2.0, size=(205, 199))
+        bkg = Background2D(data, (20, 20), filter_size=3, tiled=tiled)
+        bkg2 = Background2D(data, (20, 20), filter_size=3)
+        assert_equal(bkg._changed_boxes(None), False)
+        for args in ((), (None,)):
+            bkg.update(*args)
+            assert bkg.mask is None
+            assert_equal(bkg._box_idx, bkg2._box_idx)
+            assert_allclose(bkg.background_mesh, bkg2.background_mesh)
+            assert_allclose(bkg.background, bkg2.background)
+
+    @pytest.mark.parametrize('interpolator',
+                             [*INTERPOLATORS,
+                              BkgZoomInterpolator(grid_mode=False)])
+    @pytest.mark.parametrize('edge_method', ['pad', 'crop'])
+    def test_background_at(self, interpolator, edge_method):
+        rng = np.random.default_rng(0)
+        data = rng.normal(10.0, 2.0, size=(205, 199))
+        data += np.linspace(0, 5, data.shape[1])
+        coverage_mask = np.zeros(data.shape, dtype=bool)
+        coverage_mask[:10, :10] = True
+        bkg1 = Background2D(data, (20, 20), interpolator=interpolator,
+                            edge_method=edge_method,
+                            coverage_mask=coverage_mask)
+        bkg2 = Background2D(data, (20, 20), interpolator=interpolator,
+                            edge_method=edge_method,
+                            coverage_mask=coverage_mask)
+
+        yy, xx = np.mgrid[0:205, 0:199]
+        assert_allclose(bkg2.background_at(xx, yy), bkg1.background,
+                        rtol=1e-12)
+        assert_allclose(bkg2.background_rms_at(xx, yy),
+                        bkg1.background_rms, rtol=1e-12)
+        assert_allclose(bkg2.background_at(3, 150),
+                        bkg1.background[150, 3], rtol=1e-12)
+        slc = np.s_[5:50, 100:]
+        assert_allclose(bkg2.background_cutout(slc), bkg1.background[slc],
+                        rtol=1e-12)
+        assert_allclose(bkg2.background_rms_cutout(slc),
+                        bkg1.background_rms[slc], rtol=1e-12)
+        assert 'background' not in bkg2.__dict__
+        assert 'background_rms' not in bkg2.__dict__
+
+        lazy_bkg = bkg2.lazy_background
+        assert lazy_bkg.shape == data.shape
+        assert lazy_bkg.dtype == bkg1.background.dtype
+        assert_allclose(lazy_bkg[slc], bkg1.background[slc], rtol=1e-12)
+        assert_allclose(lazy_bkg[3], bkg1.background[3], rtol=1e-12)
+        assert_allclose(lazy_bkg[-1, 5:-5], bkg1.background[-1, 5:-5],
+                        rtol=1e-12)
+        assert_allclose(lazy_bkg[-1, -1], bkg1.background[-1, -1],
+                        rtol=1e-12)
+        idx = ([0, 10, -3], [5, 198, 100])
+        assert_allclose(lazy_bkg[idx], bkg1.background[idx], rtol=1e-12)
+        assert 'background' not in bkg2.__dict__
+        assert_allclose(lazy_bkg[::2, ::3], bkg1.background[::2, ::3])
+        assert_allclose(np.asarray(bkg2.lazy_background_rms),
+                        bkg1.background_rms)
+
+        with pytest.raises(ValueError):
+            bkg2.background_at(-1, 10)
+        with pytest.raises(ValueError):
+            bkg2.background_cutout(np.s_[::2, :])
+        with pytest.raises(ValueError):
+            bkg2.background_cutout(np.s_[:])
+        with pytest.raises(IndexError):
+            lazy_bkg[205, 0]
+
+    def test_background_at_units(self):
+        bkg = Background2D(DATA1, (25, 25))
+        assert bkg.background_at(10, 20) == 1.0 * u.ct
+        assert_equal(bkg.background_cutout(np.s_[:10, :10]),
+                     np.ones((10, 10)) * u.ct)
+        assert bkg.lazy_background.unit == u.ct
+        assert bkg.lazy_background.value.unit is None
+        assert bkg.lazy_background.value[0, 0] == 1.0
+
+    def test_background_at_custom_interpolator(self):
+        def interpolator(mesh, bkg2d_obj):
+            return BkgIDWInterpolator()(mesh, bkg2d_obj)
+
+        bkg = Background2D(DATA, (25, 25), interpolator=interpolator)
+        assert_allclose(bkg.background_at([1, 2], [3, 4]), [1.0, 1.0])
+        assert_allclose(bkg.lazy_background[[3, 4], [1, 2]], [1.0, 1.0])
+        with pytest.raises(ValueError, match='positions must be integers'):
+            bkg.background_at([1.5, 2], [3, 4])
+        assert_allclose(bkg.background_cutout(np.s_[:10, :10]),
+                        np.ones((10, 10)))
+
 
 @pytest.mark.skipif(not HAS_SCIPY, reason='scipy is required')
 def test_bkgzoominterp_clip():
@@ -366,3 +662,35 @@ def test_bkgzoominterp_clip():
     assert np.max(zoom1) > maxval
     assert np.min(zoom2) == minval
     assert np.max(zoom2) == maxval
+
+
+@pytest.mark.skipif(not HAS_SCIPY, reason='scipy is required')
+@pytest.mark.parametrize('mode', ['reflect', 'mirror', 'nearest'])
+@pytest.mark.parametrize('edge_method', ['pad', 'crop'])
+@pytest.mark.parametrize('clip', [True, False])
+def test_bkgbicubicinterp(mode, edge_method, clip):
+    rng = np.random.default_rng(0)
+    data = rng.normal(10.0, 2.0, size=(205, 199))
+    data += np.linspace(0, 5, data.shape[1])
+    bkg = Background2D(data, (20, 20), edge_method=edge_method)
+    mesh = bkg.background_mesh
+
+    zoom = BkgZoomInterpolator(mode=mode, clip=clip)(mesh, bkg)
+    interp = BkgBicubicInterpolator(mode=mode, clip=clip)
+    assert_allclose(interp(mesh, bkg), zoom, rtol=1e-12)
+    interp.nproc = 2
+    assert_allclose(interp(mesh, bkg), zoom, rtol=1e-12)
+
+    yy, xx = np.mgrid[0:205:3, 0:199:4]
+    assert_allclose(interp._interpolate_at(mesh, bkg, yy.ravel(),
+                                           xx.ravel()),
+                    zoom[yy, xx].ravel(), rtol=1e-12)
+
+    bkg32 = Background2D(data, (20, 20), edge_method=edge_method,
+                         dtype=np.float32)
+    result = interp(mesh, bkg32)
+    assert result.dtype == np.float32
+    assert_allclose(result, zoom, rtol=1e-6)
+
+    with pytest.raises(ValueError):
+        BkgBicubicInterpolator(mode='constant')
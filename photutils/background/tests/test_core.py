@@ -3,18 +3,22 @@
 Tests for the core module.
 """
 
+import warnings
+
 import astropy.units as u
 import numpy as np
 import pytest
 from astropy.stats import SigmaClip
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 
-from photutils.background.core import (BiweightLocationBackground,
+from photutils.background.core import (_SORTED_STATS_FUNCS,
+                                       BiweightLocationBackground,
                                        BiweightScaleBackgroundRMS,
                                        MADStdBackgroundRMS, MeanBackground,
                                        MedianBackground, MMMBackground,
                                        ModeEstimatorBackground,
-                                       SExtractorBackground, StdBackgroundRMS)
+                                       SExtractorBackground, StdBackgroundRMS,
+                                       _SortedStats)
 from photutils.datasets import make_noise_image
 
 BKG = 0.0
@@ -239,3 +243,28 @@ def test_background_rms_repr(rms_class):
     rms_repr = repr(bkgrms)
     assert rms_repr == str(bkgrms)
     assert rms_repr.startswith(f'<{bkgrms.__class__.__name__}(sigma_clip=')
+
+
+@pytest.mark.parametrize('estimator_class', list(_SORTED_STATS_FUNCS))
+@pytest.mark.parametrize('maxiters', [1, 10, None])
+def test_sorted_stats(estimator_class, maxiters):
+    rng = np.random.default_rng(0)
+    data = rng.normal(10.0, 2.0, size=(50, 121))
+    data[:, :5] += rng.uniform(10, 100, size=(50, 5))  # outliers
+    data[rng.random(data.shape) < 0.1] = np.nan
+    data[0] = np.nan  # completely masked row
+    data[1] = 3.0  # constant row
+
+    sigma_clip = SigmaClip(sigma_lower=2.5, sigma_upper=2.0,
+                           maxiters=maxiters)
+    estimator = estimator_class(sigma_clip=None)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        clipped = sigma_clip(data, axis=1, masked=False)
+        expected = estimator(clipped, axis=1)
+
+    stats = _SortedStats(data)
+    stats.sigma_clip(sigma_clip)
+    result = _SORTED_STATS_FUNCS[estimator_class](estimator, stats)
+    assert_equal(stats.npixels, np.count_nonzero(~np.isnan(clipped), axis=1))
+    assert_allclose(result, expected, rtol=1e-10, atol=1e-12)
@@ -8,11 +8,19 @@ define a method called ``find_stars`` that finds stars in an image.
 import abc
 import math
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from multiprocessing import cpu_count
 
 import numpy as np
 from astropy.stats import gaussian_fwhm_to_sigma
 
-from photutils.detection.peakfinder import find_peaks
+from photutils.detection.peakfinder import _find_peaks_tiled, find_peaks
+from photutils.utils._convolution import (_Convolver, _filter_data,
+                                          _filter_data_tiled)
+from photutils.utils._coords import non_maximum_suppression
+from photutils.utils._parameters import as_pair
+from photutils.utils._sorting import argsort_largest
 from photutils.utils.exceptions import NoDetectionsWarning
 
 __all__ = ['StarFinderBase']
@@ -28,7 +36,9 @@ class StarFinderBase(metaclass=abc.ABCMeta):
 
     @staticmethod
     def _find_stars(convolved_data, kernel, threshold, *, min_separation=0.0,
-                    mask=None, exclude_border=False):
+                    mask=None, exclude_border=False, tile_size=None,
+                    peak_method='auto', separation_method='footprint',
+                    executor=None):
         """
         Find stars in an image.
 
@@ -59,6 +69,29 @@ class StarFinderBase(metaclass=abc.ABCMeta):
             `False`, which is the mode used by IRAF's `DAOFIND`_ and
             `starfind`_ tasks.
 
+        tile_size : tuple of 2 int or `None`, optional
+            If not `None`, the ``(ny, nx)`` size of the tiles in which
+            the peaks are found (see ``_find_peaks_tiled``). The result
+            is identical to that found without tiles.
+
+        peak_method : {'auto', 'ndimage', 'rectangles', 'sparse'}, optional
+            The method used to find the local maxima (see
+            `~photutils.detection.find_peaks`). The result does not
+            depend on the method.
+
+        separation_method : {'footprint', 'nms'}, optional
+            The method used to enforce the ``min_separation``. If
+            ``'footprint'``, the peaks are the maxima within a circular
+            footprint with a radius of ``min_separation``. If ``'nms'``,
+            the peaks are the maxima within the kernel footprint and
+            peaks within ``min_separation`` of a brighter peak are then
+            removed using non-maximum suppression with a KD-tree.
+            Unlike ``'footprint'``, brighter pixels that are not peaks
+            do not remove a peak.
+
+        executor : `~concurrent.futures.Executor` or `None`, optional
+            The executor used to process the tiles.
+
         Returns
         -------
         result : Nx2 `~numpy.ndarray`
@@ -68,8 +101,14 @@ class StarFinderBase(metaclass=abc.ABCMeta):
 
         .. _starfind: https://iraf.net/irafhelp.php?val=starfind
         """
+        separation_methods = ('footprint', 'nms')
+        if separation_method not in separation_methods:
+            raise ValueError('separation_method must be one of '
+                             f'{separation_methods}')
+        use_nms = separation_method == 'nms' and min_separation > 0
+
         # define a local footprint for the peak finder
-        if min_separation == 0.0:  # DAOStarFinder
+        if min_separation == 0.0 or use_nms:  # DAOStarFinder
             if isinstance(kernel, np.ndarray):
                 footprint = np.ones(kernel.shape)
             else:
@@ -90,27 +129,46 @@ class StarFinderBase(metaclass=abc.ABCMeta):
             ypad = kernel.yradius
             xpad = kernel.xradius
 
-        if not exclude_border:
-            pad = ((ypad, ypad), (xpad, xpad))
-            pad_mode = 'constant'
-            convolved_data = np.pad(convolved_data, pad, mode=pad_mode,
-                                    constant_values=0.0)
+        if tile_size is not None:
+            # the data are padded virtually in each tile
+            pad = (0, 0) if exclude_border else (ypad, xpad)
             if mask is not None:
-                mask = np.pad(mask, pad, mode=pad_mode, constant_values=False)
-
-        # find local peaks in the convolved data
-        # suppress any NoDetectionsWarning from find_peaks
-        with warnings.catch_warnings():
-            warnings.filterwarnings('ignore', category=NoDetectionsWarning)
-            tbl = find_peaks(convolved_data, threshold, footprint=footprint,
-                             mask=mask)
+                mask = np.asanyarray(mask, dtype=bool)
+            tbl = _find_peaks_tiled(convolved_data, threshold, footprint,
+                                    tile_size, mask=mask, pad=pad,
+                                    method=peak_method, executor=executor)
+            shape = np.array(convolved_data.shape) + 2 * np.array(pad)
+        else:
+            if not exclude_border:
+                pad = ((ypad, ypad), (xpad, xpad))
+                pad_mode = 'constant'
+                convolved_data = np.pad(convolved_data, pad, mode=pad_mode,
+                                        constant_values=0.0)
+                if mask is not None:
+                    mask = np.pad(mask, pad, mode=pad_mode,
+                                  constant_values=False)
+
+            # find local peaks in the convolved data
+            # suppress any NoDetectionsWarning from find_peaks
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore', category=NoDetectionsWarning)
+                tbl = find_peaks(convolved_data, threshold,
+                                 footprint=footprint, mask=mask,
+                                 method=peak_method)
+            shape = convolved_data.shape
 
         if tbl is None:
             return None
 
+        if use_nms:
+            idx = non_maximum_suppression(
+                np.transpose((tbl['x_peak'], tbl['y_peak'])), min_separation,
+                values=tbl['peak_value'])
+            tbl = tbl[idx]
+
         if exclude_border:
-            xmax = convolved_data.shape[1] - xpad
-            ymax = convolved_data.shape[0] - ypad
+            xmax = shape[1] - xpad
+            ymax = shape[0] - ypad
             mask = ((tbl['x_peak'] > xpad) & (tbl['y_peak'] > ypad)
                     & (tbl['x_peak'] < xmax) & (tbl['y_peak'] < ymax))
             tbl = tbl[mask]
@@ -122,6 +180,195 @@ class StarFinderBase(metaclass=abc.ABCMeta):
 
         return np.transpose((xpos, ypos))
 
+    def _filter_and_find_stars(self, data, threshold, mask=None,
+                               convolver=None):
+        """
+        Convolve the data with the star finder kernel and find the
+        stars.
+
+        The convolution and the peak finding are done in tiles (in
+        multiple threads) if ``tile_size`` is not `None` or ``nproc``
+        is not 1.
+
+        Parameters
+        ----------
+        data : 2D array_like
+            The 2D image array.
+
+        threshold : float
+            The absolute image value above which to select sources in
+            the convolved data.
+
+        mask : 2D bool array, optional
+            A boolean mask with the same shape as ``data``, where a
+            `True` value indicates the corresponding element of ``data``
+            is masked.
+
+        convolver : ``_Convolver`` or `None`, optional
+            A convolver prepared for the kernel and the ``data`` shape.
+            If `None`, the data are convolved with ``_filter_data``.
+
+        Returns
+        -------
+        convolved_data : 2D `~numpy.ndarray`
+            The convolved data.
+
+        xypos : Nx2 `~numpy.ndarray` or `None`
+            The (x, y) pixel coordinates of the stars (or the input
+            ``xycoords``). `None` is returned if no stars are found.
+        """
+        nproc = cpu_count() if self.nproc is None else self.nproc
+        tile_size = self.tile_size
+        if tile_size is None and nproc != 1:
+            tile_size = 1024
+        if tile_size is not None:
+            tile_size = as_pair('tile_size', tile_size, lower_bound=(0, 1))
+
+        context = (ThreadPoolExecutor(max_workers=nproc)
+                   if tile_size is not None and nproc > 1 else nullcontext())
+        with context as executor:
+            if convolver is not None:
+                convolved_data = convolver(data)
+            elif tile_size is None:
+                convolved_data = _filter_data(data, self.kernel.data,
+                                              mode='constant', fill_value=0.0,
+                                              check_normalization=False,
+                                              dtype=self.dtype,
+                                              method=self.convolution_method)
+            else:
+                convolved_data = _filter_data_tiled(data, self.kernel.data,
+                                                    tile_size,
+                                                    fill_value=0.0,
+                                                    dtype=self.dtype,
+                                                    method=self.convolution_method,
+                                                    executor=executor)
+
+            if self.xycoords is not None:
+                return convolved_data, self.xycoords
+
+            xypos = self._find_stars(convolved_data, self.kernel, threshold,
+                                     min_separation=self.min_separation,
+                                     mask=mask,
+                                     exclude_border=self.exclude_border,
+                                     tile_size=tile_size,
+                                     separation_method=self.separation_method,
+                                     executor=executor)
+
+        return convolved_data, xypos
+
+    @property
+    def _convolution_kernel(self):
+        """
+        The 2D kernel array used to convolve the data.
+        """
+        return self.kernel.data
+
+    def _make_convolver(self, frame):
+        """
+        Make a convolver for frames of the same shape and data type as
+        the input ``frame``.
+
+        `None` is returned if the frames are convolved in tiles, which
+        are processed in multiple threads.
+        """
+        nproc = cpu_count() if self.nproc is None else self.nproc
+        if self.tile_size is not None or nproc != 1:
+            return None
+
+        dtype = self.dtype
+        if dtype is None:
+            dtype = (frame.dtype if np.issubdtype(frame.dtype, np.floating)
+                     else float)
+        return _Convolver(self._convolution_kernel, frame.shape,
+                          fill_value=0.0, dtype=dtype,
+                          method=self.convolution_method)
+
+    def find_stars_many(self, frames, mask=None, prefetch=False):
+        """
+        Find stars in many images of the same shape.
+
+        This is a generator that yields the table of found stars for
+        each image (e.g., the slices of an image cube or a time series).
+        The kernel preparation (e.g., its FFT) and the buffers for the
+        convolved image are reused for all images. The tables are
+        identical to those returned by ``find_stars`` (to within
+        floating-point round-off errors for the ``'fft'``
+        ``convolution_method``).
+
+        Parameters
+        ----------
+        frames : 3D array_like or iterable of 2D array_like
+            The images, e.g., a 3D `~numpy.ndarray` or `~numpy.memmap`
+            whose first axis indexes the images, or an iterator of 2D
+            arrays. All images must have the same shape.
+
+        mask : 2D bool array, optional
+            A boolean mask with the same shape as each image, where
+            a `True` value indicates the corresponding element of the
+            images is masked. The same mask is used for all images.
+            Masked pixels are ignored when searching for stars.
+
+        prefetch : bool, optional
+            If `True`, the next image is loaded into memory (e.g., read
+            from a `~numpy.memmap` or from the input iterator) in a
+            background thread while the stars are found in the current
+            image.
+
+        Yields
+        ------
+        table : `~astropy.table.QTable` or `None`
+            The table of found stars for each image (see
+            ``find_stars``). `None` is yielded if no stars are found in
+            an image.
+        """
+        if isinstance(frames, np.ndarray) and frames.ndim != 3:
+            raise ValueError('frames must be a 3D array or an iterable of '
+                             '2D arrays.')
+
+        frames = iter(frames)
+
+        def next_frame():
+            frame = next(frames, None)
+            if frame is None:
+                return None
+            if prefetch:
+                # copy the frame (e.g., a memmap slice) into memory
+                return np.array(frame, subok=True)
+            return np.asanyarray(frame)
+
+        context = (ThreadPoolExecutor(max_workers=1) if prefetch
+                   else nullcontext())
+        with context as executor:
+            if prefetch:
+                future = executor.submit(next_frame)
+
+            convolver = None
+            shape = None
+            while True:
+                if prefetch:
+                    frame = future.result()
+                    if frame is not None:
+                        future = executor.submit(next_frame)
+                else:
+                    frame = next_frame()
+                if frame is None:
+                    break
+
+                if shape is None:
+                    shape = frame.shape
+                    convolver = self._make_convolver(frame)
+                elif frame.shape != shape:
+                    raise ValueError('All frames must have the same shape.')
+
+                cat = self._get_raw_catalog(frame, mask=mask,
+                                            convolver=convolver)
+                if cat is not None:
+                    cat = cat.apply_all_filters()
+
+                # the catalog properties are computed in to_table, thus
+                # the convolved image buffer can then be reused
+                yield None if cat is None else cat.to_table()
+
     @abc.abstractmethod
     def find_stars(self, data, mask=None):
         """
@@ -272,3 +519,108 @@ class _StarFinderKernel:
             self.data = self.gaussian_kernel
 
         self.shape = self.data.shape
+
+
+def _extract_cutouts(data, xypos, shape, fill_value=0.0):
+    """
+    Extract cutouts of the same shape centered at many positions.
+
+    The cutouts are extracted with a single fancy-indexing operation.
+    They are identical to those extracted individually with
+    `~astropy.nddata.extract_array` (with ``mode='partial'``), i.e.,
+    pixels outside of the ``data`` are set to ``fill_value``.
+
+    Parameters
+    ----------
+    data : 2D `~numpy.ndarray`
+        The 2D array from which to extract the cutouts.
+
+    xypos : Nx2 `~numpy.ndarray`
+        The ``(x, y)`` pixel coordinates of the cutout centers.
+
+    shape : tuple of 2 int
+        The ``(ny, nx)`` shape of the cutouts.
+
+    fill_value : number, optional
+        The value of the pixels outside of the ``data``.
+
+    Returns
+    -------
+    cutouts : 3D `~numpy.ndarray`
+        The ``(N, ny, nx)`` stacked cutouts.
+
+    Raises
+    ------
+    `~astropy.nddata.utils.NoOverlapError`
+        If a cutout does not overlap the ``data``.
+    """
+    from astropy.nddata.utils import NoOverlapError
+
+    xypos = np.asarray(xypos)
+    if not np.all(np.isfinite(xypos)):
+        raise ValueError('Input position contains invalid values (NaNs or '
+                         'infs).')
+
+    # the cutout origins (as in astropy.nddata.overlap_slices)
+    origins = []
+    for pos, size, data_size in zip(np.transpose(xypos)[::-1], shape,
+                                    data.shape):
+        origin = np.ceil(pos - size / 2.0).astype(int)
+        if np.any(origin + size < 0) or np.any(origin >= data_size):
+            raise NoOverlapError('Arrays do not overlap.')
+        origins.append(origin)
+
+    yidx = origins[0][:, np.newaxis] + np.arange(shape[0])
+    xidx = origins[1][:, np.newaxis] + np.arange(shape[1])
+    yvalid = (yidx >= 0) & (yidx < data.shape[0])
+    xvalid = (xidx >= 0) & (xidx < data.shape[1])
+    yidx = np.clip(yidx, 0, data.shape[0] - 1)
+    xidx = np.clip(xidx, 0, data.shape[1] - 1)
+
+    cutouts = data[yidx[:, :, np.newaxis], xidx[:, np.newaxis, :]]
+    if not np.all(yvalid) or not np.all(xvalid):
+        valid = yvalid[:, :, np.newaxis] & xvalid[:, np.newaxis, :]
+        cutouts[~valid] = fill_value
+
+    return cutouts
+
+
+def _brightest_candidates(catalog, batch_factor=4):
+    """
+    Select the brightest sources of a star-finder catalog that are
+    needed to apply its filters and ``brightest`` cut.
+
+    The brightest ``catalog.brightest`` sources that pass the catalog
+    filters are always among the sources with the largest fluxes. The
+    filters are therefore evaluated on batches of the sources with the
+    largest fluxes, of increasing size, until enough of them pass. This
+    avoids computing the (expensive) properties used by the filters
+    for sources that would be rejected by the ``brightest`` cut.
+
+    Parameters
+    ----------
+    catalog : star-finder catalog
+        The catalog. It must define ``brightest``, ``flux``, and a
+        ``_filter_mask`` method that returns the sources passing the
+        catalog filters.
+
+    batch_factor : int, optional
+        The factor by which the batch size grows.
+
+    Returns
+    -------
+    result : star-finder catalog
+        The catalog of candidate sources, sorted by decreasing flux.
+        This is the input ``catalog`` if all of its sources must be
+        considered.
+    """
+    nsources = len(catalog)
+    nbatch = batch_factor * catalog.brightest
+    while nbatch < nsources:
+        idx = argsort_largest(catalog.flux, nbatch)
+        candidates = catalog[idx]
+        if np.count_nonzero(candidates._filter_mask()) >= catalog.brightest:
+            return candidates
+        nbatch *= batch_factor
+
+    return catalog
@@ -7,13 +7,14 @@ import inspect
 import warnings
 
 import numpy as np
-from astropy.nddata import extract_array
 from astropy.table import QTable
 from astropy.utils import lazyproperty
 
-from photutils.detection.core import StarFinderBase, _StarFinderKernel
-from photutils.utils._convolution import _filter_data
+from photutils.detection.core import (StarFinderBase, _brightest_candidates,
+                                      _extract_cutouts, _StarFinderKernel)
 from photutils.utils._misc import _get_meta
+from photutils.utils._parameters import as_float_dtype
+from photutils.utils._sorting import argsort_largest
 from photutils.utils.exceptions import NoDetectionsWarning
 
 __all__ = ['DAOStarFinder']
@@ -128,6 +129,52 @@ class DAOStarFinder(StarFinderBase):
         The minimum separation (in pixels) for detected objects. Note
         that large values may result in long run times.
 
+    dtype : data-type or `None`, optional
+        The floating-point data type (e.g., ``np.float32``) of the
+        convolved image used to find the stars. Using ``np.float32``
+        halves the memory footprint for large images. If `None`, the
+        data type of floating-point ``data`` is kept and integer
+        ``data`` are converted to float64.
+
+    tile_size : int, array_like (int), or `None`, optional
+        If not `None`, the image is convolved and searched for
+        stars in tiles of this size (with a halo of neighboring pixels
+        sized from the kernel and the minimum separation), which
+        can be processed in multiple threads (see ``nproc``). If
+        ``tile_size`` is a scalar then square tiles will be used. If
+        ``tile_size`` has two elements, they must be in ``(ny, nx)``
+        order. The found stars are identical to those found without
+        tiles. If `None` (default) and ``nproc`` is not 1, then a tile
+        size of 1024 is used.
+
+    nproc : int or `None`, optional
+        The number of threads used to process the tiles. If `None`,
+        then all available CPU cores are used.
+
+    convolution_method : {'direct', 'fft', 'separable', 'auto'}, optional
+        The method used to convolve the image with the kernel:
+        ``'direct'`` for a direct convolution, ``'fft'`` for an
+        overlap-add FFT convolution (faster for large kernels),
+        ``'separable'`` for two 1D convolutions (the kernel must be
+        separable, i.e., of rank 1), or ``'auto'`` to select the method
+        by the kernel size and shape. The results of the methods agree
+        to within floating-point round-off errors.
+
+    separation_method : {'footprint', 'nms'}, optional
+        The method used to enforce the ``min_separation``. The two
+        methods define the stars differently. If ``'footprint'``,
+        each star must be the maximum of the convolved image within a
+        circular footprint with a radius of ``min_separation``, whose
+        cost grows with its area. A star is therefore rejected if
+        any brighter pixel lies within ``min_separation``, including
+        a pixel in the wings of a brighter star that is farther away.
+        If ``'nms'``, the stars are first found as the maxima within
+        the kernel footprint and then stars within ``min_separation``
+        of a brighter star are removed using non-maximum suppression
+        with a KD-tree, which is fast for large separations. Only
+        the brighter stars themselves are compared, so ``'nms'``
+        generally returns more stars, anywhere in the image.
+
     See Also
     --------
     IRAFStarFinder
@@ -162,7 +209,8 @@ class DAOStarFinder(StarFinderBase):
                  sigma_radius=1.5, sharplo=0.2, sharphi=1.0, roundlo=-1.0,
                  roundhi=1.0, sky=0.0, exclude_border=False,
                  brightest=None, peakmax=None, xycoords=None,
-                 min_separation=0.0):
+                 min_separation=0.0, dtype=None, tile_size=None, nproc=1,
+                 convolution_method='direct', separation_method='footprint'):
 
         if not np.isscalar(threshold):
             raise TypeError('threshold must be a scalar value.')
@@ -187,6 +235,11 @@ class DAOStarFinder(StarFinderBase):
         if min_separation < 0:
             raise ValueError('min_separation must be >= 0')
         self.min_separation = min_separation
+        self.dtype = as_float_dtype(dtype)
+        self.tile_size = tile_size
+        self.nproc = nproc
+        self.convolution_method = convolution_method
+        self.separation_method = separation_method
 
         if xycoords is not None:
             xycoords = np.asarray(xycoords)
@@ -209,18 +262,9 @@ class DAOStarFinder(StarFinderBase):
             brightest = bright_int
         return brightest
 
-    def _get_raw_catalog(self, data, mask=None):
-        convolved_data = _filter_data(data, self.kernel.data, mode='constant',
-                                      fill_value=0.0,
-                                      check_normalization=False)
-
-        if self.xycoords is None:
-            xypos = self._find_stars(convolved_data, self.kernel,
-                                     self.threshold_eff, mask=mask,
-                                     min_separation=self.min_separation,
-                                     exclude_border=self.exclude_border)
-        else:
-            xypos = self.xycoords
+    def _get_raw_catalog(self, data, mask=None, convolver=None):
+        convolved_data, xypos = self._filter_and_find_stars(
+            data, self.threshold_eff, mask=mask, convolver=convolver)
 
         if xypos is None:
             warnings.warn('No sources were found.', NoDetectionsWarning)
@@ -403,11 +447,8 @@ class _DAOStarFinderCatalog:
         self.id = np.arange(len(self)) + 1
 
     def make_cutouts(self, data):
-        cutouts = []
-        for xpos, ypos in self.xypos:
-            cutouts.append(extract_array(data, self.cutout_shape, (ypos, xpos),
-                                         fill_value=0.0))
-        return np.array(cutouts)
+        return _extract_cutouts(data, self.xypos, self.cutout_shape,
+                                fill_value=0.0)
 
     @lazyproperty
     def cutout_data(self):
@@ -657,8 +698,11 @@ class _DAOStarFinderCatalog:
     def npix(self):
         return np.full(len(self), fill_value=self.kernel.data.size)
 
-    def apply_filters(self):
-        """Filter the catalog."""
+    def _filter_mask(self):
+        """
+        Return a boolean mask of the sources that pass the catalog
+        filters.
+        """
         mask = (~np.isnan(self.dx) & ~np.isnan(self.dy)
                 & ~np.isnan(self.hx) & ~np.isnan(self.hy))
         mask &= ((self.sharpness > self.sharplo)
@@ -669,7 +713,11 @@ class _DAOStarFinderCatalog:
                  & (self.roundness2 < self.roundhi))
         if self.peakmax is not None:
             mask &= (self.peak < self.peakmax)
-        newcat = self[mask]
+        return mask
+
+    def apply_filters(self):
+        """Filter the catalog."""
+        newcat = self[self._filter_mask()]
 
         if len(newcat) == 0:
             warnings.warn('Sources were found, but none pass the sharpness, '
@@ -686,7 +734,7 @@ class _DAOStarFinderCatalog:
         """
         newcat = self
         if self.brightest is not None:
-            idx = np.argsort(self.flux)[::-1][:self.brightest]
+            idx = argsort_largest(self.flux, self.brightest)
             newcat = self[idx]
         return newcat
 
@@ -694,8 +742,15 @@ class _DAOStarFinderCatalog:
         """
         Apply all filters, select the brightest, and reset the source
         ids.
+
+        If ``brightest`` is set, the filters are applied only to the
+        sources with the largest fluxes that are needed to select the
+        brightest sources.
         """
-        cat = self.apply_filters()
+        cat = self
+        if self.brightest is not None:
+            cat = _brightest_candidates(self)
+        cat = cat.apply_filters()
         if cat is None:
             return None
         cat = cat.select_brightest()
@@ -7,14 +7,15 @@ import inspect
 import warnings
 
 import numpy as np
-from astropy.nddata import extract_array
 from astropy.table import QTable
 from astropy.utils import lazyproperty
 
-from photutils.detection.core import StarFinderBase, _StarFinderKernel
-from photutils.utils._convolution import _filter_data
+from photutils.detection.core import (StarFinderBase, _brightest_candidates,
+                                      _extract_cutouts, _StarFinderKernel)
 from photutils.utils._misc import _get_meta
-from photutils.utils._moments import _moments, _moments_central
+from photutils.utils._moments import _moments_central_stack
+from photutils.utils._parameters import as_float_dtype
+from photutils.utils._sorting import argsort_largest
 from photutils.utils.exceptions import NoDetectionsWarning
 
 __all__ = ['IRAFStarFinder']
@@ -100,6 +101,52 @@ class IRAFStarFinder(StarFinderBase):
         overrides ``minsep_fwhm``. Note that large values may result in
         long run times.
 
+    dtype : data-type or `None`, optional
+        The floating-point data type (e.g., ``np.float32``) of the
+        convolved image used to find the stars. Using ``np.float32``
+        halves the memory footprint for large images. If `None`, the
+        data type of floating-point ``data`` is kept and integer
+        ``data`` are converted to float64.
+
+    tile_size : int, array_like (int), or `None`, optional
+        If not `None`, the image is convolved and searched for
+        stars in tiles of this size (with a halo of neighboring pixels
+        sized from the kernel and the minimum separation), which
+        can be processed in multiple threads (see ``nproc``). If
+        ``tile_size`` is a scalar then square tiles will be used. If
+        ``tile_size`` has two elements, they must be in ``(ny, nx)``
+        order. The found stars are identical to those found without
+        tiles. If `None` (default) and ``nproc`` is not 1, then a tile
+        size of 1024 is used.
+
+    nproc : int or `None`, optional
+        The number of threads used to process the tiles. If `None`,
+        then all available CPU cores are used.
+
+    convolution_method : {'direct', 'fft', 'separable', 'auto'}, optional
+        The method used to convolve the image with the kernel:
+        ``'direct'`` for a direct convolution, ``'fft'`` for an
+        overlap-add FFT convolution (faster for large kernels),
+        ``'separable'`` for two 1D convolutions (the kernel must be
+        separable, i.e., of rank 1), or ``'auto'`` to select the method
+        by the kernel size and shape. The results of the methods agree
+        to within floating-point round-off errors.
+
+    separation_method : {'footprint', 'nms'}, optional
+        The method used to enforce the ``min_separation``. The two
+        methods define the stars differently. If ``'footprint'``,
+        each star must be the maximum of the convolved image within a
+        circular footprint with a radius of ``min_separation``, whose
+        cost grows with its area. A star is therefore rejected if
+        any brighter pixel lies within ``min_separation``, including
+        a pixel in the wings of a brighter star that is farther away.
+        If ``'nms'``, the stars are first found as the maxima within
+        the kernel footprint and then stars within ``min_separation``
+        of a brighter star are removed using non-maximum suppression
+        with a KD-tree, which is fast for large separations. Only
+        the brighter stars themselves are compared, so ``'nms'``
+        generally returns more stars, anywhere in the image.
+
     See Also
     --------
     DAOStarFinder
@@ -139,7 +186,9 @@ class IRAFStarFinder(StarFinderBase):
     def __init__(self, threshold, fwhm, sigma_radius=1.5, minsep_fwhm=2.5,
                  sharplo=0.5, sharphi=2.0, roundlo=0.0, roundhi=0.2, sky=None,
                  exclude_border=False, brightest=None, peakmax=None,
-                 xycoords=None, min_separation=None):
+                 xycoords=None, min_separation=None, dtype=None,
+                 tile_size=None, nproc=1, convolution_method='direct',
+                 separation_method='footprint'):
 
         if not np.isscalar(threshold):
             raise TypeError('threshold must be a scalar value.')
@@ -159,6 +208,11 @@ class IRAFStarFinder(StarFinderBase):
         self.exclude_border = exclude_border
         self.brightest = self._validate_brightest(brightest)
         self.peakmax = peakmax
+        self.dtype = as_float_dtype(dtype)
+        self.tile_size = tile_size
+        self.nproc = nproc
+        self.convolution_method = convolution_method
+        self.separation_method = separation_method
 
         if xycoords is not None:
             xycoords = np.asarray(xycoords)
@@ -188,19 +242,9 @@ class IRAFStarFinder(StarFinderBase):
             brightest = bright_int
         return brightest
 
-    def _get_raw_catalog(self, data, mask=None):
-        convolved_data = _filter_data(data, self.kernel.data, mode='constant',
-                                      fill_value=0.0,
-                                      check_normalization=False)
-
-        if self.xycoords is None:
-            xypos = self._find_stars(convolved_data, self.kernel,
-                                     self.threshold,
-                                     min_separation=self.min_separation,
-                                     mask=mask,
-                                     exclude_border=self.exclude_border)
-        else:
-            xypos = self.xycoords
+    def _get_raw_catalog(self, data, mask=None, convolver=None):
+        convolved_data, xypos = self._filter_and_find_stars(
+            data, self.threshold, mask=mask, convolver=convolver)
 
         if xypos is None:
             warnings.warn('No sources were found.', NoDetectionsWarning)
@@ -387,11 +431,8 @@ class _IRAFStarFinderCatalog:
         return sky
 
     def make_cutouts(self, data):
-        cutouts = []
-        for xpos, ypos in self.xypos:
-            cutouts.append(extract_array(data, self.cutout_shape, (ypos, xpos),
-                                         fill_value=0.0))
-        return np.array(cutouts)
+        return _extract_cutouts(data, self.xypos, self.cutout_shape,
+                                fill_value=0.0)
 
     @lazyproperty
     def cutout_data_nosub(self):
@@ -415,7 +456,8 @@ class _IRAFStarFinderCatalog:
 
     @lazyproperty
     def moments(self):
-        return np.array([_moments(arr, order=1) for arr in self.cutout_data])
+        return _moments_central_stack(self.cutout_data,
+                                      np.zeros((len(self), 2)), order=1)
 
     @lazyproperty
     def cutout_centroid(self):
@@ -454,11 +496,11 @@ class _IRAFStarFinderCatalog:
 
     @lazyproperty
     def peak(self):
-        return np.array([np.max(arr) for arr in self.cutout_data])
+        return np.max(self.cutout_data, axis=(1, 2))
 
     @lazyproperty
     def flux(self):
-        return np.array([np.sum(arr) for arr in self.cutout_data])
+        return np.sum(self.cutout_data, axis=(1, 2))
 
     @lazyproperty
     def mag(self):
@@ -466,11 +508,9 @@ class _IRAFStarFinderCatalog:
 
     @lazyproperty
     def moments_central(self):
-        moments = np.array([_moments_central(arr, center=(xcen_, ycen_),
-                                             order=2)
-                            for arr, xcen_, ycen_ in
-                            zip(self.cutout_data, self.cutout_xcentroid,
-                                self.cutout_ycentroid)])
+        centers = np.transpose((self.cutout_xcentroid,
+                                self.cutout_ycentroid))
+        moments = _moments_central_stack(self.cutout_data, centers, order=2)
         return moments / self.moments[:, 0, 0][:, np.newaxis, np.newaxis]
 
     @lazyproperty
@@ -505,8 +545,11 @@ class _IRAFStarFinderCatalog:
         pa = np.where(pa < 0, pa + 180, pa)
         return pa
 
-    def apply_filters(self):
-        """Filter the catalog."""
+    def _filter_mask(self):
+        """
+        Return a boolean mask of the sources that pass the catalog
+        filters.
+        """
         mask = np.count_nonzero(self.cutout_data, axis=(1, 2)) > 1
         mask &= ((self.sharpness > self.sharplo)
                  & (self.sharpness < self.sharphi)
@@ -514,7 +557,11 @@ class _IRAFStarFinderCatalog:
                  & (self.roundness < self.roundhi))
         if self.peakmax is not None:
             mask &= (self.peak < self.peakmax)
-        newcat = self[mask]
+        return mask
+
+    def apply_filters(self):
+        """Filter the catalog."""
+        newcat = self[self._filter_mask()]
 
         if len(newcat) == 0:
             warnings.warn('Sources were found, but none pass the sharpness, '
@@ -531,7 +578,7 @@ class _IRAFStarFinderCatalog:
         """
         newcat = self
         if self.brightest is not None:
-            idx = np.argsort(self.flux)[::-1][:self.brightest]
+            idx = argsort_largest(self.flux, self.brightest)
             newcat = self[idx]
         return newcat
 
@@ -539,8 +586,15 @@ class _IRAFStarFinderCatalog:
         """
         Apply all filters, select the brightest, and reset the source
         ids.
+
+        If ``brightest`` is set, the filters are applied only to the
+        sources with the largest fluxes that are needed to select the
+        brightest sources.
         """
-        cat = self.apply_filters()
+        cat = self
+        if self.brightest is not None:
+            cat = _brightest_candidates(self)
+        cat = cat.apply_filters()
         if cat is None:
             return None
         cat = cat.select_brightest()
@@ -9,15 +9,22 @@ import warnings
 import numpy as np
 from astropy.table import QTable
 
+from photutils.utils._convolution import _tile_slices
+from photutils.utils._coords import non_maximum_suppression
 from photutils.utils._misc import _get_meta
+from photutils.utils._sorting import argsort_largest
 from photutils.utils.exceptions import NoDetectionsWarning
 
 __all__ = ['find_peaks']
 
+# the approximate number of pixels in the image strips processed by the
+# 'rectangles' peak-finding method
+_STRIP_SIZE = 2**18
+
 
 def find_peaks(data, threshold, box_size=3, footprint=None, mask=None,
                border_width=None, npeaks=np.inf, centroid_func=None,
-               error=None, wcs=None):
+               error=None, wcs=None, min_separation=None, method='auto'):
     """
     Find local peaks in an image that are above above a specified
     threshold value.
@@ -99,6 +106,42 @@ def find_peaks(data, threshold, box_size=3, footprint=None, mask=None,
         the sky coordinates will not be returned in the output
         `~astropy.table.Table`.
 
+    min_separation : float or `None`, optional
+        If not `None`, the minimum separation (in pixels) between the
+        returned peaks. The peaks are selected with non-maximum
+        suppression in the order of decreasing peak values (using
+        a KD-tree), i.e., a peak is removed if it is within
+        ``min_separation`` of a brighter peak that is kept. Unlike
+        a large ``box_size`` or ``footprint``, whose cost grows with
+        its area, this is fast for large separations. If ``npeaks``
+        is input, the brightest ``npeaks`` peaks are selected after
+        applying the minimum separation.
+
+    method : {'auto', 'ndimage', 'rectangles', 'sparse'}, optional
+        The method used to find the local maxima. The found peaks do
+        not depend on the method:
+
+            * ``'ndimage'``: the maximum-filtered image is computed with
+              `scipy.ndimage.maximum_filter`. Its cost per pixel is
+              proportional to the number of footprint pixels for
+              non-rectangular footprints.
+            * ``'rectangles'``: the footprint is decomposed into
+              rectangles, for which the maximum-filtered image is
+              computed with 1D running-maximum filters along the
+              rows and columns. Its cost per pixel is proportional
+              to the number of rectangles (e.g., about the radius of
+              a circular footprint). The image is processed in strips
+              of rows and strips without pixels above the threshold
+              are skipped.
+            * ``'sparse'``: the local maxima are computed only for the
+              (unmasked) pixels above the threshold by comparing them
+              to the pixels in their footprint. This method is fast if
+              only a small fraction of pixels is above the threshold.
+            * ``'auto'``: the method is selected by its estimated cost,
+              which depends on the number of pixels above the
+              threshold, the number of footprint pixels, and the
+              number of footprint rectangles.
+
     Returns
     -------
     output : `~astropy.table.Table` or `None`
@@ -116,7 +159,9 @@ def find_peaks(data, threshold, box_size=3, footprint=None, mask=None,
     to compute centroid coordinates with subpixel precision within the
     input ``box_size`` or ``footprint``.
     """
-    from scipy.ndimage import maximum_filter
+    methods = ('auto', 'ndimage', 'rectangles', 'sparse')
+    if method not in methods:
+        raise ValueError(f'method must be one of {methods}')
 
     data = np.asanyarray(data)
 
@@ -138,13 +183,14 @@ def find_peaks(data, threshold, box_size=3, footprint=None, mask=None,
         data[nan_mask] = np.nanmin(data)
 
     if footprint is not None:
-        data_max = maximum_filter(data, footprint=footprint, mode='constant',
-                                  cval=0.0)
+        peak_footprint = np.asanyarray(footprint, dtype=bool)
     else:
-        data_max = maximum_filter(data, size=box_size, mode='constant',
-                                  cval=0.0)
+        box_shape = np.broadcast_to(box_size, data.ndim).astype(int)
+        peak_footprint = np.ones(box_shape, dtype=bool)
 
-    peak_goodmask = (data == data_max)  # good pixels are True
+    # the candidate peak pixels, which are above the threshold and
+    # not masked; the local maxima are found only among them
+    peak_goodmask = (data > threshold)  # good pixels are True
 
     if mask is not None:
         mask = np.asanyarray(mask)
@@ -159,13 +205,20 @@ def find_peaks(data, threshold, box_size=3, footprint=None, mask=None,
             peak_goodmask[-border_width:] = False
             peak_goodmask = peak_goodmask.swapaxes(0, i)
 
-    peak_goodmask = np.logical_and(peak_goodmask, (data > threshold))
-    y_peaks, x_peaks = peak_goodmask.nonzero()
+    y_peaks, x_peaks = _local_peaks(data, peak_footprint, peak_goodmask,
+                                    method=method)
     peak_values = data[y_peaks, x_peaks]
 
+    if min_separation is not None and len(x_peaks) > 0:
+        idx = non_maximum_suppression(np.transpose((x_peaks, y_peaks)),
+                                      min_separation, values=peak_values)
+        x_peaks = x_peaks[idx]
+        y_peaks = y_peaks[idx]
+        peak_values = peak_values[idx]
+
     nxpeaks = len(x_peaks)
     if nxpeaks > npeaks:
-        idx = np.argsort(peak_values)[::-1][:npeaks]
+        idx = argsort_largest(peak_values, npeaks)
         x_peaks = x_peaks[idx]
         y_peaks = y_peaks[idx]
         peak_values = peak_values[idx]
@@ -207,3 +260,345 @@ def find_peaks(data, threshold, box_size=3, footprint=None, mask=None,
                              index=idx)
 
     return table
+
+
+def _footprint_rectangles(footprint):
+    """
+    Decompose a 2D footprint into rectangles.
+
+    Each distinct horizontal run of `True` values in the footprint rows
+    defines a rectangle with the run columns and the (contiguous) rows
+    whose runs contain it. The union of the rectangles is the footprint.
+    If the rows containing a run are not contiguous, a rectangle is
+    returned for each group of contiguous rows.
+
+    Parameters
+    ----------
+    footprint : 2D bool `~numpy.ndarray`
+        The footprint.
+
+    Returns
+    -------
+    rectangles : list of tuple
+        The ``(row, height, column, width)`` of each rectangle.
+    """
+    footprint = np.asanyarray(footprint, dtype=bool)
+
+    # the runs of True values in each row
+    edges = np.diff(np.pad(footprint.astype(np.int8), ((0, 0), (1, 1))),
+                    axis=1)
+    runs = set()
+    for row_edges in edges:
+        starts = np.flatnonzero(row_edges == 1)
+        stops = np.flatnonzero(row_edges == -1)
+        runs.update(zip(starts.tolist(), stops.tolist()))
+
+    rectangles = []
+    for start, stop in sorted(runs):
+        rows = np.all(footprint[:, start:stop], axis=1)
+        row_edges = np.diff(np.pad(rows.astype(np.int8), 1))
+        for row0, row1 in zip(np.flatnonzero(row_edges == 1),
+                              np.flatnonzero(row_edges == -1)):
+            rectangles.append((int(row0), int(row1 - row0), start,
+                               stop - start))
+
+    return rectangles
+
+
+def _maximum_filter_rectangles(data, footprint_shape, rectangles, rows,
+                               cval=0.0):
+    """
+    Compute the maximum filter of a range of image rows using the
+    rectangle decomposition of a footprint.
+
+    The result is identical to ``scipy.ndimage.maximum_filter(data,
+    footprint=footprint, mode='constant', cval=cval)[rows]``. The
+    maximum over each rectangle is computed with two 1D maximum
+    filters, whose cost per pixel does not depend on the rectangle
+    size. Thus, the cost per pixel is proportional to the number of
+    rectangles (e.g., about the radius of a circular footprint) instead
+    of the number of footprint pixels.
+
+    Parameters
+    ----------
+    data : 2D `~numpy.ndarray`
+        The 2D array of the image.
+
+    footprint_shape : tuple of 2 int
+        The shape of the footprint.
+
+    rectangles : list of tuple
+        The ``(row, height, column, width)`` of the footprint rectangles
+        (see ``_footprint_rectangles``).
+
+    rows : slice
+        The range of image rows.
+
+    cval : float, optional
+        The value of the pixels beyond the image borders.
+
+    Returns
+    -------
+    result : 2D `~numpy.ndarray`
+        The maximum-filtered image rows.
+    """
+    from scipy.ndimage import maximum_filter1d
+
+    fy, fx = footprint_shape
+    nrows = rows.stop - rows.start
+    nx = data.shape[1]
+
+    # the image rows and the rows and columns within the footprint
+    # extent, padded with cval beyond the image borders
+    row0 = rows.start - fy // 2
+    row1 = rows.stop + fy - 1 - fy // 2
+    window = np.full((row1 - row0, nx + 2 * fx), cval, dtype=data.dtype)
+    start = max(row0, 0)
+    stop = min(row1, data.shape[0])
+    window[start - row0:stop - row0, fx:fx + nx] = data[start:stop]
+
+    result = None
+    hmax = {}
+    for row, height, column, width in rectangles:
+        if width not in hmax:
+            hmax[width] = maximum_filter1d(window, width, axis=1)
+
+        # the window columns whose filtered values are the maximum over
+        # the rectangle columns for each image column
+        xstart = fx + column - fx // 2 + width // 2
+        values = hmax[width][:, xstart:xstart + nx]
+        if height > 1:
+            values = maximum_filter1d(values, height, axis=0)
+        ystart = row + height // 2
+        values = values[ystart:ystart + nrows]
+
+        if result is None:
+            result = values.copy()
+        else:
+            np.maximum(result, values, out=result)
+
+    return result
+
+
+def _local_peaks(data, footprint, candidates, method='auto', cval=0.0):
+    """
+    Find the candidate pixels that are local maxima.
+
+    A pixel is a local maximum if it is equal to the maximum of the
+    data within the ``footprint`` centered on it, where pixels beyond
+    the image borders have the value ``cval``, i.e., if ``data ==
+    scipy.ndimage.maximum_filter(data, footprint=footprint,
+    mode='constant', cval=cval)``. The result does not depend on the
+    ``method``.
+
+    Parameters
+    ----------
+    data : 2D `~numpy.ndarray`
+        The 2D array of the image.
+
+    footprint : 2D bool `~numpy.ndarray`
+        The footprint of the local region.
+
+    candidates : 2D bool `~numpy.ndarray`
+        The candidate pixels (e.g., the unmasked pixels above the
+        threshold).
+
+    method : {'auto', 'ndimage', 'rectangles', 'sparse'}, optional
+        The method used to compute the local maxima (see
+        `find_peaks`).
+
+    cval : float, optional
+        The value of the pixels beyond the image borders.
+
+    Returns
+    -------
+    y_peaks, x_peaks : 1D `~numpy.ndarray`
+        The indices of the local peaks in row-major order.
+    """
+    from scipy.ndimage import maximum_filter
+
+    data = np.asarray(data)
+    footprint = np.asanyarray(footprint, dtype=bool)
+
+    rectangles = None
+    if data.ndim != 2:
+        method = 'ndimage'
+    elif method == 'auto':
+        # select the method with the smallest estimated cost (in units
+        # of ~1 ns, as measured for large images); scipy.ndimage uses
+        # 1D filters for box footprints
+        npixels = np.count_nonzero(footprint)
+        costs = {'sparse': 10 * np.count_nonzero(candidates) * npixels}
+        if np.all(footprint):
+            costs['ndimage'] = 15 * data.size
+        else:
+            rectangles = _footprint_rectangles(footprint)
+            costs['ndimage'] = 0.5 * npixels * data.size
+            costs['rectangles'] = 10 * len(rectangles) * data.size
+        method = min(costs, key=costs.get)
+
+    if method == 'ndimage':
+        data_max = maximum_filter(data, footprint=footprint,
+                                  mode='constant', cval=cval)
+        return np.nonzero(candidates & (data == data_max))
+
+    if method == 'sparse':
+        y_peaks, x_peaks = np.nonzero(candidates)
+        peak_max = None
+        for dy, dx in zip(*np.nonzero(footprint)):
+            yy = y_peaks + dy - footprint.shape[0] // 2
+            xx = x_peaks + dx - footprint.shape[1] // 2
+            inside = ((yy >= 0) & (yy < data.shape[0])
+                      & (xx >= 0) & (xx < data.shape[1]))
+            neighbors = np.full(y_peaks.shape, cval, dtype=data.dtype)
+            neighbors[inside] = data[yy[inside], xx[inside]]
+            if peak_max is None:
+                peak_max = neighbors
+            else:
+                np.maximum(peak_max, neighbors, out=peak_max)
+        peaks = data[y_peaks, x_peaks] == peak_max
+        return y_peaks[peaks], x_peaks[peaks]
+
+    # the rectangles method, in strips of image rows that contain
+    # candidate pixels
+    if rectangles is None:
+        rectangles = _footprint_rectangles(footprint)
+    nrows = max(_STRIP_SIZE // max(data.shape[1], 1), 1)
+    y_peaks = []
+    x_peaks = []
+    for row in range(0, data.shape[0], nrows):
+        rows = slice(row, min(row + nrows, data.shape[0]))
+        strip_candidates = candidates[rows]
+        if not np.any(strip_candidates):
+            continue
+        data_max = _maximum_filter_rectangles(data, footprint.shape,
+                                              rectangles, rows, cval=cval)
+        y_strip, x_strip = np.nonzero(strip_candidates
+                                      & (data[rows] == data_max))
+        y_peaks.append(y_strip + row)
+        x_peaks.append(x_strip)
+
+    if not y_peaks:
+        return np.array([], dtype=int), np.array([], dtype=int)
+    return np.concatenate(y_peaks), np.concatenate(x_peaks)
+
+
+def _find_peaks_tiled(data, threshold, footprint, tile_size, *, mask=None,
+                      pad=(0, 0), method='auto', executor=None):
+    """
+    Find local peaks in an image in tiles.
+
+    The result is identical to that of ``find_peaks(padded_data,
+    threshold, footprint=footprint, mask=padded_mask)``, where the
+    ``data`` and ``mask`` are padded (with zeros and `False`,
+    respectively) by ``pad`` pixels on each side. The padded arrays
+    are never created. Each tile is processed together with a halo of
+    the neighboring pixels that is larger than the ``footprint``. The
+    tiles are processed in the threads of the input ``executor`` (if
+    not `None`).
+
+    Parameters
+    ----------
+    data : 2D `~numpy.ndarray`
+        The 2D array of the image.
+
+    threshold : float
+        The data value above which to select peaks.
+
+    footprint : 2D `~numpy.ndarray`
+        The footprint of the local region used to find the local
+        maxima.
+
+    tile_size : tuple of 2 int
+        The ``(ny, nx)`` size of the tiles.
+
+    mask : 2D bool `~numpy.ndarray`, optional
+        A boolean mask with the same shape as ``data``, where a `True`
+        value indicates the corresponding element of ``data`` is
+        masked.
+
+    pad : tuple of 2 int, optional
+        The number of padding pixels on each side of the ``(y, x)``
+        axes.
+
+    method : {'auto', 'ndimage', 'rectangles', 'sparse'}, optional
+        The method used to find the local maxima (see `find_peaks`).
+
+    executor : `~concurrent.futures.Executor` or `None`, optional
+        The executor used to process the tiles.
+
+    Returns
+    -------
+    result : `~astropy.table.QTable` or `None`
+        A table with the ``x_peak``, ``y_peak``, and ``peak_value``
+        columns in the padded coordinates. `None` is returned if no
+        peaks are found.
+    """
+    pad = np.array(pad)
+    shape = np.array(data.shape) + 2 * pad
+
+    # the checks of find_peaks are done on the full (padded) data
+    if np.any(pad > 0):
+        if np.all(data == 0):
+            return None
+    elif np.all(data == data.flat[0]):
+        return None
+    nan_value = None
+    if np.any(np.isnan(data)):
+        nan_value = np.nanmin(data)
+        if np.any(pad > 0):
+            nan_value = min(nan_value, 0.0)
+
+    halo = np.array(footprint.shape) // 2 + 1
+
+    def get_padded(array, yx0, yx1, fill_value):
+        # a (y, x) region of the padded array
+        start = np.maximum(yx0 - pad, 0)
+        stop = np.minimum(yx1 - pad, data.shape)
+        region = array[start[0]:stop[0], start[1]:stop[1]]
+        if np.all(start - yx0 + pad == 0) and np.all(yx1 - pad - stop == 0):
+            return region
+        pad_width = tuple(zip(start - yx0 + pad, yx1 - pad - stop))
+        return np.pad(region, pad_width, mode='constant',
+                      constant_values=fill_value)
+
+    def find_tile_peaks(slices):
+        yx0 = np.array([slc.start for slc in slices])
+        yx1 = np.array([slc.stop for slc in slices])
+        win0 = np.maximum(yx0 - halo, 0)
+        win1 = np.minimum(yx1 + halo, shape)
+
+        window = get_padded(data, win0, win1, 0.0)
+        if nan_value is not None:
+            window = np.where(np.isnan(window), nan_value, window)
+
+        # the candidate peaks are only in the tile core
+        core = tuple(slice(start, stop)
+                     for start, stop in zip(yx0 - win0, yx1 - win0))
+        candidates = np.zeros(window.shape, dtype=bool)
+        candidates[core] = window[core] > threshold
+        if mask is not None:
+            candidates[core] &= ~get_padded(mask, yx0, yx1, False)
+
+        y_peaks, x_peaks = _local_peaks(window, footprint, candidates,
+                                        method=method)
+        return (y_peaks + win0[0], x_peaks + win0[1],
+                window[y_peaks, x_peaks])
+
+    tiles = _tile_slices(shape, tile_size)
+    if executor is None:
+        results = [find_tile_peaks(slices) for slices in tiles]
+    else:
+        results = list(executor.map(find_tile_peaks, tiles))
+
+    y_peaks, x_peaks, peak_values = (np.concatenate(arrays)
+                                     for arrays in zip(*results))
+    if len(x_peaks) == 0:
+        return None
+
+    # the peaks in row-major order (as in find_peaks)
+    idx = np.lexsort((x_peaks, y_peaks))
+    table = QTable([x_peaks[idx], y_peaks[idx], peak_values[idx]],
+                   names=['x_peak', 'y_peak', 'peak_value'])
+    table.meta.update(_get_meta())  # keep table.meta type
+    return table
@@ -15,6 +15,8 @@ from photutils.detection.core import StarFinderBase
 from photutils.utils._convolution import _filter_data
 from photutils.utils._misc import _get_meta
 from photutils.utils._moments import _moments, _moments_central
+from photutils.utils._parameters import as_float_dtype
+from photutils.utils._sorting import argsort_largest
 from photutils.utils.exceptions import NoDetectionsWarning
 
 __all__ = ['StarFinder']
@@ -55,6 +57,37 @@ class StarFinder(StarFinderBase):
             pixel values are negative. Therefore, setting ``peakmax`` to
             a non-positive value would result in excluding all objects.
 
+    dtype : data-type or `None`, optional
+        The floating-point data type (e.g., ``np.float32``) of the
+        convolved image used to find the stars. Using ``np.float32``
+        halves the memory footprint for large images. If `None`, the
+        data type of floating-point ``data`` is kept and integer
+        ``data`` are converted to float64.
+
+    convolution_method : {'direct', 'fft', 'separable', 'auto'}, optional
+        The method used to convolve the image with the kernel:
+        ``'direct'`` for a direct convolution, ``'fft'`` for an
+        overlap-add FFT convolution (faster for large kernels),
+        ``'separable'`` for two 1D convolutions (the kernel must be
+        separable, i.e., of rank 1), or ``'auto'`` to select the method
+        by the kernel size and shape. The results of the methods agree
+        to within floating-point round-off errors.
+
+    separation_method : {'footprint', 'nms'}, optional
+        The method used to enforce the ``min_separation``. The two
+        methods define the stars differently. If ``'footprint'``,
+        each star must be the maximum of the convolved image within a
+        circular footprint with a radius of ``min_separation``, whose
+        cost grows with its area. A star is therefore rejected if
+        any brighter pixel lies within ``min_separation``, including
+        a pixel in the wings of a brighter star that is farther away.
+        If ``'nms'``, the stars are first found as the maxima within
+        the kernel footprint and then stars within ``min_separation``
+        of a brighter star are removed using non-maximum suppression
+        with a KD-tree, which is fast for large separations. Only
+        the brighter stars themselves are compared, so ``'nms'``
+        generally returns more stars, anywhere in the image.
+
     See Also
     --------
     DAOStarFinder, IRAFStarFinder
@@ -68,7 +101,9 @@ class StarFinder(StarFinderBase):
     """
 
     def __init__(self, threshold, kernel, min_separation=5.0,
-                 exclude_border=False, brightest=None, peakmax=None):
+                 exclude_border=False, brightest=None, peakmax=None,
+                 dtype=None, convolution_method='direct',
+                 separation_method='footprint'):
 
         self.threshold = threshold
         self.kernel = kernel
@@ -78,6 +113,12 @@ class StarFinder(StarFinderBase):
         self.exclude_border = exclude_border
         self.brightest = self._validate_brightest(brightest)
         self.peakmax = peakmax
+        self.dtype = as_float_dtype(dtype)
+        self.convolution_method = convolution_method
+        self.separation_method = separation_method
+        # StarFinder always convolves the whole image in a single thread
+        self.tile_size = None
+        self.nproc = 1
 
     @staticmethod
     def _validate_brightest(brightest):
@@ -90,19 +131,31 @@ class StarFinder(StarFinderBase):
             brightest = bright_int
         return brightest
 
-    def _get_raw_catalog(self, data, mask=None):
+    @property
+    def _convolution_kernel(self):
+        """
+        The 2D kernel array used to convolve the data.
+        """
         kernel = self.kernel
         kernel /= np.max(kernel)  # normalize max value to 1.0
         denom = np.sum(kernel**2) - (np.sum(kernel)**2 / kernel.size)
-        kernel = (kernel - np.sum(kernel) / kernel.size) / denom
-
-        convolved_data = _filter_data(data, kernel, mode='constant',
-                                      fill_value=0.0,
-                                      check_normalization=False)
+        return (kernel - np.sum(kernel) / kernel.size) / denom
+
+    def _get_raw_catalog(self, data, mask=None, convolver=None):
+        kernel = self._convolution_kernel
+        if convolver is None:
+            convolved_data = _filter_data(data, kernel, mode='constant',
+                                          fill_value=0.0,
+                                          check_normalization=False,
+                                          dtype=self.dtype,
+                                          method=self.convolution_method)
+        else:
+            convolved_data = convolver(data)
 
         xypos = self._find_stars(convolved_data, kernel, self.threshold,
                                  min_separation=self.min_separation,
-                                 mask=mask, exclude_border=self.exclude_border)
+                                 mask=mask, exclude_border=self.exclude_border,
+                                 separation_method=self.separation_method)
 
         if xypos is None:
             warnings.warn('No sources were found.', NoDetectionsWarning)
@@ -371,7 +424,7 @@ class _StarFinderCatalog:
         """
         newcat = self
         if self.brightest is not None:
-            idx = np.argsort(self.flux)[::-1][:self.brightest]
+            idx = argsort_largest(self.flux, self.brightest)
             newcat = self[idx]
         return newcat
 
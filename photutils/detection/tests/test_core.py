@@ -0,0 +1,188 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+Tests for the core module.
+"""
+
+import numpy as np
+import pytest
+from astropy.modeling.models import Gaussian2D
+from astropy.nddata import extract_array
+from astropy.nddata.utils import NoOverlapError
+from numpy.testing import assert_allclose, assert_equal
+
+from photutils.datasets import make_100gaussians_image
+from photutils.detection.core import StarFinderBase, _extract_cutouts
+from photutils.detection.daofinder import DAOStarFinder
+from photutils.detection.irafstarfinder import IRAFStarFinder
+from photutils.detection.starfinder import StarFinder
+from photutils.utils.exceptions import NoDetectionsWarning
+
+DATA = make_100gaussians_image()
+y, x = np.mgrid[0:25, 0:25]
+g = Gaussian2D(1, 12, 12, 3, 2, theta=np.pi / 6.0)
+PSF = g(x, y)
+FINDERS = [DAOStarFinder, IRAFStarFinder, StarFinder]
+
+
+def make_finder(finder_class, fwhm=2.0, **kwargs):
+    """
+    Make a star finder with a Gaussian kernel of the given FWHM, or
+    with the ``PSF`` kernel for `StarFinder`.
+    """
+    if finder_class is StarFinder:
+        return StarFinder(10, PSF, **kwargs)
+    return finder_class(threshold=5, fwhm=fwhm, **kwargs)
+
+
+@pytest.mark.parametrize('shape', [(5, 5), (4, 6), (7, 3)])
+def test_extract_cutouts(shape):
+    rng = np.random.default_rng(0)
+    data = rng.random((30, 40))
+    xypos = np.column_stack((rng.uniform(-1.4, 40.4, 200),
+                             rng.uniform(-1.4, 30.4, 200)))
+    xypos[:50] = np.round(xypos[:50])
+
+    cutouts = _extract_cutouts(data, xypos, shape, fill_value=0.0)
+    expected = [extract_array(data, shape, (ypos, xpos), fill_value=0.0)
+                for xpos, ypos in xypos]
+    assert cutouts.shape == (len(xypos), *shape)
+    assert_equal(cutouts, expected)
+
+
+def test_extract_cutouts_invalid():
+    data = np.ones((30, 40))
+    with pytest.raises(NoOverlapError):
+        _extract_cutouts(data, [(5, 5), (-10, 5)], (5, 5))
+    with pytest.raises(ValueError, match='invalid values'):
+        _extract_cutouts(data, [(5, 5), (np.nan, 5)], (5, 5))
+
+
+def test_find_stars_separation_method():
+    """
+    Test that the 'footprint' method rejects a faint star in the wings
+    of a brighter star, while the 'nms' method compares only the stars.
+    """
+    yy, xx = np.mgrid[0:61, 0:61]
+    data = 20.0 * np.exp(-((xx - 30)**2 + (yy - 30)**2) / (2 * 8.0**2))
+    data += 3.0 * np.exp(-((xx - 44)**2 + (yy - 30)**2) / (2 * 0.7**2))
+    kernel = np.ones((3, 3))
+
+    # the faint star is 14 pixels from the bright star, but within
+    # 10 pixels of brighter pixels in the wings of the bright star
+    xypos = StarFinderBase._find_stars(data, kernel, 1.0, min_separation=10)
+    assert_equal(xypos, [[30, 30]])
+    xypos = StarFinderBase._find_stars(data, kernel, 1.0, min_separation=10,
+                                       separation_method='nms')
+    assert_equal(xypos, [[30, 30], [44, 30]])
+
+    # both methods reject a star within min_separation of a brighter
+    # star
+    for method in ('footprint', 'nms'):
+        xypos = StarFinderBase._find_stars(data, kernel, 1.0,
+                                           min_separation=15,
+                                           separation_method=method)
+        assert_equal(xypos, [[30, 30]])
+
+
+@pytest.mark.parametrize('finder_class', [DAOStarFinder, IRAFStarFinder])
+@pytest.mark.parametrize('exclude_border', [False, True])
+@pytest.mark.parametrize('min_separation', [None, 5.0])
+def test_tiled(finder_class, exclude_border, min_separation):
+    data = DATA.copy()
+    data[50:60, 100:110] = np.nan
+    mask = np.zeros(data.shape, dtype=bool)
+    mask[120:150, 300:350] = True
+    kwargs = {'exclude_border': exclude_border}
+    if min_separation is not None:
+        kwargs['min_separation'] = min_separation
+
+    finder1 = make_finder(finder_class, **kwargs)
+    tbl1 = finder1(data, mask=mask)
+    for tile_size, nproc in ((37, 1), ((64, 111), 2), (None, 3)):
+        finder2 = make_finder(finder_class, tile_size=tile_size,
+                              nproc=nproc, **kwargs)
+        cat = finder2._get_raw_catalog(data, mask=mask)
+        assert_equal(cat.convolved_data,
+                     finder1._get_raw_catalog(data).convolved_data)
+        tbl2 = finder2(data, mask=mask)
+        assert len(tbl1) == len(tbl2)
+        for col in tbl1.colnames:
+            assert_equal(tbl2[col], tbl1[col])
+
+
+@pytest.mark.parametrize('finder_class', FINDERS)
+@pytest.mark.parametrize('convolution_method', ['fft', 'auto'])
+def test_convolution_method(finder_class, convolution_method):
+    finder1 = make_finder(finder_class, fwhm=5.0)
+    finder2 = make_finder(finder_class, fwhm=5.0,
+                          convolution_method=convolution_method)
+    tbl1 = finder1(DATA)
+    tbl2 = finder2(DATA)
+    assert len(tbl1) == len(tbl2)
+    for col in tbl1.colnames:
+        assert_allclose(tbl2[col], tbl1[col])
+
+
+@pytest.mark.parametrize('finder_class', FINDERS)
+@pytest.mark.parametrize('prefetch', [False, True])
+@pytest.mark.parametrize('kwargs', [{}, {'convolution_method': 'fft'}])
+def test_find_stars_many(tmp_path, finder_class, prefetch, kwargs):
+    frames = np.array([DATA, DATA[::-1], np.zeros(DATA.shape)])
+    mask = np.zeros(DATA.shape, dtype=bool)
+    mask[120:150, 300:350] = True
+    filename = tmp_path / 'frames.dat'
+    memmap = np.memmap(filename, dtype=float, mode='w+', shape=frames.shape)
+    memmap[:] = frames
+
+    finder = make_finder(finder_class, **kwargs)
+    with pytest.warns(NoDetectionsWarning):
+        expected = [finder(frame, mask=mask) for frame in frames]
+    assert expected[-1] is None
+
+    for inputs in (frames, memmap, iter(list(frames))):
+        with pytest.warns(NoDetectionsWarning):
+            tbls = list(finder.find_stars_many(inputs, mask=mask,
+                                               prefetch=prefetch))
+        assert len(tbls) == len(expected)
+        assert tbls[-1] is None
+        for tbl, tbl_expected in zip(tbls[:-1], expected[:-1]):
+            assert len(tbl) == len(tbl_expected)
+            for col in tbl.colnames:
+                assert_allclose(tbl[col], tbl_expected[col])
+
+
+@pytest.mark.parametrize('finder_class', FINDERS)
+def test_find_stars_many_inputs(finder_class):
+    finder = make_finder(finder_class)
+    with pytest.raises(ValueError, match='must be a 3D array'):
+        list(finder.find_stars_many(DATA))
+    with pytest.raises(ValueError, match='same shape'):
+        list(finder.find_stars_many([DATA, DATA[:100]]))
+
+
+@pytest.mark.parametrize('finder_class', FINDERS)
+def test_separation_method(finder_class):
+    finder1 = make_finder(finder_class, min_separation=10)
+    finder2 = make_finder(finder_class, min_separation=10,
+                          separation_method='nms')
+    tbl1 = finder1(DATA)
+    tbl2 = finder2(DATA)
+    assert len(tbl1) > 0
+    assert len(tbl2) > 0
+    xycoords = np.transpose((tbl2['xcentroid'], tbl2['ycentroid']))
+    dist = np.hypot(*(xycoords[:, np.newaxis] - xycoords).T)
+    # the centroids can shift from the peak pixels by ~1 pixel
+    assert np.all(dist[np.triu_indices(len(xycoords), 1)] > 8)
+
+    # the maxima within the min_separation footprint are never
+    # suppressed by a brighter star if the kernel footprint (used
+    # by the 'nms' method) is smaller than the min_separation
+    # footprint, which is not the case for the StarFinder PSF
+    if finder_class is not StarFinder:
+        assert len(tbl2) >= len(tbl1)
+        assert np.all(np.isin(tbl1['xcentroid'], tbl2['xcentroid']))
+
+    finder = make_finder(finder_class, min_separation=10,
+                         separation_method='invalid')
+    with pytest.raises(ValueError, match='separation_method must be'):
+        finder(DATA)
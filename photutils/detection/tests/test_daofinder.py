@@ -9,7 +9,7 @@ import os.path as op
 import numpy as np
 import pytest
 from astropy.table import Table
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 
 from photutils.datasets import make_100gaussians_image
 from photutils.detection.daofinder import DAOStarFinder
@@ -152,6 +152,22 @@ class TestDAOStarFinder:
         tbl = starfinder(DATA)
         assert len(tbl) == 37
 
+    @pytest.mark.parametrize('brightest', [1, 5, 20])
+    def test_daofind_brightest_candidates(self, brightest):
+        """
+        Test that filtering only the brightest candidates gives the
+        same result as filtering all the sources.
+        """
+        starfinder = DAOStarFinder(threshold=5.0, fwhm=1.5, sharplo=0.5,
+                                   roundlo=-0.5, roundhi=0.5)
+        tbl0 = starfinder(DATA)
+        tbl0.sort('flux', reverse=True)
+        starfinder.brightest = brightest
+        tbl = starfinder(DATA)
+        assert_equal(tbl['id'], np.arange(brightest) + 1)
+        for column in ('xcentroid', 'ycentroid', 'sharpness', 'flux'):
+            assert_allclose(tbl[column], tbl0[column][:brightest])
+
     def test_daofind_mask(self):
         """Test DAOStarFinder with a mask."""
         starfinder = DAOStarFinder(threshold=10, fwhm=1.5)
@@ -183,6 +199,20 @@ class TestDAOStarFinder:
         with pytest.raises(ValueError):
             DAOStarFinder(threshold=10, fwhm=1.5, xycoords=xycoords)
 
+    def test_dtype(self):
+        finder1 = DAOStarFinder(threshold=10, fwhm=1.5)
+        finder2 = DAOStarFinder(threshold=10, fwhm=1.5, dtype=np.float32)
+        cat = finder2._get_raw_catalog(DATA)
+        assert cat.convolved_data.dtype == np.float32
+        tbl1 = finder1(DATA)
+        tbl2 = finder2(DATA)
+        assert len(tbl1) == len(tbl2)
+        for col in ('xcentroid', 'ycentroid', 'flux'):
+            assert_allclose(tbl1[col], tbl2[col], rtol=1e-5)
+
+        with pytest.raises(ValueError):
+            DAOStarFinder(threshold=10, fwhm=1.5, dtype=int)
+
     def test_min_separation(self):
         threshold = 5
         fwhm = 1.0
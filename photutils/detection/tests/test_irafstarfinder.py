@@ -10,7 +10,7 @@ from contextlib import nullcontext
 import numpy as np
 import pytest
 from astropy.table import Table
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 
 from photutils.datasets import make_100gaussians_image
 from photutils.detection.irafstarfinder import IRAFStarFinder
@@ -119,6 +119,22 @@ class TestIRAFStarFinder:
         tbl = starfinder(DATA)
         assert len(tbl) == brightest
 
+    @pytest.mark.parametrize('brightest', [1, 5, 20])
+    def test_irafstarfind_brightest_candidates(self, brightest):
+        """
+        Test that filtering only the brightest candidates gives the
+        same result as filtering all the sources.
+        """
+        starfinder = IRAFStarFinder(threshold=5.0, fwhm=2, sharplo=0.5,
+                                    roundhi=0.1)
+        tbl0 = starfinder(DATA)
+        tbl0.sort('flux', reverse=True)
+        starfinder.brightest = brightest
+        tbl = starfinder(DATA)
+        assert_equal(tbl['id'], np.arange(brightest) + 1)
+        for column in ('xcentroid', 'ycentroid', 'sharpness', 'flux'):
+            assert_allclose(tbl[column], tbl0[column][:brightest])
+
     def test_irafstarfind_mask(self):
         """Test IRAFStarFinder with a mask."""
 
@@ -151,6 +167,17 @@ class TestIRAFStarFinder:
         with pytest.raises(ValueError):
             IRAFStarFinder(threshold=10, fwhm=1.5, xycoords=xycoords)
 
+    def test_dtype(self):
+        finder1 = IRAFStarFinder(threshold=10, fwhm=1.5)
+        finder2 = IRAFStarFinder(threshold=10, fwhm=1.5, dtype=np.float32)
+        cat = finder2._get_raw_catalog(DATA)
+        assert cat.convolved_data.dtype == np.float32
+        tbl1 = finder1(DATA)
+        tbl2 = finder2(DATA)
+        assert len(tbl1) == len(tbl2)
+        for col in ('xcentroid', 'ycentroid', 'flux'):
+            assert_allclose(tbl1[col], tbl2[col], rtol=1e-5)
+
     def test_min_separation(self):
         threshold = 5
         fwhm = 1.0
@@ -10,7 +10,8 @@ from numpy.testing import assert_array_equal
 
 from photutils.centroids import centroid_com
 from photutils.datasets import make_4gaussians_image, make_gwcs, make_wcs
-from photutils.detection.peakfinder import find_peaks
+from photutils.detection.peakfinder import (_footprint_rectangles,
+                                            _local_peaks, find_peaks)
 from photutils.utils._optional_deps import HAS_GWCS, HAS_SCIPY
 from photutils.utils.exceptions import NoDetectionsWarning
 
@@ -144,3 +145,97 @@ class TestFindPeaks:
         data = np.copy(PEAKDATA)
         data[1, 1] = np.nan
         find_peaks(data, 0.0)
+
+    @pytest.mark.parametrize('method', ['ndimage', 'rectangles', 'sparse',
+                                        'auto'])
+    @pytest.mark.parametrize('threshold', [5.0, 50.0])
+    def test_method(self, method, threshold):
+        yy, xx = np.mgrid[-5:6, -5:6]
+        footprints = (np.ones((5, 7)), (xx**2 + yy**2) <= 25,
+                      (np.abs(xx) + np.abs(yy)) <= 3)
+        mask = np.zeros(IMAGE.shape, dtype=bool)
+        mask[50:60, 30:40] = True
+        for footprint in footprints:
+            tbl1 = find_peaks(IMAGE, threshold, footprint=footprint,
+                              mask=mask, border_width=2, method='ndimage')
+            tbl2 = find_peaks(IMAGE, threshold, footprint=footprint,
+                              mask=mask, border_width=2, method=method)
+            for col in tbl1.colnames:
+                assert_array_equal(tbl1[col], tbl2[col])
+
+        tbl1 = find_peaks(IMAGE, threshold, box_size=(3, 4),
+                          method='ndimage')
+        tbl2 = find_peaks(IMAGE, threshold, box_size=(3, 4), method=method)
+        for col in tbl1.colnames:
+            assert_array_equal(tbl1[col], tbl2[col])
+
+    def test_min_separation(self):
+        tbl0 = find_peaks(IMAGE, 5.0, box_size=3)
+        tbl1 = find_peaks(IMAGE, 5.0, box_size=3, min_separation=10)
+        assert 0 < len(tbl1) < len(tbl0)
+
+        xycoords = np.transpose((tbl1['x_peak'], tbl1['y_peak']))
+        dist = np.hypot(*(xycoords[:, np.newaxis] - xycoords).T)
+        assert np.all(dist[np.triu_indices(len(xycoords), 1)] > 10)
+
+        # the removed peaks are close to a brighter kept peak
+        kept = set(zip(tbl1['x_peak'], tbl1['y_peak']))
+        for row in tbl0:
+            if (row['x_peak'], row['y_peak']) in kept:
+                continue
+            dist = np.hypot(xycoords[:, 0] - row['x_peak'],
+                            xycoords[:, 1] - row['y_peak'])
+            assert np.any((dist <= 10)
+                          & (tbl1['peak_value'] >= row['peak_value']))
+
+        tbl2 = find_peaks(IMAGE, 5.0, box_size=3, min_separation=10,
+                          npeaks=3)
+        assert len(tbl2) == 3
+        assert_array_equal(tbl2['peak_value'],
+                           np.sort(tbl1['peak_value'])[::-1][:3])
+
+    def test_method_invalid(self):
+        with pytest.raises(ValueError, match='method must be one of'):
+            find_peaks(IMAGE, 5.0, method='invalid')
+
+
+def test_footprint_rectangles():
+    footprint = np.array([[0, 1, 0],
+                          [1, 1, 1],
+                          [0, 1, 0]], dtype=bool)
+    rectangles = _footprint_rectangles(footprint)
+    assert rectangles == [(1, 1, 0, 3), (0, 3, 1, 1)]
+
+    # a run whose rows are not contiguous
+    footprint = np.array([[1, 1],
+                          [0, 1],
+                          [1, 1]], dtype=bool)
+    rectangles = _footprint_rectangles(footprint)
+    assert rectangles == [(0, 1, 0, 2), (2, 1, 0, 2), (0, 3, 1, 1)]
+
+    reconstructed = np.zeros(footprint.shape, dtype=bool)
+    for row, height, column, width in rectangles:
+        reconstructed[row:row + height, column:column + width] = True
+    assert_array_equal(reconstructed, footprint)
+
+
+@pytest.mark.skipif(not HAS_SCIPY, reason='scipy is required')
+@pytest.mark.parametrize('method', ['rectangles', 'sparse'])
+def test_local_peaks(method, monkeypatch):
+    from scipy.ndimage import maximum_filter
+
+    # process the images in strips of a few rows
+    monkeypatch.setattr('photutils.detection.peakfinder._STRIP_SIZE', 50)
+
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        shape = tuple(rng.integers(1, 30, 2))
+        data = np.round(rng.random(shape) * 4) - 1  # with ties
+        footprint = rng.random(tuple(rng.integers(1, 8, 2))) > 0.4
+        footprint[0, 0] = True
+        candidates = rng.random(shape) > 0.3
+        data_max = maximum_filter(data, footprint=footprint, mode='constant',
+                                  cval=0.0)
+        expected = np.nonzero(candidates & (data == data_max))
+        result = _local_peaks(data, footprint, candidates, method=method)
+        assert_array_equal(result, expected)
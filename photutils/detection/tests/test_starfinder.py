@@ -6,6 +6,7 @@ Tests for StarFinder.
 import numpy as np
 import pytest
 from astropy.modeling.models import Gaussian2D
+from numpy.testing import assert_allclose
 
 from photutils.datasets import make_100gaussians_image
 from photutils.detection.starfinder import StarFinder
@@ -41,6 +42,14 @@ class TestStarFinder:
             tbl = finder(DATA)
             assert tbl is None
 
+    def test_dtype(self):
+        finder1 = StarFinder(10, PSF)
+        finder2 = StarFinder(10, PSF, dtype=np.float32)
+        tbl1 = finder1(DATA)
+        tbl2 = finder2(DATA)
+        assert len(tbl1) == len(tbl2)
+        assert_allclose(tbl1['xcentroid'], tbl2['xcentroid'])
+
     def test_min_separation(self):
         finder1 = StarFinder(10, PSF, min_separation=0)
         finder2 = StarFinder(10, PSF, min_separation=50)
@@ -80,3 +89,8 @@ class TestStarFinder:
         tbl2 = starfinder(DATA, mask=mask)
         assert len(tbl1) > len(tbl2)
         assert min(tbl2['ycentroid']) > 100
+
+    def test_convolution_method_not_separable(self):
+        finder = StarFinder(10, PSF, convolution_method='separable')
+        with pytest.raises(ValueError, match='kernel is not separable'):
+            finder(DATA)
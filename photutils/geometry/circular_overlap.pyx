@@ -8,10 +8,11 @@ overlap of a rectangle and a circle (written by Thomas Robitaille).
 import numpy as np
 cimport numpy as np
 
-__all__ = ['circular_overlap_grid']
+__all__ = ['circular_overlap_grid', 'circular_overlap_grid_batch',
+           'circular_overlap_sum_batch', 'circular_overlap_multi_sum_batch']
 
 
-cdef extern from "math.h":
+cdef extern from "math.h" nogil:
 
     double asin(double x)
     double sin(double x)
@@ -58,63 +59,467 @@ def circular_overlap_grid(double xmin, double xmax, double ymin, double ymax,
         2-d array of shape (ny, nx) giving the fraction of the overlap.
     """
 
-    cdef unsigned int i, j
-    cdef double x, y, dx, dy, d, pixel_radius
-    cdef double bxmin, bxmax, bymin, bymax
-    cdef double pxmin, pxcen, pxmax, pymin, pycen, pymax
-
     # Define output array
     cdef np.ndarray[DTYPE_t, ndim=2] frac = np.zeros([ny, nx], dtype=DTYPE)
 
+    with nogil:
+        if nx > 0 and ny > 0:
+            circular_overlap_fill(&frac[0, 0], xmin, xmax, ymin, ymax, nx, ny,
+                                  r, use_exact, subpixels)
+
+    return frac
+
+
+def circular_overlap_grid_batch(edges, shapes, double r, int use_exact,
+                                int subpixels):
+    """
+    circular_overlap_grid_batch(edges, shapes, r, use_exact, subpixels)
+
+    Area of overlap between a circle and many pixel grids, computed in
+    a single call.
+
+    The circle is centered on the origin of each grid. The overlap
+    grids are written contiguously (in row-major order) into a single
+    packed 1D output array.
+
+    Parameters
+    ----------
+    edges : (N, 4) array_like (float)
+        The ``(xmin, xmax, ymin, ymax)`` extent of each grid in the x
+        and y direction.
+    shapes : (N, 2) array_like (int)
+        The ``(ny, nx)`` dimensions of each grid.
+    r : float
+        The radius of the circle.
+    use_exact : 0 or 1
+        If ``1`` calculates exact overlap, if ``0`` uses ``subpixel`` number
+        of subpixels to calculate the overlap.
+    subpixels : int
+        Each pixel resampled by this factor in each dimension, thus each
+        pixel is divided into ``subpixels ** 2`` subpixels.
+
+    Returns
+    -------
+    frac : 1D `~numpy.ndarray` (float)
+        The packed fractions of the overlap. The 2D grid for the
+        ``i``-th position is ``frac[offsets[i]:offsets[i +
+        1]].reshape(shapes[i])``.
+    offsets : 1D `~numpy.ndarray` (int)
+        The ``N + 1`` offsets of each grid in the packed ``frac`` array.
+    """
+
+    cdef double[:, ::1] edges_ = np.ascontiguousarray(edges, dtype=DTYPE)
+    cdef np.intp_t[:, ::1] shapes_ = np.ascontiguousarray(shapes,
+                                                          dtype=np.intp)
+    cdef np.intp_t[::1] offsets_
+    cdef double[::1] frac_
+    cdef Py_ssize_t i, ny, nx
+
+    offsets = np.zeros(shapes_.shape[0] + 1, dtype=np.intp)
+    offsets[1:] = np.cumsum(np.prod(shapes, axis=1, dtype=np.intp))
+    frac = np.zeros(offsets[-1], dtype=DTYPE)
+
+    offsets_ = offsets
+    frac_ = frac
+    with nogil:
+        for i in range(shapes_.shape[0]):
+            ny = shapes_[i, 0]
+            nx = shapes_[i, 1]
+            if nx > 0 and ny > 0:
+                circular_overlap_fill(&frac_[offsets_[i]], edges_[i, 0],
+                                      edges_[i, 1], edges_[i, 2], edges_[i, 3],
+                                      nx, ny, r, use_exact, subpixels)
+
+    return frac, offsets
+
+
+def circular_overlap_sum_batch(data, error, mask, edges, bbox, double r,
+                               double r_in, int use_exact, int subpixels):
+    """
+    circular_overlap_sum_batch(data, error, mask, edges, bbox, r, r_in,
+                               use_exact, subpixels)
+
+    Weighted sums of a 2D array within many circular apertures (or
+    annuli), computed in a single call.
+
+    The overlap weight of each pixel is computed on the fly and is
+    immediately applied to the input arrays, which are read in place.
+    No intermediate weight, cutout, or product arrays are created. The
+    weights are identical to those of `circular_overlap_grid_batch`.
+
+    Parameters
+    ----------
+    data : 2D `~numpy.ndarray` (float)
+        The 2D array to sum.
+    error : 2D `~numpy.ndarray` (float) or `None`
+        The 1-sigma errors of ``data``. If not `None`, the weighted
+        sums of ``error**2`` are also computed.
+    mask : 2D `~numpy.ndarray` (bool) or `None`
+        A boolean mask where a `True` value indicates the corresponding
+        element of ``data`` is excluded from the sums.
+    edges : (N, 4) array_like (float)
+        The ``(xmin, xmax, ymin, ymax)`` extent of each aperture grid
+        relative to the aperture center.
+    bbox : (N, 4) array_like (int)
+        The ``(ixmin, ixmax, iymin, iymax)`` pixel indices of each
+        aperture grid in ``data``.
+    r : float
+        The radius of the circle.
+    r_in : float
+        The inner radius of a circular annulus. If ``r_in <= 0``, then
+        no inner circle is subtracted.
+    use_exact : 0 or 1
+        If ``1`` calculates exact overlap, if ``0`` uses ``subpixel`` number
+        of subpixels to calculate the overlap.
+    subpixels : int
+        Each pixel resampled by this factor in each dimension, thus each
+        pixel is divided into ``subpixels ** 2`` subpixels.
+
+    Returns
+    -------
+    sums : 1D `~numpy.ndarray` (float)
+        The weighted sums of ``data`` within each aperture. The sum is
+        NaN for apertures that do not overlap ``data``.
+    sum_errs : 1D `~numpy.ndarray` (float)
+        The square root of the weighted sums of ``error**2`` within each
+        aperture. All values are NaN if ``error`` is `None`.
+    """
+
+    cdef const double[:, :] data_
+    cdef const double[:, :] error_
+    cdef const unsigned char[:, :] mask_
+    cdef double[:, ::1] edges_ = np.ascontiguousarray(edges, dtype=DTYPE)
+    cdef np.intp_t[:, ::1] bbox_ = np.ascontiguousarray(bbox, dtype=np.intp)
+    cdef double[::1] sums_, sum_errs_
+    cdef Py_ssize_t k, i, j, ny, nx
+    cdef Py_ssize_t ixmin, iymin, x0, x1, y0, y1
+    cdef int has_error, has_mask
+    cdef double dx, dy, weight, err, total, variance
+
+    data_ = data
+    has_error = error is not None
+    has_mask = mask is not None
+    if has_error:
+        error_ = error
+    if has_mask:
+        mask_ = mask.view(np.uint8)
+
+    sums = np.full(bbox_.shape[0], np.nan)
+    sum_errs = np.full(bbox_.shape[0], np.nan)
+    sums_ = sums
+    sum_errs_ = sum_errs
+
+    with nogil:
+        for k in range(bbox_.shape[0]):
+            ixmin = bbox_[k, 0]
+            iymin = bbox_[k, 2]
+            nx = bbox_[k, 1] - ixmin
+            ny = bbox_[k, 3] - iymin
+
+            # overlap of the aperture grid with the data array
+            x0 = max(ixmin, 0)
+            x1 = min(bbox_[k, 1], data_.shape[1])
+            y0 = max(iymin, 0)
+            y1 = min(bbox_[k, 3], data_.shape[0])
+            if nx <= 0 or ny <= 0 or x0 >= x1 or y0 >= y1:
+                continue
+
+            dx = (edges_[k, 1] - edges_[k, 0]) / nx
+            dy = (edges_[k, 3] - edges_[k, 2]) / ny
+
+            total = 0.0
+            variance = 0.0
+            for j in range(y0, y1):
+                for i in range(x0, x1):
+                    if has_mask and mask_[j, i]:
+                        continue
+
+                    weight = circular_overlap_pixel(edges_[k, 0], edges_[k, 2],
+                                                    dx, dy, i - ixmin, j - iymin,
+                                                    r, use_exact, subpixels)
+                    if r_in > 0:
+                        weight -= circular_overlap_pixel(
+                            edges_[k, 0], edges_[k, 2], dx, dy, i - ixmin,
+                            j - iymin, r_in, use_exact, subpixels)
+
+                    if weight > 0:
+                        total += data_[j, i] * weight
+                        if has_error:
+                            err = error_[j, i]
+                            variance += err * err * weight
+
+            sums_[k] = total
+            if has_error:
+                sum_errs_[k] = sqrt(variance)
+
+    return sums, sum_errs
+
+
+def circular_overlap_multi_sum_batch(data, error, mask, edges, bbox, radii,
+                                     int use_exact, int subpixels):
+    """
+    circular_overlap_multi_sum_batch(data, error, mask, edges, bbox, radii,
+                                     use_exact, subpixels)
+
+    Weighted sums of a 2D array within many sets of concentric circular
+    apertures, computed in a single pass over the pixels.
+
+    Each pixel of the largest aperture is visited once. A pixel that
+    lies fully within the circle of radius ``radii[k]`` also lies fully
+    within all larger circles, so its value is added once to a running
+    increment at index ``k`` that is cumulatively summed at the end.
+    Only the (few) radii whose circle crosses the pixel require an
+    overlap calculation. The partial-pixel weights are identical to
+    those of `circular_overlap_grid` for the grid of each aperture.
+
+    Parameters
+    ----------
+    data : 2D `~numpy.ndarray` (float)
+        The 2D array to sum.
+    error : 2D `~numpy.ndarray` (float) or `None`
+        The 1-sigma errors of ``data``. If not `None`, the weighted
+        sums of ``error**2`` are also computed.
+    mask : 2D `~numpy.ndarray` (bool) or `None`
+        A boolean mask where a `True` value indicates the corresponding
+        element of ``data`` is excluded from the sums.
+    edges : (N, R, 4) array_like (float)
+        The ``(xmin, xmax, ymin, ymax)`` extent of the grid of each
+        aperture at each position relative to the aperture center.
+    bbox : (N, R, 4) array_like (int)
+        The ``(ixmin, ixmax, iymin, iymax)`` pixel indices of the grid
+        of each aperture at each position in ``data``. The pixels
+        within the grid of the largest (i.e., last) aperture are
+        visited.
+    radii : 1D array_like (float)
+        The radii of the circles. ``radii`` must be sorted in
+        increasing order.
+    use_exact : 0 or 1
+        If ``1`` calculates exact overlap, if ``0`` uses ``subpixel`` number
+        of subpixels to calculate the overlap.
+    subpixels : int
+        Each pixel resampled by this factor in each dimension, thus each
+        pixel is divided into ``subpixels ** 2`` subpixels.
+
+    Returns
+    -------
+    sums : (N, R) `~numpy.ndarray` (float)
+        The weighted sums of ``data`` within each aperture and radius.
+        The sums are NaN for positions whose largest aperture does not
+        overlap ``data``.
+    sum_errs : (N, R) `~numpy.ndarray` (float)
+        The square root of the weighted sums of ``error**2``. All
+        values are NaN if ``error`` is `None`.
+    areas : (N, R) `~numpy.ndarray` (float)
+        The sums of the weights of the unmasked pixels (i.e., the areas
+        of overlap between the apertures and ``data``).
+    """
+
+    cdef const double[:, :] data_
+    cdef const double[:, :] error_
+    cdef const unsigned char[:, :] mask_
+    cdef double[:, :, ::1] edges_ = np.ascontiguousarray(edges, dtype=DTYPE)
+    cdef np.intp_t[:, :, ::1] bbox_ = np.ascontiguousarray(bbox,
+                                                           dtype=np.intp)
+    cdef double[::1] radii_ = np.ascontiguousarray(radii, dtype=DTYPE)
+    cdef double[:, ::1] sums_, sum_errs_, areas_
+    cdef double[:, ::1] work_, deltas_
+    cdef Py_ssize_t n, m, k, i, j, ny, nx, nradii, kfull, lo, hi
+    cdef Py_ssize_t ixmin, iymin, x0, x1, y0, y1
+    cdef int has_error, has_mask
+    cdef double dx, dy, d, pixel_radius, pxcen, pycen
+    cdef double weight, value, err2
+
+    data_ = data
+    has_error = error is not None
+    has_mask = mask is not None
+    if has_error:
+        error_ = error
+    if has_mask:
+        mask_ = mask.view(np.uint8)
+
+    nradii = radii_.shape[0]
+    sums = np.full((bbox_.shape[0], nradii), np.nan)
+    sum_errs = np.full((bbox_.shape[0], nradii), np.nan)
+    areas = np.full((bbox_.shape[0], nradii), np.nan)
+    sums_ = sums
+    sum_errs_ = sum_errs
+    areas_ = areas
+
+    # work rows: full-pixel increments and partial-pixel sums of the
+    # data, error**2, and weights
+    work_ = np.zeros((6, nradii + 1), dtype=DTYPE)
+    deltas_ = np.zeros((2, nradii), dtype=DTYPE)
+
+    with nogil:
+        for n in range(bbox_.shape[0]):
+            if nradii == 0:
+                continue
+
+            # pixel sizes of the aperture grids
+            for k in range(nradii):
+                nx = bbox_[n, k, 1] - bbox_[n, k, 0]
+                ny = bbox_[n, k, 3] - bbox_[n, k, 2]
+                if nx > 0 and ny > 0:
+                    deltas_[0, k] = (edges_[n, k, 1] - edges_[n, k, 0]) / nx
+                    deltas_[1, k] = (edges_[n, k, 3] - edges_[n, k, 2]) / ny
+
+            # the pixels of the largest aperture grid are visited
+            m = nradii - 1
+            ixmin = bbox_[n, m, 0]
+            iymin = bbox_[n, m, 2]
+            nx = bbox_[n, m, 1] - ixmin
+            ny = bbox_[n, m, 3] - iymin
+
+            # overlap of the aperture grid with the data array
+            x0 = max(ixmin, 0)
+            x1 = min(bbox_[n, m, 1], data_.shape[1])
+            y0 = max(iymin, 0)
+            y1 = min(bbox_[n, m, 3], data_.shape[0])
+            if nx <= 0 or ny <= 0 or x0 >= x1 or y0 >= y1:
+                continue
+
+            dx = deltas_[0, m]
+            dy = deltas_[1, m]
+            pixel_radius = 0.5 * sqrt(dx * dx + dy * dy)
+
+            work_[:, :] = 0.0
+            for j in range(y0, y1):
+                pycen = edges_[n, m, 2] + (j - iymin) * dy + dy * 0.5
+                for i in range(x0, x1):
+                    if has_mask and mask_[j, i]:
+                        continue
+
+                    pxcen = edges_[n, m, 0] + (i - ixmin) * dx + dx * 0.5
+                    d = sqrt(pxcen * pxcen + pycen * pycen)
+
+                    # binary search for the smallest circle that fully
+                    # contains the pixel (same test as
+                    # circular_overlap_pixel)
+                    lo = 0
+                    hi = nradii
+                    while lo < hi:
+                        kfull = (lo + hi) // 2
+                        if d < radii_[kfull] - pixel_radius:
+                            hi = kfull
+                        else:
+                            lo = kfull + 1
+                    kfull = lo
+
+                    value = data_[j, i]
+                    err2 = 0.0
+                    if has_error:
+                        err2 = error_[j, i] * error_[j, i]
+
+                    work_[0, kfull] += value
+                    work_[1, kfull] += err2
+                    work_[2, kfull] += 1.0
+
+                    # smaller circles that partially overlap the pixel
+                    for k in range(kfull - 1, -1, -1):
+                        if d >= radii_[k] + pixel_radius:
+                            break
+
+                        # use the grid of each aperture so that the
+                        # weights are identical to circular_overlap_grid
+                        if (i < bbox_[n, k, 0] or i >= bbox_[n, k, 1]
+                                or j < bbox_[n, k, 2]
+                                or j >= bbox_[n, k, 3]):
+                            continue
+                        weight = circular_overlap_pixel(
+                            edges_[n, k, 0], edges_[n, k, 2], deltas_[0, k],
+                            deltas_[1, k], i - bbox_[n, k, 0],
+                            j - bbox_[n, k, 2], radii_[k], use_exact,
+                            subpixels)
+                        if weight > 0:
+                            work_[3, k] += value * weight
+                            work_[4, k] += err2 * weight
+                            work_[5, k] += weight
+
+            for k in range(nradii):
+                if k > 0:
+                    work_[0, k] += work_[0, k - 1]
+                    work_[1, k] += work_[1, k - 1]
+                    work_[2, k] += work_[2, k - 1]
+                sums_[n, k] = work_[0, k] + work_[3, k]
+                areas_[n, k] = work_[2, k] + work_[5, k]
+                if has_error:
+                    sum_errs_[n, k] = sqrt(work_[1, k] + work_[4, k])
+
+    return sums, sum_errs, areas
+
+
+cdef void circular_overlap_fill(double *frac, double xmin, double xmax,
+                                double ymin, double ymax, int nx, int ny,
+                                double r, int use_exact,
+                                int subpixels) noexcept nogil:
+    """
+    Fill the (ny, nx) row-major ``frac`` buffer with the area of overlap
+    between a circle centered on the origin and a pixel grid.
+    """
+
+    cdef int i, j
+    cdef double dx, dy
+
     # Find the width of each element in x and y
     dx = (xmax - xmin) / nx
     dy = (ymax - ymin) / ny
 
-    # Find the radius of a single pixel
-    pixel_radius = 0.5 * sqrt(dx * dx + dy * dy)
+    for i in range(nx):
+        for j in range(ny):
+            frac[j * nx + i] = circular_overlap_pixel(xmin, ymin, dx, dy, i, j,
+                                                      r, use_exact, subpixels)
 
-    # Define bounding box
-    bxmin = -r - 0.5 * dx
-    bxmax = +r + 0.5 * dx
-    bymin = -r - 0.5 * dy
-    bymax = +r + 0.5 * dy
 
-    for i in range(nx):
-        pxmin = xmin + i * dx  # lower end of pixel
-        pxcen = pxmin + dx * 0.5
-        pxmax = pxmin + dx  # upper end of pixel
-        if pxmax > bxmin and pxmin < bxmax:
-            for j in range(ny):
-                pymin = ymin + j * dy
-                pycen = pymin + dy * 0.5
-                pymax = pymin + dy
-                if pymax > bymin and pymin < bymax:
-
-                    # Distance from circle center to pixel center.
-                    d = sqrt(pxcen * pxcen + pycen * pycen)
+cdef double circular_overlap_pixel(double xmin, double ymin, double dx,
+                                   double dy, int i, int j, double r,
+                                   int use_exact,
+                                   int subpixels) noexcept nogil:
+    """
+    Return the fraction of overlap between a circle centered on the
+    origin and the ``(j, i)`` pixel of a grid with lower edges ``(xmin,
+    ymin)`` and pixel size ``(dx, dy)``.
+    """
 
-                    # If pixel center is "well within" circle, count full
-                    # pixel.
-                    if d < r - pixel_radius:
-                        frac[j, i] = 1.0
+    cdef double d, pixel_radius
+    cdef double pxmin, pxcen, pxmax, pymin, pycen, pymax
 
-                    # If pixel center is "close" to circle border, find
-                    # overlap.
-                    elif d < r + pixel_radius:
+    pxmin = xmin + i * dx  # lower end of pixel
+    pxmax = pxmin + dx  # upper end of pixel
 
-                        # Either do exact calculation or use subpixel
-                        # sampling:
-                        if use_exact:
-                            frac[j, i] = circular_overlap_single_exact(
-                                pxmin, pymin, pxmax, pymax, r) / (dx * dy)
-                        else:
-                            frac[j, i] = circular_overlap_single_subpixel(
-                                pxmin, pymin, pxmax, pymax, r, subpixels)
+    # Pixels outside of the circle bounding box do not overlap
+    if pxmax <= -r - 0.5 * dx or pxmin >= r + 0.5 * dx:
+        return 0.0
 
-                    # Otherwise, it is fully outside circle.
-                    # No action needed.
+    pymin = ymin + j * dy
+    pymax = pymin + dy
+    if pymax <= -r - 0.5 * dy or pymin >= r + 0.5 * dy:
+        return 0.0
 
-    return frac
+    pxcen = pxmin + dx * 0.5
+    pycen = pymin + dy * 0.5
+
+    # Find the radius of a single pixel
+    pixel_radius = 0.5 * sqrt(dx * dx + dy * dy)
+
+    # Distance from circle center to pixel center.
+    d = sqrt(pxcen * pxcen + pycen * pycen)
+
+    # If pixel center is "well within" circle, count full pixel.
+    if d < r - pixel_radius:
+        return 1.0
+
+    # If pixel center is "close" to circle border, find overlap.
+    if d < r + pixel_radius:
+        # Either do exact calculation or use subpixel sampling:
+        if use_exact:
+            return circular_overlap_single_exact(pxmin, pymin, pxmax, pymax,
+                                                 r) / (dx * dy)
+        else:
+            return circular_overlap_single_subpixel(pxmin, pymin, pxmax,
+                                                    pymax, r, subpixels)
+
+    # Otherwise, it is fully outside circle.
+    return 0.0
 
 
 # NOTE: The following two functions use cdef because they are not
@@ -125,7 +530,8 @@ def circular_overlap_grid(double xmin, double xmax, double ymin, double ymax,
 
 cdef double circular_overlap_single_subpixel(double x0, double y0,
                                              double x1, double y1,
-                                             double r, int subpixels):
+                                             double r,
+                                             int subpixels) noexcept nogil:
     """Return the fraction of overlap between a circle and a single pixel
     with given extent, using a sub-pixel sampling method."""
 
@@ -151,7 +557,7 @@ cdef double circular_overlap_single_subpixel(double x0, double y0,
 
 cdef double circular_overlap_single_exact(double xmin, double ymin,
                                           double xmax, double ymax,
-                                          double r):
+                                          double r) noexcept nogil:
     """
     Area of overlap of a rectangle and a circle
     """
@@ -186,7 +592,7 @@ cdef double circular_overlap_single_exact(double xmin, double ymin,
 
 
 cdef double circular_overlap_core(double xmin, double ymin, double xmax, double ymax,
-                          double r):
+                          double r) noexcept nogil:
     """
     Assumes that the center of the circle is <= xmin,
     ymin (can always modify input to conform to this).
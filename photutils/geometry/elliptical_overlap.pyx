@@ -12,10 +12,12 @@ import numpy as np
 
 cimport numpy as np
 
-__all__ = ['elliptical_overlap_grid']
+__all__ = ['elliptical_overlap_grid', 'elliptical_overlap_grid_batch',
+           'elliptical_overlap_sum_batch',
+           'elliptical_overlap_multi_sum_batch']
 
 
-cdef extern from "math.h":
+cdef extern from "math.h" nogil:
 
     double asin(double x)
     double sin(double x)
@@ -71,20 +73,478 @@ def elliptical_overlap_grid(double xmin, double xmax, double ymin, double ymax,
         2-d array giving the fraction of the overlap.
     """
 
-    cdef unsigned int i, j
-    cdef double x, y, dx, dy
-    cdef double bxmin, bxmax, bymin, bymax
-    cdef double pxmin, pxmax, pymin, pymax
-    cdef double norm
-
     # Define output array
     cdef np.ndarray[DTYPE_t, ndim=2] frac = np.zeros([ny, nx], dtype=DTYPE)
 
+    with nogil:
+        if nx > 0 and ny > 0:
+            elliptical_overlap_fill(&frac[0, 0], xmin, xmax, ymin, ymax, nx, ny,
+                                    rx, ry, theta, use_exact, subpixels)
+
+    return frac
+
+
+def elliptical_overlap_grid_batch(edges, shapes, double rx, double ry,
+                                  double theta, int use_exact, int subpixels):
+    """
+    elliptical_overlap_grid_batch(edges, shapes, rx, ry, theta, use_exact,
+                                  subpixels)
+
+    Area of overlap between an ellipse and many pixel grids, computed in
+    a single call.
+
+    The ellipse is centered on the origin of each grid. The overlap
+    grids are written contiguously (in row-major order) into a single
+    packed 1D output array.
+
+    Parameters
+    ----------
+    edges : (N, 4) array_like (float)
+        The ``(xmin, xmax, ymin, ymax)`` extent of each grid in the x
+        and y direction.
+    shapes : (N, 2) array_like (int)
+        The ``(ny, nx)`` dimensions of each grid.
+    rx : float
+        The semimajor axis of the ellipse.
+    ry : float
+        The semiminor axis of the ellipse.
+    theta : float
+        The position angle of the semimajor axis in radians (counterclockwise).
+    use_exact : 0 or 1
+        If set to 1, calculates the exact overlap, while if set to 0, uses a
+        subpixel sampling method with ``subpixel`` subpixels in each direction.
+    subpixels : int
+        If ``use_exact`` is 0, each pixel is resampled by this factor in each
+        dimension. Thus, each pixel is divided into ``subpixels ** 2``
+        subpixels.
+
+    Returns
+    -------
+    frac : 1D `~numpy.ndarray` (float)
+        The packed fractions of the overlap. The 2D grid for the
+        ``i``-th position is ``frac[offsets[i]:offsets[i +
+        1]].reshape(shapes[i])``.
+    offsets : 1D `~numpy.ndarray` (int)
+        The ``N + 1`` offsets of each grid in the packed ``frac`` array.
+    """
+
+    cdef double[:, ::1] edges_ = np.ascontiguousarray(edges, dtype=DTYPE)
+    cdef np.intp_t[:, ::1] shapes_ = np.ascontiguousarray(shapes,
+                                                          dtype=np.intp)
+    cdef np.intp_t[::1] offsets_
+    cdef double[::1] frac_
+    cdef Py_ssize_t i, ny, nx
+
+    offsets = np.zeros(shapes_.shape[0] + 1, dtype=np.intp)
+    offsets[1:] = np.cumsum(np.prod(shapes, axis=1, dtype=np.intp))
+    frac = np.zeros(offsets[-1], dtype=DTYPE)
+
+    offsets_ = offsets
+    frac_ = frac
+    with nogil:
+        for i in range(shapes_.shape[0]):
+            ny = shapes_[i, 0]
+            nx = shapes_[i, 1]
+            if nx > 0 and ny > 0:
+                elliptical_overlap_fill(&frac_[offsets_[i]], edges_[i, 0],
+                                        edges_[i, 1], edges_[i, 2], edges_[i, 3],
+                                        nx, ny, rx, ry, theta, use_exact,
+                                        subpixels)
+
+    return frac, offsets
+
+
+def elliptical_overlap_sum_batch(data, error, mask, edges, bbox, double rx,
+                                 double ry, double theta, double rx_in,
+                                 double ry_in, int use_exact, int subpixels):
+    """
+    elliptical_overlap_sum_batch(data, error, mask, edges, bbox, rx, ry,
+                                 theta, rx_in, ry_in, use_exact, subpixels)
+
+    Weighted sums of a 2D array within many elliptical apertures
+    (or annuli), computed in a single call.
+
+    The overlap weight of each pixel is computed on the fly and is
+    immediately applied to the input arrays, which are read in place.
+    No intermediate weight, cutout, or product arrays are created. The
+    weights are identical to those of `elliptical_overlap_grid_batch`.
+
+    Parameters
+    ----------
+    data : 2D `~numpy.ndarray` (float)
+        The 2D array to sum.
+    error : 2D `~numpy.ndarray` (float) or `None`
+        The 1-sigma errors of ``data``. If not `None`, the weighted
+        sums of ``error**2`` are also computed.
+    mask : 2D `~numpy.ndarray` (bool) or `None`
+        A boolean mask where a `True` value indicates the corresponding
+        element of ``data`` is excluded from the sums.
+    edges : (N, 4) array_like (float)
+        The ``(xmin, xmax, ymin, ymax)`` extent of each aperture grid
+        relative to the aperture center.
+    bbox : (N, 4) array_like (int)
+        The ``(ixmin, ixmax, iymin, iymax)`` pixel indices of each
+        aperture grid in ``data``.
+    rx : float
+        The semimajor axis of the ellipse.
+    ry : float
+        The semiminor axis of the ellipse.
+    theta : float
+        The position angle of the semimajor axis in radians (counterclockwise).
+    rx_in, ry_in : float
+        The inner semimajor and semiminor axes of an elliptical annulus.
+        If ``rx_in <= 0``, then no inner ellipse is subtracted.
+    use_exact : 0 or 1
+        If set to 1, calculates the exact overlap, while if set to 0, uses a
+        subpixel sampling method with ``subpixel`` subpixels in each direction.
+    subpixels : int
+        If ``use_exact`` is 0, each pixel is resampled by this factor in each
+        dimension. Thus, each pixel is divided into ``subpixels ** 2``
+        subpixels.
+
+    Returns
+    -------
+    sums : 1D `~numpy.ndarray` (float)
+        The weighted sums of ``data`` within each aperture. The sum is
+        NaN for apertures that do not overlap ``data``.
+    sum_errs : 1D `~numpy.ndarray` (float)
+        The square root of the weighted sums of ``error**2`` within each
+        aperture. All values are NaN if ``error`` is `None`.
+    """
+
+    cdef const double[:, :] data_
+    cdef const double[:, :] error_
+    cdef const unsigned char[:, :] mask_
+    cdef double[:, ::1] edges_ = np.ascontiguousarray(edges, dtype=DTYPE)
+    cdef np.intp_t[:, ::1] bbox_ = np.ascontiguousarray(bbox, dtype=np.intp)
+    cdef double[::1] sums_, sum_errs_
+    cdef Py_ssize_t k, i, j, ny, nx
+    cdef Py_ssize_t ixmin, iymin, x0, x1, y0, y1
+    cdef int has_error, has_mask
+    cdef double dx, dy, weight, err, total, variance
+
+    data_ = data
+    has_error = error is not None
+    has_mask = mask is not None
+    if has_error:
+        error_ = error
+    if has_mask:
+        mask_ = mask.view(np.uint8)
+
+    sums = np.full(bbox_.shape[0], np.nan)
+    sum_errs = np.full(bbox_.shape[0], np.nan)
+    sums_ = sums
+    sum_errs_ = sum_errs
+
+    with nogil:
+        for k in range(bbox_.shape[0]):
+            ixmin = bbox_[k, 0]
+            iymin = bbox_[k, 2]
+            nx = bbox_[k, 1] - ixmin
+            ny = bbox_[k, 3] - iymin
+
+            # overlap of the aperture grid with the data array
+            x0 = max(ixmin, 0)
+            x1 = min(bbox_[k, 1], data_.shape[1])
+            y0 = max(iymin, 0)
+            y1 = min(bbox_[k, 3], data_.shape[0])
+            if nx <= 0 or ny <= 0 or x0 >= x1 or y0 >= y1:
+                continue
+
+            dx = (edges_[k, 1] - edges_[k, 0]) / nx
+            dy = (edges_[k, 3] - edges_[k, 2]) / ny
+
+            total = 0.0
+            variance = 0.0
+            for j in range(y0, y1):
+                for i in range(x0, x1):
+                    if has_mask and mask_[j, i]:
+                        continue
+
+                    weight = elliptical_overlap_pixel(
+                        edges_[k, 0], edges_[k, 2], dx, dy, i - ixmin, j - iymin,
+                        rx, ry, theta, use_exact, subpixels)
+                    if rx_in > 0:
+                        weight -= elliptical_overlap_pixel(
+                            edges_[k, 0], edges_[k, 2], dx, dy, i - ixmin,
+                            j - iymin, rx_in, ry_in, theta, use_exact, subpixels)
+
+                    if weight > 0:
+                        total += data_[j, i] * weight
+                        if has_error:
+                            err = error_[j, i]
+                            variance += err * err * weight
+
+            sums_[k] = total
+            if has_error:
+                sum_errs_[k] = sqrt(variance)
+
+    return sums, sum_errs
+
+
+def elliptical_overlap_multi_sum_batch(data, error, mask, edges, bbox, rx,
+                                       ry, double theta, int use_exact,
+                                       int subpixels):
+    """
+    elliptical_overlap_multi_sum_batch(data, error, mask, edges, bbox, rx,
+                                       ry, theta, use_exact, subpixels)
+
+    Weighted sums of a 2D array within many sets of concentric (nested)
+    elliptical apertures, computed in a single pass over the pixels.
+
+    Each pixel of the largest aperture is visited once. A pixel whose
+    corners all lie within the ellipse ``(rx[k], ry[k])`` also lies
+    fully within all larger ellipses, so its value is added once to a
+    running increment at index ``k`` that is cumulatively summed at the
+    end. Only the (few) ellipses that cross the pixel require an
+    overlap calculation.
+
+    Parameters
+    ----------
+    data : 2D `~numpy.ndarray` (float)
+        The 2D array to sum.
+    error : 2D `~numpy.ndarray` (float) or `None`
+        The 1-sigma errors of ``data``. If not `None`, the weighted
+        sums of ``error**2`` are also computed.
+    mask : 2D `~numpy.ndarray` (bool) or `None`
+        A boolean mask where a `True` value indicates the corresponding
+        element of ``data`` is excluded from the sums.
+    edges : (N, R, 4) array_like (float)
+        The ``(xmin, xmax, ymin, ymax)`` extent of the grid of each
+        aperture at each position relative to the aperture center.
+    bbox : (N, R, 4) array_like (int)
+        The ``(ixmin, ixmax, iymin, iymax)`` pixel indices of the grid
+        of each aperture at each position in ``data``. The pixels
+        within the grid of the largest (i.e., last) aperture are
+        visited.
+    rx, ry : 1D array_like (float)
+        The semimajor and semiminor axes of the ellipses. Both ``rx``
+        and ``ry`` must be sorted in increasing order (i.e., the
+        ellipses must be nested).
+    theta : float
+        The position angle of the semimajor axis in radians (counterclockwise).
+    use_exact : 0 or 1
+        If set to 1, calculates the exact overlap, while if set to 0, uses a
+        subpixel sampling method with ``subpixel`` subpixels in each direction.
+    subpixels : int
+        If ``use_exact`` is 0, each pixel is resampled by this factor in each
+        dimension. Thus, each pixel is divided into ``subpixels ** 2``
+        subpixels.
+
+    Returns
+    -------
+    sums : (N, R) `~numpy.ndarray` (float)
+        The weighted sums of ``data`` within each aperture and ellipse.
+        The sums are NaN for positions whose largest aperture does not
+        overlap ``data``.
+    sum_errs : (N, R) `~numpy.ndarray` (float)
+        The square root of the weighted sums of ``error**2``. All
+        values are NaN if ``error`` is `None`.
+    areas : (N, R) `~numpy.ndarray` (float)
+        The sums of the weights of the unmasked pixels (i.e., the areas
+        of overlap between the apertures and ``data``).
+    """
+
+    cdef const double[:, :] data_
+    cdef const double[:, :] error_
+    cdef const unsigned char[:, :] mask_
+    cdef double[:, :, ::1] edges_ = np.ascontiguousarray(edges, dtype=DTYPE)
+    cdef np.intp_t[:, :, ::1] bbox_ = np.ascontiguousarray(bbox,
+                                                           dtype=np.intp)
+    cdef double[::1] rx_ = np.ascontiguousarray(rx, dtype=DTYPE)
+    cdef double[::1] ry_ = np.ascontiguousarray(ry, dtype=DTYPE)
+    cdef double[:, ::1] sums_, sum_errs_, areas_
+    cdef double[:, ::1] work_, deltas_
+    cdef Py_ssize_t n, m, k, i, j, ny, nx, nradii, kfull, lo, hi, c
+    cdef Py_ssize_t ixmin, iymin, x0, x1, y0, y1
+    cdef int has_error, has_mask, inside
+    cdef double dx, dy, pixel_radius, pxmin, pymin
+    cdef double cos_theta = cos(theta)
+    cdef double sin_theta = sin(theta)
+    cdef double xc, yc, rho, rmin
+    cdef double xtr[4]
+    cdef double ytr[4]
+    cdef double weight, value, err2
+
+    data_ = data
+    has_error = error is not None
+    has_mask = mask is not None
+    if has_error:
+        error_ = error
+    if has_mask:
+        mask_ = mask.view(np.uint8)
+
+    nradii = rx_.shape[0]
+    sums = np.full((bbox_.shape[0], nradii), np.nan)
+    sum_errs = np.full((bbox_.shape[0], nradii), np.nan)
+    areas = np.full((bbox_.shape[0], nradii), np.nan)
+    sums_ = sums
+    sum_errs_ = sum_errs
+    areas_ = areas
+
+    # work rows: full-pixel increments and partial-pixel sums of the
+    # data, error**2, and weights
+    work_ = np.zeros((6, nradii + 1), dtype=DTYPE)
+    deltas_ = np.zeros((2, nradii), dtype=DTYPE)
+
+    with nogil:
+        for n in range(bbox_.shape[0]):
+            if nradii == 0:
+                continue
+
+            # pixel sizes of the aperture grids
+            for k in range(nradii):
+                nx = bbox_[n, k, 1] - bbox_[n, k, 0]
+                ny = bbox_[n, k, 3] - bbox_[n, k, 2]
+                if nx > 0 and ny > 0:
+                    deltas_[0, k] = (edges_[n, k, 1] - edges_[n, k, 0]) / nx
+                    deltas_[1, k] = (edges_[n, k, 3] - edges_[n, k, 2]) / ny
+
+            # the pixels of the largest aperture grid are visited
+            m = nradii - 1
+            ixmin = bbox_[n, m, 0]
+            iymin = bbox_[n, m, 2]
+            nx = bbox_[n, m, 1] - ixmin
+            ny = bbox_[n, m, 3] - iymin
+
+            # overlap of the aperture grid with the data array
+            x0 = max(ixmin, 0)
+            x1 = min(bbox_[n, m, 1], data_.shape[1])
+            y0 = max(iymin, 0)
+            y1 = min(bbox_[n, m, 3], data_.shape[0])
+            if nx <= 0 or ny <= 0 or x0 >= x1 or y0 >= y1:
+                continue
+
+            dx = deltas_[0, m]
+            dy = deltas_[1, m]
+            pixel_radius = 0.5 * sqrt(dx * dx + dy * dy)
+
+            work_[:, :] = 0.0
+            for j in range(y0, y1):
+                pymin = edges_[n, m, 2] + (j - iymin) * dy
+                for i in range(x0, x1):
+                    if has_mask and mask_[j, i]:
+                        continue
+
+                    # pixel corners in the frame of the rotated ellipse
+                    pxmin = edges_[n, m, 0] + (i - ixmin) * dx
+                    for c in range(4):
+                        xc = pxmin + dx * (c == 1 or c == 2)
+                        yc = pymin + dy * (c >= 2)
+                        xtr[c] = yc * sin_theta + xc * cos_theta
+                        ytr[c] = yc * cos_theta - xc * sin_theta
+
+                    # binary search for the smallest ellipse that
+                    # contains all of the pixel corners
+                    lo = 0
+                    hi = nradii
+                    while lo < hi:
+                        kfull = (lo + hi) // 2
+                        inside = 1
+                        for c in range(4):
+                            if (xtr[c] * xtr[c] / (rx_[kfull] * rx_[kfull])
+                                    + ytr[c] * ytr[c]
+                                    / (ry_[kfull] * ry_[kfull])) >= 1.0:
+                                inside = 0
+                                break
+                        if inside:
+                            hi = kfull
+                        else:
+                            lo = kfull + 1
+                    kfull = lo
+
+                    value = data_[j, i]
+                    err2 = 0.0
+                    if has_error:
+                        err2 = error_[j, i] * error_[j, i]
+
+                    work_[0, kfull] += value
+                    work_[1, kfull] += err2
+                    work_[2, kfull] += 1.0
+
+                    # pixel center in the frame of the rotated ellipse
+                    xc = 0.5 * (xtr[0] + xtr[2])
+                    yc = 0.5 * (ytr[0] + ytr[2])
+
+                    # smaller ellipses that may partially overlap the
+                    # pixel
+                    for k in range(kfull - 1, -1, -1):
+                        # the pixel lies within pixel_radius of its
+                        # center, so it is fully outside of the ellipse
+                        # (and all smaller ellipses) if:
+                        rho = sqrt(xc * xc / (rx_[k] * rx_[k])
+                                   + yc * yc / (ry_[k] * ry_[k]))
+                        rmin = min(rx_[k], ry_[k])
+                        if rho > 1.0 + pixel_radius / rmin:
+                            break
+
+                        # use the grid of each aperture so that the
+                        # weights are identical to elliptical_overlap_grid
+                        if (i < bbox_[n, k, 0] or i >= bbox_[n, k, 1]
+                                or j < bbox_[n, k, 2]
+                                or j >= bbox_[n, k, 3]):
+                            continue
+                        weight = elliptical_overlap_pixel(
+                            edges_[n, k, 0], edges_[n, k, 2], deltas_[0, k],
+                            deltas_[1, k], i - bbox_[n, k, 0],
+                            j - bbox_[n, k, 2], rx_[k], ry_[k], theta,
+                            use_exact, subpixels)
+                        if weight > 0:
+                            work_[3, k] += value * weight
+                            work_[4, k] += err2 * weight
+                            work_[5, k] += weight
+
+            for k in range(nradii):
+                if k > 0:
+                    work_[0, k] += work_[0, k - 1]
+                    work_[1, k] += work_[1, k - 1]
+                    work_[2, k] += work_[2, k - 1]
+                sums_[n, k] = work_[0, k] + work_[3, k]
+                areas_[n, k] = work_[2, k] + work_[5, k]
+                if has_error:
+                    sum_errs_[n, k] = sqrt(work_[1, k] + work_[4, k])
+
+    return sums, sum_errs, areas
+
+
+cdef int elliptical_overlap_fill(double *frac, double xmin, double xmax,
+                                 double ymin, double ymax, int nx, int ny,
+                                 double rx, double ry, double theta,
+                                 int use_exact,
+                                 int subpixels) except -1 nogil:
+    """
+    Fill the (ny, nx) row-major ``frac`` buffer with the area of overlap
+    between an ellipse centered on the origin and a pixel grid.
+    """
+
+    cdef int i, j
+    cdef double dx, dy
+
     # Find the width of each element in x and y
     dx = (xmax - xmin) / nx
     dy = (ymax - ymin) / ny
 
-    norm = 1.0 / (dx * dy)
+    for i in range(nx):
+        for j in range(ny):
+            frac[j * nx + i] = elliptical_overlap_pixel(
+                xmin, ymin, dx, dy, i, j, rx, ry, theta, use_exact,
+                subpixels)
+
+    return 0
+
+
+cdef double elliptical_overlap_pixel(double xmin, double ymin, double dx,
+                                     double dy, int i, int j, double rx,
+                                     double ry, double theta, int use_exact,
+                                     int subpixels) nogil:
+    """
+    Return the fraction of overlap between an ellipse centered on the
+    origin and the ``(j, i)`` pixel of a grid with lower edges ``(xmin,
+    ymin)`` and pixel size ``(dx, dy)``.
+    """
+
+    cdef double r
+    cdef double pxmin, pxmax, pymin, pymax
 
     # For now we use a bounding circle and then use that to find a bounding box
     # but of course this is inefficient and could be done better.
@@ -92,28 +552,22 @@ def elliptical_overlap_grid(double xmin, double xmax, double ymin, double ymax,
     # Find bounding circle radius
     r = max(rx, ry)
 
-    # Define bounding box
-    bxmin = -r - 0.5 * dx
-    bxmax = +r + 0.5 * dx
-    bymin = -r - 0.5 * dy
-    bymax = +r + 0.5 * dy
+    pxmin = xmin + i * dx  # lower end of pixel
+    pxmax = pxmin + dx  # upper end of pixel
+    if pxmax <= -r - 0.5 * dx or pxmin >= r + 0.5 * dx:
+        return 0.0
 
-    for i in range(nx):
-        pxmin = xmin + i * dx  # lower end of pixel
-        pxmax = pxmin + dx  # upper end of pixel
-        if pxmax > bxmin and pxmin < bxmax:
-            for j in range(ny):
-                pymin = ymin + j * dy
-                pymax = pymin + dy
-                if pymax > bymin and pymin < bymax:
-                    if use_exact:
-                        frac[j, i] = elliptical_overlap_single_exact(
-                            pxmin, pymin, pxmax, pymax, rx, ry, theta) * norm
-                    else:
-                        frac[j, i] = elliptical_overlap_single_subpixel(
-                            pxmin, pymin, pxmax, pymax, rx, ry, theta,
-                            subpixels)
-    return frac
+    pymin = ymin + j * dy
+    pymax = pymin + dy
+    if pymax <= -r - 0.5 * dy or pymin >= r + 0.5 * dy:
+        return 0.0
+
+    if use_exact:
+        return elliptical_overlap_single_exact(
+            pxmin, pymin, pxmax, pymax, rx, ry, theta) * (1.0 / (dx * dy))
+    else:
+        return elliptical_overlap_single_subpixel(
+            pxmin, pymin, pxmax, pymax, rx, ry, theta, subpixels)
 
 
 # NOTE: The following two functions use cdef because they are not
@@ -125,7 +579,8 @@ def elliptical_overlap_grid(double xmin, double xmax, double ymin, double ymax,
 cdef double elliptical_overlap_single_subpixel(double x0, double y0,
                                                double x1, double y1,
                                                double rx, double ry,
-                                               double theta, int subpixels):
+                                               double theta,
+                                               int subpixels) noexcept nogil:
     """
     Return the fraction of overlap between a ellipse and a single pixel with
     given extent, using a sub-pixel sampling method.
@@ -166,7 +621,7 @@ cdef double elliptical_overlap_single_subpixel(double x0, double y0,
 cdef double elliptical_overlap_single_exact(double xmin, double ymin,
                                             double xmax, double ymax,
                                             double rx, double ry,
-                                            double theta):
+                                            double theta) nogil:
     """
     Given a rectangle defined by (xmin, ymin, xmax, ymax) and an ellipse
     with major and minor axes rx and ry respectively, position angle theta,
@@ -176,6 +631,7 @@ cdef double elliptical_overlap_single_exact(double xmin, double ymin,
     cdef double cos_m_theta = cos(-theta)
     cdef double sin_m_theta = sin(-theta)
     cdef double scale
+    cdef double x1, y1, x2, y2, x3, y3, x4, y4
 
     # Find scale by which the areas will be shrunk
     scale = rx * ry
@@ -8,10 +8,11 @@ rectangle and a pixel grid.
 import numpy as np
 cimport numpy as np
 
-__all__ = ['rectangular_overlap_grid']
+__all__ = ['rectangular_overlap_grid', 'rectangular_overlap_grid_batch',
+           'rectangular_overlap_sum_batch']
 
 
-cdef extern from "math.h":
+cdef extern from "math.h" nogil:
 
     double asin(double x)
     double sin(double x)
@@ -64,17 +65,240 @@ def rectangular_overlap_grid(double xmin, double xmax, double ymin,
         2-d array giving the fraction of the overlap.
     """
 
-    cdef unsigned int i, j
-    cdef double x, y, dx, dy
-    cdef double pxmin, pxmax, pymin, pymax
+    if use_exact == 1:
+        raise NotImplementedError("Exact mode has not been implemented for "
+                                  "rectangular apertures")
 
     # Define output array
     cdef np.ndarray[DTYPE_t, ndim=2] frac = np.zeros([ny, nx], dtype=DTYPE)
 
+    with nogil:
+        if nx > 0 and ny > 0:
+            rectangular_overlap_fill(&frac[0, 0], xmin, xmax, ymin, ymax, nx, ny,
+                                     width, height, theta, subpixels)
+
+    return frac
+
+
+def rectangular_overlap_grid_batch(edges, shapes, double width, double height,
+                                   double theta, int use_exact, int subpixels):
+    """
+    rectangular_overlap_grid_batch(edges, shapes, width, height, theta,
+                                   use_exact, subpixels)
+
+    Area of overlap between a rectangle and many pixel grids, computed
+    in a single call.
+
+    The rectangle is centered on the origin of each grid. The overlap
+    grids are written contiguously (in row-major order) into a single
+    packed 1D output array.
+
+    Parameters
+    ----------
+    edges : (N, 4) array_like (float)
+        The ``(xmin, xmax, ymin, ymax)`` extent of each grid in the x
+        and y direction.
+    shapes : (N, 2) array_like (int)
+        The ``(ny, nx)`` dimensions of each grid.
+    width : float
+        The width of the rectangle
+    height : float
+        The height of the rectangle
+    theta : float
+        The position angle of the rectangle in radians (counterclockwise).
+    use_exact : 0 or 1
+        If set to 1, calculates the exact overlap, while if set to 0, uses a
+        subpixel sampling method with ``subpixel`` subpixels in each direction.
+    subpixels : int
+        If ``use_exact`` is 0, each pixel is resampled by this factor in each
+        dimension. Thus, each pixel is divided into ``subpixels ** 2``
+        subpixels.
+
+    Returns
+    -------
+    frac : 1D `~numpy.ndarray` (float)
+        The packed fractions of the overlap. The 2D grid for the
+        ``i``-th position is ``frac[offsets[i]:offsets[i +
+        1]].reshape(shapes[i])``.
+    offsets : 1D `~numpy.ndarray` (int)
+        The ``N + 1`` offsets of each grid in the packed ``frac`` array.
+    """
+
+    if use_exact == 1:
+        raise NotImplementedError("Exact mode has not been implemented for "
+                                  "rectangular apertures")
+
+    cdef double[:, ::1] edges_ = np.ascontiguousarray(edges, dtype=DTYPE)
+    cdef np.intp_t[:, ::1] shapes_ = np.ascontiguousarray(shapes,
+                                                          dtype=np.intp)
+    cdef np.intp_t[::1] offsets_
+    cdef double[::1] frac_
+    cdef Py_ssize_t i, ny, nx
+
+    offsets = np.zeros(shapes_.shape[0] + 1, dtype=np.intp)
+    offsets[1:] = np.cumsum(np.prod(shapes, axis=1, dtype=np.intp))
+    frac = np.zeros(offsets[-1], dtype=DTYPE)
+
+    offsets_ = offsets
+    frac_ = frac
+    with nogil:
+        for i in range(shapes_.shape[0]):
+            ny = shapes_[i, 0]
+            nx = shapes_[i, 1]
+            if nx > 0 and ny > 0:
+                rectangular_overlap_fill(&frac_[offsets_[i]], edges_[i, 0],
+                                         edges_[i, 1], edges_[i, 2], edges_[i, 3],
+                                         nx, ny, width, height, theta, subpixels)
+
+    return frac, offsets
+
+
+def rectangular_overlap_sum_batch(data, error, mask, edges, bbox,
+                                  double width, double height, double theta,
+                                  double width_in, double height_in,
+                                  int use_exact, int subpixels):
+    """
+    rectangular_overlap_sum_batch(data, error, mask, edges, bbox, width,
+                                  height, theta, width_in, height_in,
+                                  use_exact, subpixels)
+
+    Weighted sums of a 2D array within many rectangular apertures
+    (or annuli), computed in a single call.
+
+    The overlap weight of each pixel is computed on the fly and is
+    immediately applied to the input arrays, which are read in place.
+    No intermediate weight, cutout, or product arrays are created. The
+    weights are identical to those of `rectangular_overlap_grid_batch`.
+
+    Parameters
+    ----------
+    data : 2D `~numpy.ndarray` (float)
+        The 2D array to sum.
+    error : 2D `~numpy.ndarray` (float) or `None`
+        The 1-sigma errors of ``data``. If not `None`, the weighted
+        sums of ``error**2`` are also computed.
+    mask : 2D `~numpy.ndarray` (bool) or `None`
+        A boolean mask where a `True` value indicates the corresponding
+        element of ``data`` is excluded from the sums.
+    edges : (N, 4) array_like (float)
+        The ``(xmin, xmax, ymin, ymax)`` extent of each aperture grid
+        relative to the aperture center.
+    bbox : (N, 4) array_like (int)
+        The ``(ixmin, ixmax, iymin, iymax)`` pixel indices of each
+        aperture grid in ``data``.
+    width : float
+        The width of the rectangle
+    height : float
+        The height of the rectangle
+    theta : float
+        The position angle of the rectangle in radians (counterclockwise).
+    width_in, height_in : float
+        The inner width and height of a rectangular annulus. If
+        ``width_in <= 0``, then no inner rectangle is subtracted.
+    use_exact : 0 or 1
+        If set to 1, calculates the exact overlap, while if set to 0, uses a
+        subpixel sampling method with ``subpixel`` subpixels in each direction.
+    subpixels : int
+        If ``use_exact`` is 0, each pixel is resampled by this factor in each
+        dimension. Thus, each pixel is divided into ``subpixels ** 2``
+        subpixels.
+
+    Returns
+    -------
+    sums : 1D `~numpy.ndarray` (float)
+        The weighted sums of ``data`` within each aperture. The sum is
+        NaN for apertures that do not overlap ``data``.
+    sum_errs : 1D `~numpy.ndarray` (float)
+        The square root of the weighted sums of ``error**2`` within each
+        aperture. All values are NaN if ``error`` is `None`.
+    """
+
     if use_exact == 1:
         raise NotImplementedError("Exact mode has not been implemented for "
                                   "rectangular apertures")
 
+    cdef const double[:, :] data_
+    cdef const double[:, :] error_
+    cdef const unsigned char[:, :] mask_
+    cdef double[:, ::1] edges_ = np.ascontiguousarray(edges, dtype=DTYPE)
+    cdef np.intp_t[:, ::1] bbox_ = np.ascontiguousarray(bbox, dtype=np.intp)
+    cdef double[::1] sums_, sum_errs_
+    cdef Py_ssize_t k, i, j, ny, nx
+    cdef Py_ssize_t ixmin, iymin, x0, x1, y0, y1
+    cdef int has_error, has_mask
+    cdef double dx, dy, weight, err, total, variance
+
+    data_ = data
+    has_error = error is not None
+    has_mask = mask is not None
+    if has_error:
+        error_ = error
+    if has_mask:
+        mask_ = mask.view(np.uint8)
+
+    sums = np.full(bbox_.shape[0], np.nan)
+    sum_errs = np.full(bbox_.shape[0], np.nan)
+    sums_ = sums
+    sum_errs_ = sum_errs
+
+    with nogil:
+        for k in range(bbox_.shape[0]):
+            ixmin = bbox_[k, 0]
+            iymin = bbox_[k, 2]
+            nx = bbox_[k, 1] - ixmin
+            ny = bbox_[k, 3] - iymin
+
+            # overlap of the aperture grid with the data array
+            x0 = max(ixmin, 0)
+            x1 = min(bbox_[k, 1], data_.shape[1])
+            y0 = max(iymin, 0)
+            y1 = min(bbox_[k, 3], data_.shape[0])
+            if nx <= 0 or ny <= 0 or x0 >= x1 or y0 >= y1:
+                continue
+
+            dx = (edges_[k, 1] - edges_[k, 0]) / nx
+            dy = (edges_[k, 3] - edges_[k, 2]) / ny
+
+            total = 0.0
+            variance = 0.0
+            for j in range(y0, y1):
+                for i in range(x0, x1):
+                    if has_mask and mask_[j, i]:
+                        continue
+
+                    weight = rectangular_overlap_pixel(
+                        edges_[k, 0], edges_[k, 2], dx, dy, i - ixmin, j - iymin,
+                        width, height, theta, subpixels)
+                    if width_in > 0:
+                        weight -= rectangular_overlap_pixel(
+                            edges_[k, 0], edges_[k, 2], dx, dy, i - ixmin,
+                            j - iymin, width_in, height_in, theta, subpixels)
+
+                    if weight > 0:
+                        total += data_[j, i] * weight
+                        if has_error:
+                            err = error_[j, i]
+                            variance += err * err * weight
+
+            sums_[k] = total
+            if has_error:
+                sum_errs_[k] = sqrt(variance)
+
+    return sums, sum_errs
+
+
+cdef void rectangular_overlap_fill(double *frac, double xmin, double xmax,
+                                   double ymin, double ymax, int nx, int ny,
+                                   double width, double height, double theta,
+                                   int subpixels) noexcept nogil:
+    """
+    Fill the (ny, nx) row-major ``frac`` buffer with the area of overlap
+    between a rectangle centered on the origin and a pixel grid.
+    """
+
+    cdef int i, j
+    cdef double dx, dy
+
     # Find the width of each element in x and y
     dx = (xmax - xmin) / nx
     dy = (ymax - ymin) / ny
@@ -83,22 +307,36 @@ def rectangular_overlap_grid(double xmin, double xmax, double ymin,
     # circular and elliptical aperture photometry)
 
     for i in range(nx):
-        pxmin = xmin + i * dx  # lower end of pixel
-        pxmax = pxmin + dx  # upper end of pixel
         for j in range(ny):
-            pymin = ymin + j * dy
-            pymax = pymin + dy
-            frac[j, i] = rectangular_overlap_single_subpixel(
-                pxmin, pymin, pxmax, pymax, width, height, theta,
-                subpixels)
+            frac[j * nx + i] = rectangular_overlap_pixel(
+                xmin, ymin, dx, dy, i, j, width, height, theta, subpixels)
 
-    return frac
+
+cdef double rectangular_overlap_pixel(double xmin, double ymin, double dx,
+                                      double dy, int i, int j, double width,
+                                      double height, double theta,
+                                      int subpixels) noexcept nogil:
+    """
+    Return the fraction of overlap between a rectangle centered on the
+    origin and the ``(j, i)`` pixel of a grid with lower edges ``(xmin,
+    ymin)`` and pixel size ``(dx, dy)``.
+    """
+
+    cdef double pxmin, pymin
+
+    pxmin = xmin + i * dx  # lower end of pixel
+    pymin = ymin + j * dy
+
+    return rectangular_overlap_single_subpixel(pxmin, pymin, pxmin + dx,
+                                               pymin + dy, width, height,
+                                               theta, subpixels)
 
 
 cdef double rectangular_overlap_single_subpixel(double x0, double y0,
                                                 double x1, double y1,
                                                 double width, double height,
-                                                double theta, int subpixels):
+                                                double theta,
+                                                int subpixels) noexcept nogil:
     """
     Return the fraction of overlap between a rectangle and a single pixel with
     given extent, using a sub-pixel sampling method.
@@ -110,6 +348,7 @@ cdef double rectangular_overlap_single_subpixel(double x0, double y0,
     cdef double cos_theta = cos(theta)
     cdef double sin_theta = sin(theta)
     cdef double half_width, half_height
+    cdef double dx, dy, x_tr, y_tr
 
     half_width = width / 2.0
     half_height = height / 2.0
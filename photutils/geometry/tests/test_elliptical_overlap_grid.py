@@ -5,10 +5,14 @@ Tests for the elliptical_overlap_grid module.
 
 import itertools
 
+import numpy as np
 import pytest
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 
-from photutils.geometry import elliptical_overlap_grid
+from photutils.geometry import (elliptical_overlap_grid,
+                                elliptical_overlap_grid_batch,
+                                elliptical_overlap_multi_sum_batch,
+                                elliptical_overlap_sum_batch)
 
 grid_sizes = [50, 500, 1000]
 maj_sizes = [0.2, 0.4, 0.8]
@@ -33,3 +37,136 @@ def test_elliptical_overlap_grid(grid_size, maj_size, min_size, angle,
                                 maj_size, min_size, angle, use_exact,
                                 subsample)
     assert_allclose(g.max(), 1.0)
+
+
+@pytest.mark.parametrize('use_exact', use_exacts)
+def test_elliptical_overlap_grid_batch(use_exact):
+    """
+    Test that the batched overlap grids match the individual grids.
+    """
+    edges = np.array([[-1.0, 1.0, -1.0, 1.0], [-0.7, 1.3, -1.2, 0.8],
+                      [-0.5, 0.5, -1.5, 1.5]])
+    shapes = np.array([[10, 10], [20, 15], [30, 10]])
+    frac, offsets = elliptical_overlap_grid_batch(edges, shapes, 0.6, 0.3,
+                                                  0.5, use_exact, 5)
+    assert_equal(offsets, [0, 100, 400, 700])
+    assert frac.shape == (700,)
+    for i, (edge, shape) in enumerate(zip(edges, shapes)):
+        grid = elliptical_overlap_grid(*edge, shape[1], shape[0], 0.6, 0.3,
+                                       0.5, use_exact, 5)
+        assert_equal(frac[offsets[i]:offsets[i + 1]].reshape(shape), grid)
+
+
+@pytest.mark.parametrize('use_exact', use_exacts)
+@pytest.mark.parametrize('use_error', [False, True])
+@pytest.mark.parametrize('use_mask', [False, True])
+def test_elliptical_overlap_sum_batch(use_exact, use_error, use_mask):
+    """
+    Test that the fused aperture sums match the weighted sums of the
+    batched overlap grids.
+    """
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(40, 50))
+    error = rng.uniform(0.5, 1.5, size=data.shape) if use_error else None
+    mask = rng.uniform(size=data.shape) > 0.9 if use_mask else None
+
+    # aperture centers, including partial and no overlap with the data
+    xypos = np.array([[20.3, 15.7], [1.0, 2.0], [48.5, 38.2], [80.0, 10.0]])
+    size = 6.0
+    bbox = np.column_stack((np.floor(xypos[:, 0] - size / 2 + 0.5),
+                            np.ceil(xypos[:, 0] + size / 2 + 0.5),
+                            np.floor(xypos[:, 1] - size / 2 + 0.5),
+                            np.ceil(xypos[:, 1] + size / 2 + 0.5)))
+    bbox = bbox.astype(int)
+    edges = np.column_stack((bbox[:, 0] - 0.5 - xypos[:, 0],
+                             bbox[:, 1] - 0.5 - xypos[:, 0],
+                             bbox[:, 2] - 0.5 - xypos[:, 1],
+                             bbox[:, 3] - 0.5 - xypos[:, 1]))
+    shapes = np.column_stack((bbox[:, 3] - bbox[:, 2],
+                              bbox[:, 1] - bbox[:, 0]))
+
+    for inner in (False, True):
+        weights, offsets = elliptical_overlap_grid_batch(
+            edges, shapes, 3.0, 2.0, 0.5, use_exact, 5)
+        params_in = (0.0, 0.0)
+        if inner:
+            params_in = (1.5, 1.0)
+            weights -= elliptical_overlap_grid_batch(
+                edges, shapes, 1.5, 1.0, 0.5, use_exact, 5)[0]
+        sums, sum_errs = elliptical_overlap_sum_batch(
+            data, error, mask, edges, bbox, 3.0, 2.0, 0.5, *params_in,
+            use_exact, 5)
+
+        for i, (ixmin, ixmax, iymin, iymax) in enumerate(bbox):
+            if ixmin >= data.shape[1]:
+                assert np.isnan(sums[i])
+                assert np.isnan(sum_errs[i])
+                continue
+
+            weight = np.zeros(data.shape)
+            grid = weights[offsets[i]:offsets[i + 1]].reshape(shapes[i])
+            x0 = max(ixmin, 0)
+            y0 = max(iymin, 0)
+            x1 = min(ixmax, data.shape[1])
+            y1 = min(iymax, data.shape[0])
+            weight[y0:y1, x0:x1] = grid[y0 - iymin:y1 - iymin,
+                                        x0 - ixmin:x1 - ixmin]
+            if mask is not None:
+                weight[mask] = 0.0
+            assert_allclose(sums[i], np.sum(data * weight))
+            if error is None:
+                assert np.isnan(sum_errs[i])
+            else:
+                assert_allclose(sum_errs[i],
+                                np.sqrt(np.sum(error**2 * weight)))
+
+
+@pytest.mark.parametrize('use_exact', use_exacts)
+@pytest.mark.parametrize('use_error', [False, True])
+def test_elliptical_overlap_multi_sum_batch(use_exact, use_error):
+    """
+    Test that the single-pass concentric aperture sums match the
+    individual fused aperture sums.
+    """
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(40, 50))
+    error = rng.uniform(0.5, 1.5, size=data.shape) if use_error else None
+    mask = rng.uniform(size=data.shape) > 0.9
+
+    xypos = np.array([[20.3, 15.7], [1.0, 2.0], [48.5, 38.2], [80.0, 10.0]])
+    rx = np.array([0.4, 1.0, 2.5, 2.5, 6.2])
+    ry = 0.6 * rx
+    theta = 0.7
+    all_edges = []
+    all_bbox = []
+    for radius in rx:
+        bbox = np.column_stack((np.floor(xypos[:, 0] - radius + 0.5),
+                                np.ceil(xypos[:, 0] + radius + 0.5),
+                                np.floor(xypos[:, 1] - radius + 0.5),
+                                np.ceil(xypos[:, 1] + radius + 0.5)))
+        bbox = bbox.astype(int)
+        all_bbox.append(bbox)
+        all_edges.append(np.column_stack((bbox[:, 0] - 0.5 - xypos[:, 0],
+                                          bbox[:, 1] - 0.5 - xypos[:, 0],
+                                          bbox[:, 2] - 0.5 - xypos[:, 1],
+                                          bbox[:, 3] - 0.5 - xypos[:, 1])))
+    edges = np.stack(all_edges, axis=1)
+    bbox = np.stack(all_bbox, axis=1)
+
+    sums, sum_errs, areas = elliptical_overlap_multi_sum_batch(
+        data, error, mask, edges, bbox, rx, ry, theta, use_exact, 5)
+    assert sums.shape == (len(xypos), len(rx))
+    assert np.all(np.isnan(sums[-1]))
+    assert np.all(np.isnan(areas[-1]))
+
+    for k in range(len(rx)):
+        params = (rx[k], ry[k], theta, 0.0, 0.0)
+        sums1, sum_errs1 = elliptical_overlap_sum_batch(
+            data, error, mask, edges[:, k], bbox[:, k], *params,
+            use_exact, 5)
+        areas1 = elliptical_overlap_sum_batch(
+            np.ones(data.shape), None, mask, edges[:, k], bbox[:, k],
+            *params, use_exact, 5)[0]
+        assert_allclose(sums[:-1, k], sums1[:-1], rtol=1e-12, atol=1e-12)
+        assert_allclose(areas[:-1, k], areas1[:-1], rtol=1e-12)
+        assert_allclose(sum_errs[:-1, k], sum_errs1[:-1], rtol=1e-12)
@@ -5,10 +5,13 @@ Tests for the rectangular_overlap_grid module.
 
 import itertools
 
+import numpy as np
 import pytest
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 
-from photutils.geometry import rectangular_overlap_grid
+from photutils.geometry import (rectangular_overlap_grid,
+                                rectangular_overlap_grid_batch,
+                                rectangular_overlap_sum_batch)
 
 grid_sizes = [50, 500, 1000]
 rect_sizes = [0.2, 0.4, 0.8]
@@ -27,3 +30,87 @@ def test_rectangular_overlap_grid(grid_size, rect_size, angle, subsample):
     g = rectangular_overlap_grid(-1.0, 1.0, -1.0, 1.0, grid_size, grid_size,
                                  rect_size, rect_size, angle, 0, subsample)
     assert_allclose(g.max(), 1.0)
+
+
+def test_rectangular_overlap_grid_batch():
+    """
+    Test that the batched overlap grids match the individual grids.
+    """
+    edges = np.array([[-1.0, 1.0, -1.0, 1.0], [-0.7, 1.3, -1.2, 0.8],
+                      [-0.5, 0.5, -1.5, 1.5]])
+    shapes = np.array([[10, 10], [20, 15], [30, 10]])
+    frac, offsets = rectangular_overlap_grid_batch(edges, shapes, 0.6, 0.3,
+                                                   0.5, 0, 5)
+    assert_equal(offsets, [0, 100, 400, 700])
+    assert frac.shape == (700,)
+    for i, (edge, shape) in enumerate(zip(edges, shapes)):
+        grid = rectangular_overlap_grid(*edge, shape[1], shape[0], 0.6, 0.3,
+                                        0.5, 0, 5)
+        assert_equal(frac[offsets[i]:offsets[i + 1]].reshape(shape), grid)
+
+    match = 'Exact mode has not been implemented'
+    with pytest.raises(NotImplementedError, match=match):
+        rectangular_overlap_grid_batch(edges, shapes, 0.6, 0.3, 0.5, 1, 5)
+
+
+@pytest.mark.parametrize('use_error', [False, True])
+@pytest.mark.parametrize('use_mask', [False, True])
+def test_rectangular_overlap_sum_batch(use_error, use_mask):
+    """
+    Test that the fused aperture sums match the weighted sums of the
+    batched overlap grids.
+    """
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(40, 50))
+    error = rng.uniform(0.5, 1.5, size=data.shape) if use_error else None
+    mask = rng.uniform(size=data.shape) > 0.9 if use_mask else None
+
+    # aperture centers, including partial and no overlap with the data
+    xypos = np.array([[20.3, 15.7], [1.0, 2.0], [48.5, 38.2], [80.0, 10.0]])
+    size = 6.0
+    bbox = np.column_stack((np.floor(xypos[:, 0] - size / 2 + 0.5),
+                            np.ceil(xypos[:, 0] + size / 2 + 0.5),
+                            np.floor(xypos[:, 1] - size / 2 + 0.5),
+                            np.ceil(xypos[:, 1] + size / 2 + 0.5)))
+    bbox = bbox.astype(int)
+    edges = np.column_stack((bbox[:, 0] - 0.5 - xypos[:, 0],
+                             bbox[:, 1] - 0.5 - xypos[:, 0],
+                             bbox[:, 2] - 0.5 - xypos[:, 1],
+                             bbox[:, 3] - 0.5 - xypos[:, 1]))
+    shapes = np.column_stack((bbox[:, 3] - bbox[:, 2],
+                              bbox[:, 1] - bbox[:, 0]))
+
+    for inner in (False, True):
+        weights, offsets = rectangular_overlap_grid_batch(
+            edges, shapes, 5.0, 3.0, 0.5, 0, 5)
+        params_in = (0.0, 0.0)
+        if inner:
+            params_in = (2.5, 1.5)
+            weights -= rectangular_overlap_grid_batch(
+                edges, shapes, 2.5, 1.5, 0.5, 0, 5)[0]
+        sums, sum_errs = rectangular_overlap_sum_batch(
+            data, error, mask, edges, bbox, 5.0, 3.0, 0.5, *params_in,
+            0, 5)
+
+        for i, (ixmin, ixmax, iymin, iymax) in enumerate(bbox):
+            if ixmin >= data.shape[1]:
+                assert np.isnan(sums[i])
+                assert np.isnan(sum_errs[i])
+                continue
+
+            weight = np.zeros(data.shape)
+            grid = weights[offsets[i]:offsets[i + 1]].reshape(shapes[i])
+            x0 = max(ixmin, 0)
+            y0 = max(iymin, 0)
+            x1 = min(ixmax, data.shape[1])
+            y1 = min(iymax, data.shape[0])
+            weight[y0:y1, x0:x1] = grid[y0 - iymin:y1 - iymin,
+                                        x0 - ixmin:x1 - ixmin]
+            if mask is not None:
+                weight[mask] = 0.0
+            assert_allclose(sums[i], np.sum(data * weight))
+            if error is None:
+                assert np.isnan(sum_errs[i])
+            else:
+                assert_allclose(sum_errs[i],
+                                np.sqrt(np.sum(error**2 * weight)))
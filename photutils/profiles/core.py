@@ -175,28 +175,29 @@ class ProfileBase(metaclass=abc.ABCMeta):
         The aperture fluxes, flux errors, and areas as a function of
         radius.
         """
-        fluxes = []
-        fluxerrs = []
-        areas = []
-        for aperture in self._circular_apertures:
-            if aperture is None:
-                flux, fluxerr = [0.0], [0.0]
-                area = 0.0
-            else:
-                flux, fluxerr = aperture.do_photometry(
-                    self.data, error=self.error, mask=self.mask,
-                    method=self.method, subpixels=self.subpixels)
-                area = aperture.area_overlap(self.data, mask=self.mask,
-                                             method=self.method,
-                                             subpixels=self.subpixels)
-            fluxes.append(flux[0])
-            if self.error is not None:
-                fluxerrs.append(fluxerr[0])
-            areas.append(area)
-
-        fluxes = np.array(fluxes)
-        fluxerrs = np.array(fluxerrs)
-        areas = np.array(areas)
+        from photutils.aperture.photometry import _concentric_aperture_sums
+
+        # all of the circular apertures are measured in a single pass
+        # over the pixels
+        apertures = [aperture for aperture in self._circular_apertures
+                     if aperture is not None]
+        fluxes, fluxerrs, areas = _concentric_aperture_sums(
+            apertures, self.data, self.error, self.mask, self.method,
+            self.subpixels)
+        fluxes = fluxes[0]
+        fluxerrs = fluxerrs[0]
+        areas = areas[0]
+
+        # the first radius may be zero
+        nzero = len(self._circular_apertures) - len(apertures)
+        if nzero > 0:
+            fluxes = np.insert(fluxes, 0, 0.0)
+            fluxerrs = np.insert(fluxerrs, 0, 0.0)
+            areas = np.insert(areas, 0, 0.0)
+
+        if self.error is None:
+            fluxerrs = np.array([])
+
         if self.unit is not None:
             fluxes <<= self.unit
             fluxerrs <<= self.unit
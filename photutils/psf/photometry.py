@@ -20,7 +20,7 @@ from astropy.utils import lazyproperty
 from astropy.utils.exceptions import AstropyUserWarning
 
 from photutils.aperture import CircularAperture
-from photutils.background import LocalBackground
+from photutils.background import LazyBackgroundImage, LocalBackground
 from photutils.psf.groupstars import GroupStarsBase
 from photutils.utils._misc import _get_meta
 from photutils.utils._parameters import as_pair
@@ -98,6 +98,17 @@ class PSFPhotometry:
         source.  If `None`, then no local background is subtracted.  The
         ``local_bkg`` values in ``init_params`` override this keyword.
 
+    background : `~photutils.background.LazyBackgroundImage` or `None`, optional
+        A background image (e.g., ``Background2D.lazy_background``).
+        If input, the ``local_bkg`` of each source is the value of the
+        background image at the initial source position, which is
+        computed without computing the full-sized background image.
+        Unlike ``localbkg_estimator``, the values come from a global
+        background model, not from the pixels around each source.
+        ``background`` and ``localbkg_estimator`` cannot both be
+        input.  The ``local_bkg`` values in ``init_params`` override
+        this keyword.
+
     aperture_radius : float, optional
         The radius of the circular aperture used to estimate the initial
         flux of each source. The ``flux_init`` values in ``init_params``
@@ -113,8 +124,8 @@ class PSFPhotometry:
 
     def __init__(self, psf_model, fit_shape, *, finder=None, grouper=None,
                  fitter=LevMarLSQFitter(), fitter_maxiters=100,
-                 localbkg_estimator=None, aperture_radius=None,
-                 progress_bar=False):
+                 localbkg_estimator=None, background=None,
+                 aperture_radius=None, progress_bar=False):
 
         self.psf_model = psf_model
         self._validate_psf_model()
@@ -126,6 +137,7 @@ class PSFPhotometry:
         self.fitter = self._validate_callable(fitter, 'fitter')
         self.localbkg_estimator = self._validate_localbkg(
             localbkg_estimator, 'localbkg_estimator')
+        self.background = self._validate_background(background)
         self.fitter_maxiters = self._validate_maxiters(fitter_maxiters)
         self.aperture_radius = self._validate_radius(aperture_radius)
         self.progress_bar = progress_bar
@@ -223,6 +235,17 @@ class PSFPhotometry:
                              'LocalBackground instance.')
         return self._validate_callable(value, name)
 
+    def _validate_background(self, background):
+        if background is None:
+            return None
+        if not isinstance(background, LazyBackgroundImage):
+            raise ValueError('background must be a LazyBackgroundImage '
+                             'instance.')
+        if self.localbkg_estimator is not None:
+            raise ValueError('background and localbkg_estimator cannot '
+                             'both be input.')
+        return background
+
     def _validate_maxiters(self, maxiters):
         spec = inspect.signature(self.fitter.__call__)
         if 'maxiter' not in spec.parameters:
@@ -397,7 +420,12 @@ class PSFPhotometry:
                 self.grouper = None
 
         if 'local_bkg' not in init_params.colnames:
-            if self.localbkg_estimator is None:
+            if self.background is not None:
+                # the data units have been removed
+                local_bkg = self.background.value.at(
+                    init_params[self._init_colnames['x']],
+                    init_params[self._init_colnames['y']])
+            elif self.localbkg_estimator is None:
                 local_bkg = np.zeros(len(init_params))
             else:
                 local_bkg = self.localbkg_estimator(
@@ -872,7 +900,8 @@ class PSFPhotometry:
             keyword must be defined. Note that the initial flux
             values refer to the model flux parameters and are not
             corrected for local background values (computed using
-            ``localbkg_estimator`` or input in a ``local_bkg`` column)
+            ``localbkg_estimator`` or ``background``, or input in a
+            ``local_bkg`` column)
             The allowed column names are:
 
               * ``x_init``, ``xinit``, ``xcentroid``, ``x_centroid``,
@@ -892,8 +921,8 @@ class PSFPhotometry:
             The table can also have ``group_id`` and ``local_bkg``
             columns. If ``group_id`` is input, the values will be used
             and ``grouper`` keyword will be ignored. If ``local_bkg`` is
-            input, they will be used and the ``localbkg_estimator`` will
-            be ignored.
+            input, they will be used and the ``localbkg_estimator`` and
+            ``background`` will be ignored.
 
         Returns
         -------
@@ -1180,6 +1209,17 @@ class IterativePSFPhotometry:
         source.  If `None`, then no local background is subtracted.  The
         ``local_bkg`` values in ``init_params`` override this keyword.
 
+    background : `~photutils.background.LazyBackgroundImage` or `None`, optional
+        A background image (e.g., ``Background2D.lazy_background``).
+        If input, the ``local_bkg`` of each source is the value of the
+        background image at the initial source position, which is
+        computed without computing the full-sized background image.
+        Unlike ``localbkg_estimator``, the values come from a global
+        background model, not from the pixels around each source.
+        ``background`` and ``localbkg_estimator`` cannot both be
+        input.  The ``local_bkg`` values in ``init_params`` override
+        this keyword.
+
     aperture_radius : float, optional
         The radius of the circular aperture used to estimate the initial
         flux of each source. The ``flux_init`` values in ``init_params``
@@ -1203,8 +1243,8 @@ class IterativePSFPhotometry:
 
     def __init__(self, psf_model, fit_shape, finder, *, grouper=None,
                  fitter=LevMarLSQFitter(), fitter_maxiters=100, maxiters=3,
-                 localbkg_estimator=None, aperture_radius=None,
-                 sub_shape=None, progress_bar=False):
+                 localbkg_estimator=None, background=None,
+                 aperture_radius=None, sub_shape=None, progress_bar=False):
 
         if finder is None:
             raise ValueError('finder cannot be None for '
@@ -1220,6 +1260,7 @@ class IterativePSFPhotometry:
                                      grouper=grouper, fitter=fitter,
                                      fitter_maxiters=fitter_maxiters,
                                      localbkg_estimator=localbkg_estimator,
+                                     background=background,
                                      aperture_radius=aperture_radius,
                                      progress_bar=progress_bar)
 
@@ -14,7 +14,7 @@ from astropy.utils.exceptions import (AstropyDeprecationWarning,
                                       AstropyUserWarning)
 from numpy.testing import assert_allclose, assert_equal
 
-from photutils.background import LocalBackground, MMMBackground
+from photutils.background import Background2D, LocalBackground, MMMBackground
 from photutils.datasets import (make_gaussian_prf_sources_image,
                                 make_noise_image, make_test_psf_data)
 from photutils.detection import DAOStarFinder
@@ -471,6 +471,25 @@ def test_local_bkg(test_data):
     phot = psfphot(data, error=error)
     assert np.count_nonzero(phot['local_bkg']) == len(sources)
 
+    # the local background from a lazy Background2D image
+    bkg = Background2D(data, (25, 25), filter_size=3)
+    psfphot = PSFPhotometry(psf_model, fit_shape, finder=finder,
+                            grouper=grouper, aperture_radius=4,
+                            background=bkg.lazy_background)
+    phot = psfphot(data, error=error)
+    assert 'background' not in bkg.__dict__
+    assert_allclose(phot['local_bkg'],
+                    bkg.background_at(phot['x_init'], phot['y_init']))
+
+    match = 'background must be a LazyBackgroundImage instance'
+    with pytest.raises(ValueError, match=match):
+        PSFPhotometry(psf_model, fit_shape, background=bkg.background)
+    match = 'background and localbkg_estimator cannot both be input'
+    with pytest.raises(ValueError, match=match):
+        PSFPhotometry(psf_model, fit_shape,
+                      localbkg_estimator=localbkg_estimator,
+                      background=bkg.lazy_background)
+
 
 @pytest.mark.skipif(not HAS_SCIPY, reason='scipy is required')
 def test_fixed_params(test_data):
@@ -0,0 +1,130 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+# cython: language_level=3
+"""
+This module defines a function to build the max-tree (component tree)
+of a 2D image.
+"""
+
+import numpy as np
+
+cimport cython
+cimport numpy as np
+
+__all__ = ['max_tree']
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline Py_ssize_t find_root(np.intp_t[::1] zpar,
+                                 Py_ssize_t p) noexcept nogil:
+    """
+    Find the root of a pixel in the union-find forest, compressing the
+    path from the pixel to the root.
+    """
+    cdef Py_ssize_t root = p
+    cdef Py_ssize_t tmp
+
+    while zpar[root] != root:
+        root = zpar[root]
+    while zpar[p] != root:
+        tmp = zpar[p]
+        zpar[p] = root
+        p = tmp
+    return root
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def max_tree(image, footprint):
+    """
+    max_tree(image, footprint)
+
+    Build the max-tree (component tree) of a 2D integer image.
+
+    Each node of the max-tree is a connected component of the pixels
+    with values greater than or equal to the node value. The tree is
+    built with a union-find in a single pass over the pixels sorted by
+    decreasing value.
+
+    Parameters
+    ----------
+    image : 2D array_like (int)
+        The 2D image.
+    footprint : 2D bool `~numpy.ndarray`
+        A 3x3 footprint that defines the pixel connectivity.
+
+    Returns
+    -------
+    parent : 1D `~numpy.ndarray` (int)
+        The flat index of the parent of each pixel in the flattened
+        image. Each node is represented by one of its pixels (the
+        canonical pixel). The parent of a canonical pixel is the
+        canonical pixel of the parent node, while the parent of the
+        other pixels is the canonical pixel of their node. The root
+        pixel is its own parent.
+    traverser : 1D `~numpy.ndarray` (int)
+        The flat indices of the pixels sorted by increasing value, such
+        that the parent of each pixel comes before the pixel. The first
+        element is the root pixel.
+    area : 1D `~numpy.ndarray` (int)
+        The number of pixels of the node component of each canonical
+        pixel.
+    """
+
+    cdef const np.intp_t[::1] image_ = np.ascontiguousarray(
+        image, dtype=np.intp).ravel()
+    cdef Py_ssize_t ny = np.shape(image)[0]
+    cdef Py_ssize_t nx = np.shape(image)[1]
+    cdef Py_ssize_t npix = ny * nx
+
+    offsets = np.argwhere(footprint) - 1
+    offsets = offsets[np.any(offsets != 0, axis=1)]
+    cdef np.intp_t[:, ::1] offsets_ = np.ascontiguousarray(offsets,
+                                                           dtype=np.intp)
+    cdef Py_ssize_t noffsets = offsets_.shape[0]
+
+    traverser = np.argsort(image_, kind='stable').astype(np.intp)
+    parent = np.empty(npix, dtype=np.intp)
+    area = np.ones(npix, dtype=np.intp)
+    zpar = np.full(npix, -1, dtype=np.intp)
+
+    cdef const np.intp_t[::1] traverser_ = traverser
+    cdef np.intp_t[::1] parent_ = parent
+    cdef np.intp_t[::1] area_ = area
+    cdef np.intp_t[::1] zpar_ = zpar
+    cdef Py_ssize_t i, k, p, q, root, x, y, xx, yy
+
+    with nogil:
+        # merge the components of the processed neighbors of each pixel
+        for i in range(npix - 1, -1, -1):
+            p = traverser_[i]
+            parent_[p] = p
+            zpar_[p] = p
+            y = p // nx
+            x = p - y * nx
+            for k in range(noffsets):
+                yy = y + offsets_[k, 0]
+                xx = x + offsets_[k, 1]
+                if yy < 0 or yy >= ny or xx < 0 or xx >= nx:
+                    continue
+                q = yy * nx + xx
+                if zpar_[q] == -1:  # not yet processed
+                    continue
+                root = find_root(zpar_, q)
+                if root != p:
+                    parent_[root] = p
+                    zpar_[root] = p
+
+        # point each pixel to the canonical pixel of its node
+        for i in range(npix):
+            p = traverser_[i]
+            q = parent_[p]
+            if image_[parent_[q]] == image_[q]:
+                parent_[p] = parent_[q]
+
+        # accumulate the areas from the children to their parents
+        for i in range(npix - 1, 0, -1):
+            p = traverser_[i]
+            area_[parent_[p]] += area_[p]
+
+    return parent, traverser, area
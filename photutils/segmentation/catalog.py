@@ -18,11 +18,11 @@ from astropy.utils.exceptions import AstropyUserWarning
 
 from photutils.aperture import (BoundingBox, CircularAperture,
                                 EllipticalAperture, RectangularAnnulus)
-from photutils.background import SExtractorBackground
+from photutils.background import LazyBackgroundImage, SExtractorBackground
 from photutils.centroids import centroid_quadratic
 from photutils.segmentation.core import SegmentationImage
 from photutils.utils._misc import _get_meta
-from photutils.utils._moments import _moments, _moments_central
+from photutils.utils._moments import _moments_central
 from photutils.utils._progress_bars import add_progress_bar
 from photutils.utils._quantity_helpers import process_quantities
 from photutils.utils.cutouts import CutoutImage
@@ -39,6 +39,10 @@ DEFAULT_COLUMNS = ['label', 'xcentroid', 'ycentroid', 'sky_centroid',
                    'local_background', 'segment_flux', 'segment_fluxerr',
                    'kron_flux', 'kron_fluxerr']
 
+# the number of segmentation image pixels read at a time when gathering
+# the pixels within the source segments
+_PIXEL_BLOCK_SIZE = 2**20
+
 
 def as_scalar(method):
     """
@@ -147,7 +151,10 @@ class SourceCatalog:
         Non-finite ``background`` values (NaN and inf) are not
         automatically masked, unless they are at the same position of
         non-finite values in the input ``data`` array. Such pixels can
-        be masked using the ``mask`` keyword.
+        be masked using the ``mask`` keyword. ``background`` may also be
+        a `~photutils.background.LazyBackgroundImage` (e.g.,
+        ``Background2D.lazy_background``), in which case only the
+        background values within the source cutouts are computed.
 
     wcs : WCS object or `None`, optional
         A world coordinate system (WCS) transformation that
@@ -275,6 +282,15 @@ class SourceCatalog:
     outside of the source segment, masked pixels from the ``mask``
     input, or any non-finite ``data`` values (NaN and inf).
 
+    The input ``data``, ``convolved_data``, ``error``, ``mask``, and
+    ``background`` arrays (and the segmentation array) can be
+    `~numpy.memmap` arrays or other array-like objects that support
+    2D slicing (e.g., a FITS image section, ``hdu.section``) that are
+    larger than the available memory. They are never loaded into memory
+    in full. The source properties are computed from blocks of rows
+    of these arrays or from the source cutouts, which are read in the
+    order of their position in the image.
+
     .. _SourceExtractor: https://sextractor.readthedocs.io/en/latest/
     """
 
@@ -344,10 +360,12 @@ class SourceCatalog:
         if name == 'mask' and array is np.ma.nomask:
             array = None
         if array is not None:
-            # UFuncTypeError is raised when subtracting float
-            # local_background from int data; convert to float
-            array = np.asanyarray(array)
-            if array.ndim != 2:
+            # array-like objects that support slicing (e.g., a
+            # numpy.memmap, a FITS image section, or a
+            # LazyBackgroundImage) are not loaded into memory
+            if not hasattr(array, 'shape'):
+                array = np.asanyarray(array)
+            if len(array.shape) != 2:
                 raise ValueError(f'{name} must be a 2D array.')
             if shape and array.shape != self._data.shape:
                 raise ValueError(f'data and {name} must have the same shape.')
@@ -390,11 +408,29 @@ class SourceCatalog:
         if not isinstance(detection_cat, SourceCatalog):
             raise TypeError('detection_cat must be a SourceCatalog '
                             'instance')
-        if not np.array_equal(detection_cat._segment_img, self._segment_img):
+        if not self._segment_img_equal(detection_cat._segment_img):
             raise ValueError('detection_cat must have same segment_img as '
                              'the input segment_img')
         return detection_cat
 
+    def _segment_img_equal(self, segment_img):
+        """
+        Check whether the input segmentation image is equal to the
+        ``segment_img`` of this catalog.
+
+        The segmentation arrays are compared in blocks of rows.
+        """
+        data1 = self._segment_img.data
+        data2 = segment_img.data
+        if data1 is data2:
+            return True
+        if data1.shape != data2.shape:
+            return False
+        nrows = max(1, _PIXEL_BLOCK_SIZE // max(1, data1.shape[1]))
+        return all(np.array_equal(data1[row:row + nrows],
+                                  data2[row:row + nrows])
+                   for row in range(0, data1.shape[0], nrows))
+
     def _update_meta(self):
         attrs = ('localbkg_width', 'apermask_method', 'kron_params')
         for attr in attrs:
@@ -489,6 +525,13 @@ class SourceCatalog:
         keys = (set(self.__dict__.keys())
                 & (set(self._lazyproperties) | set(self._extra_properties)))
         for key in keys:
+            # _pixel_<attr> lazyproperties are defined for all the
+            # pixels within the source segments and _read_order is a
+            # permutation of the sources (i.e., they are not defined for
+            # each source); they are recomputed for the new sources
+            if key.startswith('_pixel_') or key == '_read_order':
+                continue
+
             value = self.__dict__[key]
 
             # do not insert attributes that are always scalar (e.g.,
@@ -712,12 +755,43 @@ class SourceCatalog:
         values.fill(np.nan)
         return values
 
+    @lazyproperty
+    def _read_order(self):
+        """
+        The source indices sorted by the position of their bounding box
+        in the image (in raster order of the lower-left corner).
+
+        Sources are read from the input arrays in this order for good
+        I/O locality (e.g., for memory-mapped arrays).
+        """
+        bounds = self._bbox_bounds
+        return np.lexsort((bounds[:, 2], bounds[:, 0]))
+
+    def _get_cutouts(self, array):
+        """
+        Return a list of cutouts of the input array using the
+        segmentation image slices.
+
+        The cutouts of a `~numpy.ndarray` (including a `~numpy.memmap`)
+        are views, which are read lazily. The cutouts of other
+        array-like objects (e.g., a FITS image section) are read into
+        memory one at a time in the ``_read_order`` of the sources.
+        """
+        slices = self._slices_iter
+        if isinstance(array, np.ndarray):
+            return [array[slc] for slc in slices]
+
+        cutouts = [None] * self.nlabels
+        for idx in self._read_order:
+            cutouts[idx] = np.asarray(array[slices[idx]])
+        return cutouts
+
     @lazyproperty
     def _data_cutouts(self):
         """
         A list of data cutouts using the segmentation image slices.
         """
-        return [self._data[slc] for slc in self._slices_iter]
+        return self._get_cutouts(self._data)
 
     @lazyproperty
     def _segment_img_cutouts(self):
@@ -725,7 +799,7 @@ class SourceCatalog:
         A list of segmentation image cutouts using the segmentation image
         slices.
         """
-        return [self._segment_img.data[slc] for slc in self._slices_iter]
+        return self._get_cutouts(self._segment_img.data)
 
     @lazyproperty
     def _mask_cutouts(self):
@@ -736,7 +810,7 @@ class SourceCatalog:
         """
         if self._mask is None:
             return self._null_objects
-        return [self._mask[slc] for slc in self._slices_iter]
+        return self._get_cutouts(self._mask)
 
     @lazyproperty
     def _error_cutouts(self):
@@ -747,7 +821,7 @@ class SourceCatalog:
         """
         if self._error is None:
             return self._null_objects
-        return [self._error[slc] for slc in self._slices_iter]
+        return self._get_cutouts(self._error)
 
     @lazyproperty
     def _convdata_cutouts(self):
@@ -755,7 +829,7 @@ class SourceCatalog:
         A list of convolved data cutouts using the segmentation image
         slices.
         """
-        return [self._convolved_data[slc] for slc in self._slices_iter]
+        return self._get_cutouts(self._convolved_data)
 
     @lazyproperty
     def _background_cutouts(self):
@@ -765,7 +839,7 @@ class SourceCatalog:
         """
         if self._background is None:
             return self._null_objects
-        return [self._background[slc] for slc in self._slices_iter]
+        return self._get_cutouts(self._background)
 
     @staticmethod
     def _make_cutout_data_mask(data_cutout, mask_cutout):
@@ -860,6 +934,213 @@ class SourceCatalog:
             cutouts.append(cutout)
         return cutouts
 
+    @lazyproperty
+    def _bbox_bounds(self):
+        """
+        The ``(ymin, ymax, xmin, xmax)`` bounds of the minimal bounding
+        box of each source segment, always as an iterable.
+
+        The maximum values are exclusive, as for numpy slice indices.
+        """
+        return np.array([(slc[0].start, slc[0].stop, slc[1].start,
+                          slc[1].stop) for slc in self._slices_iter],
+                        dtype=np.intp).reshape(-1, 4)
+
+    @lazyproperty
+    def _pixel_positions(self):
+        """
+        The source index and the ``(y, x)`` pixel indices of all pixels
+        within the source segments, in raster order.
+
+        The segmentation image is read in blocks of rows within the
+        bounding box enclosing all the sources. The list of ``(slices,
+        start, stop)`` blocks, where ``start`` and ``stop`` are the
+        range of the block pixels in the output arrays, is also
+        returned.
+
+        Like all the ``_pixel_*`` properties, these arrays are for all
+        the pixels of the sources, not for each source. They are used to
+        compute the source properties with `numpy.bincount`.
+        """
+        bounds = self._bbox_bounds
+        ymin, xmin = bounds[:, 0].min(), bounds[:, 2].min()
+        ymax, xmax = bounds[:, 1].max(), bounds[:, 3].max()
+
+        # maps the label numbers to the source indices (or -1)
+        label_map = np.full(self._segment_img.max_label + 1, -1,
+                            dtype=np.intp)
+        label_map[self.labels] = np.arange(self.nlabels)
+
+        index = []
+        ypos = []
+        xpos = []
+        blocks = []
+        npixels = 0
+        nrows = max(1, _PIXEL_BLOCK_SIZE // (xmax - xmin))
+        for row in range(ymin, ymax, nrows):
+            slc = (slice(row, min(row + nrows, ymax)), slice(xmin, xmax))
+            block_index = label_map[self._segment_img.data[slc]]
+            yidx, xidx = np.nonzero(block_index >= 0)
+            if len(yidx) == 0:
+                continue
+            index.append(block_index[yidx, xidx])
+            ypos.append(yidx + row)
+            xpos.append(xidx + xmin)
+            blocks.append((slc, npixels, npixels + len(yidx)))
+            npixels += len(yidx)
+
+        return (np.concatenate(index), np.concatenate(ypos),
+                np.concatenate(xpos), blocks)
+
+    def _get_pixel_values(self, array, dtype=float):
+        """
+        Get a 1D array of the input array values at the pixels within
+        the source segments (see ``_pixel_positions``).
+
+        The input array is read in the same blocks of rows as the
+        segmentation image.
+        """
+        _, ypos, xpos, blocks = self._pixel_positions
+        if isinstance(array, LazyBackgroundImage):
+            # compute only the background values at the pixels
+            return np.asarray(array[ypos, xpos], dtype=dtype)
+
+        values = np.empty(len(ypos), dtype=dtype)
+        for slc, start, stop in blocks:
+            values[start:stop] = array[slc][ypos[start:stop] - slc[0].start,
+                                            xpos[start:stop] - slc[1].start]
+        return values
+
+    @lazyproperty
+    def _pixel_data(self):
+        """
+        The ``data`` values at the pixels within the source segments.
+        """
+        return self._get_pixel_values(self._data)
+
+    @lazyproperty
+    def _pixel_mask(self):
+        """
+        The input ``mask`` values at the pixels within the source
+        segments.
+
+        If the input ``mask`` is None then None is returned.
+        """
+        if self._mask is None:
+            return None
+        return self._get_pixel_values(self._mask, dtype=bool)
+
+    @lazyproperty
+    def _pixel_data_mask(self):
+        """
+        The mask of non-finite ``data`` values combined with the input
+        ``mask`` array at the pixels within the source segments.
+        """
+        data_mask = ~np.isfinite(self._pixel_data)
+        if self._mask is not None:
+            data_mask |= self._pixel_mask
+        return data_mask
+
+    @lazyproperty
+    def _pixel_moment_data(self):
+        """
+        The (convolved) data values used to compute the image moments at
+        the pixels within the source segments.
+
+        As for ``_moment_data_cutouts``, masked pixels, non-finite
+        values, and negative values are set to zero.
+        """
+        if self._convolved_data is self._data:
+            values = self._pixel_data.copy()
+        else:
+            values = self._get_pixel_values(self._convolved_data)
+        convdata_mask = ~np.isfinite(values) | (values < 0)
+        if self._mask is not None:
+            convdata_mask |= self._pixel_mask
+        values[convdata_mask] = 0.0
+        return values
+
+    @lazyproperty
+    def _pixel_cutout_positions(self):
+        """
+        The ``(y, x)`` pixel positions, relative to the source cutouts,
+        of the pixels within the source segments.
+        """
+        index, ypos, xpos, _ = self._pixel_positions
+        bounds = self._bbox_bounds
+        return ((ypos - bounds[index, 0]).astype(float),
+                (xpos - bounds[index, 2]).astype(float))
+
+    @lazyproperty
+    def _pixel_data_order(self):
+        """
+        The indices of the unmasked pixels within the source segments,
+        sorted by source and then by ``data`` value.
+
+        The sort is stable, so pixels with the same value are in raster
+        order. The number of unmasked pixels and the position of the
+        first one in the sorted indices are also returned for each
+        source.
+        """
+        index = self._pixel_positions[0]
+        good = np.flatnonzero(~self._pixel_data_mask)
+        order = good[np.lexsort((self._pixel_data[good], index[good]))]
+        counts = np.bincount(index[order], minlength=self.nlabels)
+        starts = np.cumsum(counts) - counts
+        return order, counts, starts
+
+    @lazyproperty
+    def _pixel_background(self):
+        """
+        The ``background`` values at the pixels within the source
+        segments.
+        """
+        return self._get_pixel_values(self._background)
+
+    def _sum_pixels(self, weights=None, masked=True):
+        """
+        Sum the input pixel values (or count the pixels if ``weights``
+        is `None`) within each source segment.
+
+        If ``masked`` is `True`, then the pixels masked in ``data`` are
+        excluded.
+        """
+        index = self._pixel_positions[0]
+        if masked:
+            good = ~self._pixel_data_mask
+            index = index[good]
+            if weights is not None:
+                weights = weights[good]
+        sums = np.bincount(index, weights=weights, minlength=self.nlabels)
+        if weights is not None:
+            # bincount returns integers if there are no pixels
+            sums = sums.astype(float, copy=False)
+        return sums
+
+    def _pixel_moments(self, xcenter, ycenter, order=3):
+        """
+        Calculate the image moments of each source from the pixel values
+        within the source segments.
+
+        ``xcenter`` and ``ycenter`` are the center of each source,
+        relative to its cutout.
+        """
+        index = self._pixel_positions[0]
+        ypos, xpos = self._pixel_cutout_positions
+        ypos = ypos - ycenter[index]
+        xpos = xpos - xcenter[index]
+
+        moments = np.empty((self.nlabels, order + 1, order + 1))
+        yweights = self._pixel_moment_data
+        for ypower in range(order + 1):
+            weights = yweights
+            for xpower in range(order + 1):
+                moments[:, ypower, xpower] = np.bincount(
+                    index, weights=weights, minlength=self.nlabels)
+                weights = weights * xpos
+            yweights = yweights * ypos
+        return moments
+
     def _prepare_cutouts(self, arrays, units=True, masked=False, dtype=None):
         """
         Prepare cutouts by applying optional units, masks, or dtype.
@@ -1141,7 +1422,7 @@ class SourceCatalog:
         """
         True if all pixels over the source segment are masked.
         """
-        return np.array([np.all(mask) for mask in self._cutout_total_masks])
+        return self._sum_pixels() == 0
 
     def _get_values(self, array):
         """
@@ -1193,8 +1474,8 @@ class SourceCatalog:
         """
         Spatial moments up to 3rd order of the source.
         """
-        return np.array([_moments(arr, order=3) for arr in
-                         self._moment_data_cutouts])
+        zeros = np.zeros(self.nlabels)
+        return self._pixel_moments(zeros, zeros, order=3)
 
     @lazyproperty
     @use_detcat
@@ -1207,10 +1488,8 @@ class SourceCatalog:
         cutout_centroid = self.cutout_centroid
         if self.isscalar:
             cutout_centroid = cutout_centroid[np.newaxis, :]
-        return np.array([_moments_central(arr, center=(xcen_, ycen_), order=3)
-                         for arr, xcen_, ycen_ in
-                         zip(self._moment_data_cutouts, cutout_centroid[:, 0],
-                             cutout_centroid[:, 1])])
+        return self._pixel_moments(cutout_centroid[:, 0],
+                                   cutout_centroid[:, 1], order=3)
 
     @lazyproperty
     @use_detcat
@@ -1692,7 +1971,7 @@ class SourceCatalog:
         The minimum ``x`` pixel index within the minimal bounding box
         containing the source segment.
         """
-        return np.array([slc[1].start for slc in self._slices_iter])
+        return self._bbox_bounds[:, 2]
 
     @lazyproperty
     @use_detcat
@@ -1704,7 +1983,7 @@ class SourceCatalog:
 
         Note that this value is inclusive, unlike numpy slice indices.
         """
-        return np.array([slc[1].stop - 1 for slc in self._slices_iter])
+        return self._bbox_bounds[:, 3] - 1
 
     @lazyproperty
     @use_detcat
@@ -1714,7 +1993,7 @@ class SourceCatalog:
         The minimum ``y`` pixel index within the minimal bounding box
         containing the source segment.
         """
-        return np.array([slc[0].start for slc in self._slices_iter])
+        return self._bbox_bounds[:, 0]
 
     @lazyproperty
     @use_detcat
@@ -1726,7 +2005,7 @@ class SourceCatalog:
 
         Note that this value is inclusive, unlike numpy slice indices.
         """
-        return np.array([slc[0].stop - 1 for slc in self._slices_iter])
+        return self._bbox_bounds[:, 1] - 1
 
     @lazyproperty
     @use_detcat
@@ -1855,7 +2134,10 @@ class SourceCatalog:
         The minimum pixel value of the ``data`` within the source
         segment.
         """
-        values = np.array([np.min(array) for array in self._data_values])
+        order, counts, starts = self._pixel_data_order
+        values = np.full(self.nlabels, np.nan)
+        good = counts > 0
+        values[good] = self._pixel_data[order[starts[good]]]
         values -= self._local_background
         if self._data_unit is not None:
             values <<= self._data_unit
@@ -1868,7 +2150,11 @@ class SourceCatalog:
         The maximum pixel value of the ``data`` within the source
         segment.
         """
-        values = np.array([np.max(array) for array in self._data_values])
+        order, counts, starts = self._pixel_data_order
+        values = np.full(self.nlabels, np.nan)
+        good = counts > 0
+        values[good] = self._pixel_data[order[starts[good] + counts[good]
+                                              - 1]]
         values -= self._local_background
         if self._data_unit is not None:
             values <<= self._data_unit
@@ -1884,16 +2170,10 @@ class SourceCatalog:
         If there are multiple occurrences of the minimum value, only the
         first occurrence is returned.
         """
-        data = self.data_ma
-        if self.isscalar:
-            data = (data,)
-        idx = []
-        for arr in data:
-            if np.all(arr.mask):
-                idx.append((np.nan, np.nan))
-            else:
-                idx.append(np.unravel_index(np.argmin(arr), arr.shape))
-        return np.array(idx)
+        order, counts, starts = self._pixel_data_order
+        # the sort is stable, so the first sorted pixel is the first
+        # occurrence of the minimum value
+        return self._get_cutout_index(order[starts[counts > 0]])
 
     @lazyproperty
     @as_scalar
@@ -1905,16 +2185,35 @@ class SourceCatalog:
         If there are multiple occurrences of the maximum value, only the
         first occurrence is returned.
         """
-        data = self.data_ma
-        if self.isscalar:
-            data = (data,)
-        idx = []
-        for arr in data:
-            if np.all(arr.mask):
-                idx.append((np.nan, np.nan))
-            else:
-                idx.append(np.unravel_index(np.argmax(arr), arr.shape))
-        return np.array(idx)
+        order, counts, starts = self._pixel_data_order
+        # the pixels with the maximum value are last for each source (in
+        # raster order); select the first one
+        index = self._pixel_positions[0][order]
+        values = self._pixel_data[order]
+        maxvals = values[(starts + counts - 1)[counts > 0]]
+        ismax = values == np.repeat(maxvals, counts[counts > 0])
+        _, first = np.unique(index[ismax], return_index=True)
+        return self._get_cutout_index(order[np.flatnonzero(ismax)[first]])
+
+    def _get_cutout_index(self, pixels):
+        """
+        Return the ``(y, x)`` indices, relative to the cutout data, of
+        the input pixels (one for each source that is not completely
+        masked).
+
+        The indices are NaN for completely-masked sources.
+        """
+        index, ypos, xpos, _ = self._pixel_positions
+        index = index[pixels]
+        bounds = self._bbox_bounds
+        cutout_index = np.transpose((ypos[pixels] - bounds[index, 0],
+                                     xpos[pixels] - bounds[index, 2]))
+        all_masked = self._all_masked
+        if np.any(all_masked):
+            idx = np.full((self.nlabels, 2), np.nan)
+            idx[~all_masked] = cutout_index
+            return idx
+        return cutout_index
 
     @lazyproperty
     @as_scalar
@@ -2034,7 +2333,8 @@ class SourceCatalog:
         localbkg = self._local_background
         if self.isscalar:
             localbkg = localbkg[0]
-        source_sum = np.array([np.sum(arr) for arr in self._data_values])
+        source_sum = self._sum_pixels(self._pixel_data)
+        source_sum[self._all_masked] = np.nan
         source_sum -= self.area.value * localbkg
         if self._data_unit is not None:
             source_sum <<= self._data_unit
@@ -2065,8 +2365,9 @@ class SourceCatalog:
         if self._error is None:
             err = self._null_values
         else:
-            err = np.sqrt(np.array([np.sum(arr**2)
-                                    for arr in self._error_values]))
+            err = np.sqrt(self._sum_pixels(
+                self._get_pixel_values(self._error)**2))
+            err[self._all_masked] = np.nan
 
         if self._data_unit is not None:
             err <<= self._data_unit
@@ -2085,8 +2386,8 @@ class SourceCatalog:
         if self._background is None:
             bkg_sum = self._null_values
         else:
-            bkg_sum = np.array([np.sum(arr)
-                                for arr in self._background_values])
+            bkg_sum = self._sum_pixels(self._pixel_background)
+            bkg_sum[self._all_masked] = np.nan
 
         if self._data_unit is not None:
             bkg_sum <<= self._data_unit
@@ -2105,8 +2406,11 @@ class SourceCatalog:
         if self._background is None:
             bkg_mean = self._null_values
         else:
-            bkg_mean = np.array([np.mean(arr)
-                                 for arr in self._background_values])
+            # ignore divide-by-zero RuntimeWarning
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                bkg_mean = (self._sum_pixels(self._pixel_background)
+                            / self._sum_pixels())
 
         if self._data_unit is not None:
             bkg_mean <<= self._data_unit
@@ -2127,20 +2431,51 @@ class SourceCatalog:
         if self._background is None:
             bkg = self._null_values
         else:
-            from scipy.ndimage import map_coordinates
-
             xcen = self._xcentroid
             ycen = self._ycentroid
-            bkg = map_coordinates(self._background, (xcen, ycen), order=1,
-                                  mode='nearest')
-
             mask = np.isfinite(xcen) & np.isfinite(ycen)
+
+            # bilinear interpolation (with "nearest" edge handling) using
+            # only the neighboring pixels, which are indexed so that a
+            # LazyBackgroundImage computes only those pixels
+            idx = []
+            for cen, size in zip((xcen, ycen), self._background.shape):
+                cen = np.clip(np.where(mask, cen, 0.0), 0, size - 1)
+                idx0 = np.floor(cen).astype(int)
+                idx.append((idx0, np.minimum(idx0 + 1, size - 1),
+                            cen - idx0))
+            (i0, i1, fi), (j0, j1, fj) = idx
+            values = self._get_values_at(self._background,
+                                         np.concatenate((i0, i0, i1, i1)),
+                                         np.concatenate((j0, j1, j0, j1)))
+            bkg00, bkg01, bkg10, bkg11 = np.split(np.asarray(values), 4)
+            bkg = ((1.0 - fi) * ((1.0 - fj) * bkg00 + fj * bkg01)
+                   + fi * ((1.0 - fj) * bkg10 + fj * bkg11))
+            bkg = np.atleast_1d(np.asarray(bkg, dtype=float))
             bkg[~mask] = np.nan
 
         if self._data_unit is not None:
             bkg <<= self._data_unit
         return bkg
 
+    @staticmethod
+    def _get_values_at(array, yidx, xidx):
+        """
+        Get the values of the input array at the given ``(y, x)``
+        integer pixel indices.
+
+        Array-like objects that do not support indexing with integer
+        arrays (e.g., a FITS image section) are read one pixel at a
+        time, in raster order.
+        """
+        if isinstance(array, (np.ndarray, LazyBackgroundImage)):
+            return array[yidx, xidx]
+
+        values = np.empty(len(yidx))
+        for idx in np.lexsort((xidx, yidx)):
+            values[idx] = array[yidx[idx], xidx[idx]]
+        return values
+
     @lazyproperty
     @use_detcat
     @as_scalar
@@ -2153,10 +2488,7 @@ class SourceCatalog:
         masking (i.e., a ``mask`` input to `SourceCatalog` or invalid
         ``data`` values).
         """
-        areas = []
-        for label, slices in zip(self.labels, self._slices_iter):
-            areas.append(np.count_nonzero(self._segment_img[slices] == label))
-        return np.array(areas) << (u.pix**2)
+        return self._sum_pixels(masked=False) << (u.pix**2)
 
     @lazyproperty
     @use_detcat
@@ -2169,7 +2501,7 @@ class SourceCatalog:
         if a mask is input to `SourceCatalog` or if the ``data`` within
         the segment contains invalid values (NaN and inf).
         """
-        areas = np.array([arr.size for arr in self._data_values]).astype(float)
+        areas = self._sum_pixels().astype(float)
         areas[self._all_masked] = np.nan
         return areas << (u.pix**2)
 
@@ -2559,17 +2891,25 @@ class SourceCatalog:
         while a Gini coefficient value of 1 represents a galaxy image
         with all its light concentrated in just one pixel.
         """
-        gini = []
-        for arr in self._data_values:
-            if np.all(np.isnan(arr)):
-                gini.append(np.nan)
-                continue
-            npix = np.size(arr)
-            normalization = np.abs(np.mean(arr)) * npix * (npix - 1)
-            kernel = ((2.0 * np.arange(1, npix + 1) - npix - 1)
-                      * np.abs(np.sort(arr)))
-            gini.append(np.sum(kernel) / normalization)
-        return np.array(gini)
+        order, counts, starts = self._pixel_data_order
+        index = self._pixel_positions[0][order]
+        values = self._pixel_data[order]
+
+        # the rank of each pixel value within its source
+        npix = counts[index]
+        rank = np.arange(1, len(order) + 1) - starts[index]
+        kernel = (2.0 * rank - npix - 1) * np.abs(values)
+
+        # ignore divide-by-zero RuntimeWarning
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            normalization = (np.abs(np.bincount(index, weights=values,
+                                                minlength=self.nlabels)
+                                    / counts) * counts * (counts - 1))
+            gini = np.bincount(index, weights=kernel,
+                               minlength=self.nlabels) / normalization
+        gini[self._all_masked] = np.nan
+        return gini
 
     @lazyproperty
     def _local_background_apertures(self):
@@ -2623,9 +2963,11 @@ class SourceCatalog:
             bkg_func = SExtractorBackground(sigma_clip)
             bkg_apers = self._local_background_apertures
 
-            local_bkgs = []
-            for aperture in bkg_apers:
-                aperture_mask = aperture.to_mask(method='center')
+            # the sources are read in _read_order; local_bkgs remains
+            # zero if there are not enough unmasked pixels
+            local_bkgs = np.zeros(self.nlabels)
+            for idx in self._read_order:
+                aperture_mask = bkg_apers[idx].to_mask(method='center')
                 slc_lg, slc_sm = aperture_mask.get_overlap_slices(
                     self._data.shape)
 
@@ -2648,10 +2990,8 @@ class SourceCatalog:
 
                 # check not enough unmasked pixels
                 if len(data_values) < 10:  # pragma: no cover
-                    local_bkgs.append(0.0)
                     continue
-                local_bkgs.append(bkg_func(data_values))
-            local_bkgs = np.array(local_bkgs)
+                local_bkgs[idx] = bkg_func(data_values)
 
         local_bkgs[self._all_masked] = np.nan
         return local_bkgs
@@ -2965,17 +3305,20 @@ class SourceCatalog:
             cxy = (cxy,)
             cyy = (cyy,)
 
-        labels = self.labels
+        # the sources are read in _read_order
+        indices = self._read_order
         if self.progress_bar:
             desc = 'kron_radius'
-            labels = add_progress_bar(labels, desc=desc)  # pragma: no cover
+            indices = add_progress_bar(indices, desc=desc)  # pragma: no cover
 
-        kron_radius = []
-        for (label, aperture, cxx_, cxy_, cyy_) in zip(labels, apertures,
-                                                       cxx, cxy, cyy):
+        labels = self.labels
+        kron_radius = np.full(self.nlabels, np.nan)
+        for idx in indices:
+            label = labels[idx]
+            aperture = apertures[idx]
             if aperture is None:
-                kron_radius.append(np.nan)
                 continue
+            cxx_, cxy_, cyy_ = cxx[idx], cxy[idx], cyy[idx]
 
             xcen, ycen = aperture.positions
             # use 'center' (whole pixels) to compute Kron radius
@@ -3003,12 +3346,12 @@ class SourceCatalog:
             # set Kron radius to the minimum Kron radius if numerator or
             # denominator is negative
             if flux_numer <= 0 or flux_denom <= 0:
-                kron_radius.append(self.kron_params[1])
+                kron_radius[idx] = self.kron_params[1]
                 continue
 
-            kron_radius.append(flux_numer / flux_denom)
+            kron_radius[idx] = flux_numer / flux_denom
 
-        return np.array(kron_radius)
+        return kron_radius
 
     @as_scalar
     def _calc_kron_radius(self, kron_params):
@@ -3269,19 +3612,19 @@ class SourceCatalog:
         flux, fluxerr : 1D `~numpy.ndaray`
             The flux and flux error arrays.
         """
-        labels = self.labels
+        # the sources are read in _read_order
+        indices = self._read_order
         if self.progress_bar:
-            labels = add_progress_bar(labels, desc=desc)  # pragma: no cover
+            indices = add_progress_bar(indices, desc=desc)  # pragma: no cover
 
-        flux = []
-        fluxerr = []
-        for label, aperture, bkg in zip(labels, apertures,
-                                        self._local_background):
-            # return NaN for completely masked sources or sources where
-            # the centroid is not finite
+        # NaN is returned for completely masked sources or sources where
+        # the centroid is not finite
+        labels = self.labels
+        flux = np.full(self.nlabels, np.nan)
+        fluxerr = np.full(self.nlabels, np.nan)
+        for idx in indices:
+            aperture = apertures[idx]
             if aperture is None:
-                flux.append(np.nan)
-                fluxerr.append(np.nan)
                 continue
 
             xcen, ycen = aperture.positions
@@ -3289,7 +3632,8 @@ class SourceCatalog:
 
             # prepare cutouts of the data based on the aperture size
             data, error, mask, _, slc_sm = self._make_aperture_data(
-                label, xcen, ycen, aperture_mask.bbox, bkg)
+                labels[idx], xcen, ycen, aperture_mask.bbox,
+                self._local_background[idx])
 
             aperture_weights = aperture_mask.data[slc_sm]
             pixel_mask = (aperture_weights > 0) & ~mask  # good pixels
@@ -3297,24 +3641,13 @@ class SourceCatalog:
             with warnings.catch_warnings():
                 warnings.simplefilter('ignore', RuntimeWarning)
                 values = (aperture_weights * data)[pixel_mask]
-                if values.shape == (0,):
-                    flux_ = np.nan
-                else:
-                    flux_ = np.sum(values)
-                flux.append(flux_)
+                if values.shape != (0,):
+                    flux[idx] = np.sum(values)
 
-                if error is None:
-                    fluxerr_ = np.nan
-                else:
+                if error is not None:
                     values = (aperture_weights * error**2)[pixel_mask]
-                    if values.shape == (0,):
-                        fluxerr_ = np.nan
-                    else:
-                        fluxerr_ = np.sqrt(np.sum(values))
-                fluxerr.append(fluxerr_)
-
-        flux = np.array(flux)
-        fluxerr = np.array(fluxerr)
+                    if values.shape != (0,):
+                        fluxerr[idx] = np.sqrt(np.sum(values))
 
         return flux, fluxerr
 
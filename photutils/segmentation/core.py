@@ -5,6 +5,7 @@ segment within a segmentation image.
 """
 
 import inspect
+import math
 import warnings
 from copy import copy, deepcopy
 
@@ -13,6 +14,7 @@ from astropy.utils import lazyproperty
 from astropy.utils.exceptions import AstropyUserWarning
 
 from photutils.aperture import BoundingBox
+from photutils.segmentation.utils import _get_label_dtype
 from photutils.utils._optional_deps import HAS_RASTERIO, HAS_SHAPELY
 from photutils.utils._parameters import as_pair
 from photutils.utils.colormaps import make_random_cmap
@@ -22,6 +24,19 @@ __all__ = ['SegmentationImage', 'Segment']
 __doctest_requires__ = {('SegmentationImage', 'SegmentationImage.*'):
                         ['scipy']}
 
+# the number of pixels relabeled at a time by in-place relabeling
+_REMAP_BLOCK_SIZE = 2**20
+
+# the number of pixels read at a time to find the labels and slices of
+# a memory-mapped segmentation array
+_LABEL_BLOCK_SIZE = 2**20
+
+# the maximum fraction of the segmentation array covered by the slices of
+# the changed labels for which only those slices are relabeled, and the
+# per-label overhead of relabeling a slice (in pixels)
+_REMAP_SLICE_FRACTION = 0.25
+_REMAP_LABEL_NPIXELS = 1024
+
 
 class SegmentationImage:
     """
@@ -37,6 +52,10 @@ class SegmentationImage:
 
     Notes
     -----
+    If ``data`` is a `~numpy.memmap`, the labels and the slices of the
+    labeled regions are found from blocks of rows of the segmentation
+    array, which is therefore never loaded into memory in full.
+
     The `SegmentationImage` instance may be sliced, but note that the
     sliced `SegmentationImage` data array will be a view into the
     original `SegmentationImage` array (this is the same behavior as
@@ -111,6 +130,61 @@ class SegmentationImage:
         # np.unique also sorts elements
         return np.unique(data[data != 0])
 
+    @staticmethod
+    def _get_labels_slices_blocks(data):
+        """
+        Return the sorted non-zero labels and the raw slices (see
+        ``scipy.ndimage.find_objects``) of a segmentation array,
+        reading the array in blocks of rows.
+
+        This is used for `~numpy.memmap` arrays to avoid creating any
+        full-sized intermediate arrays.
+        """
+        nrows = max(1, _LABEL_BLOCK_SIZE // max(1, data.shape[1]))
+        # the (ymin, ymax, xmin, xmax) bounds indexed by label
+        bounds = np.empty((0, 4), dtype=np.intp)
+        for row0 in range(0, data.shape[0], nrows):
+            block = np.asarray(data[row0:row0 + nrows])
+            yidx, xidx = np.nonzero(block)
+            if yidx.size == 0:
+                continue
+            labels = block[yidx, xidx]
+            if np.min(labels) < 0:
+                return labels, None
+
+            idx = np.argsort(labels, kind='stable')
+            labels = labels[idx]
+            yidx = yidx[idx] + row0
+            xidx = xidx[idx]
+            block_labels, starts = np.unique(labels, return_index=True)
+            block_bounds = np.column_stack(
+                [np.minimum.reduceat(yidx, starts),
+                 np.maximum.reduceat(yidx, starts),
+                 np.minimum.reduceat(xidx, starts),
+                 np.maximum.reduceat(xidx, starts)])
+
+            if block_labels[-1] >= len(bounds):
+                new_bounds = np.empty((block_labels[-1] + 1, 4),
+                                      dtype=np.intp)
+                new_bounds[:, 0::2] = np.iinfo(np.intp).max
+                new_bounds[:, 1::2] = -1
+                new_bounds[:len(bounds)] = bounds
+                bounds = new_bounds
+            old_bounds = bounds[block_labels]
+            bounds[block_labels, 0::2] = np.minimum(old_bounds[:, 0::2],
+                                                    block_bounds[:, 0::2])
+            bounds[block_labels, 1::2] = np.maximum(old_bounds[:, 1::2],
+                                                    block_bounds[:, 1::2])
+
+        labels = np.nonzero(bounds[:, 1] >= 0)[0].astype(data.dtype)
+        raw_slices = [None] * max(0, len(bounds) - 1)
+        for label, (ymin, ymax, xmin, xmax) in zip(
+                labels.tolist(), bounds[labels].tolist()):
+            raw_slices[label - 1] = (slice(ymin, ymax + 1),
+                                     slice(xmin, xmax + 1))
+
+        return labels, raw_slices
+
     @lazyproperty
     def segments(self):
         """
@@ -162,7 +236,11 @@ class SegmentationImage:
         if not np.issubdtype(value.dtype, np.integer):
             raise TypeError('data must be have integer type')
 
-        labels = self._get_labels(value)  # array([]) if value all zeros
+        raw_slices = None
+        if isinstance(value, np.memmap):
+            labels, raw_slices = self._get_labels_slices_blocks(value)
+        else:
+            labels = self._get_labels(value)  # array([]) if value all zeros
         if labels.shape != (0,) and np.min(labels) < 0:
             raise ValueError('The segmentation image cannot contain '
                              'negative integers.')
@@ -173,6 +251,8 @@ class SegmentationImage:
 
         self._data = value  # pylint: disable=attribute-defined-outside-init
         self.__dict__['labels'] = labels
+        if raw_slices is not None:
+            self.__dict__['_raw_slices'] = raw_slices
 
     @lazyproperty
     def data_ma(self):
@@ -216,7 +296,7 @@ class SegmentationImage:
         """The maximum label in the segmentation array."""
         if self.nlabels == 0:
             return 0
-        return np.max(self.labels)
+        return int(np.max(self.labels))
 
     def get_index(self, label):
         """
@@ -524,7 +604,128 @@ class SegmentationImage:
         """
         return self.make_cmap(background_color='#000000ff', seed=0)
 
-    def reassign_label(self, label, new_label, relabel=False):
+    def _remap_labels(self, label_map, inplace=False):
+        """
+        Remap the labels of the segmentation array using a lookup
+        table.
+
+        If the bounding-box slices of the labels are cached and the
+        labels that change cover a small fraction of the segmentation
+        array, then only the pixels of those labels within their slices
+        are updated. Otherwise, the lookup table is applied to the whole
+        segmentation array.
+
+        The cached ``labels``, ``_raw_slices`` (and hence ``slices``),
+        and ``areas`` are updated from the lookup table. All other cached
+        properties are reset.
+
+        Parameters
+        ----------
+        label_map : 1D int `~numpy.ndarray`
+            The lookup table of the new label numbers, indexed by the
+            current label numbers. Label zero must map to zero.
+
+        inplace : bool, optional
+            If `True`, then the new labels are written into the
+            existing segmentation array (in blocks of rows if the whole
+            array is remapped), without creating a full-size temporary
+            array. Otherwise, a new array is created with the data type
+            of the segmentation array, promoted if necessary to hold the
+            new labels.
+        """
+        labels = self.labels
+        new_labels = label_map[labels]
+        changed = np.nonzero(new_labels != labels)[0]
+        if len(changed) == 0:
+            return
+
+        max_label = int(np.max(new_labels))
+        if inplace:
+            dtype = self._data.dtype
+            if max_label > np.iinfo(dtype).max:
+                raise ValueError('The new labels cannot be written in-place '
+                                 f'into a segmentation array of type {dtype}.')
+        else:
+            dtype = np.promote_types(self._data.dtype,
+                                     _get_label_dtype(max_label))
+
+        raw_slices = self.__dict__.get('_raw_slices', None)
+        areas = self.__dict__.get('areas', None)
+
+        use_slices = False
+        if raw_slices is not None:
+            slices = self.slices
+            # the cost of relabeling the slices, in pixels, including
+            # the overhead of each label
+            max_npixels = _REMAP_SLICE_FRACTION * self._data.size
+            npixels = 0
+            for i in changed.tolist():
+                npixels += (math.prod(slc.stop - slc.start
+                                      for slc in slices[i])
+                            + _REMAP_LABEL_NPIXELS)
+                if npixels >= max_npixels:
+                    break
+            use_slices = npixels < max_npixels
+
+        if use_slices:
+            # find all the changed pixels before writing any new labels
+            # because the slices can overlap
+            masks = [self._data[slices[i]] == labels[i] for i in changed]
+            data_new = self._data if inplace else self._data.astype(dtype)
+            for i, mask in zip(changed, masks):
+                data_new[slices[i]][mask] = new_labels[i]
+        elif inplace:
+            label_map = label_map.astype(dtype, copy=False)
+            nrows = max(1, _REMAP_BLOCK_SIZE // max(1, self._data[0].size))
+            for row in range(0, self.shape[0], nrows):
+                block = self._data[row:row + nrows]
+                block[...] = label_map[block]
+            data_new = self._data
+        else:
+            data_new = label_map.astype(dtype, copy=False)[self._data]
+
+        self._reset_lazyproperties()  # reset all cached properties
+        self._data = data_new  # use _data to avoid validation
+
+        # update the cached labels, slices, and areas
+        keep = np.nonzero(new_labels)[0]
+        self.__dict__['labels'] = np.unique(new_labels[keep]).astype(dtype)
+        if raw_slices is not None:
+            # merge the slices of labels that were combined
+            if np.array_equal(new_labels[keep], np.arange(len(keep)) + 1):
+                # the new labels are consecutive, starting from 1, and in
+                # the same order (e.g., relabel_consecutive)
+                new_raw_slices = [slices[i] for i in keep.tolist()]
+            else:
+                # only the slices of the changed labels need to be
+                # updated; they are first cleared and then merged into
+                # the slices at their new labels
+                new_raw_slices = list(raw_slices)
+                new_raw_slices.extend([None] * (max_label - len(raw_slices)))
+                changed = changed.tolist()
+                for i in changed:
+                    new_raw_slices[labels[i] - 1] = None
+                for i in changed:
+                    new_label = int(new_labels[i])
+                    if new_label == 0:
+                        continue
+                    slc = slices[i]
+                    merged = new_raw_slices[new_label - 1]
+                    if merged is not None:
+                        slc = tuple(slice(min(slc1.start, slc2.start),
+                                          max(slc1.stop, slc2.stop))
+                                    for slc1, slc2 in zip(merged, slc))
+                    new_raw_slices[new_label - 1] = slc
+                del new_raw_slices[max_label:]
+            self.__dict__['_raw_slices'] = new_raw_slices
+        if areas is not None:
+            idx = np.searchsorted(self.labels, new_labels[keep])
+            self.__dict__['areas'] = np.bincount(
+                idx, weights=areas[keep],
+                minlength=len(self.labels)).astype(areas.dtype)
+
+    def reassign_label(self, label, new_label, relabel=False,
+                       inplace=False):
         """
         Reassign a label number to a new number.
 
@@ -546,6 +747,12 @@ class SegmentationImage:
             such that the labels are in consecutive order starting from
             1.
 
+        inplace : bool, optional
+            If `True`, then the new labels are written into the
+            existing segmentation array (in blocks of rows) instead of
+            a new array. The new labels must fit in the data type of
+            the segmentation array.
+
         Examples
         --------
         >>> from photutils.segmentation import SegmentationImage
@@ -597,9 +804,11 @@ class SegmentationImage:
                [4, 4, 0, 3, 3, 3],
                [4, 4, 0, 0, 3, 3]])
         """
-        self.reassign_labels(label, new_label, relabel=relabel)
+        self.reassign_labels(label, new_label, relabel=relabel,
+                             inplace=inplace)
 
-    def reassign_labels(self, labels, new_label, relabel=False):
+    def reassign_labels(self, labels, new_label, relabel=False,
+                        inplace=False):
         """
         Reassign one or more label numbers.
 
@@ -622,6 +831,12 @@ class SegmentationImage:
             such that the labels are in consecutive order starting from
             1.
 
+        inplace : bool, optional
+            If `True`, then the new labels are written into the
+            existing segmentation array (in blocks of rows) instead of
+            a new array. The new labels must fit in the data type of
+            the segmentation array.
+
         Examples
         --------
         >>> from photutils.segmentation import SegmentationImage
@@ -690,11 +905,9 @@ class SegmentationImage:
                 idx2[labels] = np.arange(len(labels)) + 1
                 idx = idx2[idx]
 
-        data_new = idx[self.data]
-        self._reset_lazyproperties()  # reset all cached properties
-        self._data = data_new  # use _data to avoid validation
+        self._remap_labels(idx, inplace=inplace)
 
-    def relabel_consecutive(self, start_label=1):
+    def relabel_consecutive(self, start_label=1, inplace=False):
         """
         Reassign the label numbers consecutively starting from a given
         label number.
@@ -705,6 +918,12 @@ class SegmentationImage:
             The starting label number, which should be a strictly
             positive integer.  The default is 1.
 
+        inplace : bool, optional
+            If `True`, then the new labels are written into the
+            existing segmentation array (in blocks of rows) instead of
+            a new array. The new labels must fit in the data type of
+            the segmentation array.
+
         Examples
         --------
         >>> from photutils.segmentation import SegmentationImage
@@ -736,19 +955,11 @@ class SegmentationImage:
                 and (self.labels[-1] - self.labels[0] + 1) == self.nlabels):
             return
 
-        old_slices = self.__dict__.get('slices', None)
-        new_labels = np.arange(self.nlabels) + start_label
         new_label_map = np.zeros(self.max_label + 1, dtype=int)
-        new_label_map[self.labels] = new_labels
+        new_label_map[self.labels] = np.arange(self.nlabels) + start_label
+        self._remap_labels(new_label_map, inplace=inplace)
 
-        data_new = new_label_map[self.data]
-        self._reset_lazyproperties()  # reset all cached properties
-        self._data = data_new  # use _data to avoid validation
-        self.__dict__['labels'] = new_labels
-        if old_slices is not None:
-            self.__dict__['slices'] = old_slices  # slice order is unchanged
-
-    def keep_label(self, label, relabel=False):
+    def keep_label(self, label, relabel=False, inplace=False):
         """
         Keep only the specified label.
 
@@ -761,6 +972,12 @@ class SegmentationImage:
             If `True`, then the single segment will be assigned a label
             value of 1.
 
+        inplace : bool, optional
+            If `True`, then the new labels are written into the
+            existing segmentation array (in blocks of rows) instead of
+            a new array. The new labels must fit in the data type of
+            the segmentation array.
+
         Examples
         --------
         >>> from photutils.segmentation import SegmentationImage
@@ -796,9 +1013,9 @@ class SegmentationImage:
                [0, 0, 0, 0, 0, 0],
                [0, 0, 0, 0, 0, 0]])
         """
-        self.keep_labels(label, relabel=relabel)
+        self.keep_labels(label, relabel=relabel, inplace=inplace)
 
-    def keep_labels(self, labels, relabel=False):
+    def keep_labels(self, labels, relabel=False, inplace=False):
         """
         Keep only the specified labels.
 
@@ -812,6 +1029,12 @@ class SegmentationImage:
             such that the labels are in consecutive order starting from
             1.
 
+        inplace : bool, optional
+            If `True`, then the new labels are written into the
+            existing segmentation array (in blocks of rows) instead of
+            a new array. The new labels must fit in the data type of
+            the segmentation array.
+
         Examples
         --------
         >>> from photutils.segmentation import SegmentationImage
@@ -849,11 +1072,10 @@ class SegmentationImage:
         """
         self.check_labels(labels)
 
-        labels = np.atleast_1d(labels)
-        labels_tmp = list(set(self.labels) - set(labels))
-        self.remove_labels(labels_tmp, relabel=relabel)
+        labels_tmp = np.setdiff1d(self.labels, labels)
+        self.remove_labels(labels_tmp, relabel=relabel, inplace=inplace)
 
-    def remove_label(self, label, relabel=False):
+    def remove_label(self, label, relabel=False, inplace=False):
         """
         Remove the label number.
 
@@ -870,6 +1092,12 @@ class SegmentationImage:
             such that the labels are in consecutive order starting from
             1.
 
+        inplace : bool, optional
+            If `True`, then the new labels are written into the
+            existing segmentation array (in blocks of rows) instead of
+            a new array. The new labels must fit in the data type of
+            the segmentation array.
+
         Examples
         --------
         >>> from photutils.segmentation import SegmentationImage
@@ -905,9 +1133,9 @@ class SegmentationImage:
                [4, 4, 0, 0, 0, 0],
                [4, 4, 0, 0, 0, 0]])
         """
-        self.remove_labels(label, relabel=relabel)
+        self.remove_labels(label, relabel=relabel, inplace=inplace)
 
-    def remove_labels(self, labels, relabel=False):
+    def remove_labels(self, labels, relabel=False, inplace=False):
         """
         Remove one or more labels.
 
@@ -923,6 +1151,12 @@ class SegmentationImage:
             such that the labels are in consecutive order starting from
             1.
 
+        inplace : bool, optional
+            If `True`, then the new labels are written into the
+            existing segmentation array (in blocks of rows) instead of
+            a new array. The new labels must fit in the data type of
+            the segmentation array.
+
         Examples
         --------
         >>> from photutils.segmentation import SegmentationImage
@@ -959,10 +1193,11 @@ class SegmentationImage:
                [3, 3, 0, 0, 0, 0]])
         """
         self.check_labels(labels)
-        self.reassign_labels(labels, new_label=0, relabel=relabel)
+        self.reassign_labels(labels, new_label=0, relabel=relabel,
+                             inplace=inplace)
 
     def remove_border_labels(self, border_width, partial_overlap=True,
-                             relabel=False):
+                             relabel=False, inplace=False):
         """
         Remove labeled segments near the array border.
 
@@ -984,6 +1219,12 @@ class SegmentationImage:
             such that the labels are in consecutive order starting from
             1.
 
+        inplace : bool, optional
+            If `True`, then the new labels are written into the
+            existing segmentation array (in blocks of rows) instead of
+            a new array. The new labels must fit in the data type of
+            the segmentation array.
+
         Examples
         --------
         >>> from photutils.segmentation import SegmentationImage
@@ -1024,19 +1265,36 @@ class SegmentationImage:
             raise ValueError('border_width must be smaller than half the '
                              'array size in any dimension')
 
-        border_mask = np.zeros(self.shape, dtype=bool)
-        for i in range(border_mask.ndim):
-            border_mask = border_mask.swapaxes(0, i)
-            border_mask[:border_width] = True
-            border_mask[-border_width:] = True
-            border_mask = border_mask.swapaxes(0, i)
+        # find the labels in the border region from the border strips
+        # along each axis
+        border_data = []
+        for axis, size in enumerate(self.shape):
+            for slc in (slice(0, border_width),
+                        slice(size - border_width, size)):
+                border_slc = ((slice(None),) * axis + (slc,))
+                border_data.append(self.data[border_slc].ravel())
+        remove_labels = self._get_labels(np.concatenate(border_data))
 
-        self.remove_masked_labels(border_mask,
-                                  partial_overlap=partial_overlap,
-                                  relabel=relabel)
+        if not partial_overlap:
+            # keep the segments with any pixels in the interior region
+            interior = tuple(slice(border_width, size - border_width)
+                             for size in self.shape)
+            interior_labels = []
+            for label, slices in zip(remove_labels,
+                                     [self.slices[idx] for idx
+                                      in self.get_indices(remove_labels)]):
+                overlap = tuple(slice(max(slc.start, islc.start),
+                                      min(slc.stop, islc.stop))
+                                for slc, islc in zip(slices, interior))
+                if (all(slc.start < slc.stop for slc in overlap)
+                        and np.any(self.data[overlap] == label)):
+                    interior_labels.append(label)
+            remove_labels = np.setdiff1d(remove_labels, interior_labels)
+
+        self.remove_labels(remove_labels, relabel=relabel, inplace=inplace)
 
     def remove_masked_labels(self, mask, partial_overlap=True,
-                             relabel=False):
+                             relabel=False, inplace=False):
         """
         Remove labeled segments located within a masked region.
 
@@ -1057,6 +1315,12 @@ class SegmentationImage:
             such that the labels are in consecutive order starting from
             1.
 
+        inplace : bool, optional
+            If `True`, then the new labels are written into the
+            existing segmentation array (in blocks of rows) instead of
+            a new array. The new labels must fit in the data type of
+            the segmentation array.
+
         Examples
         --------
         >>> from photutils.segmentation import SegmentationImage
@@ -1101,7 +1365,7 @@ class SegmentationImage:
         if not partial_overlap:
             interior_labels = self._get_labels(self.data[~mask])
             remove_labels = list(set(remove_labels) - set(interior_labels))
-        self.remove_labels(remove_labels, relabel=relabel)
+        self.remove_labels(remove_labels, relabel=relabel, inplace=inplace)
 
     def make_source_mask(self, *, size=None, footprint=None):
         """
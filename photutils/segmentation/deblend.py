@@ -5,23 +5,28 @@ a segmentation image.
 """
 
 import warnings
+from concurrent.futures import as_completed
+from contextlib import nullcontext
 from multiprocessing import cpu_count, get_context
 
 import numpy as np
 from astropy.units import Quantity
 from astropy.utils.exceptions import AstropyUserWarning
 
+from photutils.segmentation._maxtree import max_tree
 from photutils.segmentation.core import SegmentationImage
 from photutils.segmentation.detect import _detect_sources
-from photutils.segmentation.utils import _make_binary_structure
+from photutils.segmentation.utils import (_get_label_dtype,
+                                          _make_binary_structure)
 from photutils.utils._progress_bars import add_progress_bar
 
 __all__ = ['deblend_sources']
 
 
 def deblend_sources(data, segment_img, npixels, *, labels=None, nlevels=32,
-                    contrast=0.001, mode='exponential', connectivity=8,
-                    relabel=True, nproc=1, progress_bar=True):
+                    contrast=0.001, mode='exponential',
+                    method='multithreshold', connectivity=8, relabel=True,
+                    nproc=1, executor=None, progress_bar=True):
     """
     Deblend overlapping sources labeled in a segmentation image.
 
@@ -78,6 +83,16 @@ def deblend_sources(data, segment_img, npixels, *, labels=None, nlevels=32,
         are not. Also, the ``'exponential'`` mode will be changed to
         ``'linear'`` for sources with non-positive minimum data values.
 
+    method : {'multithreshold', 'maxtree'}, optional
+        The method used to find the sources at the multi-thresholding
+        levels. The ``'multithreshold'`` method (default) labels each
+        source separately at each threshold level. The ``'maxtree'``
+        method builds the max-tree (component tree) of each source once
+        and derives the sources at all the threshold levels from it,
+        so that its cost depends only weakly on ``nlevels``. Both
+        methods give identical results, but ``'maxtree'`` is faster for
+        large ``nlevels`` values.
+
     connectivity : {8, 4}, optional
         The type of pixel connectivity used in determining how pixels
         are grouped into a detected source. The options are 8 (default)
@@ -102,6 +117,19 @@ def deblend_sources(data, segment_img, npixels, *, labels=None, nlevels=32,
         multiprocessing require ~1000 or more sources to deblend, with
         larger gains as the number of sources increase.
 
+    executor : `multiprocessing.pool.Pool`, \
+            `concurrent.futures.Executor`, or `None`, optional
+        A long-lived process pool (e.g., created with
+        ``multiprocessing.get_context('spawn').Pool``) or executor
+        (e.g., `~concurrent.futures.ProcessPoolExecutor`) in which
+        to deblend the sources. Reusing the same executor for many
+        calls avoids the cost of starting new processes. If not `None`,
+        ``nproc`` is used only to divide the sources into chunks. In
+        all parallel cases, the ``data`` and segmentation arrays are
+        placed in shared memory, from which the workers slice the
+        source cutouts, and the sources are sent to the workers in
+        chunks with the largest sources first.
+
     progress_bar : bool, optional
         Whether to display a progress bar. Note that if multiprocessing
         is used (``nproc > 1``), the estimation times (e.g., time per
@@ -116,7 +144,11 @@ def deblend_sources(data, segment_img, npixels, *, labels=None, nlevels=32,
     segment_image : `~photutils.segmentation.SegmentationImage`
         A segmentation image, with the same shape as ``data``, where
         sources are marked by different positive integer values.  A
-        value of zero is reserved for the background.
+        value of zero is reserved for the background. Its ``info``
+        dictionary attribute contains the number of sources that were
+        skipped (``'nskipped'``) because they have only one local
+        maximum and therefore cannot be deblended, and any deblending
+        warnings (``'warnings'``).
 
     See Also
     --------
@@ -144,6 +176,9 @@ def deblend_sources(data, segment_img, npixels, *, labels=None, nlevels=32,
     if mode not in ('exponential', 'linear', 'sinh'):
         raise ValueError('mode must be "exponential", "linear", or "sinh"')
 
+    if method not in ('multithreshold', 'maxtree'):
+        raise ValueError('method must be "multithreshold" or "maxtree"')
+
     if labels is None:
         labels = segment_img.labels
     else:
@@ -162,50 +197,54 @@ def deblend_sources(data, segment_img, npixels, *, labels=None, nlevels=32,
     if nproc is None:
         nproc = cpu_count()  # pragma: no cover
 
-    segm_deblended = object.__new__(SegmentationImage)
-    segm_deblended._data = np.copy(segment_img.data)
-    last_label = segment_img.max_label
     indices = segment_img.get_indices(labels)
-
-    all_source_data = []
-    all_source_segments = []
-    all_source_slices = []
-    for label, idx in zip(labels, indices):
-        source_slice = segment_img.slices[idx]
-        source_data = data[source_slice]
-        source_segment = object.__new__(SegmentationImage)
-        source_segment._data = segment_img.data[source_slice]
-        source_segment.keep_labels(label)  # include only one label
-        all_source_data.append(source_data)
-        all_source_segments.append(source_segment)
-        all_source_slices.append(source_slice)
-
-    if nproc == 1:
+    all_source_slices = [segment_img.slices[idx] for idx in indices]
+
+    # skip sources with fewer than two local maxima, which cannot be
+    # deblended because there are fewer than two sources at every
+    # threshold level
+    multipeak = np.array([_local_peak_values(
+        data[source_slice], segment_img.data[source_slice] == label,
+        footprint).size >= 2
+        for label, source_slice in zip(labels, all_source_slices)],
+        dtype=bool)
+    nskipped = np.count_nonzero(~multipeak)
+    labels = labels[multipeak]
+    indices = indices[multipeak]
+    all_source_slices = [source_slice for source_slice, keep
+                         in zip(all_source_slices, multipeak) if keep]
+
+    if nproc == 1 and executor is None:
         if progress_bar:
             desc = 'Deblending'
-            all_source_data = add_progress_bar(all_source_data, desc=desc)  # pragma: no cover
+            labels_iter = add_progress_bar(labels, desc=desc)  # pragma: no cover
+        else:
+            labels_iter = labels
 
         all_source_deblends = []
-        for source_data, source_segment in zip(all_source_data,
-                                               all_source_segments):
-            deblender = _Deblender(source_data, source_segment, npixels,
-                                   footprint, nlevels, contrast, mode)
-            source_deblended = deblender.deblend_source()
+        for label, source_slice in zip(labels_iter, all_source_slices):
+            source_deblended = _deblend_source(
+                data[source_slice], segment_img.data[source_slice], label,
+                npixels, footprint, nlevels, contrast, mode, method)
             all_source_deblends.append(source_deblended)
 
     else:
-        nlabels = len(labels)
-        args_all = zip(all_source_data, all_source_segments,
-                       (npixels,) * nlabels, (footprint,) * nlabels,
-                       (nlevels,) * nlabels, (contrast,) * nlabels,
-                       (mode,) * nlabels)
-
-        if progress_bar:
-            desc = 'Deblending'
-            args_all = add_progress_bar(args_all, total=nlabels, desc=desc)  # pragma: no cover
-
-        with get_context('spawn').Pool(processes=nproc) as executor:
-            all_source_deblends = executor.starmap(_deblend_source, args_all)
+        areas = segment_img.areas[indices]
+        all_source_deblends = _deblend_sources_parallel(
+            data, segment_img.data, labels, all_source_slices, areas,
+            (npixels, footprint, nlevels, contrast, mode, method),
+            nproc=nproc, executor=executor, progress_bar=progress_bar)
+
+    # the deblended segmentation array data type must hold the new
+    # labels, which are numbered after the input labels
+    last_label = segment_img.max_label
+    max_label = last_label + sum(source_deblended.nlabels
+                                 for source_deblended in all_source_deblends
+                                 if source_deblended is not None)
+    dtype = np.promote_types(segment_img.data.dtype,
+                             _get_label_dtype(max_label))
+    segm_deblended = object.__new__(SegmentationImage)
+    segm_deblended._data = segment_img.data.astype(dtype, copy=True)
 
     nonposmin_labels = []
     nmarkers_labels = []
@@ -216,7 +255,8 @@ def deblend_sources(data, segment_img, npixels, *, labels=None, nlevels=32,
             # replace the original source with the deblended source
             segment_mask = (source_deblended.data > 0)
             segm_deblended._data[source_slice][segment_mask] = (
-                source_deblended.data[segment_mask] + last_label)
+                source_deblended.data[segment_mask].astype(dtype)
+                + last_label)
             last_label += source_deblended.nlabels
 
             if hasattr(source_deblended, 'warnings'):
@@ -227,8 +267,9 @@ def deblend_sources(data, segment_img, npixels, *, labels=None, nlevels=32,
                                                  None) is not None:
                     nmarkers_labels.append(label)
 
+    segm_deblended.info = {'nskipped': nskipped}
     if nonposmin_labels or nmarkers_labels:
-        segm_deblended.info = {'warnings': {}}
+        segm_deblended.info['warnings'] = {}
         warnings.warn('The deblending mode of one or more source labels from '
                       'the input segmentation image was changed from '
                       f'"{mode}" to "linear". See the "info" attribute '
@@ -253,17 +294,300 @@ def deblend_sources(data, segment_img, npixels, *, labels=None, nlevels=32,
     return segm_deblended
 
 
-def _deblend_source(source_data, source_segment, npixels, footprint, nlevels,
-                    contrast, mode):
+def _deblend_source(source_data, source_segment_data, label, npixels,
+                    footprint, nlevels, contrast, mode, method):
     """
-    Convenience function to deblend a single labeled source with
-    multiprocessing.
+    Deblend a single labeled source from its cutout data and
+    segmentation arrays.
     """
+    source_segment = object.__new__(SegmentationImage)
+    source_segment._data = source_segment_data
+    source_segment.keep_labels(label)  # include only one label
     deblender = _Deblender(source_data, source_segment, npixels, footprint,
-                           nlevels, contrast, mode)
+                           nlevels, contrast, mode, method)
     return deblender.deblend_source()
 
 
+def _local_peak_values(source_data, segment_mask, footprint):
+    """
+    Find the values of the local maxima of a source.
+
+    A local maximum is a source pixel that is not smaller than any of
+    its neighbors within the source segment, where the neighbors are
+    defined by the ``footprint``. Every connected region of source
+    pixels above any threshold contains at least one local maximum, so
+    a source with fewer than two local maxima cannot be deblended.
+
+    Parameters
+    ----------
+    source_data : 2D `~numpy.ndarray`
+        The cutout data array for a single source.
+
+    segment_mask : 2D bool `~numpy.ndarray`
+        The source segment mask, where `True` values indicate the
+        source pixels.
+
+    footprint : 2D bool `~numpy.ndarray`
+        The footprint that defines the pixel connectivity.
+
+    Returns
+    -------
+    values : 1D `~numpy.ndarray`
+        The values of the local maxima.
+    """
+    from scipy.ndimage import maximum_filter
+
+    # NaN values are never above a threshold
+    segment_mask = segment_mask & ~np.isnan(source_data)
+    data = np.where(segment_mask, source_data, -np.inf)
+    data_max = maximum_filter(data, footprint=footprint, mode='constant',
+                              cval=-np.inf)
+    return data[segment_mask & (data == data_max)]
+
+
+def _to_shared_memory(array):
+    """
+    Copy an array to a new shared memory block.
+
+    Parameters
+    ----------
+    array : `~numpy.ndarray`
+        The array to copy.
+
+    Returns
+    -------
+    shm : `multiprocessing.shared_memory.SharedMemory`
+        The shared memory block, which must be closed and unlinked by
+        the caller.
+
+    spec : tuple
+        The ``(name, shape, dtype)`` of the shared array, used by
+        `_from_shared_memory` to attach to it.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+    shared = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    shared[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _from_shared_memory(spec):
+    """
+    Attach to an array in shared memory.
+
+    Parameters
+    ----------
+    spec : tuple
+        The ``(name, shape, dtype)`` returned by `_to_shared_memory`.
+
+    Returns
+    -------
+    shm : `multiprocessing.shared_memory.SharedMemory`
+        The shared memory block, which must be closed by the caller
+        after the array is no longer used.
+
+    array : `~numpy.ndarray`
+        The shared array.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    name, shape, dtype = spec
+    # track=False prevents the resource tracker of the worker from
+    # unlinking the shared memory block of the parent process
+    # (available in Python 3.13+)
+    try:
+        shm = SharedMemory(name=name, track=False)
+    except TypeError:  # pragma: no cover
+        shm = SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _deblend_sources_chunk(data_spec, segment_spec, sources, args):
+    """
+    Deblend a chunk of sources in a worker, slicing the source cutouts
+    from the data and segmentation arrays in shared memory.
+
+    Parameters
+    ----------
+    data_spec, segment_spec : tuple
+        The shared memory specifications of the data and segmentation
+        arrays (see `_to_shared_memory`).
+
+    sources : list of tuple
+        The ``(index, label, slice)`` of each source to deblend.
+
+    args : tuple
+        The ``(npixels, footprint, nlevels, contrast, mode, method)``
+        deblending parameters.
+
+    Returns
+    -------
+    result : list of tuple
+        The ``(index, source_deblended)`` of each source.
+    """
+    data_shm, data = _from_shared_memory(data_spec)
+    segment_shm, segment_data = _from_shared_memory(segment_spec)
+    try:
+        result = []
+        for index, label, source_slice in sources:
+            # the deblended source must not reference the shared memory
+            source_deblended = _deblend_source(
+                data[source_slice], segment_data[source_slice].copy(),
+                label, *args)
+            result.append((index, source_deblended))
+    finally:
+        del data, segment_data
+        data_shm.close()
+        segment_shm.close()
+    return result
+
+
+def _imap_unordered(executor, func, iterable):
+    """
+    Lazily apply a function to each item of an iterable in an executor,
+    yielding the results in the order they are completed.
+
+    The ``executor`` can be either a `multiprocessing.pool.Pool` or a
+    `concurrent.futures.Executor`.
+    """
+    if hasattr(executor, 'imap_unordered'):
+        yield from executor.imap_unordered(func, iterable)
+    else:
+        futures = [executor.submit(func, item) for item in iterable]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _star_deblend_sources_chunk(args):
+    """
+    Call `_deblend_sources_chunk` with a tuple of arguments.
+    """
+    return _deblend_sources_chunk(*args)
+
+
+def _make_chunks(areas, nchunks):
+    """
+    Group sources into chunks of similar total area, starting with the
+    largest sources.
+
+    The sources are sorted by decreasing area so that the largest
+    blends are scheduled first. Sources larger than the target chunk
+    area are put in their own chunk, while small sources are grouped to
+    amortize the scheduling overhead.
+
+    Parameters
+    ----------
+    areas : 1D `~numpy.ndarray`
+        The source areas.
+
+    nchunks : int
+        The target number of chunks.
+
+    Returns
+    -------
+    chunks : list of 1D `~numpy.ndarray`
+        The source indices of each chunk.
+    """
+    order = np.argsort(areas, kind='stable')[::-1]
+    target_area = np.sum(areas) / nchunks
+    cumareas = np.cumsum(areas[order])
+    chunk_ids = (cumareas - 1) // target_area
+    bounds = np.nonzero(np.diff(chunk_ids))[0] + 1
+    return np.split(order, bounds)
+
+
+def _deblend_sources_parallel(data, segment_data, labels, source_slices,
+                              areas, args, *, nproc=None, executor=None,
+                              progress_bar=False):
+    """
+    Deblend sources in multiple processes.
+
+    The ``data`` and ``segment_data`` arrays are copied once to shared
+    memory, from which the workers slice the source cutouts. The
+    sources are sent to the workers in chunks, largest first.
+
+    Parameters
+    ----------
+    data : 2D `~numpy.ndarray`
+        The 2D array of the image.
+
+    segment_data : 2D int `~numpy.ndarray`
+        The segmentation array.
+
+    labels : 1D `~numpy.ndarray`
+        The labels of the sources to deblend.
+
+    source_slices : list of tuple of slice
+        The slices of the sources to deblend.
+
+    areas : 1D `~numpy.ndarray`
+        The areas of the sources to deblend.
+
+    args : tuple
+        The ``(npixels, footprint, nlevels, contrast, mode, method)``
+        deblending parameters.
+
+    nproc : int or `None`, optional
+        The number of processes used if ``executor`` is `None`.
+
+    executor : `multiprocessing.pool.Pool`, \
+            `concurrent.futures.Executor`, or `None`, optional
+        The executor in which to deblend the sources. If `None`,
+        then a new process pool of ``nproc`` processes is created.
+
+    progress_bar : bool, optional
+        Whether to display a progress bar.
+
+    Returns
+    -------
+    source_deblends : list
+        The deblended source for each input label (or `None` if the
+        source was not deblended).
+    """
+    nsources = len(labels)
+    all_source_deblends = [None] * nsources
+    if nsources == 0:
+        return all_source_deblends
+
+    nworkers = nproc or cpu_count()
+    chunks = _make_chunks(areas, nworkers * 4)
+
+    shms = []
+    try:
+        data_shm, data_spec = _to_shared_memory(data)
+        shms.append(data_shm)
+        segment_shm, segment_spec = _to_shared_memory(segment_data)
+        shms.append(segment_shm)
+
+        chunk_args = ((data_spec, segment_spec,
+                       [(idx, labels[idx], source_slices[idx])
+                        for idx in chunk], args)
+                      for chunk in chunks)
+
+        if executor is None:
+            context = get_context('spawn').Pool(processes=nworkers)
+        else:
+            context = nullcontext(executor)
+
+        with context as pool:
+            results = _imap_unordered(pool, _star_deblend_sources_chunk,
+                                      chunk_args)
+            if progress_bar:
+                desc = 'Deblending'
+                results = add_progress_bar(results, total=len(chunks),
+                                           desc=desc)  # pragma: no cover
+            for result in results:
+                for idx, source_deblended in result:
+                    all_source_deblends[idx] = source_deblended
+    finally:
+        for shm in shms:
+            shm.close()
+            shm.unlink()
+
+    return all_source_deblends
+
+
 class _Deblender:
     """
     Class to deblend a single labeled source.
@@ -306,6 +630,10 @@ class _Deblender:
         multi-thresholding levels (see the ``nlevels`` keyword).  The
         default is 'exponential'.
 
+    method : {'multithreshold', 'maxtree'}
+        The method used to find the sources at the multi-thresholding
+        levels. The default is 'multithreshold'.
+
     Returns
     -------
     segment_image : `~photutils.segmentation.SegmentationImage`
@@ -317,7 +645,7 @@ class _Deblender:
     """
 
     def __init__(self, source_data, source_segment, npixels, footprint,
-                 nlevels, contrast, mode):
+                 nlevels, contrast, mode, method='multithreshold'):
 
         self.source_data = source_data
         self.source_segment = source_segment
@@ -326,6 +654,7 @@ class _Deblender:
         self.nlevels = nlevels
         self.contrast = contrast
         self.mode = mode
+        self.method = method
         self.warnings = {}
 
         self.segment_mask = source_segment.data.astype(bool)
@@ -371,11 +700,32 @@ class _Deblender:
 
         return thresholds[1:-1]  # do not include source min and max
 
+    def max_threshold(self):
+        """
+        Compute the threshold at and above which the source cannot
+        contain two or more sources.
+
+        Two sources above a threshold require at least two local maxima
+        and ``2 * npixels`` pixels above the threshold.
+        """
+        peak_values = np.sort(_local_peak_values(
+            self.source_data, self.segment_mask, self.footprint))
+        source_values = np.sort(
+            self.source_values[~np.isnan(self.source_values)])
+        npixels = 2 * self.npixels
+        if peak_values.size < 2 or source_values.size < npixels:
+            return -np.inf
+        return min(peak_values[-2], source_values[-npixels])
+
     def multithreshold(self):
         """
         Perform multithreshold detection for each source.
+
+        Threshold levels at which the source cannot contain two or more
+        sources are not labeled.
         """
         thresholds = self.compute_thresholds()
+        thresholds = thresholds[thresholds < self.max_threshold()]
         with warnings.catch_warnings():
             warnings.simplefilter('ignore', category=RuntimeWarning)
             segments = _detect_sources(self.source_data, thresholds,
@@ -431,6 +781,151 @@ class _Deblender:
 
         return segments
 
+    def make_tree_markers(self):
+        """
+        Make markers (possible sources) for the watershed algorithm
+        from the max-tree of the source.
+
+        The source pixels are quantized to the number of threshold
+        levels that they are above and the max-tree (component tree) of
+        the quantized source is built once. Each tree node represents
+        the connected component of the source pixels above one or more
+        consecutive threshold levels. The sources at all the threshold
+        levels and the markers found by `make_markers` are derived from
+        the tree instead of labeling the source at each level.
+
+        Returns
+        -------
+        markers : `~photutils.segmentation.SegmentationImage` or `None`
+            A segmentation image that contains the possible sources as
+            markers, labeled in the same order as those found by
+            `make_markers`. `None` is returned if none of the threshold
+            levels contain two or more sources.
+        """
+        thresholds = self.compute_thresholds()
+
+        # the number of thresholds that each source pixel is above
+        levels = np.searchsorted(thresholds, self.source_data, side='left')
+        levels[~self.segment_mask | np.isnan(self.source_data)] = 0
+        parent, traverser, areas = max_tree(levels, self.footprint)
+        levels = levels.ravel()
+
+        # the tree nodes are represented by their canonical pixels,
+        # sorted such that parents come before their children (the
+        # first node is the root)
+        pixels = np.arange(levels.size)
+        canonical = (levels[parent] != levels) | (parent == pixels)
+        nodes = traverser[canonical[traverser]]
+        pixel_nodes = np.where(canonical, pixels, parent)
+
+        # a node component is a source at the levels between the level
+        # of its parent node (exclusive) and its level (inclusive) if it
+        # has at least npixels
+        node_levels = levels[nodes]
+        parent_levels = levels[parent[nodes]]
+        parent_levels[0] = 0  # the root node has no parent
+        sources = ((areas[nodes] >= self.npixels)
+                   & (node_levels > 0))
+        nsources = np.zeros(thresholds.size + 2, dtype=int)
+        np.add.at(nsources, parent_levels[sources] + 1, 1)
+        np.add.at(nsources, node_levels[sources] + 1, -1)
+        kept_levels = np.nonzero(np.cumsum(nsources) >= 2)[0]
+        if kept_levels.size == 0:
+            return None
+
+        level_list = levels.tolist()
+        children = {}
+        for node, parent_node in zip(nodes[sources].tolist(),
+                                     parent[nodes[sources]].tolist()):
+            children.setdefault(parent_node, []).append(node)
+
+        def get_sources(node, level):
+            # the sources at the given level in the node component,
+            # which must be above the node level
+            result = []
+            stack = list(children.get(node, []))
+            while stack:
+                node = stack.pop()
+                if level_list[node] >= level:
+                    result.append(node)
+                else:
+                    stack.extend(children.get(node, []))
+            return result
+
+        # start with the sources at the lowest level with two or more
+        # sources; each marker is replaced by the sources within it at
+        # the first higher level where it contains two or more sources
+        level = kept_levels[0]
+        stack = nodes[sources & (parent_levels < level)
+                      & (node_levels >= level)].tolist()
+        markers = []
+        while stack:
+            marker = node = stack.pop()
+            while True:
+                idx = np.searchsorted(kept_levels, level_list[node],
+                                      side='right')
+                if idx == kept_levels.size:
+                    markers.append(marker)
+                    break
+                level = kept_levels[idx]
+                level_sources = get_sources(node, level)
+                if len(level_sources) >= 2:
+                    stack.extend(level_sources)
+                    break
+                if len(level_sources) == 0:
+                    markers.append(marker)
+                    break
+                # the marker cannot be split until its single source
+                # ends at a higher level
+                node = level_sources[0]
+
+        # label the pixels in each marker component, propagating the
+        # marker labels from the parent to the child nodes
+        parent_list = parent.tolist()
+        node_markers = [0] * levels.size
+        for i, marker in enumerate(markers):
+            node_markers[marker] = i + 1
+        for node in nodes[1:].tolist():
+            if node_markers[node] == 0:
+                node_markers[node] = node_markers[parent_list[node]]
+        markers = np.array(node_markers)[pixel_nodes]
+
+        # label the markers in order of their first pixel, as
+        # done by scipy.ndimage.label in make_markers
+        labels, first_pixels = np.unique(markers, return_index=True)
+        label_map = np.zeros(labels.size, dtype=int)
+        label_map[labels[1:][np.argsort(first_pixels[1:])]] = (
+            np.arange(labels.size - 1) + 1)
+
+        segm = object.__new__(SegmentationImage)
+        segm._data = label_map[markers].reshape(self.source_data.shape)
+        segm.__dict__['labels'] = np.arange(labels.size - 1) + 1
+        return segm
+
+    def find_markers(self):
+        """
+        Find the markers (possible sources) for the watershed algorithm
+        using the deblending method.
+
+        Returns
+        -------
+        markers : list of `~photutils.segmentation.SegmentationImage` or `None`
+            A list of segmentation images that contain possible sources
+            as markers. The last list element contains all of the
+            potential source markers. `None` is returned if none of the
+            threshold levels contain two or more sources.
+        """
+        if self.method == 'maxtree':
+            markers = self.make_tree_markers()
+            if markers is None:
+                return None
+            return [markers]
+
+        segments = self.multithreshold()
+        if len(segments) == 0:
+            return None
+        return self.make_markers(segments)
+
     def apply_watershed(self, markers):
         """
         Apply the watershed algorithm to the source markers.
@@ -486,12 +981,10 @@ class _Deblender:
         if self.source_min == self.source_max:  # no deblending
             return None
 
-        segments = self.multithreshold()
-        if len(segments) == 0:  # no deblending
-            return None
-
         # define the markers (possible sources) for the watershed algorithm
-        markers = self.make_markers(segments)
+        markers = self.find_markers()
+        if markers is None:  # no deblending
+            return None
 
         # If there are too many markers (e.g., due to low threshold
         # and/or small npixels), the watershed step can be very slow
@@ -502,10 +995,9 @@ class _Deblender:
         if self.mode != 'linear' and markers[-1].nlabels > 200:
             self.warnings['nmarkers'] = 'too many markers'
             self.mode = 'linear'
-            segments = self.multithreshold()
-            if len(segments) == 0:  # no deblending
+            markers = self.find_markers()
+            if markers is None:  # no deblending
                 return None
-            markers = self.make_markers(segments)
 
         # deblend using the watershed algorithm using the markers as seeds
         markers = self.apply_watershed(markers)
@@ -9,7 +9,9 @@ import numpy as np
 from astropy.stats import SigmaClip
 
 from photutils.segmentation.core import SegmentationImage
-from photutils.segmentation.utils import _make_binary_structure
+from photutils.segmentation.utils import (_get_label_dtype,
+                                          _make_binary_structure)
+from photutils.utils._parameters import as_float_dtype
 from photutils.utils._quantity_helpers import process_quantities
 from photutils.utils._stats import nanmean, nanstd
 from photutils.utils.exceptions import NoDetectionsWarning
@@ -18,7 +20,8 @@ __all__ = ['detect_threshold', 'detect_sources']
 
 
 def detect_threshold(data, nsigma, *, background=None, error=None, mask=None,
-                     sigma_clip=SigmaClip(sigma=3.0, maxiters=10)):
+                     sigma_clip=SigmaClip(sigma=3.0, maxiters=10),
+                     dtype=None):
     """
     Calculate a pixel-wise threshold image that can be used to detect
     sources.
@@ -65,6 +68,11 @@ def detect_threshold(data, nsigma, *, background=None, error=None, mask=None,
         A `~astropy.stats.SigmaClip` object that defines the sigma
         clipping parameters.
 
+    dtype : data-type or `None`, optional
+        The floating-point data type (e.g., ``np.float32``) of the
+        output threshold image. If `None`, the data type is determined
+        by the input ``data``, ``background``, and ``error``.
+
     Returns
     -------
     threshold : 2D `~numpy.ndarray`
@@ -90,6 +98,7 @@ def detect_threshold(data, nsigma, *, background=None, error=None, mask=None,
 
     if not isinstance(sigma_clip, SigmaClip):
         raise TypeError('sigma_clip must be a SigmaClip object')
+    dtype = as_float_dtype(dtype)
 
     if background is None or error is None:
         if mask is not None:
@@ -111,8 +120,9 @@ def detect_threshold(data, nsigma, *, background=None, error=None, mask=None,
         raise ValueError('If input error is 2D, then it must have the same '
                          'shape as the input data.')
 
-    threshold = (np.broadcast_to(background, data.shape)
-                 + np.broadcast_to(error * nsigma, data.shape))
+    threshold = np.add(np.broadcast_to(background, data.shape),
+                       np.broadcast_to(error * nsigma, data.shape),
+                       dtype=dtype)
 
     if unit:
         threshold <<= unit
@@ -226,13 +236,14 @@ def _detect_sources(data, thresholds, npixels, footprint, inverse_mask, *,
             continue
 
         if not deblend_mode:
-            # relabel the segmentation image with consecutive numbers
+            # relabel the segmentation image with consecutive numbers,
+            # using the smallest integer data type that holds the labels
             nlabels = len(segm_labels)
-            if len(labels) != nlabels:
-                label_map = np.zeros(np.max(labels) + 1, dtype=int)
-                labels = np.arange(nlabels) + 1
-                label_map[segm_labels] = labels
-                segment_img = label_map[segment_img]
+            label_map = np.zeros(np.max(labels) + 1,
+                                 dtype=_get_label_dtype(nlabels))
+            label_map[segm_labels] = np.arange(nlabels) + 1
+            labels = np.arange(nlabels) + 1
+            segment_img = label_map[segment_img]
         else:
             labels = segm_labels
 
@@ -249,7 +260,221 @@ def _detect_sources(data, thresholds, npixels, footprint, inverse_mask, *,
     return segms
 
 
-def detect_sources(data, threshold, npixels, *, connectivity=8, mask=None):
+def _merge_labels(nlabels, labels1, labels2):
+    """
+    Merge pairs of connected labels using an array-based union-find.
+
+    Parameters
+    ----------
+    nlabels : int
+        The number of labels. The labels are ``1`` to ``nlabels``.
+
+    labels1, labels2 : 1D int `~numpy.ndarray`
+        The pairs of labels that are connected.
+
+    Returns
+    -------
+    roots : 1D int `~numpy.ndarray`
+        An array of length ``nlabels + 1`` that maps each label to the
+        smallest label of its connected component.
+    """
+    roots = np.arange(nlabels + 1)
+    while True:
+        # hook the larger root of each pair to the smaller root
+        root1 = roots[labels1]
+        root2 = roots[labels2]
+        unmerged = root1 != root2
+        if not np.any(unmerged):
+            return roots
+        labels1 = labels1[unmerged]
+        labels2 = labels2[unmerged]
+        root1 = root1[unmerged]
+        root2 = root2[unmerged]
+        np.minimum.at(roots, np.maximum(root1, root2),
+                      np.minimum(root1, root2))
+
+        # compress the paths so that each label points to its root
+        while True:
+            parents = roots[roots]
+            if np.array_equal(parents, roots):
+                break
+            roots = parents
+
+
+def _detect_sources_strips(data, threshold, npixels, footprint, mask,
+                           strip_size, output):
+    """
+    Detect sources above a specified threshold value in an image,
+    processing the image in strips of rows.
+
+    Each strip is thresholded and labeled separately with provisional
+    labels. The labels that are connected across the strip boundaries
+    are then merged with a union-find, the ``npixels`` area cut is
+    applied to the merged sources, and the final labels are written
+    strip by strip. The provisional labels are stored in the
+    ``output`` array, if input. Otherwise, each strip is labeled
+    again when writing its final labels, so that no full-sized
+    temporary array is created.
+    Only one strip of the ``data``, ``threshold``, ``mask``, and
+    ``output`` arrays is held in memory at a time, so they can be
+    memory-mapped arrays (e.g., `numpy.memmap`). The result is
+    identical to that of `_detect_sources`.
+
+    Parameters
+    ----------
+    data : 2D `~numpy.ndarray`
+        The 2D array of the image.
+
+    threshold : float or 2D `~numpy.ndarray`
+        The data value or pixel-wise data values to be used for the
+        detection threshold.
+
+    npixels : int
+        The minimum number of connected pixels, each greater than
+        ``threshold``, that an object must have to be detected.
+
+    footprint : array_like
+        A 3x3 footprint that defines feature connections.
+
+    mask : 2D bool `~numpy.ndarray` or `None`
+        A boolean mask, where `True` values indicate masked pixels.
+
+    strip_size : int
+        The number of rows in each strip.
+
+    output : 2D int `~numpy.ndarray` or `None`
+        The output segmentation array. It must be able to hold the
+        provisional labels of all strips. If `None`, then a new output
+        array is created with the smallest integer data type that
+        holds the final labels.
+
+    Returns
+    -------
+    segment_image : `~photutils.segmentation.SegmentationImage` or `None`
+        The segmentation image. If no sources are found then `None` is
+        returned.
+    """
+    from scipy.ndimage import find_objects
+    from scipy.ndimage import label as ndi_label
+
+    def label_strip(row0, row1, dtype):
+        thresh = threshold
+        if np.ndim(threshold) == 2:
+            thresh = threshold[row0:row1]
+        segment_img = np.asarray(data[row0:row1] > thresh)
+        if mask is not None:
+            segment_img &= ~np.asarray(mask[row0:row1])
+
+        labels, nstrip = ndi_label(segment_img, structure=footprint)
+        return labels.astype(dtype, copy=False), nstrip
+
+    ny, nx = data.shape
+    label_dtype = np.intp if output is None else output.dtype
+    max_label = np.iinfo(label_dtype).max
+    strips = [(row, min(row + strip_size, ny))
+              for row in range(0, ny, strip_size)]
+
+    # the column offsets connecting a row to the row below it
+    dxs = np.nonzero(footprint[0])[0] - 1
+
+    nlabels = 0
+    offsets = []
+    areas = [np.zeros(1, dtype=np.int64)]
+    bounds = [np.zeros((1, 4), dtype=np.int64)]
+    labels1 = [np.zeros(0, dtype=np.intp)]
+    labels2 = [np.zeros(0, dtype=np.intp)]
+    last_row = None
+    for row0, row1 in strips:
+        labels, nstrip = label_strip(row0, row1, label_dtype)
+        if nlabels + nstrip > max_label:
+            raise ValueError('The output array data type cannot hold the '
+                             'provisional source labels. Use a larger '
+                             'integer data type.')
+
+        # the areas and bounding boxes of the strip labels
+        areas.append(np.bincount(labels.ravel(), minlength=nstrip + 1)[1:])
+        bounds.append(np.array([(slc[0].start + row0, slc[0].stop + row0,
+                                 slc[1].start, slc[1].stop)
+                                for slc in find_objects(labels)],
+                               dtype=np.int64).reshape(-1, 4))
+
+        np.add(labels, nlabels, out=labels, where=labels > 0)
+        offsets.append(nlabels)
+        nlabels += nstrip
+
+        # the pairs of labels connected across the strip boundary
+        if last_row is not None:
+            first_row = labels[0]
+            for dx in dxs:
+                label1 = last_row[max(-dx, 0):nx - max(dx, 0)]
+                label2 = first_row[max(dx, 0):nx - max(-dx, 0)]
+                idx = (label1 > 0) & (label2 > 0)
+                labels1.append(label1[idx])
+                labels2.append(label2[idx])
+        last_row = labels[-1].copy()
+
+        if output is not None:
+            output[row0:row1] = labels
+
+    areas = np.concatenate(areas)
+    bounds = np.concatenate(bounds)
+    roots = _merge_labels(nlabels, np.concatenate(labels1),
+                          np.concatenate(labels2))
+
+    # apply the npixels area cut to the merged sources
+    areas = np.bincount(roots, weights=areas,
+                        minlength=nlabels + 1).astype(np.int64)
+    good = (roots == np.arange(nlabels + 1)) & (areas >= npixels)
+    good[0] = False
+    segm_labels = np.nonzero(good)[0]
+
+    # the sources are numbered consecutively in the order of their
+    # smallest provisional label, i.e., as with a single labeling pass
+    if len(segm_labels) == 0:
+        if output is not None:
+            for row0, row1 in strips:
+                output[row0:row1] = 0
+        warnings.warn('No sources were found.', NoDetectionsWarning)
+        return None
+
+    label_map = np.zeros(nlabels + 1,
+                         dtype=_get_label_dtype(len(segm_labels)))
+    label_map[segm_labels] = np.arange(len(segm_labels)) + 1
+    label_map = label_map[roots]
+    if output is None:
+        output = np.empty(data.shape, dtype=label_map.dtype)
+        for (row0, row1), offset in zip(strips, offsets):
+            labels, _ = label_strip(row0, row1, label_dtype)
+            np.add(labels, offset, out=labels, where=labels > 0)
+            output[row0:row1] = label_map[labels]
+    else:
+        for row0, row1 in strips:
+            output[row0:row1] = label_map[output[row0:row1]]
+
+    # merge the bounding boxes of the provisional labels
+    segm_bounds = np.empty((nlabels + 1, 4), dtype=np.int64)
+    segm_bounds[:, 0::2] = np.iinfo(np.int64).max
+    segm_bounds[:, 1::2] = -1
+    np.minimum.at(segm_bounds[:, 0], roots, bounds[:, 0])
+    np.maximum.at(segm_bounds[:, 1], roots, bounds[:, 1])
+    np.minimum.at(segm_bounds[:, 2], roots, bounds[:, 2])
+    np.maximum.at(segm_bounds[:, 3], roots, bounds[:, 3])
+    segm_bounds = segm_bounds[segm_labels]
+    slices = [(slice(y0, y1), slice(x0, x1))
+              for y0, y1, x0, x1 in segm_bounds.tolist()]
+
+    segm = object.__new__(SegmentationImage)
+    segm._data = output
+    segm.__dict__['labels'] = np.arange(len(segm_labels)) + 1
+    segm.__dict__['_raw_slices'] = slices
+    segm.__dict__['slices'] = slices
+    segm.__dict__['areas'] = areas[segm_labels]
+
+    return segm
+
+
+def detect_sources(data, threshold, npixels, *, connectivity=8, mask=None,
+                   strip_size=None, output=None):
     """
     Detect sources above a specified threshold value in an image.
 
@@ -290,13 +515,34 @@ def detect_sources(data, threshold, npixels, *, connectivity=8, mask=None):
         `True` values indicate masked pixels. Masked pixels will not be
         included in any source.
 
+    strip_size : int or `None`, optional
+        If not `None`, the image is labeled in strips of ``strip_size``
+        rows, which are merged with a union-find over the labels that
+        connect across the strip boundaries. Only one strip of the
+        input ``data``, ``threshold``, and ``mask`` arrays and of the
+        ``output`` array is held in memory at a time, so these can be
+        memory-mapped arrays (e.g., `numpy.memmap`) that are larger
+        than the available memory. The segmentation image is identical
+        to that computed without strips. If `None` (default) and
+        ``output`` is input, then a strip size of 1024 rows is used.
+
+    output : 2D int `~numpy.ndarray`, optional
+        An integer array (e.g., a `numpy.memmap`), with the same shape
+        as the input ``data``, in which to write the segmentation
+        array. It must be able to hold the provisional labels of the
+        strips, which may be larger than the final labels. If `None`,
+        then a new array is created. This keyword is used only when
+        labeling in strips (see ``strip_size``).
+
     Returns
     -------
     segment_image : `~photutils.segmentation.SegmentationImage` or `None`
         A 2D segmentation image, with the same shape as ``data``, where
         sources are marked by different positive integer values. A value
-        of zero is reserved for the background. If no sources are found
-        then `None` is returned.
+        of zero is reserved for the background. Unless ``output`` is
+        input, the segmentation array has the smallest unsigned integer
+        data type (``uint8``, ``uint16``, or ``uint32``) that can hold
+        the labels. If no sources are found then `None` is returned.
 
     See Also
     --------
@@ -347,20 +593,50 @@ def detect_sources(data, threshold, npixels, *, connectivity=8, mask=None):
         raise ValueError('npixels must be a positive integer, got '
                          f'"{npixels}"')
 
+    if output is not None and strip_size is None:
+        strip_size = 1024
+
+    if strip_size is not None:
+        if data.ndim != 2:
+            raise ValueError('data must be a 2D array to detect sources '
+                             'in strips')
+        if (strip_size <= 0) or (int(strip_size) != strip_size):
+            raise ValueError('strip_size must be a positive integer, got '
+                             f'"{strip_size}"')
+        strip_size = int(strip_size)
+
+    if output is not None:
+        if output.shape != data.shape:
+            raise ValueError('output must have the same shape as the input '
+                             'image.')
+        if not np.issubdtype(output.dtype, np.integer):
+            raise TypeError('output must have integer type')
+
     if mask is not None:
         if mask.shape != data.shape:
             raise ValueError('mask must have the same shape as the input '
                              'image.')
-        if mask.all():
+        if strip_size is None:
+            all_masked = mask.all()
+        else:
+            all_masked = all(np.all(mask[row:row + strip_size])
+                             for row in range(0, data.shape[0], strip_size))
+        if all_masked:
             raise ValueError('mask must not be True for every pixel. There '
                              'are no unmasked pixels in the image to detect '
                              'sources.')
-        inverse_mask = np.logical_not(mask)
-    else:
-        inverse_mask = None
 
     footprint = _make_binary_structure(data.ndim, connectivity)
 
+    if strip_size is not None:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            return _detect_sources_strips(data, threshold, npixels,
+                                          footprint, mask, strip_size,
+                                          output)
+
+    inverse_mask = None if mask is None else np.logical_not(mask)
+
     with warnings.catch_warnings():
         warnings.simplefilter('ignore', category=RuntimeWarning)
         return _detect_sources(data, (threshold,), npixels, footprint,
@@ -77,6 +77,14 @@ class SourceFinder:
         ``'linear'`` for sources with non-positive minimum data values.
         This keyword is ignored unless ``deblend=True``.
 
+    method : {'multithreshold', 'maxtree'}, optional
+        The method used to find the sources at the multi-thresholding
+        levels during deblending. The ``'maxtree'`` method gives the
+        same results as the ``'multithreshold'`` method (default),
+        but it is faster for large ``nlevels`` values. See
+        `~photutils.segmentation.deblend_sources` for details. This
+        keyword is ignored unless ``deblend=True``.
+
     relabel : bool, optional
         If `True` (default), then the segmentation image will be
         relabeled after deblending such that the labels are in
@@ -95,6 +103,14 @@ class SourceFinder:
         larger gains as the number of sources increase. This keyword is
         ignored unless ``deblend=True``.
 
+    executor : `multiprocessing.pool.Pool`, \
+            `concurrent.futures.Executor`, or `None`, optional
+        A long-lived process pool or executor in which to deblend
+        the sources. Reusing the same executor when the finder is
+        called for many images avoids the cost of starting new
+        processes. See `~photutils.segmentation.deblend_sources` for
+        details. This keyword is ignored unless ``deblend=True``.
+
     progress_bar : bool, optional
         Whether to display a progress bar. Note that if multiprocessing
         is used (``nproc > 1``), the estimation times (e.g., time per
@@ -152,16 +168,18 @@ class SourceFinder:
     """
 
     def __init__(self, npixels, *, connectivity=8, deblend=True, nlevels=32,
-                 contrast=0.001, mode='exponential', relabel=True, nproc=1,
-                 progress_bar=True):
+                 contrast=0.001, mode='exponential', method='multithreshold',
+                 relabel=True, nproc=1, executor=None, progress_bar=True):
         self.npixels = as_pair('npixels', npixels, check_odd=False)
         self.deblend = deblend
         self.connectivity = connectivity
         self.nlevels = nlevels
         self.contrast = contrast
         self.mode = mode
+        self.method = method
         self.relabel = relabel
         self.nproc = nproc
+        self.executor = executor
         self.progress_bar = progress_bar
 
     def __call__(self, data, threshold, mask=None):
@@ -205,9 +223,11 @@ class SourceFinder:
                                           nlevels=self.nlevels,
                                           contrast=self.contrast,
                                           mode=self.mode,
+                                          method=self.method,
                                           connectivity=self.connectivity,
                                           relabel=self.relabel,
                                           nproc=self.nproc,
+                                          executor=self.executor,
                                           progress_bar=self.progress_bar)
 
         return segment_img
@@ -10,6 +10,7 @@ import numpy as np
 import pytest
 from astropy.convolution import convolve
 from astropy.coordinates import SkyCoord
+from astropy.io import fits
 from astropy.modeling.models import Gaussian2D
 from astropy.table import QTable
 from numpy.testing import assert_allclose, assert_equal
@@ -19,11 +20,12 @@ from photutils.aperture import (BoundingBox, CircularAperture,
 from photutils.background import Background2D, MedianBackground
 from photutils.datasets import (make_100gaussians_image, make_gwcs,
                                 make_noise_image, make_wcs)
-from photutils.segmentation.catalog import SourceCatalog
+from photutils.segmentation.catalog import DEFAULT_COLUMNS, SourceCatalog
 from photutils.segmentation.core import SegmentationImage
 from photutils.segmentation.detect import detect_sources
 from photutils.segmentation.finder import SourceFinder
 from photutils.segmentation.utils import make_2dgaussian_kernel
+from photutils.utils._moments import _moments, _moments_central
 from photutils.utils._optional_deps import (HAS_GWCS, HAS_MATPLOTLIB,
                                             HAS_SCIPY, HAS_SKIMAGE)
 from photutils.utils.cutouts import CutoutImage
@@ -929,3 +931,168 @@ def test_centroid_win_migrate():
     indices = (0, 3, 14, 30)
     for idx in indices:
         assert_equal(cat.centroid_win[idx], cat.centroid[idx])
+
+
+@pytest.mark.skipif(not HAS_SCIPY, reason='scipy is required')
+def test_lazy_background():
+    data = make_100gaussians_image()
+    bkg = Background2D(data, (50, 50), filter_size=(3, 3))
+    data = data - bkg.background_median
+    segm = detect_sources(data, 3.0 * bkg.background_rms_median, npixels=10)
+
+    bkg2 = Background2D(make_100gaussians_image(), (50, 50),
+                        filter_size=(3, 3))
+    cat1 = SourceCatalog(data, segm, background=bkg.background)
+    cat2 = SourceCatalog(data, segm, background=bkg2.lazy_background)
+    props = ('background_mean', 'background_sum', 'background_centroid')
+    for prop in props:
+        assert_allclose(getattr(cat2, prop), getattr(cat1, prop))
+    assert_allclose(cat2.background[0], cat1.background[0])
+    assert 'background' not in bkg2.__dict__
+
+    bkg3 = Background2D(make_100gaussians_image() << u.Jy, (50, 50),
+                        filter_size=(3, 3))
+    cat3 = SourceCatalog(data << u.Jy, segm,
+                         background=bkg3.lazy_background)
+    assert_allclose(cat3.background_mean, cat1.background_mean * u.Jy)
+
+
+@pytest.mark.skipif(not HAS_SCIPY, reason='scipy is required')
+def test_pixel_properties():
+    """
+    Test the properties computed from the pixels within the source
+    segments against those computed from the source cutouts.
+    """
+    data = make_100gaussians_image()
+    segm = detect_sources(data, 12.0, npixels=5)
+    data = np.round(data)  # repeated min/max values
+    data[::7, ::5] = np.nan
+    mask = np.zeros(data.shape, dtype=bool)
+    mask[50:100, 100:300] = True
+    mask[segm.data == segm.labels[4]] = True  # completely masked
+    error = np.sqrt(np.abs(data))
+    kernel = make_2dgaussian_kernel(3.0, size=5)
+    convolved_data = convolve(data, kernel)
+    cat = SourceCatalog(data, segm, convolved_data=convolved_data,
+                        error=error, background=error, mask=mask)
+
+    moments = [_moments(arr, order=3) for arr in cat._moment_data_cutouts]
+    assert_allclose(cat.moments, moments)
+    moments_central = [_moments_central(arr, center=center, order=3)
+                       for arr, center in zip(cat._moment_data_cutouts,
+                                              cat.cutout_centroid)]
+    assert_allclose(cat.moments_central, moments_central, atol=1e-8)
+
+    data_ma = cat.data_ma
+    error_ma = cat.error_ma
+    props = ('area', 'segment_flux', 'segment_fluxerr', 'background_sum',
+             'background_mean', 'min_value', 'max_value', 'gini')
+    for i, arr in enumerate(data_ma):
+        values = arr.compressed()
+        if len(values) == 0:
+            for prop in props:
+                assert np.isnan(getattr(cat, prop)[i])
+            assert np.all(np.isnan(cat.cutout_minval_index[i]))
+            continue
+
+        assert_equal(cat.area[i].value, len(values))
+        assert_allclose(cat.segment_flux[i], np.sum(values))
+        assert_allclose(cat.segment_fluxerr[i],
+                        np.sqrt(np.sum(error_ma[i].compressed()**2)))
+        assert_allclose(cat.background_mean[i],
+                        np.mean(error_ma[i].compressed()))
+        assert_equal(cat.min_value[i], np.min(values))
+        assert_equal(cat.max_value[i], np.max(values))
+        assert_equal(cat.cutout_minval_index[i],
+                     np.unravel_index(np.argmin(arr), arr.shape))
+        assert_equal(cat.cutout_maxval_index[i],
+                     np.unravel_index(np.argmax(arr), arr.shape))
+
+        npix = len(values)
+        kernel = ((2.0 * np.arange(1, npix + 1) - npix - 1)
+                  * np.abs(np.sort(values)))
+        gini = np.sum(kernel) / (np.abs(np.mean(values)) * npix * (npix - 1))
+        assert_allclose(cat.gini[i], gini)
+
+    assert np.all(np.isnan(cat.cutout_maxval_index[4]))
+    assert_equal(cat.segment_area.value, segm.areas)
+    assert_equal(cat.bbox_xmax, [bbox.ixmax - 1 for bbox in segm.bbox])
+
+    # the pixel properties are recomputed for the sliced sources
+    props += ('moments', 'moments_central', 'minval_index',
+              'maxval_index')
+    cat2 = cat[[2, 4, 9]]
+    for prop in props:
+        assert_equal(getattr(cat2, prop), getattr(cat, prop)[[2, 4, 9]])
+    obj = cat[9]
+    for prop in props:
+        assert_equal(getattr(obj, prop), getattr(cat, prop)[9])
+
+
+@pytest.mark.skipif(not HAS_SCIPY, reason='scipy is required')
+def test_out_of_core(tmp_path):
+    """
+    Test memory-mapped and FITS image section inputs.
+    """
+    data = make_100gaussians_image() - 5.0
+    data[10:13, 20:25] = np.nan
+    error = np.sqrt(np.abs(data))
+    background = np.full(data.shape, 5.0)
+    mask = np.zeros(data.shape, dtype=bool)
+    mask[150:200, 300:350] = True
+    segm = detect_sources(data, 5.0, npixels=10)
+
+    filename = tmp_path / 'segm.dat'
+    segm_mmap = np.memmap(filename, dtype=np.int32, mode='w+',
+                          shape=data.shape)
+    segm2 = detect_sources(data, 5.0, npixels=10, output=segm_mmap)
+    assert segm2.data is segm_mmap
+
+    arrays = {}
+    for name, array in (('data', data), ('error', error),
+                        ('background', background), ('mask', mask)):
+        filename = tmp_path / f'{name}.dat'
+        arrays[name] = np.memmap(filename, dtype=array.dtype, mode='w+',
+                                 shape=array.shape)
+        arrays[name][:] = array
+    filename = tmp_path / 'data.fits'
+    fits.HDUList([fits.PrimaryHDU(data), fits.ImageHDU(error),
+                  fits.ImageHDU(background)]).writeto(filename)
+
+    columns = DEFAULT_COLUMNS + ['background_centroid', 'gini',
+                                 'perimeter', 'centroid_quad',
+                                 'maxval_index']
+    kwargs = {'localbkg_width': 5, 'progress_bar': False}
+    cat1 = SourceCatalog(data, segm, error=error, background=background,
+                         mask=mask, **kwargs)
+    tbl1 = cat1.to_table(columns)
+    flux1 = cat1.circular_photometry(5.0)
+
+    with fits.open(filename) as hdulist:
+        sections = [hdu.section for hdu in hdulist]
+        # a segmentation image from detect_sources or directly from a
+        # memory-mapped array (whose labels are found in blocks)
+        for data2, error2, background2, segm3 in (
+                (arrays['data'], arrays['error'], arrays['background'],
+                 segm2),
+                (*sections, SegmentationImage(segm_mmap))):
+            cat2 = SourceCatalog(data2, segm3, error=error2,
+                                 background=background2,
+                                 mask=arrays['mask'], **kwargs)
+            tbl2 = cat2.to_table(columns)
+            for column in columns:
+                if column == 'sky_centroid':
+                    continue
+                assert_equal(tbl2[column], tbl1[column])
+            assert_equal(cat2.circular_photometry(5.0), flux1)
+            assert_equal(cat2[3].data, cat1[3].data)
+
+            cutouts = cat2.make_cutouts((11, 11))
+            assert_equal(cutouts[3].data, cat1.make_cutouts((11, 11))[3].data)
+
+            # the segmentation arrays are compared in blocks
+            cat3 = SourceCatalog(data2, segm, error=error2,
+                                 background=background2,
+                                 mask=arrays['mask'], detection_cat=cat2,
+                                 **kwargs)
+            assert_equal(cat3.kron_flux, cat1.kron_flux)
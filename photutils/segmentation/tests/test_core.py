@@ -81,6 +81,37 @@ class TestSegmentationImage:
         with pytest.raises(TypeError):
             SegmentationImage(data)
 
+    @pytest.mark.parametrize('block_size', [1, 7, 2**20])
+    def test_memmap(self, tmp_path, monkeypatch, block_size):
+        monkeypatch.setattr('photutils.segmentation.core._LABEL_BLOCK_SIZE',
+                            block_size)
+        rng = np.random.default_rng(0)
+        data = rng.integers(0, 30, size=(40, 35)) * (rng.random((40, 35))
+                                                     > 0.8)
+        data[data == 10] = 0  # a missing label
+        filename = tmp_path / 'segm.dat'
+        memmap = np.memmap(filename, dtype=np.int32, mode='w+',
+                           shape=data.shape)
+        memmap[:] = data
+
+        segm = SegmentationImage(memmap)
+        segm2 = SegmentationImage(data.astype(np.int32))
+        assert 'labels' in segm.__dict__
+        assert '_raw_slices' in segm.__dict__
+        assert segm.labels.dtype == segm2.labels.dtype
+        assert_equal(segm.labels, segm2.labels)
+        assert segm._raw_slices == segm2._raw_slices
+        assert_equal(segm.areas, segm2.areas)
+
+        memmap[:] = 0
+        segm = SegmentationImage(memmap)
+        assert segm.nlabels == 0
+        assert segm._raw_slices == []
+
+        memmap[-1, -1] = -1
+        with pytest.raises(ValueError):
+            SegmentationImage(memmap)
+
     @pytest.mark.parametrize('label', [0, -1, 2])
     def test_invalid_label(self, label):
         # test with scalar labels
@@ -306,6 +337,81 @@ class TestSegmentationImage:
         segm.remove_labels(labels=[5, 3], relabel=True)
         assert_allclose(segm.data, ref_data)
 
+    def test_relabel_dtype(self):
+        """
+        Test that relabeling keeps the data type of the segmentation
+        array, promoting it only if necessary.
+        """
+        segm = SegmentationImage(self.data.astype(np.uint8))
+        segm.remove_labels(labels=[5, 3], relabel=True)
+        assert segm.data.dtype == np.uint8
+        segm.reassign_label(1, 1000)
+        assert segm.data.dtype == np.uint16
+        assert segm.max_label == 1000
+        assert isinstance(segm.max_label, int)
+
+        segm = SegmentationImage(self.data.copy())
+        segm.relabel_consecutive(start_label=1000)
+        assert segm.data.dtype == self.data.dtype
+
+    def test_relabel_inplace(self):
+        ref_data = np.array([[1, 1, 0, 0, 2, 2],
+                             [0, 0, 0, 0, 0, 2],
+                             [0, 0, 0, 0, 0, 0],
+                             [3, 0, 0, 0, 0, 0],
+                             [3, 3, 0, 0, 0, 0],
+                             [3, 3, 0, 0, 0, 0]])
+        data = self.data.astype(np.uint8)
+        segm = SegmentationImage(data)
+        segm.remove_labels(labels=[5, 3], relabel=True, inplace=True)
+        assert segm.data is data
+        assert_equal(data, ref_data)
+        assert_equal(segm.labels, [1, 2, 3])
+
+        segm.relabel_consecutive(start_label=5, inplace=True)
+        assert segm.data is data
+        assert_equal(segm.labels, [5, 6, 7])
+
+        segm.keep_labels(6, inplace=True)
+        assert segm.data is data
+        assert_equal(segm.labels, [6])
+        assert segm.areas[0] == 3
+
+        with pytest.raises(ValueError):
+            segm.reassign_label(6, 1000, inplace=True)
+
+    @pytest.mark.parametrize('inplace', [False, True])
+    @pytest.mark.parametrize('scale', [1, 100])
+    def test_relabel_cached_properties(self, inplace, scale):
+        """
+        Test that the cached labels, slices, and areas are updated
+        when relabeling.
+
+        For ``scale=100``, only the slices of the changed labels are
+        relabeled.
+        """
+        def check_cached(segm):
+            assert {'labels', '_raw_slices', 'areas'} <= set(segm.__dict__)
+            ref = SegmentationImage(segm.data.copy())
+            assert_equal(segm.labels, ref.labels)
+            assert segm.slices == ref.slices
+            assert segm._raw_slices == ref._raw_slices
+            assert_equal(segm.areas, ref.areas)
+
+        data = np.kron(self.data, np.ones((scale, scale), dtype=int))
+        segm = SegmentationImage(data)
+        _ = segm.areas
+        segm.reassign_labels([1, 7], new_label=5, inplace=inplace)
+        check_cached(segm)
+        segm.reassign_label(3, new_label=9, inplace=inplace)
+        check_cached(segm)
+        segm.remove_label(9, inplace=inplace)
+        check_cached(segm)
+        segm.relabel_consecutive(inplace=inplace)
+        check_cached(segm)
+        segm.keep_labels(2, relabel=True, inplace=inplace)
+        check_cached(segm)
+
     def test_remove_border_labels(self):
         ref_data = np.array([[0, 0, 0, 0, 0, 0],
                              [0, 0, 0, 0, 0, 0],
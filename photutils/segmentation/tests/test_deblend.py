@@ -3,6 +3,9 @@
 Tests for the deblend module.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
 import numpy as np
 import pytest
 from astropy.modeling.models import Gaussian2D
@@ -10,7 +13,8 @@ from astropy.utils.exceptions import AstropyUserWarning
 from numpy.testing import assert_allclose, assert_equal
 
 from photutils.segmentation.core import SegmentationImage
-from photutils.segmentation.deblend import deblend_sources
+from photutils.segmentation.deblend import (_local_peak_values, _make_chunks,
+                                            deblend_sources)
 from photutils.segmentation.detect import detect_sources
 from photutils.utils._optional_deps import HAS_SCIPY, HAS_SKIMAGE
 
@@ -51,6 +55,96 @@ class TestDeblendSources:
         assert_allclose(np.sum(self.data[mask1]), np.sum(self.data[mask2]))
         assert_allclose(np.nonzero(self.segm), np.nonzero(result))
 
+    @pytest.mark.parametrize('executor_type', ['pool', 'futures'])
+    def test_deblend_sources_executor(self, executor_type):
+        data = self.data3 + np.roll(self.data, 20, axis=0)
+        segm = detect_sources(data, self.threshold, self.npixels)
+        result = deblend_sources(data, segm, self.npixels,
+                                 progress_bar=False)
+
+        if executor_type == 'pool':
+            context = get_context('spawn').Pool(processes=2)
+        else:
+            context = ProcessPoolExecutor(max_workers=2,
+                                          mp_context=get_context('spawn'))
+        with context as executor:
+            for nproc in (1, 4):
+                result2 = deblend_sources(data, segm, self.npixels,
+                                          progress_bar=False, nproc=nproc,
+                                          executor=executor)
+                assert_equal(result.data, result2.data)
+
+    def test_make_chunks(self):
+        areas = np.array([5, 100, 10, 40, 30, 20])
+        chunks = _make_chunks(areas, 2)
+        assert_equal(np.concatenate(chunks), [1, 3, 4, 5, 2, 0])
+        assert_equal(chunks[0], [1])
+        assert len(chunks) == 2
+
+    @pytest.mark.parametrize('mode', ['exponential', 'linear', 'sinh'])
+    @pytest.mark.parametrize('connectivity', [4, 8])
+    @pytest.mark.parametrize('nlevels', [4, 32, 128])
+    def test_deblend_method(self, mode, connectivity, nlevels):
+        """
+        Test that the max-tree method gives the same result as the
+        multi-threshold method.
+        """
+        rng = np.random.default_rng(0)
+        data = self.data3 + np.roll(self.data, 20, axis=0)
+        data += rng.normal(0, 2, data.shape)
+        data[50, 50] = np.nan
+        segm = detect_sources(data, self.threshold, self.npixels,
+                              connectivity=connectivity)
+        for contrast in (0.0, 0.001, 0.1):
+            kwargs = {'nlevels': nlevels, 'contrast': contrast,
+                      'mode': mode, 'connectivity': connectivity,
+                      'progress_bar': False}
+            result1 = deblend_sources(data, segm, self.npixels, **kwargs)
+            result2 = deblend_sources(data, segm, self.npixels,
+                                      method='maxtree', **kwargs)
+            assert result1.nlabels > segm.nlabels
+            assert_equal(result1.data, result2.data)
+
+    def test_deblend_skipped(self):
+        """
+        Test that sources with a single local maximum are skipped.
+        """
+        g4 = Gaussian2D(100, 80, 80, 5, 5)
+        data = self.data + g4(self.x, self.y)
+        segm = detect_sources(data, self.threshold, self.npixels)
+        assert segm.nlabels == 2
+        result = deblend_sources(data, segm, self.npixels,
+                                 progress_bar=False)
+        assert result.nlabels == 3
+        assert result.info['nskipped'] == 1
+        assert 'warnings' not in result.info
+
+        label = segm.data[80, 80]
+        result = deblend_sources(data, segm, self.npixels, labels=label,
+                                 progress_bar=False)
+        assert_equal(result.data, segm.data)
+        assert result.info['nskipped'] == 1
+
+    def test_local_peak_values(self):
+        data = np.zeros((5, 7))
+        data[2, 1] = 3.0
+        data[2, 5] = 2.0
+        data[0, 3] = np.nan
+        segment_mask = data != 0
+        footprint = np.ones((3, 3), dtype=bool)
+        values = _local_peak_values(data, segment_mask, footprint)
+        assert_equal(np.sort(values), [2.0, 3.0])
+
+        # the neighboring pixels outside of the segment are excluded
+        data[2, 0] = 4.0
+        values = _local_peak_values(data, data == 3.0, footprint)
+        assert_equal(values, [3.0])
+
+        # plateaus have multiple local maxima
+        values = _local_peak_values(np.ones((2, 2)),
+                                    np.ones((2, 2), dtype=bool), footprint)
+        assert values.size == 4
+
     def test_deblend_multiple_sources(self):
         g4 = Gaussian2D(100, 50, 15, 5, 5)
         g5 = Gaussian2D(100, 35, 15, 5, 5)
@@ -195,6 +289,19 @@ class TestDeblendSources:
         assert len(result.slices) == result.nlabels
         assert_allclose(np.nonzero(self.segm), np.nonzero(result))
 
+    def test_deblend_sources_dtype(self):
+        """
+        Test that the deblended segmentation array is promoted to hold
+        the new labels.
+        """
+        segm = self.segm.copy()
+        assert segm.data.dtype == np.uint8
+        segm.reassign_label(1, 255)
+        result = deblend_sources(self.data, segm, self.npixels,
+                                 relabel=False, progress_bar=False)
+        assert result.data.dtype == np.uint16
+        assert_equal(result.labels, [256, 257])
+
     @pytest.mark.parametrize('mode', ['exponential', 'linear'])
     def test_deblend_three_sources(self, mode):
         result = deblend_sources(self.data3, self.segm3, self.npixels,
@@ -228,6 +335,11 @@ class TestDeblendSources:
             deblend_sources(self.data, self.segm, self.npixels,
                             mode='invalid', progress_bar=False)
 
+    def test_invalid_method(self):
+        with pytest.raises(ValueError):
+            deblend_sources(self.data, self.segm, self.npixels,
+                            method='invalid', progress_bar=False)
+
     def test_invalid_connectivity(self):
         with pytest.raises(ValueError):
             deblend_sources(self.data, self.segm, self.npixels,
@@ -347,3 +459,9 @@ def test_nmarkers_fallback():
         assert segm2.info['warnings']['nmarkers']['input_labels'][0] == 1
         mesg = segm2.info['warnings']['nmarkers']['message']
         assert mesg.startswith('Deblending mode changed')
+
+    with pytest.warns(AstropyUserWarning, match='The deblending mode'):
+        segm3 = deblend_sources(data, segm, 1, mode='exponential',
+                                method='maxtree')
+        assert segm3.info['warnings']['nmarkers']['input_labels'][0] == 1
+        assert_equal(segm2.data, segm3.data)
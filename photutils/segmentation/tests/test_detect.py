@@ -3,6 +3,8 @@
 Tests for the detect module.
 """
 
+import tracemalloc
+
 import astropy.units as u
 import numpy as np
 import pytest
@@ -122,6 +124,19 @@ class TestDetectThreshold:
         with pytest.raises(TypeError):
             detect_threshold(DATA, 1.0, sigma_clip=10)
 
+    def test_dtype(self):
+        data = DATA.astype(np.float32)
+        threshold = detect_threshold(data, nsigma=2.0, background=10.0,
+                                     error=1.0)
+        assert threshold.dtype == np.float64
+        threshold = detect_threshold(data, nsigma=2.0, background=10.0,
+                                     error=1.0, dtype=np.float32)
+        assert threshold.dtype == np.float32
+        assert_allclose(threshold, 12.0)
+
+        with pytest.raises(ValueError, match='must be a floating-point'):
+            detect_threshold(data, nsigma=2.0, dtype=int)
+
 
 @pytest.mark.skipif(not HAS_SCIPY, reason='scipy is required')
 class TestDetectSources:
@@ -149,6 +164,23 @@ class TestDetectSources:
         with pytest.raises(ValueError):
             detect_sources(self.data << u.uJy, threshold=0.9 * u.m, npixels=2)
 
+    def test_dtype(self):
+        """
+        Test that the segmentation array has the smallest unsigned
+        integer data type that holds the labels.
+        """
+        segm = detect_sources(self.data, threshold=0.9, npixels=2)
+        assert segm.data.dtype == np.uint8
+        segm = detect_sources(self.data, threshold=0.9, npixels=2,
+                              strip_size=1)
+        assert segm.data.dtype == np.uint8
+
+        data = np.zeros((3, 600))
+        data[1, ::2] = 1.0
+        segm = detect_sources(data, threshold=0.9, npixels=1)
+        assert segm.data.dtype == np.uint16
+        assert segm.nlabels == 300
+
     def test_small_sources(self):
         """Test detection where sources are smaller than npixels size."""
         with pytest.warns(NoDetectionsWarning, match='No sources were found'):
@@ -241,3 +273,82 @@ class TestDetectSources:
     def test_mask_shape(self):
         with pytest.raises(ValueError):
             detect_sources(self.data, 1.0, 1.0, mask=np.ones((5, 5)))
+
+    @pytest.mark.parametrize('connectivity', [4, 8])
+    @pytest.mark.parametrize('npixels', [1, 3, 10])
+    @pytest.mark.parametrize('strip_size', [1, 2, 7, 100])
+    def test_strip_size(self, connectivity, npixels, strip_size):
+        rng = np.random.default_rng(0)
+        data = rng.normal(size=(51, 40))
+        threshold = np.full(data.shape, 0.5)
+        mask = rng.random(data.shape) < 0.05
+        segm1 = detect_sources(data, threshold, npixels,
+                               connectivity=connectivity, mask=mask)
+        segm2 = detect_sources(data, threshold, npixels,
+                               connectivity=connectivity, mask=mask,
+                               strip_size=strip_size)
+        assert_array_equal(segm2.data, segm1.data)
+        assert_array_equal(segm2.labels, segm1.labels)
+        assert segm2.slices == segm1.slices
+        assert_array_equal(segm2.areas, segm1.areas)
+
+    def test_strip_size_npixels(self):
+        """
+        Test the npixels cut of sources that are split across strips.
+        """
+        data = np.zeros((8, 8))
+        data[0:4, 0] = 1
+        data[0, 0:4] = 1
+        data[3, 2:] = 2
+        data[3:, 2] = 2
+        data[5:, 3] = 2
+        for strip_size in (1, 2, 3):
+            segm = detect_sources(data, 0, npixels=13, strip_size=strip_size)
+            assert segm.nlabels == 1
+            assert segm.areas[0] == 13
+            with pytest.warns(NoDetectionsWarning,
+                              match='No sources were found'):
+                detect_sources(data, 0, npixels=14, strip_size=strip_size)
+
+        segm = detect_sources(self.data << u.uJy, threshold=0.9 * u.uJy,
+                              npixels=2, strip_size=1)
+        assert_array_equal(segm.data, self.refdata)
+
+    def test_strip_size_memory(self):
+        """
+        Test that labeling in strips without an output array does not
+        create a full-sized temporary array of provisional labels.
+        """
+        rng = np.random.default_rng(0)
+        data = rng.normal(size=(1000, 1000))
+        tracemalloc.start()
+        try:
+            segm = detect_sources(data, 2.5, 3, strip_size=50)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert segm.data.dtype == np.uint8
+        assert peak < segm.data.nbytes + 4 * data.size
+
+    def test_output(self):
+        rng = np.random.default_rng(0)
+        data = rng.normal(size=(51, 40))
+        segm1 = detect_sources(data, 0.5, 3)
+        output = np.zeros(data.shape, dtype=np.uint16)
+        segm2 = detect_sources(data, 0.5, 3, output=output)
+        assert segm2.data is output
+        assert_array_equal(output, segm1.data)
+
+        with pytest.raises(ValueError):
+            detect_sources(data, 0.5, 3, output=np.zeros((5, 5), dtype=int))
+        with pytest.raises(TypeError):
+            detect_sources(data, 0.5, 3, output=np.zeros(data.shape))
+        with pytest.raises(ValueError):
+            data = rng.normal(size=(100, 100))
+            output = np.zeros(data.shape, dtype=np.uint8)
+            detect_sources(data, 0.5, 3, output=output)
+        with pytest.raises(ValueError):
+            detect_sources(data, 0.5, 3, strip_size=0)
+        with pytest.raises(ValueError):
+            mask = np.ones(data.shape, dtype=bool)
+            detect_sources(data, 0.5, 3, mask=mask, strip_size=10)
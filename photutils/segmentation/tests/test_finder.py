@@ -8,6 +8,7 @@ import numpy as np
 import pytest
 from astropy.convolution import convolve
 from astropy.modeling.models import Gaussian2D
+from numpy.testing import assert_equal
 
 from photutils.datasets import make_100gaussians_image
 from photutils.segmentation.finder import SourceFinder
@@ -34,6 +35,15 @@ class TestSourceFinder:
         assert segm2.nlabels == 94
         assert np.all(segm1.data == segm2.data)
 
+    @pytest.mark.skipif(not HAS_SKIMAGE, reason='skimage is required')
+    def test_deblend_method(self):
+        finder = SourceFinder(npixels=self.npixels, progress_bar=False)
+        segm1 = finder(self.convolved_data, self.threshold)
+        finder = SourceFinder(npixels=self.npixels, method='maxtree',
+                              progress_bar=False)
+        segm2 = finder(self.convolved_data, self.threshold)
+        assert_equal(segm1.data, segm2.data)
+
     def test_invalid_units(self):
         finder = SourceFinder(npixels=self.npixels, progress_bar=False)
         with pytest.raises(ValueError):
@@ -0,0 +1,70 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+Tests for the _maxtree module.
+"""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_equal
+
+from photutils.segmentation._maxtree import max_tree
+from photutils.utils._optional_deps import HAS_SCIPY
+
+
+@pytest.mark.skipif(not HAS_SCIPY, reason='scipy is required')
+@pytest.mark.parametrize('connectivity', [4, 8])
+def test_max_tree(connectivity):
+    from scipy.ndimage import label
+
+    from photutils.segmentation.utils import _make_binary_structure
+
+    footprint = _make_binary_structure(2, connectivity)
+    rng = np.random.default_rng(0)
+    for shape in [(1, 1), (1, 7), (2, 2), (9, 1), (8, 11)]:
+        image = rng.integers(0, 5, shape)
+        parent, traverser, area = max_tree(image, footprint)
+        values = image.ravel()
+        pixels = np.arange(values.size)
+        assert_equal(np.sort(traverser), pixels)
+        assert np.all(np.diff(values[traverser]) >= 0)
+
+        root = traverser[0]
+        assert parent[root] == root
+        assert area[root] == values.size
+
+        canonical = (values[parent] != values) | (parent == pixels)
+        for pixel in pixels:
+            if not canonical[pixel]:
+                assert values[parent[pixel]] == values[pixel]
+                assert canonical[parent[pixel]]
+                continue
+
+            # the node is the connected component of the pixels with
+            # values above or equal to the node value
+            segm, _ = label(image >= values[pixel], structure=footprint)
+            segm = segm.ravel()
+            component = segm == segm[pixel]
+            assert area[pixel] == np.count_nonzero(component)
+            node_pixels = component & (values == values[pixel])
+            assert_equal(parent[node_pixels & ~canonical], pixel)
+            if pixel != root:
+                assert values[parent[pixel]] < values[pixel]
+                assert canonical[parent[pixel]]
+
+
+def test_max_tree_plateau():
+    image = np.array([[0, 2, 2, 0, 1],
+                      [0, 0, 0, 0, 1]])
+    footprint = np.ones((3, 3), dtype=bool)
+    parent, traverser, area = max_tree(image, footprint)
+    root = traverser[0]
+    assert area[root] == image.size
+
+    # each plateau is a single node
+    for pixels in ([1, 2], [4, 9]):
+        pixels = np.array(pixels)
+        canonical = parent[pixels] == root
+        assert np.count_nonzero(canonical) == 1
+        node = pixels[canonical][0]
+        assert parent[pixels[~canonical][0]] == node
+        assert area[node] == 2
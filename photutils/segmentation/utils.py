@@ -103,6 +103,29 @@ def _make_binary_structure(ndim, connectivity):
     return footprint
 
 
+def _get_label_dtype(max_label):
+    """
+    Return the smallest integer data type that can hold the labels of a
+    segmentation image.
+
+    Parameters
+    ----------
+    max_label : int
+        The maximum label number.
+
+    Returns
+    -------
+    dtype : `numpy.dtype`
+        The smallest unsigned integer data type (``uint8``, ``uint16``,
+        or ``uint32``) that can hold ``max_label``. If ``max_label``
+        does not fit in ``uint32``, then ``int64`` is returned.
+    """
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if max_label <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
 def _mask_to_mirrored_value(data, replace_mask, xycenter, mask=None):
     """
     Replace masked pixels with the value of the pixel mirrored across a
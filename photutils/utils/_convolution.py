@@ -10,9 +10,147 @@ from astropy.convolution import Kernel2D
 from astropy.units import Quantity
 from astropy.utils.exceptions import AstropyUserWarning
 
+# the numpy.pad modes that correspond to the scipy.ndimage modes
+_PAD_MODES = {'constant': 'constant', 'reflect': 'symmetric',
+              'nearest': 'edge', 'mirror': 'reflect', 'wrap': 'wrap'}
+
+# the maximum number of nonzero kernel elements for which the 'auto'
+# method uses a direct convolution and the minimum number of nonzero
+# kernel elements of a non-separable kernel for which it uses an FFT
+# convolution (scipy.ndimage.convolve skips zero kernel elements)
+_AUTO_DIRECT_MAX_SIZE = 25
+_AUTO_FFT_MIN_SIZE = 121
+
+
+def _separate_kernel(kernel, rtol=1.0e-7):
+    """
+    Separate a rank-1 2D kernel into its 1D column and row kernels.
+
+    Parameters
+    ----------
+    kernel : 2D `~numpy.ndarray`
+        The 2D kernel array.
+
+    rtol : float, optional
+        The maximum ratio of the second to the first singular value of
+        the kernel for it to be considered separable.
+
+    Returns
+    -------
+    result : tuple of 2 1D `~numpy.ndarray` or `None`
+        The ``(column, row)`` kernels, whose outer product is the input
+        ``kernel``. `None` is returned if the kernel is not separable.
+    """
+    if kernel.ndim != 2 or not np.all(np.isfinite(kernel)):
+        return None
+
+    ucol, svals, vrow = np.linalg.svd(kernel)
+    if svals[0] == 0 or (svals.size > 1 and svals[1] > rtol * svals[0]):
+        return None
+
+    column = ucol[:, 0] * svals[0]
+    row = vrow[0]
+    if not np.allclose(np.outer(column, row), kernel, rtol=rtol,
+                       atol=rtol * np.max(np.abs(kernel))):
+        return None
+
+    return column, row
+
+
+def _select_method(data, kernel_array):
+    """
+    Select the convolution method for the ``'auto'`` method.
+
+    Small kernels are convolved directly, separable kernels with two
+    1D convolutions, and large non-separable kernels with an FFT
+    (unless the data contain non-finite values). If ``data`` is `None`,
+    the data are assumed to be finite.
+    """
+    nonzero = np.count_nonzero(kernel_array)
+    if nonzero <= _AUTO_DIRECT_MAX_SIZE:
+        return 'direct', None
+
+    separated = _separate_kernel(kernel_array)
+    if separated is not None:
+        return 'separable', separated
+
+    if (nonzero >= _AUTO_FFT_MIN_SIZE
+            and (data is None or np.all(np.isfinite(data)))):
+        return 'fft', None
+
+    return 'direct', None
+
+
+def _pad_data(data, kernel_shape, mode, fill_value):
+    """
+    Pad the data for a convolution with a kernel of the given shape.
+
+    The padding replicates the ``scipy.ndimage`` boundary ``mode``
+    such that the "valid" convolution of the padded data is identical
+    to the ``scipy.ndimage.convolve`` result (including its kernel
+    origin for even kernel sizes).
+    """
+    # scipy.ndimage places the (flipped) kernel origin at
+    # (size - 1) // 2 for a convolution
+    pad_width = [((size - 1) // 2, size // 2) for size in kernel_shape]
+    kwargs = {}
+    if mode == 'constant':
+        kwargs['constant_values'] = fill_value
+    return np.pad(data, pad_width, mode=_PAD_MODES[mode], **kwargs)
+
+
+def _convolve_fft(data, kernel_array, mode, fill_value):
+    """
+    Convolve a 2D image with a 2D kernel using an overlap-add FFT.
+
+    Non-finite data values are replaced by NaN in the convolved image
+    for all pixels whose kernel footprint includes them (as for a
+    direct convolution).
+    """
+    from scipy.signal import oaconvolve
+
+    padded = _pad_data(data.astype(float), kernel_array.shape, mode,
+                       fill_value)
+
+    nonfinite = ~np.isfinite(padded)
+    if np.any(nonfinite):
+        padded[nonfinite] = 0.0
+        # count the non-finite values within the kernel footprint
+        ones = np.ones(kernel_array.shape)
+        nonfinite = oaconvolve(nonfinite.astype(float), ones,
+                               mode='valid') > 0.5
+    else:
+        nonfinite = None
+
+    result = oaconvolve(padded, kernel_array.astype(float), mode='valid')
+    if nonfinite is not None:
+        result[nonfinite] = np.nan
+
+    return result
+
+
+def _convolve_separable(data, column, row, mode, fill_value):
+    """
+    Convolve a 2D image with a separable 2D kernel using two 1D
+    convolutions.
+    """
+    from scipy import ndimage
+
+    padded = _pad_data(data.astype(float), (column.size, row.size), mode,
+                       fill_value)
+
+    # the padded data includes the boundary values, thus the 1D
+    # convolutions are cropped to the "valid" region
+    ystart = (column.size - 1) // 2
+    xstart = (row.size - 1) // 2
+    result = ndimage.convolve1d(padded, column, axis=0)
+    result = result[ystart:ystart + data.shape[0]]
+    result = ndimage.convolve1d(result, row, axis=1)
+    return result[:, xstart:xstart + data.shape[1]]
+
 
 def _filter_data(data, kernel, mode='constant', fill_value=0.0,
-                 check_normalization=False):
+                 check_normalization=False, dtype=None, method='direct'):
     """
     Convolve a 2D image with a 2D kernel.
 
@@ -42,6 +180,35 @@ def _filter_data(data, kernel, mode='constant', fill_value=0.0,
         If `True` then a warning will be issued if the kernel is not
         normalized to 1.
 
+    dtype : data-type or `None`, optional
+        The floating-point data type of the convolved image. If `None`,
+        the data type of a floating-point ``data`` array is kept and
+        integer ``data`` arrays are converted to float64. Note that the
+        convolution sums are always accumulated in float64.
+
+    method : {'direct', 'fft', 'separable', 'auto'}, optional
+        The convolution method:
+
+            * ``'direct'``: a direct convolution with
+              `scipy.ndimage.convolve`, whose cost is proportional to
+              the number of kernel elements.
+            * ``'fft'``: an overlap-add FFT convolution with
+              `scipy.signal.oaconvolve`, whose cost is nearly
+              independent of the kernel size.
+            * ``'separable'``: two 1D convolutions along the columns and
+              rows, whose cost is proportional to the sum of the kernel
+              dimensions. The kernel must be separable (i.e., of rank
+              1), such as a 2D Gaussian kernel without rotation.
+            * ``'auto'``: a direct convolution for small kernels (up to
+              25 nonzero elements), the separable convolution for
+              separable kernels, and the FFT convolution for large (at
+              least 121 nonzero elements) non-separable kernels if the
+              data have only finite values.
+
+        The results of the methods agree to within floating-point
+        round-off errors. Non-finite data values propagate as NaN
+        in the ``'fft'`` method.
+
     Returns
     -------
     result : `~numpy.ndarray`
@@ -49,6 +216,10 @@ def _filter_data(data, kernel, mode='constant', fill_value=0.0,
     """
     from scipy import ndimage
 
+    methods = ('direct', 'fft', 'separable', 'auto')
+    if method not in methods:
+        raise ValueError(f'method must be one of {methods}')
+
     if kernel is not None:
         if isinstance(kernel, Kernel2D):
             kernel_array = kernel.array
@@ -70,13 +241,37 @@ def _filter_data(data, kernel, mode='constant', fill_value=0.0,
         # NOTE: if data is int and kernel is float, ndimage.convolve
         # will return an int image. If the data dtype is int, we make the
         # data float so that a float image is always returned
-        if np.issubdtype(data.dtype, np.integer):
+        # (ndimage.convolve returns an image with the data dtype)
+        if dtype is not None:
+            data = np.asanyarray(data).astype(dtype, copy=False)
+        elif np.issubdtype(data.dtype, np.integer):
             data = data.astype(float)
 
-        # NOTE: astropy.convolution.convolve fails with zero-sum kernels
-        # (used in findstars) (cf. astropy #1647)
-        result = ndimage.convolve(data, kernel_array, mode=mode,
-                                  cval=fill_value)
+        kernel_array = np.asanyarray(kernel_array)
+        separated = None
+        if np.any(np.array(kernel_array.shape) > data.shape):
+            # numpy.pad does not reproduce the scipy.ndimage boundary
+            # modes for padding larger than the data
+            method = 'direct'
+        elif method == 'auto':
+            method, separated = _select_method(data, kernel_array)
+        elif method == 'separable':
+            separated = _separate_kernel(kernel_array)
+            if separated is None:
+                raise ValueError('The kernel is not separable (i.e., it is '
+                                 'not of rank 1).')
+
+        if method == 'direct':
+            # NOTE: astropy.convolution.convolve fails with zero-sum
+            # kernels (used in findstars) (cf. astropy #1647)
+            result = ndimage.convolve(data, kernel_array, mode=mode,
+                                      cval=fill_value)
+        elif method == 'fft':
+            result = _convolve_fft(data, kernel_array, mode, fill_value)
+        else:
+            result = _convolve_separable(data, *separated, mode,
+                                         fill_value)
+        result = result.astype(data.dtype, copy=False)
 
         # reapply the input unit
         if unit is not None:
@@ -85,3 +280,267 @@ def _filter_data(data, kernel, mode='constant', fill_value=0.0,
         return result
     else:
         return data
+
+
+def _tile_slices(shape, tile_size):
+    """
+    Return the 2D slices of the tiles that cover an array of the given
+    ``shape``.
+
+    The tiles are returned in row-major order. The tiles along the top
+    and right edges may be smaller than ``tile_size``.
+    """
+    return [(slice(y0, min(y0 + tile_size[0], shape[0])),
+             slice(x0, min(x0 + tile_size[1], shape[1])))
+            for y0 in range(0, shape[0], tile_size[0])
+            for x0 in range(0, shape[1], tile_size[1])]
+
+
+def _filter_data_tiled(data, kernel, tile_size, *, fill_value=0.0,
+                       dtype=None, method='direct', executor=None):
+    """
+    Convolve a 2D image with a 2D kernel in tiles.
+
+    Each tile is convolved together with a halo of the neighboring
+    pixels that is larger than the kernel, thus the result is identical
+    to that of `_filter_data` with ``mode='constant'``. The tiles are
+    convolved in the threads of the input ``executor`` (if not `None`).
+
+    Parameters
+    ----------
+    data : 2D `~numpy.ndarray`
+        The 2D array of the image.
+
+    kernel : 2D `~numpy.ndarray`
+        The 2D kernel array.
+
+    tile_size : tuple of 2 int
+        The ``(ny, nx)`` size of the tiles.
+
+    fill_value : scalar, optional
+        Value to fill data values beyond the array borders.
+
+    dtype : data-type or `None`, optional
+        The floating-point data type of the convolved image (see
+        `_filter_data`).
+
+    method : {'direct', 'fft', 'separable', 'auto'}, optional
+        The convolution method (see `_filter_data`).
+
+    executor : `~concurrent.futures.Executor` or `None`, optional
+        The executor used to convolve the tiles.
+
+    Returns
+    -------
+    result : `~numpy.ndarray`
+        The convolved image.
+    """
+    data = np.asanyarray(data)
+    halo = np.array(kernel.shape)
+
+    # the output data type (and unit) is that of the convolved data
+    result = _filter_data(data[:1, :1], kernel, fill_value=fill_value,
+                          dtype=dtype)
+    result = np.empty_like(result, shape=data.shape)
+
+    def filter_tile(slices):
+        # the tile and its halo
+        yx0 = [max(slc.start - size, 0) for slc, size in zip(slices, halo)]
+        yx1 = [min(slc.stop + size, shape)
+               for slc, size, shape in zip(slices, halo, data.shape)]
+        tile = _filter_data(data[yx0[0]:yx1[0], yx0[1]:yx1[1]], kernel,
+                            fill_value=fill_value, dtype=dtype,
+                            method=method)
+        result[slices] = tile[tuple(slice(slc.start - start,
+                                          slc.stop - start)
+                                    for slc, start in zip(slices, yx0))]
+
+    tiles = _tile_slices(data.shape, tile_size)
+    if executor is None:
+        for slices in tiles:
+            filter_tile(slices)
+    else:
+        list(executor.map(filter_tile, tiles))
+
+    return result
+
+
+class _Convolver:
+    """
+    Class to convolve many images of the same shape with the same 2D
+    kernel.
+
+    The kernel is prepared only once (e.g., its FFT for the ``'fft'``
+    method or its 1D factors for the ``'separable'`` method) and the
+    padded and output arrays are reused for each image. The results
+    agree with those of `_filter_data` (to within floating-point
+    round-off errors for the ``'fft'`` method, whose FFT is not computed
+    in overlapping blocks).
+
+    Note that the returned convolved image is overwritten by the next
+    call.
+
+    Parameters
+    ----------
+    kernel : array_like (2D) or `~astropy.convolution.Kernel2D`
+        The 2D kernel.
+
+    shape : tuple of 2 int
+        The shape of the images.
+
+    mode : {'constant', 'reflect', 'nearest', 'mirror', 'wrap'}, optional
+        The ``mode`` determines how the array borders are handled (see
+        `_filter_data`).
+
+    fill_value : scalar, optional
+        Value to fill data values beyond the array borders if ``mode``
+        is ``'constant'``.
+
+    dtype : data-type, optional
+        The floating-point data type of the convolved images.
+
+    method : {'direct', 'fft', 'separable', 'auto'}, optional
+        The convolution method (see `_filter_data`).
+    """
+
+    def __init__(self, kernel, shape, *, mode='constant', fill_value=0.0,
+                 dtype=float, method='direct'):
+        methods = ('direct', 'fft', 'separable', 'auto')
+        if method not in methods:
+            raise ValueError(f'method must be one of {methods}')
+
+        if isinstance(kernel, Kernel2D):
+            kernel = kernel.array
+        self.kernel = np.asanyarray(kernel)
+        self.shape = tuple(shape)
+        self.mode = mode
+        self.fill_value = fill_value
+        self.dtype = np.dtype(dtype)
+
+        separated = None
+        if np.any(np.array(self.kernel.shape) > self.shape):
+            method = 'direct'
+        elif method == 'auto':
+            method, separated = _select_method(None, self.kernel)
+        elif method == 'separable':
+            separated = _separate_kernel(self.kernel)
+            if separated is None:
+                raise ValueError('The kernel is not separable (i.e., it is '
+                                 'not of rank 1).')
+        self.method = method
+        self._separated = separated
+
+        self._output = np.empty(self.shape, dtype=self.dtype)
+        if method == 'direct':
+            return
+
+        # the padded data array (see _pad_data); for the 'constant'
+        # mode only its interior changes between images
+        self._padded = None
+        self._pad_slices = tuple(slice((size - 1) // 2,
+                                       (size - 1) // 2 + data_size)
+                                 for size, data_size in zip(self.kernel.shape,
+                                                            self.shape))
+        if mode == 'constant':
+            self._padded = np.full(np.add(self.shape, self.kernel.shape) - 1,
+                                   fill_value, dtype=float)
+
+        if method == 'fft':
+            from scipy.fft import next_fast_len, rfft2
+
+            padded_shape = np.add(self.shape, self.kernel.shape) - 1
+            self._fft_shape = tuple(next_fast_len(int(size), real=True)
+                                    for size in padded_shape)
+            self._kernel_fft = rfft2(self.kernel.astype(float),
+                                     self._fft_shape)
+
+    def _pad(self, data):
+        """
+        Pad the data as in `_pad_data`, reusing the padded array for the
+        'constant' mode.
+        """
+        if self._padded is None:
+            return _pad_data(data.astype(float), self.kernel.shape, self.mode,
+                             self.fill_value)
+
+        self._padded[self._pad_slices] = data
+        return self._padded
+
+    def _convolve_fft(self, data):
+        from scipy.fft import irfft2, rfft2
+
+        padded = self._pad(data)
+
+        nonfinite = ~np.isfinite(padded)
+        if np.any(nonfinite):
+            # NaN values propagate to the full FFT output, thus handle
+            # them as in _convolve_fft
+            from scipy.signal import oaconvolve
+
+            padded = np.where(nonfinite, 0.0, padded)
+            ones = np.ones(self.kernel.shape)
+            nonfinite = oaconvolve(nonfinite.astype(float), ones,
+                                   mode='valid') > 0.5
+        else:
+            nonfinite = None
+
+        result = irfft2(rfft2(padded, self._fft_shape) * self._kernel_fft,
+                        self._fft_shape)
+        ystart, xstart = np.array(self.kernel.shape) - 1
+        result = result[ystart:ystart + self.shape[0],
+                        xstart:xstart + self.shape[1]]
+        if nonfinite is not None:
+            result[nonfinite] = np.nan
+
+        return result
+
+    def _convolve_separable(self, data):
+        from scipy import ndimage
+
+        column, row = self._separated
+        padded = self._pad(data)
+        ystart, xstart = self._pad_slices[0].start, self._pad_slices[1].start
+        result = ndimage.convolve1d(padded, column, axis=0)
+        result = result[ystart:ystart + self.shape[0]]
+        result = ndimage.convolve1d(result, row, axis=1)
+        return result[:, xstart:xstart + self.shape[1]]
+
+    def __call__(self, data):
+        """
+        Convolve an image.
+
+        Parameters
+        ----------
+        data : 2D `~numpy.ndarray`
+            The 2D image, whose shape must match the input ``shape``.
+
+        Returns
+        -------
+        result : 2D `~numpy.ndarray`
+            The convolved image. This array is overwritten by the next
+            call.
+        """
+        from scipy import ndimage
+
+        unit = None
+        if isinstance(data, Quantity):
+            unit = data.unit
+            data = data.value
+
+        data = np.asanyarray(data)
+        if data.shape != self.shape:
+            raise ValueError(f'data must have a shape of {self.shape}')
+
+        if self.method == 'direct':
+            data = data.astype(self.dtype, copy=False)
+            ndimage.convolve(data, self.kernel, output=self._output,
+                             mode=self.mode, cval=self.fill_value)
+        elif self.method == 'fft':
+            self._output[...] = self._convolve_fft(data)
+        else:
+            self._output[...] = self._convolve_separable(data)
+
+        if unit is not None:
+            return self._output << unit
+
+        return self._output
@@ -1,36 +1,121 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """
-This module provides tools for generating random (x, y) coordinates.
+This module provides tools for generating random (x, y) coordinates and
+for selecting coordinates with a minimum separation.
 """
 import warnings
-from collections import defaultdict
 
 import numpy as np
 from astropy.utils.exceptions import AstropyUserWarning
 
 
-def apply_separation(xycoords, min_separation):
-    from scipy.spatial import KDTree
+def non_maximum_suppression(xycoords, min_separation, values=None):
+    """
+    Select coordinates that are separated by more than a minimum
+    distance using non-maximum suppression.
+
+    The coordinates are processed in the order of decreasing
+    ``values`` (or in the input order if ``values`` is `None`). Each
+    coordinate is kept unless it is within ``min_separation`` of a
+    coordinate that has already been kept, i.e., it is suppressed only
+    by kept coordinates with higher values.
+
+    The neighbors within ``min_separation`` are found with a
+    `scipy.spatial.cKDTree`. Instead of visiting the coordinates one by
+    one, the coordinates are resolved in vectorized rounds: in each
+    round, the undecided coordinates whose higher-valued neighbors are
+    all suppressed are kept, and their lower-valued neighbors are then
+    suppressed. The result is identical to that of the sequential
+    algorithm.
+
+    Parameters
+    ----------
+    xycoords : Nx2 `~numpy.ndarray`
+        The (x, y) coordinates.
+
+    min_separation : float
+        The minimum separation between the kept coordinates.
+        Coordinates with a separation equal to ``min_separation`` are
+        considered to be neighbors.
+
+    values : 1D `~numpy.ndarray` or `None`, optional
+        The values (e.g., the peak values) used to order the
+        coordinates. Coordinates with higher values are kept first.
+        Equal values are ordered by their input order. If `None`, the
+        coordinates are processed in the input order.
 
-    tree = KDTree(xycoords)
+    Returns
+    -------
+    index : 1D `~numpy.ndarray`
+        The sorted indices of the kept coordinates.
+    """
+    from scipy.spatial import cKDTree
+
+    xycoords = np.asarray(xycoords, dtype=float)
+    ncoords = len(xycoords)
+    if ncoords == 0:
+        return np.arange(ncoords)
+
+    # the rank of each coordinate in the processing order
+    if values is None:
+        rank = np.arange(ncoords)
+    else:
+        order = np.argsort(-np.asarray(values), kind='stable')
+        rank = np.empty(ncoords, dtype=int)
+        rank[order] = np.arange(ncoords)
+
+    tree = cKDTree(xycoords)
     pairs = tree.query_pairs(min_separation, output_type='ndarray')
 
-    # create a dictionary of nearest neighbors (within min_separation)
-    nn = {}
-    nn = defaultdict(set)
-    for i, j in pairs:
-        nn[i].add(j)
-        nn[j].add(i)
-
-    keep_idx = []
-    discard_idx = set()
-    for idx in range(xycoords.shape[0]):
-        if idx not in discard_idx:
-            keep_idx.append(idx)
-            # remove nearest neighbors from the output
-            discard_idx.update(nn.get(idx, set()))
-
-    return xycoords[keep_idx]
+    # orient the neighbor pairs from the higher-ranked to the
+    # lower-ranked coordinate
+    swap = rank[pairs[:, 0]] > rank[pairs[:, 1]]
+    higher = np.where(swap, pairs[:, 1], pairs[:, 0])
+    lower = np.where(swap, pairs[:, 0], pairs[:, 1])
+
+    # 0 = undecided, 1 = kept, -1 = suppressed
+    state = np.zeros(ncoords, dtype=np.int8)
+    while True:
+        # undecided coordinates with an undecided or kept higher
+        # neighbor cannot be kept yet
+        blocked = np.zeros(ncoords, dtype=bool)
+        blocked[lower] = True
+        state[(state == 0) & ~blocked] = 1
+
+        # suppress the neighbors of the kept coordinates
+        suppressed = lower[state[higher] == 1]
+        state[suppressed] = -1
+
+        # remove the pairs that no longer affect undecided coordinates
+        keep = (state[lower] == 0) & (state[higher] != -1)
+        higher = higher[keep]
+        lower = lower[keep]
+        if len(lower) == 0:
+            state[state == 0] = 1
+            break
+
+    return np.flatnonzero(state == 1)
+
+
+def apply_separation(xycoords, min_separation):
+    """
+    Remove coordinates that are within ``min_separation`` of a previous
+    coordinate that has been kept.
+
+    Parameters
+    ----------
+    xycoords : Nx2 `~numpy.ndarray`
+        The (x, y) coordinates.
+
+    min_separation : float
+        The minimum separation between the output coordinates.
+
+    Returns
+    -------
+    xycoords : Nx2 `~numpy.ndarray`
+        The (x, y) coordinates with the minimum separation.
+    """
+    return xycoords[non_maximum_suppression(xycoords, min_separation)]
 
 
 def make_random_xycoords(size, x_range, y_range, min_separation=0.0,
@@ -5,7 +5,7 @@ This module provide tools for calculating image moments.
 
 import numpy as np
 
-__all__ = ['_moments_central', '_moments']
+__all__ = ['_moments_central', '_moments', '_moments_central_stack']
 
 
 def _moments_central(data, center=None, order=1):
@@ -64,3 +64,41 @@ def _moments(data, order=1):
         The raw image moments.
     """
     return _moments_central(data, center=(0, 0), order=order)
+
+
+def _moments_central_stack(data, center, order=1):
+    """
+    Calculate the central image moments up to the specified order for a
+    stack of 2D arrays.
+
+    Parameters
+    ----------
+    data : 3D array_like
+        The input ``(N, ny, nx)`` stack of 2D arrays.
+
+    center : Nx2 array_like
+        The ``(x, y)`` center positions of each 2D array.
+
+    order : int, optional
+        The maximum order of the moments to calculate.
+
+    Returns
+    -------
+    moments : 3D `~numpy.ndarray`
+        The ``(N, order + 1, order + 1)`` central image moments of each
+        2D array.
+    """
+    data = np.asarray(data).astype(float)
+
+    if data.ndim != 3:
+        raise ValueError('data must be a 3D array.')
+
+    center = np.atleast_2d(center)
+    powers = np.arange(order + 1)
+    ypowers = ((np.arange(data.shape[1]) - center[:, 1:2])[..., np.newaxis]
+               ** powers)
+    xpowers = ((np.arange(data.shape[2]) - center[:, 0:1])[..., np.newaxis]
+               ** powers)
+
+    return np.einsum('nyp,nyx,nxq->npq', ypowers, data, xpowers,
+                     optimize=True)
@@ -87,3 +87,29 @@ def as_pair(name, value, lower_bound=None, upper_bound=None, check_odd=False):
                           min(value[1], upper_bound[1])))
 
     return value
+
+
+def as_float_dtype(dtype, allow_none=True):
+    """
+    Validate a floating-point data type.
+
+    Parameters
+    ----------
+    dtype : data-type or `None`
+        The input data type.
+
+    allow_none : bool, optional
+        Whether `None` is a valid input.
+
+    Returns
+    -------
+    result : `~numpy.dtype` or `None`
+        The floating-point data type.
+    """
+    if dtype is None and allow_none:
+        return None
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError(f'dtype must be a floating-point data type, got '
+                         f'"{dtype}"')
+    return dtype
@@ -0,0 +1,61 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+This module provides tools for selecting the largest values of an array
+without fully sorting it.
+"""
+
+import numpy as np
+
+
+def argsort_largest(values, n=None):
+    """
+    Return the indices of the ``n`` largest values in decreasing order.
+
+    This is equivalent to ``np.argsort(values, kind='stable')[::-1][:n]``,
+    i.e., tied values are returned in order of decreasing index, but
+    when ``n`` is much smaller than the number of values the ``n``
+    largest values are first selected with `numpy.argpartition` so that
+    only they need to be sorted. As with the full sort, NaN values are
+    treated as the largest values.
+
+    Parameters
+    ----------
+    values : 1D `~numpy.ndarray`
+        The values.
+
+    n : int or `None`, optional
+        The number of indices to return. If `None` or not smaller than
+        the number of values, the indices of all the values are
+        returned.
+
+    Returns
+    -------
+    result : 1D `~numpy.ndarray` of int
+        The indices of the ``n`` largest values, sorted by decreasing
+        value.
+    """
+    values = np.asanyarray(values)
+    nvalues = len(values)
+    if n is None or n >= nvalues:
+        return np.argsort(values, kind='stable')[::-1]
+    if n <= 0:
+        return np.array([], dtype=np.intp)
+
+    kth = nvalues - n
+    idx = np.argpartition(values, kth)[kth:]
+
+    # the values equal to the smallest selected value may also be
+    # outside of the selection; keep those with the largest indices
+    # (as in the reversed stable sort)
+    threshold = values[idx[0]]
+    if np.isnan(threshold):
+        ties = np.isnan(values)
+        larger = np.zeros(len(idx), dtype=bool)
+    else:
+        ties = values == threshold
+        larger = (values[idx] > threshold) | np.isnan(values[idx])
+    ties = np.flatnonzero(ties)
+    idx = np.sort(np.concatenate((idx[larger],
+                                  ties[len(ties) - (n - larger.sum()):])))
+
+    return idx[np.argsort(values[idx], kind='stable')[::-1]]
@@ -25,6 +25,9 @@ class CutoutImage:
     ----------
     data : `~numpy.ndarray`
         The 2D data array from which to extract the cutout array.
+        ``data`` can also be an array-like object that supports
+        slicing (e.g., a FITS image section), in which case only the
+        cutout is read into memory.
 
     position : 2 tuple
         The ``(y, x)`` position of the center of the cutout array with
@@ -86,7 +89,10 @@ class CutoutImage:
         self.fill_value = fill_value
         self.copy = copy
 
-        data = np.asanyarray(data)
+        # array-like objects that support slicing (e.g., a FITS image
+        # section) are not loaded into memory
+        if not hasattr(data, 'shape'):
+            data = np.asanyarray(data)
         self._overlap_slices = overlap_slices(data.shape, shape, position,
                                               mode=mode)
         self.data = self._make_cutout(data)
@@ -4,12 +4,13 @@ Tests for the convolution module.
 """
 
 import astropy.units as u
+import numpy as np
 import pytest
 from astropy.convolution import Gaussian2DKernel
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 
 from photutils.datasets import make_100gaussians_image
-from photutils.utils._convolution import _filter_data
+from photutils.utils._convolution import _Convolver, _filter_data
 from photutils.utils._optional_deps import HAS_SCIPY
 
 
@@ -50,6 +51,19 @@ class TestFilterData:
                                  self.kernel.array.astype(float))
         assert filt_data.dtype == float
 
+    def test_filter_data_dtype(self):
+        filt_data = _filter_data(self.data.astype(np.float32), self.kernel)
+        assert filt_data.dtype == np.float32
+
+        filt_data = _filter_data(self.data.astype(int), self.kernel,
+                                 dtype=np.float32)
+        assert filt_data.dtype == np.float32
+
+        filt_data1 = _filter_data(self.data, self.kernel, dtype=np.float32)
+        filt_data2 = _filter_data(self.data, self.kernel)
+        assert filt_data1.dtype == np.float32
+        assert_allclose(filt_data1, filt_data2, rtol=1e-6)
+
     def test_filter_data_kernel_none(self):
         """
         Test for kernel=None.
@@ -57,3 +71,107 @@ class TestFilterData:
         kernel = None
         filt_data = _filter_data(self.data, kernel)
         assert_allclose(filt_data, self.data)
+
+    @pytest.mark.parametrize('mode', ['constant', 'reflect', 'nearest',
+                                      'mirror', 'wrap'])
+    @pytest.mark.parametrize('shape', [(5, 5), (4, 6), (7, 2), (13, 13)])
+    def test_filter_data_method(self, mode, shape):
+        rng = np.random.default_rng(0)
+        data = self.data[:50, :60]
+        kernel = np.outer(rng.random(shape[0]), rng.random(shape[1]))
+        kernel2 = rng.random(shape)
+
+        for method in ('fft', 'separable', 'auto'):
+            filt_data1 = _filter_data(data, kernel, mode=mode,
+                                      fill_value=1.5, method=method)
+            filt_data2 = _filter_data(data, kernel, mode=mode,
+                                      fill_value=1.5)
+            assert filt_data1.dtype == filt_data2.dtype
+            assert_allclose(filt_data1, filt_data2, rtol=1e-10)
+
+        for method in ('fft', 'auto'):
+            filt_data1 = _filter_data(data, kernel2, mode=mode,
+                                      fill_value=1.5, method=method)
+            filt_data2 = _filter_data(data, kernel2, mode=mode,
+                                      fill_value=1.5)
+            assert_allclose(filt_data1, filt_data2, rtol=1e-10)
+
+    def test_filter_data_method_nonfinite(self):
+        data = self.data[:50, :60].copy()
+        data[10, 20] = np.nan
+        data[0, 3] = np.inf
+        kernel = Gaussian2DKernel(3.0, x_size=11, y_size=11)
+        filt_data1 = _filter_data(data, kernel)
+        for method in ('fft', 'separable', 'auto'):
+            filt_data2 = _filter_data(data, kernel, method=method)
+            nonfinite = ~np.isfinite(filt_data1)
+            assert_equal(~np.isfinite(filt_data2), nonfinite)
+            assert_allclose(filt_data2[~nonfinite], filt_data1[~nonfinite])
+
+    def test_filter_data_method_units(self):
+        unit = u.electron
+        kernel = Gaussian2DKernel(3.0, x_size=11, y_size=11)
+        filt_data = _filter_data(self.data.astype(np.float32) * unit, kernel,
+                                 method='fft')
+        assert filt_data.unit == unit
+        assert filt_data.dtype == np.float32
+
+    def test_filter_data_method_small_data(self):
+        data = self.data[:3, :4]
+        kernel = Gaussian2DKernel(3.0, x_size=11, y_size=11)
+        filt_data1 = _filter_data(data, kernel, mode='reflect')
+        filt_data2 = _filter_data(data, kernel, mode='reflect', method='fft')
+        assert_allclose(filt_data1, filt_data2)
+
+    def test_filter_data_method_invalid(self):
+        match = 'method must be one of'
+        with pytest.raises(ValueError, match=match):
+            _filter_data(self.data, self.kernel, method='invalid')
+
+        rng = np.random.default_rng(0)
+        match = 'The kernel is not separable'
+        with pytest.raises(ValueError, match=match):
+            _filter_data(self.data, rng.random((5, 5)), method='separable')
+
+    @pytest.mark.parametrize('mode', ['constant', 'reflect', 'wrap'])
+    @pytest.mark.parametrize('method', ['direct', 'fft', 'separable',
+                                        'auto'])
+    def test_convolver(self, mode, method):
+        data = self.data[:50, :60]
+        kernel = Gaussian2DKernel(3.0, x_size=11, y_size=11)
+        convolver = _Convolver(kernel, data.shape, mode=mode, fill_value=1.5,
+                               method=method)
+        for frame in (data, data[::-1], data * u.Jy):
+            filt_data1 = convolver(frame)
+            filt_data2 = _filter_data(frame, kernel, mode=mode,
+                                      fill_value=1.5)
+            assert filt_data1.dtype == filt_data2.dtype
+            assert_allclose(filt_data1, filt_data2, rtol=1e-10)
+
+        data = data.copy()
+        data[10, 20] = np.nan
+        filt_data1 = convolver(data)
+        filt_data2 = _filter_data(data, kernel, mode=mode, fill_value=1.5)
+        assert_allclose(filt_data1, filt_data2, rtol=1e-10)
+
+    def test_convolver_dtype(self):
+        data = self.data[:50, :60]
+        convolver = _Convolver(self.kernel, data.shape, dtype=np.float32)
+        filt_data = convolver(data.astype(int))
+        assert filt_data.dtype == np.float32
+        assert_allclose(filt_data, _filter_data(data.astype(int), self.kernel,
+                                                dtype=np.float32))
+
+    def test_convolver_invalid(self):
+        match = 'method must be one of'
+        with pytest.raises(ValueError, match=match):
+            _Convolver(self.kernel, (10, 10), method='invalid')
+
+        rng = np.random.default_rng(0)
+        match = 'The kernel is not separable'
+        with pytest.raises(ValueError, match=match):
+            _Convolver(rng.random((5, 5)), (10, 10), method='separable')
+
+        convolver = _Convolver(self.kernel, (10, 10))
+        with pytest.raises(ValueError, match='data must have a shape'):
+            convolver(np.ones((10, 11)))
@@ -0,0 +1,61 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+Tests for the _coords module.
+"""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_equal
+
+from photutils.utils._coords import (apply_separation, make_random_xycoords,
+                                     non_maximum_suppression)
+from photutils.utils._optional_deps import HAS_SCIPY
+
+
+def _greedy_suppression(xycoords, min_separation, values=None):
+    order = np.arange(len(xycoords))
+    if values is not None:
+        order = np.argsort(-values, kind='stable')
+    keep = []
+    for idx in order:
+        dist = np.hypot(*(xycoords[keep] - xycoords[idx]).T)
+        if np.all(dist > min_separation):
+            keep.append(idx)
+    return np.sort(keep)
+
+
+@pytest.mark.skipif(not HAS_SCIPY, reason='scipy is required')
+@pytest.mark.parametrize('use_values', [False, True])
+def test_non_maximum_suppression(use_values):
+    rng = np.random.default_rng(0)
+    for i in range(30):
+        xycoords = rng.uniform(0, 50, (rng.integers(1, 200), 2))
+        if i % 3 == 0:
+            xycoords = np.round(xycoords)  # separations equal to the limit
+        values = None
+        if use_values:
+            values = np.round(rng.random(len(xycoords)) * 5)  # with ties
+        min_separation = rng.uniform(0, 8)
+        idx = non_maximum_suppression(xycoords, min_separation,
+                                      values=values)
+        assert_equal(idx, _greedy_suppression(xycoords, min_separation,
+                                              values=values))
+
+
+@pytest.mark.skipif(not HAS_SCIPY, reason='scipy is required')
+def test_non_maximum_suppression_empty():
+    idx = non_maximum_suppression(np.empty((0, 2)), 5.0)
+    assert len(idx) == 0
+
+
+@pytest.mark.skipif(not HAS_SCIPY, reason='scipy is required')
+def test_apply_separation():
+    rng = np.random.default_rng(0)
+    xycoords = rng.uniform(0, 50, (100, 2))
+    result = apply_separation(xycoords, 5.0)
+    assert_equal(result, xycoords[_greedy_suppression(xycoords, 5.0)])
+
+    xycoords = make_random_xycoords(50, (0, 100), (0, 100),
+                                    min_separation=5.0, seed=0)
+    dist = np.hypot(*(xycoords[:, np.newaxis] - xycoords).T)
+    assert np.all(dist[np.triu_indices(len(xycoords), 1)] > 5.0)
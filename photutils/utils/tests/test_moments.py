@@ -7,7 +7,8 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose, assert_equal
 
-from photutils.utils._moments import _moments, _moments_central
+from photutils.utils._moments import (_moments, _moments_central,
+                                      _moments_central_stack)
 
 
 def test_moments():
@@ -38,3 +39,20 @@ def test_moments_central_invalid_dim():
     data = np.arange(27).reshape(3, 3, 3)
     with pytest.raises(ValueError):
         _moments_central(data, order=3)
+
+
+def test_moments_central_stack():
+    rng = np.random.default_rng(0)
+    data = rng.random((7, 5, 6))
+    centers = rng.random((7, 2)) * 4
+    moments = _moments_central_stack(data, centers, order=2)
+    result = [_moments_central(arr, center=center, order=2)
+              for arr, center in zip(data, centers)]
+    assert_allclose(moments, result)
+
+    moments = _moments_central_stack(data, np.zeros((7, 2)), order=1)
+    result = [_moments(arr, order=1) for arr in data]
+    assert_allclose(moments, result)
+
+    with pytest.raises(ValueError):
+        _moments_central_stack(data[0], centers[0])
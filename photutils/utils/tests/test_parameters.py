@@ -7,7 +7,7 @@ import numpy as np
 import pytest
 from numpy.testing import assert_equal
 
-from photutils.utils._parameters import as_pair
+from photutils.utils._parameters import as_float_dtype, as_pair
 
 
 def test_as_pair():
@@ -31,3 +31,16 @@ def test_as_pair():
 
     with pytest.raises(ValueError):
         as_pair('myparam', 4, check_odd=True)
+
+
+def test_as_float_dtype():
+    assert as_float_dtype(None) is None
+    assert as_float_dtype(np.float32) == np.float32
+    assert as_float_dtype(float) == np.float64
+    assert as_float_dtype(None, allow_none=False) == np.float64
+
+    with pytest.raises(ValueError):
+        as_float_dtype(int)
+
+    with pytest.raises(ValueError):
+        as_float_dtype(bool)
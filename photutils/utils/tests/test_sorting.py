@@ -0,0 +1,42 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+Tests for the _sorting module.
+"""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_equal
+
+from photutils.utils._sorting import argsort_largest
+
+
+@pytest.mark.parametrize('n', [None, 0, 1, 5, 99, 100, 150])
+def test_argsort_largest(n):
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=100)
+    idx = argsort_largest(values, n)
+    expected = np.argsort(values, kind='stable')[::-1][:n]
+    if n == 0:
+        expected = expected[:0]
+    assert_equal(idx, expected)
+
+
+def test_argsort_largest_nan():
+    values = np.array([1.0, np.nan, 3.0, 2.0, np.nan, 0.0])
+    idx = argsort_largest(values, 3)
+    assert_equal(np.isnan(values[idx[:2]]), True)
+    assert idx[2] == 2
+    assert_equal(idx, np.argsort(values, kind='stable')[::-1][:3])
+
+
+@pytest.mark.parametrize('n', [1, 3, 10, 49])
+def test_argsort_largest_ties(n):
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        values = rng.integers(0, 5, size=50).astype(float)
+        values[rng.random(50) > 0.9] = np.nan
+        expected = np.argsort(values, kind='stable')[::-1][:n]
+        assert_equal(argsort_largest(values, n), expected)
+        values = values[np.isfinite(values)]
+        expected = np.argsort(values, kind='stable')[::-1][:n]
+        assert_equal(argsort_largest(values, n), expected)